@@ -0,0 +1 @@
+# Estimator Benchmark Harness (v7.11.2) - Fake LLM 기반 오케스트레이션 오버헤드 측정
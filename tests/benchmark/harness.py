@@ -0,0 +1,382 @@
+"""
+EstimatorRAG 벤치마크 하네스 (v7.11.2)
+
+목표:
+- 네트워크 / 토큰 비용 없이 EstimatorRAG.estimate 오케스트레이션 오버헤드 측정
+- CI에서 회귀 감지 (Stage별 지연, LLM 호출 수, 메모리 할당, 동시 처리량)
+
+구성:
+- FakeLLMProvider (umis_rag.core.llm_fake): 결정적 응답 + 지연 주입
+- FakeEmbeddings + 임시 Chroma 디렉토리 (실제 data/chroma 미사용)
+- LLM 응답 캐시 / 분해식 메모리 비활성 (매 실행 같은 호출 수)
+
+측정:
+- Stage별 (evidence / prior / fermi / fusion) p50 / p95 / mean
+- 질문당 end-to-end 지연, LLM 호출 수 (종류별)
+- 질문당 tracemalloc peak / 잔존 바이트
+- 동시 실행 수별 처리량 (질문/초)과 1 worker 대비 speedup
+
+사용:
+    $ python tests/benchmark/harness.py --latency 0.02 --concurrency 1 4 8
+    $ python tests/benchmark/harness.py --json tests/results/benchmark.json
+
+작성일: 2026-10-18
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+import argparse
+import json
+import shutil
+import tempfile
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator import EstimatorRAG
+from umis_rag.agents.estimator.models import Context
+from umis_rag.core.config import settings
+from umis_rag.core.llm_cache import LLMResponseCache, set_llm_cache
+from umis_rag.core.llm_clients import set_llm_client_registry
+from umis_rag.core.llm_fake import FakeEmbeddings, FakeLLMProvider
+from umis_rag.core.vector_stores import VectorStoreRegistry, set_vector_store_registry
+
+
+# Stage 메서드 → 보고 이름 (EstimatorRAG 인스턴스에서 감쌈)
+STAGE_METHODS = (
+    ('_collect_evidence', 'evidence'),
+    ('_run_prior', 'prior'),
+    ('_run_fermi', 'fermi'),
+    ('_fuse', 'fusion'),
+)
+
+# ValidatorSource는 임베딩 모델을 직접 지정
+_EXTRA_EMBEDDING_MODELS = ('text-embedding-3-large',)
+
+
+@dataclass
+class BenchmarkQuestion:
+    """벤치마크 질문"""
+    question: str
+    domain: str = "General"
+    region: Optional[str] = None
+
+    def context(self) -> Context:
+        return Context(domain=self.domain, region=self.region, time_period="2024")
+
+
+DEFAULT_CORPUS: List[BenchmarkQuestion] = [
+    BenchmarkQuestion("서울 음식점 수는?", "Food_Service", "서울"),
+    BenchmarkQuestion("한국 카페 연간 매출은?", "Food_Service", "한국"),
+    BenchmarkQuestion("B2B SaaS 월 해지율은?", "B2B_SaaS", "한국"),
+    BenchmarkQuestion("B2B SaaS 고객당 월평균 매출은?", "B2B_SaaS", "한국"),
+    BenchmarkQuestion("한국 편의점 점포 수는?", "Retail", "한국"),
+    BenchmarkQuestion("서울 택시 하루 운행 건수는?", "Mobility", "서울"),
+    BenchmarkQuestion("한국 온라인 쇼핑 연간 거래액은?", "E-commerce", "한국"),
+    BenchmarkQuestion("부산 숙박업소 객실 수는?", "Travel", "부산"),
+    BenchmarkQuestion("한국 헬스장 회원 수는?", "Fitness", "한국"),
+    BenchmarkQuestion("한국 음악 스트리밍 구독자 수는?", "Media", "한국"),
+    BenchmarkQuestion("서울 반려동물 가구 수는?", "Pet", "서울"),
+    BenchmarkQuestion("한국 전기차 연간 판매량은?", "Automotive", "한국"),
+]
+
+
+@dataclass
+class BenchmarkReport:
+    """벤치마크 결과"""
+    questions: int
+    failures: int
+    latency: float
+    cold_start_ms: float
+    end_to_end: Dict[str, float]
+    stages: Dict[str, Dict[str, float]]
+    llm_calls_per_question: float
+    llm_calls_by_kind: Dict[str, int]
+    allocations: Dict[str, float] = field(default_factory=dict)
+    concurrency: Dict[int, Dict[str, float]] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def to_json(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def format(self) -> str:
+        """콘솔 출력용 요약"""
+        lines = [
+            f"질문 {self.questions}개 (실패 {self.failures}), 주입 지연 {self.latency * 1000:.0f}ms, "
+            f"cold start {self.cold_start_ms:.0f}ms",
+            f"end-to-end: p50={self.end_to_end['p50_ms']:.1f}ms p95={self.end_to_end['p95_ms']:.1f}ms",
+        ]
+        for stage, stats in self.stages.items():
+            lines.append(
+                f"  {stage:<9} n={stats['count']:<4.0f} p50={stats['p50_ms']:.1f}ms p95={stats['p95_ms']:.1f}ms"
+            )
+        lines.append(f"LLM 호출/질문: {self.llm_calls_per_question:.2f} {self.llm_calls_by_kind}")
+        if self.allocations:
+            lines.append(
+                f"메모리: peak p50={self.allocations['peak_kb_p50']:.0f}KB "
+                f"max={self.allocations['peak_kb_max']:.0f}KB, "
+                f"잔존 mean={self.allocations['retained_kb_mean']:.1f}KB"
+            )
+        for workers, stats in self.concurrency.items():
+            lines.append(
+                f"workers={workers:<3} {stats['throughput_qps']:.1f} q/s "
+                f"(speedup x{stats['speedup']:.2f}, {stats['elapsed_s']:.2f}s, "
+                f"max in-flight {stats['max_in_flight']})"
+            )
+        return "\n".join(lines)
+
+
+def summarize_ms(samples: Sequence[float]) -> Dict[str, float]:
+    """초 단위 샘플 → count / mean / p50 / p95 (ms)"""
+    if not samples:
+        return {'count': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p95_ms': 0.0}
+    ms = np.asarray(samples) * 1000
+    return {
+        'count': float(len(ms)),
+        'mean_ms': float(ms.mean()),
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p95_ms': float(np.percentile(ms, 95)),
+    }
+
+
+class EstimatorBenchmark:
+    """
+    Fake LLM 기반 EstimatorRAG 벤치마크
+
+    with 블록 안에서만 Fake 구성요소가 설치되고, 종료 시 원래 설정으로 복원됩니다.
+
+    Example:
+        >>> with EstimatorBenchmark(latency=0.02) as bench:
+        ...     report = bench.run(concurrency=(1, 4))
+        >>> print(report.format())
+    """
+
+    def __init__(
+        self,
+        corpus: Optional[Iterable[BenchmarkQuestion]] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        latency_by_kind: Optional[Dict[str, float]] = None,
+        seed: int = 0
+    ):
+        """
+        Args:
+            corpus: 질문 목록 (None이면 DEFAULT_CORPUS)
+            latency: LLM 호출당 주입 지연 (초)
+            jitter: 지연 변동 폭 (초)
+            latency_by_kind: 종류별 지연 (prior / fermi_decomposition / guardrail)
+            seed: 지터 시드
+        """
+        self.corpus = list(corpus or DEFAULT_CORPUS)
+        self.latency = latency
+        self.provider = FakeLLMProvider(latency, jitter, latency_by_kind, seed)
+        self.embeddings = FakeEmbeddings()
+
+        self._samples: Dict[str, List[float]] = {stage: [] for _, stage in STAGE_METHODS}
+        self._samples_lock = threading.Lock()
+        self._tmp_dir: Optional[str] = None
+        self._saved: Dict[str, Any] = {}
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Fake 구성요소 설치 / 복원
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def __enter__(self) -> "EstimatorBenchmark":
+        self._tmp_dir = tempfile.mkdtemp(prefix="umis_bench_chroma_")
+        self._saved['chroma_persist_dir'] = settings.chroma_persist_dir
+        settings.chroma_persist_dir = Path(self._tmp_dir)
+
+        registry = VectorStoreRegistry()
+        for model in (settings.embedding_model,) + _EXTRA_EMBEDDING_MODELS:
+            registry.set_embeddings(self.embeddings, model)
+        self._saved['vector_registry'] = set_vector_store_registry(registry)
+
+        set_llm_client_registry(self.provider.client_registry)
+        set_llm_cache(LLMResponseCache(backend=None, enabled=False))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        set_llm_cache(None)
+        set_llm_client_registry(None)
+        set_vector_store_registry(self._saved.pop('vector_registry'))
+        settings.chroma_persist_dir = self._saved.pop('chroma_persist_dir')
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+        self._tmp_dir = None
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 실행
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def make_estimator(self) -> EstimatorRAG:
+        """Stage 메서드에 타이머를 붙인 EstimatorRAG (분해식 메모리 없음)"""
+        estimator = EstimatorRAG(llm_provider=self.provider)
+        estimator.fermi_estimator.decomposition_memory = None
+
+        for method, stage in STAGE_METHODS:
+            setattr(estimator, method, self._timed(stage, getattr(estimator, method)))
+        return estimator
+
+    def run(
+        self,
+        concurrency: Sequence[int] = (1, 4),
+        measure_allocations: bool = True
+    ) -> BenchmarkReport:
+        """
+        전체 벤치마크
+
+        1. cold start: 첫 질문 1회 (Lazy 구성요소 생성 포함, 이후 측정에서 제외)
+        2. 순차 실행: Stage별 / end-to-end 지연, 질문당 LLM 호출 수
+        3. 메모리: 질문별 tracemalloc peak / 잔존 바이트
+        4. 동시 실행: workers별 처리량
+        """
+        if self._tmp_dir is None:
+            raise RuntimeError("with EstimatorBenchmark(...) 블록 안에서 실행하세요")
+
+        estimator = self.make_estimator()
+
+        start = time.perf_counter()
+        self._estimate(estimator, self.corpus[0])
+        cold_start = time.perf_counter() - start
+        self._reset_samples()
+        self.provider.responder.reset_stats()
+
+        # 순차 실행
+        end_to_end, failures = [], 0
+        for item in self.corpus:
+            start = time.perf_counter()
+            if self._estimate(estimator, item) is None:
+                failures += 1
+            end_to_end.append(time.perf_counter() - start)
+
+        calls = self.provider.responder.get_stats()
+        stages = {stage: summarize_ms(samples) for stage, samples in self._snapshot_samples().items()}
+
+        report = BenchmarkReport(
+            questions=len(self.corpus),
+            failures=failures,
+            latency=self.latency,
+            cold_start_ms=cold_start * 1000,
+            end_to_end=summarize_ms(end_to_end),
+            stages=stages,
+            llm_calls_per_question=calls['total'] / len(self.corpus),
+            llm_calls_by_kind=calls
+        )
+
+        if measure_allocations:
+            report.allocations = self.measure_allocations(estimator)
+
+        report.concurrency = self.measure_concurrency(estimator, concurrency)
+        return report
+
+    def measure_allocations(self, estimator: EstimatorRAG) -> Dict[str, float]:
+        """질문별 tracemalloc peak / 잔존 바이트 (KB)"""
+        peaks, retained = [], []
+        tracemalloc.start()
+        try:
+            for item in self.corpus:
+                before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                self._estimate(estimator, item)
+                after, peak = tracemalloc.get_traced_memory()
+                peaks.append((peak - before) / 1024)
+                retained.append((after - before) / 1024)
+        finally:
+            tracemalloc.stop()
+
+        return {
+            'peak_kb_p50': float(np.percentile(peaks, 50)),
+            'peak_kb_max': float(max(peaks)),
+            'retained_kb_mean': float(np.mean(retained)),
+        }
+
+    def measure_concurrency(
+        self,
+        estimator: EstimatorRAG,
+        concurrency: Sequence[int]
+    ) -> Dict[int, Dict[str, float]]:
+        """workers별 전체 corpus 처리 시간 / 처리량 / 최대 동시 LLM 호출 수"""
+        results: Dict[int, Dict[str, float]] = {}
+        baseline = None
+
+        for workers in concurrency:
+            self.provider.responder.reset_stats()
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda item: self._estimate(estimator, item), self.corpus))
+            elapsed = time.perf_counter() - start
+
+            throughput = len(self.corpus) / elapsed if elapsed else float('inf')
+            baseline = baseline or throughput
+            results[workers] = {
+                'elapsed_s': elapsed,
+                'throughput_qps': throughput,
+                'speedup': throughput / baseline,
+                'max_in_flight': self.provider.responder.max_in_flight,
+            }
+        return results
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 내부
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    @staticmethod
+    def _estimate(estimator: EstimatorRAG, item: BenchmarkQuestion):
+        return estimator.estimate(item.question, context=item.context())
+
+    def _timed(self, stage: str, method: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                with self._samples_lock:
+                    self._samples[stage].append(elapsed)
+        return timed
+
+    def _reset_samples(self) -> None:
+        with self._samples_lock:
+            for samples in self._samples.values():
+                samples.clear()
+
+    def _snapshot_samples(self) -> Dict[str, List[float]]:
+        with self._samples_lock:
+            return {stage: list(samples) for stage, samples in self._samples.items()}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> BenchmarkReport:
+    parser = argparse.ArgumentParser(description="EstimatorRAG 벤치마크 (Fake LLM, 네트워크 없음)")
+    parser.add_argument('--latency', type=float, default=0.0, help="LLM 호출당 주입 지연 (초)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="지연 변동 폭 (초)")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 8], help="동시 실행 worker 수")
+    parser.add_argument('--no-allocations', action='store_true', help="tracemalloc 측정 생략")
+    parser.add_argument('--json', type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    from umis_rag.utils.logger import logger
+    logger.remove()
+
+    with EstimatorBenchmark(latency=args.latency, jitter=args.jitter) as bench:
+        report = bench.run(concurrency=args.concurrency, measure_allocations=not args.no_allocations)
+
+    print(report.format())
+    if args.json:
+        report.to_json(args.json)
+        print(f"저장: {args.json}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
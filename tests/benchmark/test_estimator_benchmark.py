@@ -0,0 +1,95 @@
+"""
+EstimatorRAG 벤치마크 회귀 테스트 (v7.11.2)
+
+Fake LLM / Fake 임베딩으로 네트워크 없이 실행:
+- 전체 corpus 실패 없음, 분해 LLM 호출은 질문당 1회
+- 같은 입력 → 같은 추정값 (결정적)
+- 오케스트레이션 오버헤드 상한 (주입 지연 0)
+- 주입 지연이 있을 때 동시 실행 처리량 증가
+
+실행:
+    $ OPENAI_API_KEY=sk-test pytest tests/benchmark -q
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from tests.benchmark.harness import DEFAULT_CORPUS, EstimatorBenchmark, summarize_ms
+from umis_rag.core.llm_clients import get_llm_client_registry
+from umis_rag.core.llm_fake import FakeLLMClientRegistry
+
+
+# 주입 지연 0에서 질문당 오케스트레이션 상한 (CI 머신 편차를 고려한 넉넉한 값)
+MAX_OVERHEAD_P95_MS = 2000
+
+
+@pytest.fixture(scope="module")
+def report():
+    with EstimatorBenchmark(latency=0.0) as bench:
+        yield bench.run(concurrency=(1,), measure_allocations=True)
+
+
+class TestEstimatorBenchmark:
+
+    def test_corpus_runs_without_failures(self, report):
+        assert report.questions == len(DEFAULT_CORPUS)
+        assert report.failures == 0
+
+    def test_llm_calls_per_question(self, report):
+        calls = report.llm_calls_by_kind
+
+        assert calls['fermi_decomposition'] == report.questions
+        assert 'unknown' not in calls
+        assert report.llm_calls_per_question >= 1
+
+    def test_all_stages_timed(self, report):
+        assert report.stages['evidence']['count'] == report.questions
+        assert report.stages['fusion']['count'] == report.questions
+        assert report.stages['fermi']['count'] > 0
+
+    def test_overhead_bound(self, report):
+        assert report.end_to_end['p95_ms'] < MAX_OVERHEAD_P95_MS
+
+    def test_allocations_reported(self, report):
+        assert report.allocations['peak_kb_max'] > 0
+
+    def test_report_serializes(self, report, tmp_path):
+        path = tmp_path / "benchmark.json"
+        report.to_json(path)
+
+        assert path.exists()
+        assert "end-to-end" in report.format()
+
+    def test_deterministic_values(self):
+        corpus = DEFAULT_CORPUS[:3]
+
+        def values():
+            with EstimatorBenchmark(corpus=corpus) as bench:
+                estimator = bench.make_estimator()
+                return [bench._estimate(estimator, item).value for item in corpus]
+
+        assert values() == values()
+
+    def test_restores_registries(self):
+        with EstimatorBenchmark(corpus=DEFAULT_CORPUS[:1]):
+            assert isinstance(get_llm_client_registry(), FakeLLMClientRegistry)
+
+        assert not isinstance(get_llm_client_registry(), FakeLLMClientRegistry)
+
+    def test_concurrency_overlaps_llm_calls(self):
+        # 처리량(speedup)은 벽시계 의존 → 동시 호출 여부로 확인
+        with EstimatorBenchmark(corpus=DEFAULT_CORPUS[:8], latency=0.02) as bench:
+            result = bench.run(concurrency=(1, 4), measure_allocations=False)
+
+        assert result.concurrency[4]['max_in_flight'] > 1
+
+
+def test_summarize_ms():
+    stats = summarize_ms([0.001, 0.002, 0.003])
+
+    assert stats['count'] == 3
+    assert stats['p50_ms'] == pytest.approx(2.0)
+    assert summarize_ms([])['count'] == 0
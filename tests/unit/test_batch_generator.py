@@ -0,0 +1,190 @@
+"""
+워크북 병렬 생성 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 프로세스 풀 생성 / 입력 순서 결과 / 스트리밍
+- 작업별 실패 격리 (다른 작업은 계속)
+- Worker 비정상 종료 시 남은 작업 재실행, 원인 작업만 실패
+- Worker 메모리 한도 (RLIMIT_AS)
+- Builder별 시간 기록 / 집계
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+import multiprocessing
+import os
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.deliverables.excel import (
+    BatchWorkbookGenerator,
+    WorkbookBuildResult,
+    WorkbookJob,
+)
+from umis_rag.deliverables.excel.batch_generator import GENERATORS, _init_worker
+from umis_rag.deliverables.excel.unit_economics import UnitEconomicsGenerator
+
+
+UE_INPUTS = {
+    'arpu': 9000, 'cac': 25000, 'gross_margin': 0.35,
+    'monthly_churn': 0.04, 'customer_lifetime': 25,
+    'sm_spend_monthly': 5_000_000, 'new_customers_monthly': 200
+}
+
+FP_ASSUMPTIONS = {
+    'base_revenue_y0': 1250_0000_0000, 'growth_rate_yoy': 0.28,
+    'gross_margin': 0.70, 'ebitda_margin': 0.15, 'net_margin': 0.10,
+    'sm_percent': 0.30, 'rd_percent': 0.15, 'ga_percent': 0.10,
+    'tax_rate': 0.25, 'discount_rate': 0.12
+}
+
+
+def ue_job(name):
+    return WorkbookJob('unit_economics', {'market_name': name, 'inputs_data': UE_INPUTS})
+
+
+def allocate_mb(size_mb):
+    """Worker에서 size_mb 할당 시도"""
+    try:
+        bytearray(size_mb * 1024 * 1024)
+        return 'ok'
+    except MemoryError:
+        return 'MemoryError'
+
+
+class CrashingGenerator:
+    """generate() 중 Worker 프로세스 강제 종료 (OOM Killer / segfault 대역)"""
+
+    builder_timings = {}
+
+    def generate(self, output_dir, market_name, **kwargs):
+        os._exit(1)
+
+
+class TestBatchGeneration:
+
+    def test_generate_in_input_order(self, tmp_path):
+        jobs = [
+            ue_job('music'),
+            WorkbookJob('financial_projection', {
+                'market_name': 'edu',
+                'assumptions_data': FP_ASSUMPTIONS,
+                'segments': [{'name': 'B2C', 'y0_revenue': 800_0000_0000, 'growth': 0.15}]
+            }),
+            ue_job('fitness'),
+        ]
+
+        results = BatchWorkbookGenerator(max_workers=2).generate(jobs, tmp_path)
+
+        assert [r.job_id for r in results] == [
+            'unit_economics:music', 'financial_projection:edu', 'unit_economics:fitness'
+        ]
+        assert all(r.ok for r in results), [r.error for r in results]
+        assert all(r.filepath.exists() and r.filepath.parent == tmp_path for r in results)
+        assert list(results[0].builder_timings)[0] == 'Inputs'
+        assert 'save' in results[1].builder_timings
+        assert results[0].total_ms >= sum(results[0].builder_timings.values())
+
+    def test_failure_is_isolated(self, tmp_path):
+        jobs = [ue_job('ok'), WorkbookJob('unit_economics', {'market_name': 'bad'})]
+
+        results = {r.job_id: r for r in BatchWorkbookGenerator(max_workers=2).generate_iter(jobs, tmp_path)}
+
+        assert results['unit_economics:ok'].ok
+        assert 'TypeError' in results['unit_economics:bad'].error
+        assert results['unit_economics:bad'].filepath is None
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != 'fork',
+        reason="Worker가 테스트 모듈의 GENERATORS 패치를 상속해야 함 (fork)"
+    )
+    def test_worker_crash_fails_only_crashed_job(self, tmp_path):
+        with patch.dict(GENERATORS, {'crash': (__name__, 'CrashingGenerator')}):
+            jobs = [ue_job('a'), WorkbookJob('crash', {'market_name': 'boom'}), ue_job('b'), ue_job('c')]
+            results = list(BatchWorkbookGenerator(max_workers=2).generate_iter(jobs, tmp_path))
+
+        by_id = {r.job_id: r for r in results}
+        assert len(results) == len(by_id) == 4
+        assert '비정상 종료' in by_id['crash:boom'].error
+        for name in ('a', 'b', 'c'):
+            assert by_id[f'unit_economics:{name}'].ok, by_id[f'unit_economics:{name}'].error
+            assert by_id[f'unit_economics:{name}'].filepath.exists()
+
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != 'fork',
+        reason="Worker가 테스트 모듈의 GENERATORS 패치를 상속해야 함 (fork)"
+    )
+    def test_healthy_jobs_stay_parallel_after_crash(self, tmp_path):
+        pool_sizes = []
+
+        class RecordingBatch(BatchWorkbookGenerator):
+            def _make_executor(self, job_count):
+                pool_sizes.append(job_count)
+                return super()._make_executor(job_count)
+
+        names = [f'm{i}' for i in range(12)]
+        with patch.dict(GENERATORS, {'crash': (__name__, 'CrashingGenerator')}):
+            jobs = [ue_job(names[0]), WorkbookJob('crash', {'market_name': 'boom'})]
+            jobs += [ue_job(name) for name in names[1:]]
+            results = {r.job_id: r for r in RecordingBatch(max_workers=4).generate_iter(jobs, tmp_path)}
+
+        assert len(results) == 13
+        assert not results['crash:boom'].ok
+        assert all(results[f'unit_economics:{name}'].ok for name in names)
+        # 시작 전 작업은 공유 풀로 재실행, 실행 중이던 작업(최대 workers개)만 절반씩 분할
+        assert pool_sizes[0] == 13
+        assert max(pool_sizes[1:]) >= 8
+        assert pool_sizes.count(1) <= 4
+        assert len(pool_sizes) <= 8
+
+    def test_invalid_jobs_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            WorkbookJob('unknown', {'market_name': 'x'})
+
+        with pytest.raises(ValueError):
+            BatchWorkbookGenerator().generate([ue_job('dup'), ue_job('dup')], tmp_path)
+
+        assert BatchWorkbookGenerator().generate([], tmp_path) == []
+
+
+class TestWorkerLimits:
+
+    @pytest.mark.skipif(sys.platform == 'win32', reason="RLIMIT_AS는 POSIX 전용")
+    def test_memory_limit_applied(self):
+        with ProcessPoolExecutor(1, initializer=_init_worker, initargs=(200,)) as executor:
+            assert executor.submit(allocate_mb, 400).result() == 'MemoryError'
+
+        with ProcessPoolExecutor(1, initializer=_init_worker, initargs=(None,)) as executor:
+            assert executor.submit(allocate_mb, 400).result() == 'ok'
+
+
+class TestTimings:
+
+    def test_generator_records_builder_timings(self, tmp_path, capsys):
+        generator = UnitEconomicsGenerator()
+        generator.generate('music', UE_INPUTS, output_dir=tmp_path)
+
+        assert list(generator.builder_timings) == [
+            'Inputs', 'LTV Calculation', 'CAC Analysis', 'LTV/CAC Ratio',
+            'Payback Period', 'Sensitivity Analysis', 'UE Scenarios',
+            'Cohort LTV', 'Benchmark Comparison', 'Dashboard', 'save'
+        ]
+        assert all(ms >= 0 for ms in generator.builder_timings.values())
+
+    def test_timing_report(self):
+        results = [
+            WorkbookBuildResult('a', 'unit_economics', builder_timings={'Inputs': 10.0, 'save': 100.0}),
+            WorkbookBuildResult('b', 'unit_economics', builder_timings={'Inputs': 30.0, 'save': 300.0}),
+            WorkbookBuildResult('c', 'unit_economics', builder_timings={'Inputs': 999.0}, error='boom'),
+        ]
+
+        report = BatchWorkbookGenerator.timing_report(results)
+
+        assert list(report) == ['unit_economics/save', 'unit_economics/Inputs']
+        assert report['unit_economics/Inputs'] == {
+            'count': 2, 'mean_ms': 20.0, 'max_ms': 30.0, 'total_ms': 40.0
+        }
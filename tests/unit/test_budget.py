@@ -0,0 +1,131 @@
+"""
+Budget 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 원자적 소비 (동시 호출 시 초과 소비 없음)
+- reserve / commit / release (BudgetLease)
+- carve() 하위 예산 (부모 반영, 미사용분 반환)
+- deadline 전파 (하위 예산 시간, 요청 timeout)
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator.common.budget import Budget, BudgetLease
+
+
+class TestBudgetConcurrency:
+    """원자적 소비 테스트"""
+
+    def test_concurrent_consume_never_overspends(self):
+        """100개 스레드가 동시에 소비해도 max_llm_calls 이하"""
+        budget = Budget(max_llm_calls=10, max_variables=100)
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            results = list(executor.map(lambda _: budget.consume_llm_call(1), range(100)))
+
+        assert sum(results) == 10
+        assert budget.get_consumed_llm_calls() == 10
+        assert budget.get_remaining_llm_calls() == 0
+
+
+class TestBudgetLease:
+    """reserve / commit / release 테스트"""
+
+    def test_reserve_blocks_other_consumers(self):
+        """선점분은 다른 소비자가 사용 불가"""
+        budget = Budget(max_llm_calls=3, max_variables=3)
+        lease = budget.reserve(llm_calls=2, variables=2)
+
+        assert isinstance(lease, BudgetLease)
+        assert budget.get_remaining_llm_calls() == 1
+        assert budget.consume_llm_call(1)
+        assert not budget.consume_llm_call(1)
+
+    def test_reserve_insufficient_returns_none(self):
+        """예산 부족 시 None"""
+        budget = Budget(max_llm_calls=1)
+        assert budget.reserve(llm_calls=2) is None
+
+    def test_commit_and_release(self):
+        """부분 소비 후 release → 미사용분 반환"""
+        budget = Budget(max_llm_calls=5, max_variables=5)
+
+        with budget.reserve(llm_calls=3, variables=3) as lease:
+            assert lease.consume(llm_calls=1, variables=1)
+            assert not lease.consume(llm_calls=3)
+
+        assert budget.get_consumed_llm_calls() == 1
+        assert budget.get_remaining_llm_calls() == 4
+        assert budget.get_remaining_variables() == 4
+
+    def test_commit_all(self):
+        """commit() → 선점분 전부 확정"""
+        budget = Budget(max_llm_calls=5, max_variables=5)
+        lease = budget.reserve(llm_calls=2, variables=1)
+
+        assert lease.commit()
+        assert budget.get_consumed_llm_calls() == 2
+        assert budget.get_consumed_variables() == 1
+        assert lease.remaining_llm_calls == 0
+
+
+class TestBudgetCarve:
+    """carve() 하위 예산 테스트"""
+
+    def test_carve_propagates_consumption(self):
+        """하위 예산 소비 → 부모 즉시 반영"""
+        parent = Budget(max_llm_calls=10, max_variables=8)
+        child = parent.carve(llm_calls=4, variables=2)
+
+        assert parent.get_remaining_llm_calls() == 6
+        assert child.consume_llm_call(3)
+        assert parent.get_consumed_llm_calls() == 3
+
+        child.close()
+        assert parent.get_remaining_llm_calls() == 7
+        assert parent.get_remaining_variables() == 8
+
+    def test_nested_carve(self):
+        """중첩 하위 예산 (Stage → 변수)"""
+        parent = Budget(max_llm_calls=10, max_variables=8)
+
+        with parent.carve(llm_calls=5, variables=5) as stage:
+            var_budget = stage.carve(llm_calls=1, variables=1)
+            assert var_budget.consume_llm_call(1)
+            assert not var_budget.consume_llm_call(1)
+            var_budget.close()
+
+        assert parent.get_consumed_llm_calls() == 1
+        assert parent.get_remaining_llm_calls() == 9
+
+    def test_carve_insufficient_returns_none(self):
+        """부모 잔여량 초과 분할 불가"""
+        parent = Budget(max_llm_calls=2)
+        assert parent.carve(llm_calls=3) is None
+
+
+class TestBudgetDeadline:
+    """deadline 전파 테스트"""
+
+    def test_carve_runtime_capped_by_parent(self):
+        """하위 예산 시간 ≤ 부모 잔여 시간"""
+        parent = Budget(max_runtime_seconds=10.0, _start_time=time.time() - 8.0)
+        child = parent.carve(runtime=30.0)
+
+        assert child.max_runtime_seconds <= 2.0 + 1e-6
+        assert child.get_deadline() <= parent.get_deadline() + 1e-3
+
+    def test_request_timeout(self):
+        """요청 timeout = 잔여 시간 (하한 적용)"""
+        budget = Budget(max_runtime_seconds=30.0)
+        assert budget.get_request_timeout() == pytest.approx(30.0, abs=0.5)
+
+        expired = Budget(max_runtime_seconds=1.0, _start_time=time.time() - 5.0)
+        assert expired.get_request_timeout(min_timeout=1.0) == 1.0
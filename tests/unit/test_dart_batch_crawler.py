@@ -0,0 +1,155 @@
+"""
+DART 배치 크롤러 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- TokenBucket: worker 간 공유 속도 제한
+- DARTBatchCrawler: 동시 처리, 결과 즉시 기록, 체크포인트 재개
+- DARTCrawlerRobust: rate_limiter 지정 시 sleep 대신 사용
+"""
+
+import json
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.utils.dart_batch_crawler import DARTBatchCrawler, TokenBucket, read_corp_list
+from umis_rag.utils.dart_crawler_robust import DARTCrawlerRobust
+
+
+def make_crawler(delay=0.05, fail=()):
+    """crawl_sga가 delay만큼 걸리는 가짜 크롤러"""
+    crawler = Mock(spec=DARTCrawlerRobust)
+    crawler.rate_limiter = None
+    crawler.min_delay = 0.0
+    crawler.max_delay = 0.0
+    active = {'now': 0, 'max': 0}
+    lock = threading.Lock()
+
+    def crawl_sga(corp_name, rcept_no, verify_ofs=True, year=2024):
+        with lock:
+            active['now'] += 1
+            active['max'] = max(active['max'], active['now'])
+        time.sleep(delay)
+        with lock:
+            active['now'] -= 1
+        if corp_name in fail:
+            return {'success': False, 'error': '파싱 실패', 'corp_name': corp_name}
+        return {'success': True, 'corp_name': corp_name, 'rcept_no': rcept_no, 'total': 1.0}
+
+    crawler.crawl_sga.side_effect = crawl_sga
+    crawler.active = active
+    return crawler
+
+
+CORPS = [(f"기업{i}", f"2025031800{i:04d}") for i in range(8)]
+
+
+class TestTokenBucket:
+
+    def test_burst_then_rate(self):
+        bucket = TokenBucket(rate=50, capacity=2)
+
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # 2개는 즉시, 나머지 4개는 1/50초 간격
+        assert 0.06 <= elapsed < 0.3
+
+    def test_shared_across_threads(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(11)]
+
+        start = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert time.monotonic() - start >= 0.09
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestDARTBatchCrawler:
+
+    def test_runs_companies_concurrently(self, tmp_path):
+        crawler = make_crawler()
+        batch = DARTBatchCrawler(tmp_path / "out.jsonl", crawler=crawler, max_workers=4, rate=1000)
+
+        summary = batch.crawl(CORPS)
+
+        assert summary['succeeded'] == 8
+        assert crawler.active['max'] > 1
+        assert [r['corp_name'] for r in summary['results']] == [c for c, _ in CORPS]
+        assert isinstance(crawler.rate_limiter, TokenBucket)
+
+    def test_writes_each_result(self, tmp_path):
+        output = tmp_path / "out.jsonl"
+        batch = DARTBatchCrawler(output, crawler=make_crawler(delay=0), rate=1000)
+
+        batch.crawl(CORPS[:3])
+
+        lines = [json.loads(l) for l in output.read_text(encoding='utf-8').splitlines()]
+        assert sorted(r['corp_name'] for r in lines) == ["기업0", "기업1", "기업2"]
+        assert all('crawled_at' in r for r in lines)
+
+    def test_resume_skips_completed(self, tmp_path):
+        output = tmp_path / "out.jsonl"
+        DARTBatchCrawler(output, crawler=make_crawler(delay=0, fail={"기업1"}), rate=1000).crawl(CORPS[:3])
+        # 중단된 기록 (깨진 마지막 줄)
+        with open(output, 'a', encoding='utf-8') as f:
+            f.write('{"corp_name": "기업3", "succ')
+
+        crawler = make_crawler(delay=0)
+        summary = DARTBatchCrawler(output, crawler=crawler, rate=1000).crawl(CORPS[:5])
+
+        crawled = sorted(call.kwargs['corp_name'] for call in crawler.crawl_sga.call_args_list)
+        assert crawled == ["기업1", "기업3", "기업4"]
+        assert summary['skipped'] == 2
+
+    def test_resume_without_retrying_failures(self, tmp_path):
+        output = tmp_path / "out.jsonl"
+        DARTBatchCrawler(output, crawler=make_crawler(delay=0, fail={"기업1"}), rate=1000).crawl(CORPS[:3])
+
+        crawler = make_crawler(delay=0)
+        summary = DARTBatchCrawler(output, crawler=crawler, rate=1000).crawl(CORPS[:3], retry_failed=False)
+
+        assert crawler.crawl_sga.call_count == 0
+        assert summary['skipped'] == 3
+
+    def test_crawler_exception_recorded_as_failure(self, tmp_path):
+        crawler = make_crawler(delay=0)
+        crawler.crawl_sga.side_effect = RuntimeError("boom")
+
+        summary = DARTBatchCrawler(tmp_path / "out.jsonl", crawler=crawler, rate=1000).crawl(CORPS[:2])
+
+        assert summary['failed'] == 2
+        assert summary['results'][0]['error'] == "boom"
+
+
+class TestRobustCrawlerRateLimiter:
+
+    def test_uses_shared_limiter(self):
+        limiter = Mock()
+        crawler = DARTCrawlerRobust(rate_limiter=limiter)
+
+        crawler._rate_limit()
+
+        limiter.acquire.assert_called_once()
+
+
+def test_read_corp_list(tmp_path):
+    path = tmp_path / "corps.txt"
+    path.write_text("# 형식: 기업명,rcept_no\n\n이마트,20250318000688\n이름만\n", encoding='utf-8')
+
+    assert read_corp_list(path) == [("이마트", "20250318000688")]
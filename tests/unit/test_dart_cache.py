@@ -0,0 +1,161 @@
+"""
+DART 크롤러 응답 캐시 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 압축 저장 / 조회, 종류별 TTL, 용량 기반 eviction, 통계
+- 기존 JSON 파일 캐시 가져오기
+- DARTCrawlerRobust: 캐시 연동, cache_only(오프라인 재현) 모드
+"""
+
+import json
+import os
+import subprocess
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.utils.dart_cache import DARTResponseCache
+from umis_rag.utils.dart_crawler_robust import DARTCrawlerRobust, DARTCacheMiss
+
+
+HTML = "<table><tr><td>급여</td><td>1,234</td></tr></table>" * 200
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = DARTResponseCache(tmp_path / "cache", shards=2)
+    yield cache
+    cache.close()
+
+
+class TestDARTResponseCache:
+
+    def test_roundtrip_compressed(self, cache):
+        cache.set("k1", {'content': HTML}, kind='section')
+
+        assert cache.get("k1", kind='section') == {'content': HTML}
+        storage = cache.get_stats()['storage']
+        assert storage['entries'] == 1
+        assert storage['size_bytes'] < storage['raw_bytes'] / 5
+
+    def test_ttl_by_kind(self, tmp_path):
+        cache = DARTResponseCache(tmp_path / "cache", ttl_by_kind={'toc': 0.05})
+        cache.set("toc", {'all_sections': []}, kind='toc')
+        cache.set("section", {'content': HTML}, kind='section')
+
+        time.sleep(0.1)
+
+        assert cache.get("toc", kind='toc') is None
+        assert cache.get("section", kind='section') is not None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = DARTResponseCache(tmp_path / "cache", shards=1, max_bytes=700, touch_interval=0)
+        # 압축 후 ~260 bytes (랜덤 hex) → 3개째에서 초과
+        for key in ("k0", "k1"):
+            cache.set(key, {'content': os.urandom(200).hex()}, kind='section')
+            time.sleep(0.01)
+        cache.get("k0", kind='section')
+        cache.set("k2", {'content': os.urandom(200).hex()}, kind='section')
+
+        stats = cache.get_stats()
+        assert stats['storage']['size_bytes'] <= 700
+        assert stats['section']['evictions'] == 1
+        assert cache.get("k1", kind='section') is None
+        assert cache.get("k0", kind='section') is not None
+
+    def test_reads_do_not_write_within_touch_interval(self, cache):
+        cache.set("k", {'content': HTML}, kind='section')
+        shard = cache._shard("k")
+        changes = shard._conn.total_changes
+
+        for _ in range(5):
+            assert cache.get("k", kind='section') is not None
+
+        assert shard._conn.total_changes == changes
+
+    def test_running_size_matches_storage(self, tmp_path):
+        cache = DARTResponseCache(tmp_path / "cache", shards=2, max_bytes=2000)
+        for i in range(20):
+            cache.set(f"k{i % 7}", {'content': os.urandom(100 + i).hex()}, kind='section')
+
+        # 덮어쓰기 / eviction 후에도 누적 용량 = 실제 합계
+        assert sum(shard.total_bytes for shard in cache._shards) == cache.get_stats()['storage']['size_bytes']
+        assert cache.get_stats()['storage']['size_bytes'] <= 2000
+        cache.close()
+
+        reopened = DARTResponseCache(tmp_path / "cache", shards=2, max_bytes=2000)
+        assert sum(shard.total_bytes for shard in reopened._shards) == reopened.get_stats()['storage']['size_bytes']
+        reopened.close()
+
+    def test_stats_per_kind(self, cache):
+        cache.set("t", {'all_sections': []}, kind='toc')
+        cache.get("t", kind='toc')
+        cache.get("missing", kind='section')
+
+        stats = cache.get_stats()
+        assert stats['toc']['hits'] == 1
+        assert stats['section']['misses'] == 1
+        assert stats['toc']['hit_rate'] == 1.0
+
+    def test_import_does_not_load_llm_cache(self):
+        code = (
+            "import sys; import umis_rag.utils.dart_cache; "
+            "print(sorted(m for m in ('umis_rag.core.llm_cache', 'umis_rag.core.tracing') if m in sys.modules))"
+        )
+        root = Path(__file__).parent.parent.parent
+        out = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True, text=True, check=True)
+
+        assert out.stdout.strip().splitlines()[-1] == '[]'
+
+    def test_import_json_dir(self, cache, tmp_path):
+        legacy = tmp_path / "legacy"
+        legacy.mkdir()
+        (legacy / "abc.json").write_text(json.dumps({'all_sections': [{'text': '목차'}]}), encoding='utf-8')
+        (legacy / "def.json").write_text(json.dumps({'content': HTML}), encoding='utf-8')
+        (legacy / "broken.json").write_text("{", encoding='utf-8')
+
+        assert cache.import_json_dir(legacy, delete=True) == 2
+        assert cache.get("abc", kind='toc') == {'all_sections': [{'text': '목차'}]}
+        assert not (legacy / "def.json").exists()
+
+
+class TestCrawlerCache:
+
+    SECTION = {
+        'rcpNo': '20250318000688', 'dcmNo': '1', 'eleId': '33',
+        'offset': '0', 'length': '10', 'dtd': 'dart3.xsd'
+    }
+
+    def test_second_fetch_served_from_cache(self, tmp_path):
+        crawler = DARTCrawlerRobust(cache_dir=str(tmp_path / "cache"), min_delay=0, max_delay=0)
+        response = Mock(status_code=200, text=HTML)
+
+        with patch.object(crawler.session, 'get', return_value=response) as get:
+            assert crawler.fetch_section_content(self.SECTION) == HTML
+            assert crawler.fetch_section_content(self.SECTION) == HTML
+
+        assert get.call_count == 1
+        assert crawler.get_cache_stats()['section']['hits'] == 1
+
+    def test_cache_only_replays_without_network(self, tmp_path):
+        online = DARTCrawlerRobust(cache_dir=str(tmp_path / "cache"), min_delay=0, max_delay=0)
+        with patch.object(online.session, 'get', return_value=Mock(status_code=200, text=HTML)):
+            online.fetch_section_content(self.SECTION)
+
+        offline = DARTCrawlerRobust(cache=online.cache, cache_only=True)
+        with patch.object(offline.session, 'get') as get:
+            assert offline.fetch_section_content(self.SECTION) == HTML
+            assert offline.fetch_section_content({**self.SECTION, 'eleId': '34'}) is None
+
+        get.assert_not_called()
+
+    def test_cache_only_raises_on_direct_request(self):
+        crawler = DARTCrawlerRobust(cache_only=True)
+
+        with pytest.raises(DARTCacheMiss):
+            crawler._request_with_retry("https://dart.fss.or.kr/dsaf001/main.do", {'rcpNo': '1'})
@@ -0,0 +1,169 @@
+"""
+DART 기업 코드 로컬 인덱스 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 정확 매칭 / 상장사 우선 부분 매칭 (기존 get_corp_code 규칙)
+- 일괄 조회 / 기업 목록 파일 읽기
+- DARTClient: 갱신 주기 안에서는 corpCode.xml 재다운로드 없음, 304 처리
+"""
+
+import io
+import time
+import zipfile
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.utils.dart_api import DARTClient
+from umis_rag.utils.dart_corp_index import CorpCodeIndex, read_company_names
+
+
+CORPS = [
+    ('00000001', '하이브아이엠', ''),
+    ('00000002', '하이브', '352820'),
+    ('00000003', '삼성전자서비스', ''),
+    ('00000004', '삼성전자', '005930'),
+    ('00000005', '신세계푸드', '031440'),
+    ('00000006', '에스엠하이브', ''),
+    ('00000007', '이마트', '139480'),
+    ('00000008', '이마트', ''),
+]
+
+
+def make_corp_zip(corps=CORPS) -> bytes:
+    items = "".join(
+        f"<list><corp_code>{code}</corp_code><corp_name>{name}</corp_name>"
+        f"<stock_code>{stock}</stock_code><modify_date>20251101</modify_date></list>"
+        for code, name, stock in corps
+    )
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, 'w') as zf:
+        zf.writestr('CORPCODE.xml', f"<?xml version='1.0' encoding='UTF-8'?><result>{items}</result>")
+    return buf.getvalue()
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = CorpCodeIndex(tmp_path / "corp.sqlite3")
+    index.build_from_zip(make_corp_zip())
+    yield index
+    index.close()
+
+
+class TestCorpCodeIndex:
+    """조회 규칙"""
+
+    def test_exact_match(self, index):
+        assert index.lookup("하이브") == '00000002'
+        assert index.lookup("삼성전자") == '00000004'
+
+    def test_exact_duplicates_prefer_listed(self, index):
+        assert index.lookup("이마트") == '00000007'
+
+    def test_partial_prefers_listed(self, index):
+        # '신세' → 상장사 신세계푸드
+        assert index.lookup("신세") == '00000005'
+        # '하이' → 상장사 하이브 (비상장 하이브아이엠이 먼저 나와도)
+        assert index.lookup("하이") == '00000002'
+
+    def test_substring_fallback(self, index):
+        assert index.lookup("전자서비스") == '00000003'
+        assert index.lookup("없는회사") is None
+        assert index.lookup("") is None
+
+    def test_lookup_many_keeps_order(self, index):
+        result = index.lookup_many(["삼성전자", "없는회사", "하이브"])
+
+        assert list(result) == ["삼성전자", "없는회사", "하이브"]
+        assert result == {"삼성전자": '00000004', "없는회사": None, "하이브": '00000002'}
+
+    def test_search_prefix(self, index):
+        names = [r['corp_name'] for r in index.search("삼성")]
+
+        assert names == ["삼성전자", "삼성전자서비스"]
+
+    def test_rebuild_replaces_rows(self, index):
+        index.build_from_zip(make_corp_zip([('00000009', '새회사', '')]))
+
+        assert index.lookup("삼성전자") is None
+        assert index.get_meta()['count'] == 1
+
+    def test_staleness(self, index):
+        assert not index.is_stale(7)
+        assert index.is_stale(0)
+
+
+class TestReadCompanyNames:
+
+    def test_skips_comments_and_rcept_no(self, tmp_path):
+        path = tmp_path / "corps.txt"
+        path.write_text("# 주석\n\n이마트,20250318000688\n삼성전자\n", encoding='utf-8')
+
+        assert read_company_names(path) == ["이마트", "삼성전자"]
+
+
+class TestDARTClientCorpIndex:
+    """DARTClient 연동"""
+
+    def _response(self, status=200, content=b"", headers=None):
+        response = Mock()
+        response.status_code = status
+        response.content = content
+        response.headers = headers or {}
+        return response
+
+    def test_defaults_come_from_settings(self, tmp_path, monkeypatch):
+        from umis_rag.core.config import settings
+        monkeypatch.setattr(settings, 'dart_corp_index_path', tmp_path / "settings.sqlite3")
+        monkeypatch.setattr(settings, 'dart_corp_index_max_age_days', 3.0)
+
+        client = DARTClient("test-key")
+
+        assert client.corp_index_path == tmp_path / "settings.sqlite3"
+        assert client.corp_index_max_age_days == 3.0
+
+    def test_downloads_once_for_many_lookups(self, tmp_path):
+        client = DARTClient("test-key", corp_index_path=tmp_path / "corp.sqlite3")
+
+        with patch('umis_rag.utils.dart_api.requests.get',
+                   return_value=self._response(content=make_corp_zip())) as get:
+            assert client.get_corp_code("삼성전자") == '00000004'
+            assert client.get_corp_codes(["하이브", "이마트"]) == {
+                "하이브": '00000002', "이마트": '00000007'
+            }
+            other = DARTClient("test-key", corp_index_path=tmp_path / "corp.sqlite3")
+            assert other.get_corp_code("신세계푸드") == '00000005'
+
+        assert get.call_count == 1
+
+    def test_not_modified_keeps_index(self, tmp_path):
+        client = DARTClient("test-key", corp_index_path=tmp_path / "corp.sqlite3")
+        first = self._response(content=make_corp_zip(), headers={'ETag': '"v1"'})
+
+        with patch('umis_rag.utils.dart_api.requests.get',
+                   side_effect=[first, self._response(status=304)]) as get:
+            before = client.get_corp_index().get_meta()['fetched_at']
+            time.sleep(0.01)
+            rebuilt = client.refresh_corp_index()
+
+        assert rebuilt is False
+        assert get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+        assert client.get_corp_index().get_meta()['fetched_at'] > before
+        assert client.get_corp_code("하이브") == '00000002'
+
+    def test_refresh_failure_falls_back_to_existing(self, tmp_path):
+        client = DARTClient(
+            "test-key",
+            corp_index_path=tmp_path / "corp.sqlite3",
+            corp_index_max_age_days=0
+        )
+        with patch('umis_rag.utils.dart_api.requests.get',
+                   return_value=self._response(content=make_corp_zip())):
+            client.get_corp_index()
+
+        with patch('umis_rag.utils.dart_api.requests.get', side_effect=ConnectionError("down")):
+            assert client.get_corp_code("삼성전자") == '00000004'
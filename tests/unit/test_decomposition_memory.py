@@ -0,0 +1,219 @@
+"""
+Fermi 분해식 메모리 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- (정규화 질문, domain, region) 정확 일치
+- 같은 (domain, region) 안에서 임베딩 유사도 조회 (region 명시 시만)
+- 컴파일되지 않는 공식은 저장하지 않음
+- SQLite 영속화, LRU 항목 수 제한
+- FermiEstimator: 메모리 hit 시 분해 LLM 호출/예산 소모 없이 변수만 재추정
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator import FermiEstimator, PriorEstimator
+from umis_rag.agents.estimator.common import Evidence, create_standard_budget
+from umis_rag.agents.estimator.decomposition_memory import DecompositionMemory
+from umis_rag.agents.estimator.models import Context
+
+
+FORMULA = "음식점수 = 인구 / 인구당음식점"
+VARIABLES = {'인구': '서울 인구', '인구당음식점': '음식점 1개당 인구'}
+
+
+class FakeEmbeddings:
+    """질문 → 고정 벡터 (유사 질문은 같은 방향)"""
+
+    VECTORS = {
+        '서울 음식점 수는': [1.0, 0.0, 0.0],
+        '서울시 음식점 개수': [0.98, 0.2, 0.0],
+        '서울 카페 매출': [0.0, 1.0, 0.0],
+    }
+
+    def __init__(self):
+        self.calls = 0
+
+    def embed_query(self, text):
+        self.calls += 1
+        return self.VECTORS.get(text, [0.0, 0.0, 1.0])
+
+
+@pytest.fixture
+def memory():
+    return DecompositionMemory(embeddings=FakeEmbeddings())
+
+
+class TestDecompositionMemory:
+
+    def test_exact_match_normalizes_question(self, memory):
+        memory.remember("서울 음식점 수는?", Context(region='서울'), FORMULA, VARIABLES)
+
+        match = memory.lookup("  서울  음식점 수는 ", {'domain': 'General', 'region': '서울'})
+
+        assert match.match_type == 'exact'
+        assert match.formula == FORMULA
+        assert match.variables == VARIABLES
+
+    def test_similar_question(self, memory):
+        memory.remember("서울 음식점 수는?", Context(region='서울'), FORMULA, VARIABLES)
+
+        match = memory.lookup("서울시 음식점 개수", Context(region='서울'))
+
+        assert match.match_type == 'similar'
+        assert match.similarity > 0.9
+        assert match.source_question == '서울 음식점 수는'
+        assert memory.get_stats()['similar_hits'] == 1
+
+    def test_dissimilar_question_misses(self, memory):
+        memory.remember("서울 음식점 수는?", Context(region='서울'), FORMULA, VARIABLES)
+
+        assert memory.lookup("서울 카페 매출", Context(region='서울')) is None
+
+    def test_scope_is_domain_and_region(self, memory):
+        memory.remember("서울 음식점 수는?", Context(region='서울'), FORMULA, VARIABLES)
+
+        assert memory.lookup("서울 음식점 수는?", Context(region='부산')) is None
+        assert memory.lookup("서울시 음식점 개수", Context(region='부산')) is None
+
+    def test_similarity_requires_explicit_region(self, memory):
+        # 지역만 다른 질문이 같은 방향 임베딩이어도 region 없는 scope에선 재사용 안 함
+        memory.remember("서울 음식점 수는?", None, FORMULA, VARIABLES)
+
+        assert memory.lookup("서울시 음식점 개수", None) is None
+        assert memory.lookup("서울시 음식점 개수", {'domain': 'General'}) is None
+        assert memory.lookup("서울 음식점 수는", None).match_type == 'exact'
+
+    def test_hits_do_not_write(self, tmp_path):
+        memory = DecompositionMemory(path=tmp_path / "d.sqlite3", embeddings=FakeEmbeddings())
+        memory.remember("서울 음식점 수는?", Context(region='서울'), FORMULA, VARIABLES)
+        changes = memory._conn.total_changes
+
+        for question in ("서울 음식점 수는?", "서울시 음식점 개수") * 3:
+            assert memory.lookup(question, Context(region='서울')) is not None
+
+        assert memory._conn.total_changes == changes
+        memory.close()
+
+    def test_without_embeddings_exact_only(self):
+        memory = DecompositionMemory()
+        memory.remember("서울 음식점 수는?", None, FORMULA, VARIABLES)
+
+        assert memory.lookup("서울 음식점 수는", None) is not None
+        assert memory.lookup("서울시 음식점 개수", None) is None
+
+    def test_embedding_failure_falls_back_to_exact(self):
+        embeddings = Mock()
+        embeddings.embed_query.side_effect = RuntimeError("API down")
+        memory = DecompositionMemory(embeddings=embeddings)
+
+        assert memory.remember("서울 음식점 수는?", None, FORMULA, VARIABLES)
+        assert memory.lookup("서울 음식점 수는", None).match_type == 'exact'
+        assert memory.lookup("서울시 음식점 개수", None) is None
+
+    def test_invalid_formula_not_stored(self, memory):
+        assert not memory.remember("q", None, "X = __import__('os')", {})
+        assert not memory.remember("q", None, "X = a * b", {'a': 'a만 정의'})
+        assert memory.get_stats()['entries'] == 0
+
+    def test_persists_to_sqlite(self, tmp_path):
+        path = tmp_path / "decompositions.sqlite3"
+        first = DecompositionMemory(path=path, embeddings=FakeEmbeddings())
+        first.remember("서울 음식점 수는?", Context(region='서울'), FORMULA, VARIABLES)
+        first.close()
+
+        second = DecompositionMemory(path=path, embeddings=FakeEmbeddings())
+
+        assert second.lookup("서울 음식점 수는?", Context(region='서울')).formula == FORMULA
+        assert second.lookup("서울시 음식점 개수", Context(region='서울')).match_type == 'similar'
+        second.close()
+
+    def test_lru_limit(self, tmp_path):
+        memory = DecompositionMemory(path=tmp_path / "d.sqlite3", max_entries=2)
+        memory.remember("a", None, "1 + 1", {})
+        memory.remember("b", None, "2 + 2", {})
+        memory.lookup("a", None)
+        memory.remember("c", None, "3 + 3", {})
+
+        assert memory.lookup("b", None) is None
+        assert memory.lookup("a", None) is not None
+        assert memory.get_stats()['evictions'] == 1
+        memory.close()
+        assert DecompositionMemory(path=tmp_path / "d.sqlite3").get_stats()['entries'] == 2
+
+
+class TestFermiDecompositionMemory:
+
+    def _make_fermi(self, memory):
+        provider = Mock()
+        prior = PriorEstimator(llm_provider=provider, model_name='gpt-4o-mini')
+        fermi = FermiEstimator(
+            llm_provider=provider,
+            model_name='gpt-4o-mini',
+            prior_estimator=prior,
+            decomposition_memory=memory,
+            uncertainty_samples=0
+        )
+        values = {'인구': 10_000_000.0, '인구당음식점': 100.0}
+
+        def fake_call_llm(question, evidence, context, **kwargs):
+            name = question.replace('은/는?', '')
+            return values[name], None, 'high', f"{name} 추정"
+
+        async def fake_acall_llm(question, evidence, context, **kwargs):
+            return fake_call_llm(question, evidence, context)
+
+        self.generate = patch.object(fermi, '_generate_decomposition', return_value=(FORMULA, VARIABLES)).start()
+        self.agenerate = patch.object(fermi, '_agenerate_decomposition', return_value=(FORMULA, VARIABLES)).start()
+        self.call_llm = patch.object(prior, '_call_llm', side_effect=fake_call_llm).start()
+        patch.object(prior, '_acall_llm', side_effect=fake_acall_llm).start()
+        return fermi
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def test_second_question_skips_decomposition_call(self, memory):
+        fermi = self._make_fermi(memory)
+
+        first = fermi.estimate("서울 음식점 수는?", Evidence(), create_standard_budget(), Context(region='서울'))
+        budget = create_standard_budget()
+        second = fermi.estimate("서울시 음식점 개수", Evidence(), budget, Context(region='서울'))
+
+        assert self.generate.call_count == 1
+        assert first.value == second.value == pytest.approx(100_000)
+        # 변수는 다시 추정 (분해 호출만 생략)
+        assert self.call_llm.call_count == 4
+        assert budget.get_remaining_llm_calls() == budget.max_llm_calls - 2
+        # 비용: 첫 질문은 분해 1 + 변수 2, 메모리 hit은 변수 2만
+        assert first.cost['llm_calls'] == 3
+        assert second.cost['llm_calls'] == 2
+        assert (first.decomposition['from_memory'], second.decomposition['from_memory']) == (False, True)
+
+    def test_async_path_uses_memory(self, memory):
+        fermi = self._make_fermi(memory)
+
+        async def run():
+            await fermi.aestimate("서울 음식점 수는?", Evidence(), create_standard_budget(), Context(region='서울'))
+            return await fermi.aestimate("서울 음식점 수는", Evidence(), create_standard_budget(), Context(region='서울'))
+
+        result = asyncio.run(run())
+
+        assert result.value == pytest.approx(100_000)
+        assert self.agenerate.call_count == 1
+        assert result.cost['llm_calls'] == 2
+
+    def test_memory_lookup_error_falls_back_to_llm(self):
+        broken = Mock()
+        broken.lookup.side_effect = RuntimeError("db locked")
+        fermi = self._make_fermi(broken)
+
+        result = fermi.estimate("서울 음식점 수는?", Evidence(), create_standard_budget(), Context(region='서울'))
+
+        assert result.value == pytest.approx(100_000)
+        assert self.generate.call_count == 1
@@ -0,0 +1,178 @@
+"""
+FormulaEngine 셀 단위 의존성 그래프 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 순환 참조 (자기 참조 / 간접 / Named Range 경유, 긴 체인)
+- 미정의 Named Range
+- 가정 → 영향 셀 / 최종 출력, 부분 재계산 순서
+- 저장 전 그래프 (일반 / 스트리밍 워크북 동일)
+"""
+
+import pytest
+from openpyxl import Workbook
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.deliverables.excel import (
+    DependencyGraph,
+    FormulaEngine,
+    StreamingWorkbook,
+    WorkbookEvaluator,
+)
+from umis_rag.deliverables.excel.unit_economics import UnitEconomicsGenerator
+
+
+UE_INPUTS = {
+    'arpu': 9000, 'cac': 25000, 'gross_margin': 0.35,
+    'monthly_churn': 0.04, 'customer_lifetime': 25,
+    'sm_spend_monthly': 5_000_000, 'new_customers_monthly': 200
+}
+
+
+def model_workbook(wb):
+    """Inputs → Calc → Summary 소형 모델"""
+    engine = FormulaEngine(wb)
+    inputs = wb.create_sheet('Inputs')
+    inputs['B5'] = 100
+    inputs['B6'] = 0.5
+    engine.define_named_range('ARPU', 'Inputs', 'B5')
+    engine.define_named_range('Margin', 'Inputs', 'B6')
+
+    calc = wb.create_sheet('Calc')
+    for row in range(1, 101):
+        calc.cell(row=row, column=1).value = f"=ARPU*{row}"
+    calc['B1'] = '=SUM(A1:A100)'       # 64셀 초과 범위
+    calc['B2'] = '=B1*Margin'
+    calc['B3'] = '=Margin*2'
+
+    summary = wb.create_sheet('Summary')
+    summary['B5'] = '=Calc!B2'
+    summary['B6'] = '=Calc!B3+1'
+    return engine
+
+
+class TestGraph:
+
+    def test_cycles(self):
+        graph = DependencyGraph()
+        graph.add_name('Loop', 'S', '$D$1')
+        graph.add_formula('S', 'A1', '=A1*2')      # 자기 참조
+        graph.add_formula('S', 'B1', '=C1+1')      # 간접 순환
+        graph.add_formula('S', 'C1', '=SUM(B1:B2)')
+        graph.add_formula('S', 'D1', '=Loop+1')    # Named Range 경유
+        graph.add_formula('S', 'E1', '=B1')        # 순환 셀 참조 (순환 아님)
+
+        assert graph.find_cycles() == [[('S', 1, 1)], [('S', 1, 2), ('S', 1, 3)], [('S', 1, 4)]]
+        assert not graph.validate()['passed']
+
+        graph.add_formula('S', 'C1', '=10')
+        graph.set_cell('S', 1, 1, 5)               # 수식 → 값
+        assert graph.find_cycles() == [[('S', 1, 4)]]
+
+    def test_long_chain_without_recursion(self):
+        graph = DependencyGraph()
+        graph.add_formula('S', 'A1', '=1')
+        for row in range(2, 20001):
+            graph.add_formula('S', f'A{row}', f'=A{row - 1}+1')
+
+        assert graph.find_cycles() == []
+        assert len(graph.affected_cells('S!A1')) == 19999
+
+        graph.add_formula('S', 'A1', '=A20000')
+        assert len(graph.find_cycles()[0]) == 20000
+
+    def test_dangling_names(self):
+        graph = DependencyGraph()
+        graph.add_name('SAM', 'Method', 'C6')
+        graph.add_formula('Summary', 'B5', '=TAM')
+        graph.add_formula('Summary', 'B6', '=TAM/SAM')
+        graph.add_formula('Summary', 'B7', '=SAM')
+
+        assert graph.dangling_names() == {'TAM': [('Summary', 5, 2), ('Summary', 6, 2)]}
+        assert graph.validate()['dangling_names'] == {'TAM': ['Summary!B5', 'Summary!B6']}
+
+        graph.add_name('TAM', 'Method', 'A5')
+        assert graph.dangling_names() == {}
+
+    def test_references_must_resolve(self):
+        graph = DependencyGraph()
+        with pytest.raises(KeyError):
+            graph.affected_cells('Unknown')
+        with pytest.raises(ValueError):
+            graph.affected_cells('B5')  # 시트 없음
+
+
+class TestEngineGraph:
+
+    def test_affected_outputs_and_recalculation_order(self):
+        wb = Workbook()
+        engine = model_workbook(wb)
+
+        graph = engine.dependency_graph()
+
+        affected = graph.affected_cells('ARPU')
+        assert len(affected) == 100 + 3  # Calc!A1:A100, B1, B2, Summary!B5
+        assert graph.affected_outputs('ARPU') == {('Summary', 5, 2)}
+        assert graph.affected_outputs('Inputs!B6') == {('Summary', 5, 2), ('Summary', 6, 2)}
+        assert graph.dependents('Margin') == {('Calc', 2, 2), ('Calc', 3, 2)}
+        assert graph.precedents('Calc!B2') == {('Calc', 1, 2), ('Inputs', 6, 2)}
+
+        order = graph.recalculation_order(['Margin'])
+        assert set(order) == {('Calc', 2, 2), ('Calc', 3, 2), ('Summary', 5, 2), ('Summary', 6, 2)}
+        assert order.index(('Calc', 2, 2)) < order.index(('Summary', 5, 2))
+        assert order.index(('Calc', 3, 2)) < order.index(('Summary', 6, 2))
+
+    def test_graph_tracks_workbook_edits(self):
+        wb = Workbook()
+        engine = model_workbook(wb)
+        assert engine.validate_dependencies()['passed']
+
+        wb['Calc']['B3'] = '=Summary!B6'   # Calc!B3 ↔ Summary!B6 순환
+        wb['Summary']['B7'] = '=Missing'
+        report = engine.validate_dependencies()
+        assert report['cycles'] == [['Calc!B3', 'Summary!B6']]
+        assert report['dangling_names'] == {'Missing': ['Summary!B7']}
+
+        wb.remove(wb['Summary'])
+        assert engine.validate_dependencies()['passed']
+
+    def test_validation_quiet_by_default(self, capsys):
+        wb = Workbook()
+        engine = model_workbook(wb)
+        wb['Summary']['B7'] = '=Missing'
+
+        report = engine.validate_dependencies()
+        assert capsys.readouterr().out == ''
+        assert FormulaEngine.summarize_dependency_report(report) == (
+            "수식 의존성 ⚠️ 순환 참조 0건, 미정의 Named Range 1개, 파싱 실패 0건"
+        )
+
+        engine.validate_dependencies(verbose=True)
+        assert 'Missing' in capsys.readouterr().out
+
+    def test_streaming_matches_in_memory(self, tmp_path, capsys):
+        memory = UnitEconomicsGenerator()
+        memory.generate('music', UE_INPUTS, output_dir=tmp_path / 'memory')
+        streaming = UnitEconomicsGenerator()
+        filepath = streaming.generate('music', UE_INPUTS, output_dir=tmp_path / 'streaming', streaming=True)
+
+        memory_graph = memory.formula_engine.dependency_graph()
+        streaming_graph = streaming.formula_engine.dependency_graph()
+
+        assert streaming_graph.formulas == memory_graph.formulas == WorkbookEvaluator.from_file(filepath).formulas
+        assert streaming_graph.affected_cells('ARPU') == memory_graph.affected_cells('ARPU')
+        assert streaming.dependency_report['passed']
+        assert streaming.dependency_report['formula_count'] == len(memory_graph)
+        assert '수식 의존성 ✅' in capsys.readouterr().out
+
+    def test_streaming_buffer_included_before_save(self):
+        wb = StreamingWorkbook(window=2)
+        engine = FormulaEngine(wb)
+        ws = wb.create_sheet('S')
+        for row in range(1, 6):
+            ws.cell(row=row, column=1).value = f"=A{row + 1}+1" if row < 5 else '=A1'
+
+        assert engine.dependency_graph().find_cycles() == [[('S', row, 1) for row in range(1, 6)]]
+        wb.close()
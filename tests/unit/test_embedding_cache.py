@@ -0,0 +1,140 @@
+"""
+Embedding Cache 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 메모리 LRU hit
+- 디스크 저장소 hit (새 인스턴스)
+- embed_documents: miss만 한 번에 배치 임베딩
+- async 경로
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from langchain_core.embeddings import Embeddings
+
+from umis_rag.core.embedding_cache import CachedEmbeddings, SQLiteEmbeddingStore
+
+
+class FakeEmbeddings(Embeddings):
+    """호출 기록을 남기는 결정적 임베딩"""
+
+    def __init__(self):
+        self.calls: List[List[str]] = []
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(t)), 1.0, 0.5] for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+class TestCachedEmbeddings:
+    """메모리 / 디스크 캐시"""
+
+    def test_query_memory_hit(self):
+        base = FakeEmbeddings()
+        embeddings = CachedEmbeddings(base, model="m")
+
+        v1 = embeddings.embed_query("서울 음식점 수")
+        v2 = embeddings.embed_query("서울 음식점 수")
+
+        assert v1 == v2
+        assert len(base.calls) == 1
+        assert embeddings.get_stats()['memory_hits'] == 1
+
+    def test_documents_batch_only_misses(self):
+        base = FakeEmbeddings()
+        embeddings = CachedEmbeddings(base, model="m")
+        embeddings.embed_query("a")
+
+        vectors = embeddings.embed_documents(["a", "bb", "ccc", "bb"])
+
+        assert [v[0] for v in vectors] == [1.0, 2.0, 3.0, 2.0]
+        # 두 번째 호출은 miss("bb", "ccc")만 한 번에
+        assert base.calls[1] == ["bb", "ccc"]
+
+    def test_model_is_part_of_key(self):
+        base = FakeEmbeddings()
+        a = CachedEmbeddings(base, model="m1")
+        b = CachedEmbeddings(base, model="m2")
+
+        assert a.make_key("x") != b.make_key("x")
+
+    def test_lru_eviction(self):
+        base = FakeEmbeddings()
+        embeddings = CachedEmbeddings(base, model="m", memory_size=2)
+
+        embeddings.embed_documents(["a", "b", "c"])
+        embeddings.embed_query("a")
+
+        assert len(base.calls) == 2
+        assert embeddings.get_stats()['memory_entries'] == 2
+
+    def test_disk_store_survives_new_instance(self, tmp_path):
+        store = SQLiteEmbeddingStore(tmp_path / "emb.sqlite3")
+        first = FakeEmbeddings()
+        CachedEmbeddings(first, model="m", store=store).embed_query("서울")
+
+        second = FakeEmbeddings()
+        embeddings = CachedEmbeddings(second, model="m", store=store)
+        vector = embeddings.embed_query("서울")
+
+        assert second.calls == []
+        assert vector == pytest.approx([2.0, 1.0, 0.5])
+        assert embeddings.get_stats()['disk_hits'] == 1
+        store.close()
+
+    def test_disk_store_evicts_least_recently_used(self, tmp_path):
+        # 벡터 3개(float32) = 12바이트 → 최대 3개 보관
+        store = SQLiteEmbeddingStore(tmp_path / "emb.sqlite3", max_bytes=36)
+        store.TOUCH_INTERVAL = 0
+        embeddings = CachedEmbeddings(FakeEmbeddings(), model="m", store=store, memory_size=0)
+
+        embeddings.embed_documents(["a", "b", "c"])
+        embeddings.embed_query("a")          # a 최근 사용
+        embeddings.embed_query("dddd")       # 초과 → b, c 정리 (90%까지)
+
+        assert store.count() == 2
+        assert store.size_bytes() == 24
+        assert set(store.get_many([embeddings.make_key(t) for t in "abc"])) == {embeddings.make_key("a")}
+        store.close()
+
+    def test_disk_store_migrates_old_schema(self, tmp_path):
+        import sqlite3
+        path = tmp_path / "old.sqlite3"
+        conn = sqlite3.connect(str(path))
+        conn.execute("CREATE TABLE embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL, created_at REAL NOT NULL)")
+        conn.execute("INSERT INTO embeddings VALUES ('k', ?, 1.0)", (b"\0" * 12,))
+        conn.commit()
+        conn.close()
+
+        store = SQLiteEmbeddingStore(path)
+
+        assert store.size_bytes() == 12
+        assert store.get_many(['k']) == {'k': [0.0, 0.0, 0.0]}
+        store.close()
+
+    def test_disk_cache_off_by_default(self):
+        from umis_rag.core.config import Settings
+        assert Settings.model_fields['embedding_cache_path'].default is None
+
+    def test_async_paths(self):
+        base = FakeEmbeddings()
+        embeddings = CachedEmbeddings(base, model="m")
+
+        async def run():
+            await embeddings.aembed_query("a")
+            return await embeddings.aembed_documents(["a", "b"])
+
+        vectors = asyncio.run(run())
+
+        assert [v[0] for v in vectors] == [1.0, 1.0]
+        assert base.calls == [["a"], ["b"]]
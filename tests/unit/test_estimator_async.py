@@ -0,0 +1,170 @@
+"""
+Async 추정 경로 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- EstimatorRAG.aestimate (Stage 2 + 3 동시 실행, 예산 정산)
+- 하나의 이벤트 루프에서 다수 추정 동시 실행
+- 변수 추정 sync / async 동일 Fallback
+- BaseLLM 기본 async 구현 (동기 메서드 위임)
+- LLMResponseCache.aget_or_call
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator import EstimatorRAG, FermiEstimator, PriorEstimator, FusionLayer
+from umis_rag.agents.estimator.common import Budget, Evidence
+from umis_rag.core.llm_cache import LLMResponseCache, SQLiteLLMCache
+from umis_rag.core.llm_cursor import CursorLLM
+from umis_rag.core.llm_interface import TaskType
+
+
+def make_estimator():
+    """LLM/Chroma 없이 동작하는 EstimatorRAG (Stage 1은 Mock, LLM은 async fake)"""
+    provider = Mock()
+    prior = PriorEstimator(llm_provider=provider, model_name='gpt-4o-mini')
+    fermi = FermiEstimator(llm_provider=provider, model_name='gpt-4o-mini', prior_estimator=prior)
+
+    estimator = EstimatorRAG.__new__(EstimatorRAG)
+    estimator.llm_provider = provider
+    estimator.pipeline_stages = True
+    estimator.prior_estimator = prior
+    estimator.fermi_estimator = fermi
+    estimator.fusion_layer = FusionLayer()
+    estimator.evidence_collector = Mock()
+    estimator.evidence_collector.collect.return_value = (None, Evidence())
+
+    prior_calls = []
+
+    async def fake_acall_llm(question, evidence, context, **kwargs):
+        prior_calls.append(question)
+        await asyncio.sleep(0.01)
+        return 100.0, (50.0, 200.0), 'medium', '추정'
+
+    async def fake_adecompose(question, evidence, context, **kwargs):
+        return "매출 = 사업자수 * 평균매출", {'사업자수': '사업자 수', '평균매출': '평균 매출'}
+
+    patch.object(prior, '_acall_llm', side_effect=fake_acall_llm).start()
+    patch.object(fermi, '_agenerate_decomposition', side_effect=fake_adecompose).start()
+
+    return estimator, prior_calls
+
+
+class TestEstimatorAsync:
+    """EstimatorRAG.aestimate"""
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def test_aestimate_returns_fused_result(self):
+        estimator, prior_calls = make_estimator()
+        budget = Budget(max_llm_calls=10, max_variables=10)
+
+        result = asyncio.run(estimator.aestimate("서울 음식점 수는?", budget=budget))
+
+        assert result is not None
+        # Prior 1회 + Fermi 변수 2회
+        assert len(prior_calls) == 3
+        # Prior 1 + 분해식 1 + 변수 2
+        assert budget.get_consumed_llm_calls() == 4
+
+    def test_many_concurrent_estimations_on_one_loop(self):
+        estimator, prior_calls = make_estimator()
+        questions = [f"질문 {i}" for i in range(20)]
+
+        async def run_all():
+            return await asyncio.gather(*(estimator.aestimate(q) for q in questions))
+
+        results = asyncio.run(run_all())
+
+        assert all(r is not None for r in results)
+        assert len(prior_calls) == 60
+
+    def test_use_fermi_false_skips_fermi(self):
+        estimator, prior_calls = make_estimator()
+
+        result = asyncio.run(estimator.aestimate("서울 음식점 수는?", use_fermi=False))
+
+        assert result is not None
+        assert prior_calls == ["서울 음식점 수는?"]
+
+    def test_budget_limits_async_variables(self):
+        estimator, prior_calls = make_estimator()
+        # Prior 1 + 분해식 1 + 변수 1개만 가능
+        budget = Budget(max_llm_calls=3, max_variables=2)
+
+        asyncio.run(estimator.aestimate("서울 음식점 수는?", budget=budget))
+
+        assert budget.get_consumed_llm_calls() <= 3
+        assert budget.get_consumed_variables() <= 2
+
+
+class TestVariableFallback:
+    """_estimate_variable / _aestimate_variable 결과 동일"""
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def estimate_both(self, estimate, aestimate):
+        fermi = make_estimator()[0].fermi_estimator
+        fermi.prior_estimator = Mock(estimate=Mock(side_effect=estimate), aestimate=aestimate)
+        args = ('사업자수', '사업자 수', Evidence(), Budget(), None)
+        return fermi._estimate_variable(*args), asyncio.run(fermi._aestimate_variable(*args))
+
+    def test_failed_variable_uses_same_fallback(self):
+        async def aestimate(**kwargs):
+            return None
+
+        sync_result, async_result = self.estimate_both(lambda **kwargs: None, aestimate)
+
+        assert sync_result.value == async_result.value == 1.0
+        assert sync_result.value_range == async_result.value_range == (0.1, 10.0)
+        assert sync_result.certainty == async_result.certainty == 'low'
+        assert sync_result.reasoning == async_result.reasoning
+
+    def test_error_returns_none(self):
+        async def aestimate(**kwargs):
+            raise RuntimeError('LLM 오류')
+
+        def estimate(**kwargs):
+            raise RuntimeError('LLM 오류')
+
+        assert self.estimate_both(estimate, aestimate) == (None, None)
+
+
+class TestBaseLLMAsyncDefaults:
+    """BaseLLM a* 메서드는 동기 구현과 같은 결과"""
+
+    def test_cursor_async_matches_sync(self):
+        llm = CursorLLM(TaskType.PRIOR_ESTIMATION)
+
+        assert asyncio.run(llm.aestimate("질문", None)) is None
+        assert asyncio.run(llm.aevaluate_certainty("질문", 1.0, None)) == "medium"
+        assert asyncio.run(llm.avalidate_boundary(1.0, None))["is_valid"] is True
+
+
+class TestLLMCacheAsync:
+    """LLMResponseCache.aget_or_call"""
+
+    def test_aget_or_call_hits_after_first_call(self, tmp_path):
+        cache = LLMResponseCache(SQLiteLLMCache(tmp_path / "cache.sqlite3"), enabled=True)
+        calls = []
+
+        async def acall():
+            calls.append(1)
+            return "응답"
+
+        async def run():
+            first = await cache.aget_or_call('gpt-4o-mini', {}, 'prompt', acall)
+            second = await cache.aget_or_call('gpt-4o-mini', {}, 'prompt', acall)
+            return first, second
+
+        assert asyncio.run(run()) == ("응답", "응답")
+        assert len(calls) == 1
+        assert cache.get_stats()['hits'] == 1
@@ -0,0 +1,163 @@
+"""
+EstimatorRAG.estimate_many 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 결과 스트리밍 (모든 질문에 대해 index, 질문, 결과 반환)
+- 정규화된 질문당 Stage 1 1회
+- 질문 간 Fermi 변수 중복 제거
+- BatchMemo single-flight
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator import EstimatorRAG, FermiEstimator, PriorEstimator, FusionLayer
+from umis_rag.agents.estimator.batch import BatchMemo, normalize_question
+from umis_rag.agents.estimator.common import Evidence
+from umis_rag.agents.estimator.models import Context
+
+
+def make_estimator():
+    """LLM/Chroma 없이 동작하는 EstimatorRAG (Stage 1은 Mock)"""
+    provider = Mock()
+    prior = PriorEstimator(llm_provider=provider, model_name='gpt-4o-mini')
+    fermi = FermiEstimator(llm_provider=provider, model_name='gpt-4o-mini', prior_estimator=prior)
+
+    estimator = EstimatorRAG.__new__(EstimatorRAG)
+    estimator.llm_provider = provider
+    estimator.pipeline_stages = True
+    estimator.prior_estimator = prior
+    estimator.fermi_estimator = fermi
+    estimator.fusion_layer = FusionLayer()
+    estimator.evidence_collector = Mock()
+    estimator.evidence_collector.collect.return_value = (None, Evidence())
+
+    prior_calls = []
+
+    def fake_call_llm(question, evidence, context, **kwargs):
+        prior_calls.append(question)
+        time.sleep(0.01)
+        return 100.0, (50.0, 200.0), 'medium', '추정'
+
+    patch.object(prior, '_call_llm', side_effect=fake_call_llm).start()
+    patch.object(fermi, '_generate_decomposition', return_value=(
+        "매출 = 사업자수 * 평균매출",
+        {'사업자수': '사업자 수', '평균매출': '평균 매출'}
+    )).start()
+
+    return estimator, prior_calls
+
+
+class TestEstimateMany:
+    """배치 추정"""
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def test_streams_all_results(self):
+        estimator, _ = make_estimator()
+        questions = ["서울 음식점 수는?", "부산 음식점 수는?", "대구 음식점 수는?"]
+
+        results = list(estimator.estimate_many(questions, max_workers=2))
+
+        assert sorted(i for i, _, _ in results) == [0, 1, 2]
+        for i, question, result in results:
+            assert question == questions[i]
+            assert result is not None
+
+    def test_stage1_once_per_normalized_question(self):
+        estimator, _ = make_estimator()
+        questions = ["서울 음식점 수는?", "서울  음식점 수는??", "부산 음식점 수는?"]
+
+        list(estimator.estimate_many(questions, max_workers=3))
+
+        assert estimator.evidence_collector.collect.call_count == 2
+
+    def test_fermi_variables_deduplicated(self):
+        estimator, prior_calls = make_estimator()
+        questions = ["서울 음식점 매출은?", "부산 음식점 매출은?", "대구 음식점 매출은?"]
+
+        list(estimator.estimate_many(questions, max_workers=3))
+
+        # Prior: 질문당 1회, Fermi 변수: 배치 전체에서 변수당 1회
+        variable_calls = [q for q in prior_calls if q in ('사업자수은/는?', '평균매출은/는?')]
+        assert sorted(variable_calls) == ['사업자수은/는?', '평균매출은/는?']
+
+    def test_variables_not_shared_across_different_evidence(self):
+        estimator, prior_calls = make_estimator()
+        evidence = {
+            "서울 음식점 매출은?": Evidence(hard_bounds=(0, 1e6)),
+            "부산 음식점 매출은?": Evidence(hard_bounds=(0, 1e3)),
+        }
+        estimator.evidence_collector.collect.side_effect = (
+            lambda question, **kwargs: (None, evidence[question])
+        )
+
+        list(estimator.estimate_many(list(evidence), max_workers=2))
+
+        # 변수 이름이 같아도 증거가 다르면 질문별로 추정
+        variable_calls = [q for q in prior_calls if q in ('사업자수은/는?', '평균매출은/는?')]
+        assert sorted(variable_calls) == ['사업자수은/는?'] * 2 + ['평균매출은/는?'] * 2
+
+    def test_stage1_not_shared_across_different_context(self):
+        estimator, _ = make_estimator()
+        question = "서울 음식점 수는?"
+
+        memo = BatchMemo()
+        for project_data in ({'stores': 1}, {'stores': 2}, {'stores': 1}):
+            estimator._collect_evidence(question, Context(project_data=project_data), memo)
+
+        assert estimator.evidence_collector.collect.call_count == 2
+
+
+class TestBatchMemo:
+    """single-flight 메모"""
+
+    def test_concurrent_requests_compute_once(self):
+        memo = BatchMemo()
+        calls = []
+        barrier = threading.Barrier(4)
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return 42
+
+        def worker():
+            barrier.wait()
+            return memo.get_or_compute('k', compute)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert memo.get_stats()['hits'] == 3
+
+    def test_failure_is_not_memoized(self):
+        memo = BatchMemo()
+
+        with pytest.raises(ValueError):
+            memo.get_or_compute('k', Mock(side_effect=ValueError("boom")))
+
+        assert memo.get_or_compute('k', lambda: 1) == (1, True)
+
+    def test_none_is_not_memoized(self):
+        memo = BatchMemo()
+
+        assert memo.get_or_compute('k', lambda: None) == (None, True)
+        assert memo.get_or_compute('k', lambda: 1) == (1, True)
+        assert memo.get_or_compute('k', lambda: 2) == (1, False)
+
+    def test_normalize_question(self):
+        assert normalize_question("  서울  음식점 수는?? ") == "서울 음식점 수는"
+        assert normalize_question("B2B SaaS Churn?") == normalize_question("b2b saas churn")
@@ -0,0 +1,106 @@
+"""
+EstimatorRAG Lazy 초기화 / get_estimator 싱글톤 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 생성 시 Stage 구성요소를 만들지 않음
+- estimate_fast()는 FermiEstimator를 만들지 않음
+- get_estimator()는 같은 인스턴스 반환
+- LazyComponent 동시 첫 접근 시 1회 생성
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator import EstimatorRAG, PriorEstimator, get_estimator
+from umis_rag.agents.estimator.estimator import reset_estimator
+from umis_rag.agents.estimator.common import Evidence
+from umis_rag.agents.estimator.common.lazy import LazyComponent
+
+
+class TestEstimatorLazyStages:
+    """Stage 구성요소는 첫 사용 시 생성"""
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def test_construction_builds_no_stage(self):
+        estimator = EstimatorRAG(llm_provider=Mock())
+
+        for name in ('evidence_collector', 'prior_estimator', 'fermi_estimator', 'fusion_layer'):
+            assert not LazyComponent.is_built(estimator, name)
+
+    def test_estimate_fast_never_builds_fermi(self):
+        estimator = EstimatorRAG(llm_provider=Mock())
+        estimator.evidence_collector = Mock()
+        estimator.evidence_collector.collect.return_value = (None, Evidence())
+        patch.object(
+            PriorEstimator, '_call_llm',
+            return_value=(100.0, (50.0, 200.0), 'medium', '추정')
+        ).start()
+
+        result = estimator.estimate_fast("서울 음식점 수는?")
+
+        assert result is not None
+        assert LazyComponent.is_built(estimator, 'prior_estimator')
+        assert not LazyComponent.is_built(estimator, 'fermi_estimator')
+
+    def test_fermi_shares_prior_estimator(self):
+        estimator = EstimatorRAG(llm_provider=Mock())
+
+        assert estimator.fermi_estimator.prior_estimator is estimator.prior_estimator
+
+
+class TestGetEstimator:
+    """get_estimator() 싱글톤"""
+
+    def teardown_method(self):
+        reset_estimator()
+
+    def test_returns_same_instance(self):
+        assert get_estimator() is get_estimator()
+
+    def test_instance_per_project(self):
+        assert get_estimator("a") is not get_estimator("b")
+        assert get_estimator("a") is get_estimator("a")
+
+
+class TestLazyComponent:
+    """동시 첫 접근"""
+
+    def test_concurrent_first_access_builds_once(self):
+        built = []
+
+        def factory(owner):
+            time.sleep(0.01)
+            built.append(1)
+            return object()
+
+        class Owner:
+            part = LazyComponent(factory)
+
+        owner = Owner()
+        seen = []
+        threads = [threading.Thread(target=lambda: seen.append(owner.part)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(built) == 1
+        assert len({id(p) for p in seen}) == 1
+
+    def test_assignment_overrides_factory(self):
+        class Owner:
+            part = LazyComponent(lambda owner: "built")
+
+        owner = Owner()
+        owner.part = "injected"
+
+        assert owner.part == "injected"
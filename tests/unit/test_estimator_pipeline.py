@@ -0,0 +1,179 @@
+"""
+Stage 2 (Prior) + Stage 3 (Fermi) 동시 실행 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- EstimatorRAG._run_prior_and_fermi_pipelined (동시 실행, 예산 분할)
+- 순차 실행과 같은 결과 / 예산 소비
+- pipeline_stages=False, use_fermi=False 순차 경로
+"""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator import EstimatorRAG, FermiEstimator, PriorEstimator, FusionLayer
+from umis_rag.agents.estimator.common import Budget, Evidence
+
+
+QUESTION = "서울 음식점 수는?"
+
+
+def make_estimator(pipeline_stages=True, prior_gate=None):
+    """
+    LLM/Chroma 없이 동작하는 EstimatorRAG (Stage 1은 Mock, LLM은 fake)
+
+    Args:
+        pipeline_stages: Stage 2 + 3 동시 실행 여부
+        prior_gate: 설정 시 Prior는 Fermi 분해식 생성 후에만 응답 (동시 실행 확인용)
+    """
+    provider = Mock()
+    prior = PriorEstimator(llm_provider=provider, model_name='gpt-4o-mini')
+    fermi = FermiEstimator(
+        llm_provider=provider, model_name='gpt-4o-mini', prior_estimator=prior,
+        parallel_variables=False
+    )
+
+    estimator = EstimatorRAG.__new__(EstimatorRAG)
+    estimator.llm_provider = provider
+    estimator.pipeline_stages = pipeline_stages
+    estimator.prior_estimator = prior
+    estimator.fermi_estimator = fermi
+    estimator.fusion_layer = FusionLayer()
+    estimator.evidence_collector = Mock()
+    estimator.evidence_collector.collect.return_value = (None, Evidence())
+
+    events = []
+    lock = threading.Lock()
+    values = {QUESTION: 100.0, '사업자수은/는?': 20.0, '평균매출은/는?': 5.0}
+
+    def record(event):
+        with lock:
+            events.append(event)
+
+    def fake_call_llm(question, evidence, context, **kwargs):
+        if question == QUESTION and prior_gate is not None:
+            assert prior_gate.wait(timeout=5), "Prior와 Fermi가 동시에 실행되지 않음"
+        record(('prior', question))
+        value = values[question]
+        return value, (value * 0.5, value * 2), 'medium', '추정'
+
+    def fake_decompose(question, evidence, context, **kwargs):
+        record(('decompose', question))
+        if prior_gate is not None:
+            prior_gate.set()
+        return "음식점수 = 사업자수 * 평균매출", {'사업자수': '사업자 수', '평균매출': '평균 매출'}
+
+    patch.object(prior, '_call_llm', side_effect=fake_call_llm).start()
+    patch.object(fermi, '_generate_decomposition', side_effect=fake_decompose).start()
+
+    return estimator, events
+
+
+class TestPipelinedStages:
+    """Prior / Fermi 동시 실행"""
+
+    def teardown_method(self):
+        patch.stopall()
+
+    def test_prior_and_fermi_overlap(self):
+        # Prior는 Fermi 분해식이 나온 뒤에만 응답 → 순차 실행이면 timeout
+        estimator, events = make_estimator(prior_gate=threading.Event())
+
+        result = estimator.estimate(QUESTION, budget=Budget(max_llm_calls=10, max_variables=10))
+
+        assert result is not None
+        assert events.index(('decompose', QUESTION)) < events.index(('prior', QUESTION))
+
+    def test_matches_sequential_path(self):
+        results = {}
+        for pipelined in (True, False):
+            estimator, events = make_estimator(pipeline_stages=pipelined)
+            budget = Budget(max_llm_calls=10, max_variables=10)
+            result = estimator.estimate(QUESTION, budget=budget)
+            results[pipelined] = (
+                result.value, result.source,
+                budget.get_consumed_llm_calls(), budget.get_consumed_variables(),
+                sorted(events)
+            )
+
+        assert results[True] == results[False]
+        # Prior 1 + 분해식 1 + 변수 2
+        assert results[True][2] == 4
+
+    def test_budget_split_between_stages(self):
+        estimator, events = make_estimator()
+        budget = Budget(max_llm_calls=3, max_variables=10)
+
+        with patch.object(
+            estimator, '_run_prior', wraps=estimator._run_prior
+        ) as run_prior, patch.object(
+            estimator, '_run_fermi', wraps=estimator._run_fermi
+        ) as run_fermi:
+            estimator.estimate(QUESTION, budget=budget)
+
+        prior_budget = run_prior.call_args.args[2]
+        fermi_budget = run_fermi.call_args.args[2]
+        # Prior 몫 LLM 1회 선점, 나머지는 Fermi
+        assert (prior_budget.max_llm_calls, prior_budget.max_variables) == (1, 1)
+        assert (fermi_budget.max_llm_calls, fermi_budget.max_variables) == (2, 9)
+
+        # Fermi: 분해식 1 + 변수 1개만 (예산 부족)
+        prior_questions = [question for kind, question in events if kind == 'prior']
+        assert prior_questions.count(QUESTION) == 1
+        assert len(prior_questions) == 2
+        # 하위 예산 소비는 부모에 반영, 미사용분 반환
+        assert budget.get_consumed_llm_calls() == 3
+        assert budget.get_consumed_variables() == 2
+
+    def test_failed_stage_returns_unused_share(self):
+        estimator, events = make_estimator()
+        estimator.fermi_estimator._generate_decomposition.side_effect = RuntimeError("LLM down")
+        budget = Budget(max_llm_calls=10, max_variables=10)
+
+        result = estimator.estimate(QUESTION, budget=budget)
+
+        # Fermi 실패 → Prior 결과만 사용, Fermi 몫 미사용분은 부모에 반환
+        assert result.value == pytest.approx(100.0)
+        assert budget.get_consumed_llm_calls() == 1
+        assert budget.get_remaining_llm_calls() == 9
+        assert budget.get_remaining_variables() == 9
+
+    def test_prior_only_budget_skips_fermi(self):
+        estimator, events = make_estimator()
+        budget = Budget(max_llm_calls=1, max_variables=10)
+
+        result = estimator.estimate(QUESTION, budget=budget)
+
+        assert result.value == pytest.approx(100.0)
+        assert events == [('prior', QUESTION)]
+        assert budget.get_consumed_llm_calls() == 1
+
+
+class TestSequentialFallback:
+    """pipeline_stages=False / use_fermi=False → 순차 경로"""
+
+    def teardown_method(self):
+        patch.stopall()
+
+    @pytest.mark.parametrize("pipeline_stages, use_fermi", [(False, True), (True, False)])
+    def test_sequential_path_used(self, pipeline_stages, use_fermi):
+        estimator, events = make_estimator(pipeline_stages=pipeline_stages)
+
+        with patch.object(estimator, '_run_prior_and_fermi_pipelined') as pipelined:
+            result = estimator.estimate(
+                QUESTION, budget=Budget(max_llm_calls=10, max_variables=10), use_fermi=use_fermi
+            )
+
+        pipelined.assert_not_called()
+        assert result is not None
+        # Prior가 먼저 끝난 뒤 Fermi 실행
+        assert events[0] == ('prior', QUESTION)
+        if use_fermi:
+            assert events[1] == ('decompose', QUESTION)
+        else:
+            assert events == [('prior', QUESTION)]
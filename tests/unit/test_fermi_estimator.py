@@ -311,6 +311,98 @@ class TestFermiEstimatorErrorHandling:
         assert result is None or isinstance(result, EstimationResult)
 
 
+class TestFermiEstimatorParallelVariables:
+    """변수 병렬 추정 테스트 (v7.11.2)"""
+    
+    def _make_fermi(self, parallel_variables=True):
+        """분해식/변수 추정이 Mock된 FermiEstimator"""
+        from unittest.mock import Mock, patch
+        
+        provider = Mock()
+        prior = PriorEstimator(llm_provider=provider, model_name='gpt-4o-mini')
+        fermi = FermiEstimator(
+            llm_provider=provider,
+            model_name='gpt-4o-mini',
+            prior_estimator=prior,
+            parallel_variables=parallel_variables
+        )
+        
+        values = {'사업자수': 1000.0, '평균매출': 50.0, '도입률': 0.1}
+        
+        def fake_call_llm(question, evidence, context, **kwargs):
+            name = question.replace('은/는?', '')
+            value = values[name]
+            return value, (value * 0.5, value * 2), 'high', f"{name} 추정"
+        
+        patch.object(fermi, '_generate_decomposition', return_value=(
+            "시장규모 = 사업자수 * 평균매출 * 도입률",
+            {'사업자수': '사업자 수', '평균매출': '평균 매출', '도입률': '도입 비율'}
+        )).start()
+        patch.object(prior, '_call_llm', side_effect=fake_call_llm).start()
+        
+        return fermi
+    
+    def teardown_method(self):
+        from unittest.mock import patch
+        patch.stopall()
+    
+    def test_parallel_matches_sequential(self):
+        """병렬/순차 결과 동일"""
+        results = []
+        for parallel in (True, False):
+            fermi = self._make_fermi(parallel_variables=parallel)
+            budget = create_standard_budget()
+            results.append(fermi.estimate(
+                question="시장 규모는?",
+                evidence=Evidence(),
+                budget=budget,
+                context=Context(),
+                depth=0
+            ))
+        
+        parallel_result, sequential_result = results
+        assert parallel_result.value == pytest.approx(5000.0)
+        assert parallel_result.value == sequential_result.value
+        assert list(parallel_result.decomposition['variables']) == ['사업자수', '평균매출', '도입률']
+    
+    def test_parallel_reserves_budget_up_front(self):
+        """예산 일괄 선점 (분해 1회 + 변수 3개)"""
+        fermi = self._make_fermi()
+        budget = create_standard_budget()
+        
+        result = fermi.estimate(
+            question="시장 규모는?",
+            evidence=Evidence(),
+            budget=budget,
+            context=Context(),
+            depth=0
+        )
+        
+        assert result.cost['llm_calls'] == 4
+        assert budget.get_remaining_llm_calls() == budget.max_llm_calls - 4
+        assert budget.get_remaining_variables() == budget.max_variables - 3
+    
+    def test_parallel_respects_budget_limit(self):
+        """예산 부족 시 선점 가능한 변수만 추정"""
+        fermi = self._make_fermi()
+        budget = Budget(max_llm_calls=3, max_variables=10, max_runtime_seconds=60, max_depth=2)
+        
+        result = fermi.estimate(
+            question="시장 규모는?",
+            evidence=Evidence(),
+            budget=budget,
+            context=Context(),
+            depth=0
+        )
+        
+        # 분해 1회 + 변수 2개만 추정 (도입률은 예산 부족 → 공식 계산 불가)
+        assert result is None
+        assert budget.get_remaining_llm_calls() == 0
+        assert budget.get_remaining_variables() == budget.max_variables - 2
+        estimated = [c.args[0] for c in fermi.prior_estimator._call_llm.call_args_list]
+        assert sorted(estimated) == ['사업자수은/는?', '평균매출은/는?']
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
 
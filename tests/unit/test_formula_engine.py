@@ -0,0 +1,128 @@
+"""
+Fermi 공식 컴파일러 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 변수명 부분 문자열 충돌 없음 ('매출' / '평균매출')
+- 허용되지 않은 구문 거부 (속성, 호출, 비교 등)
+- 공식 텍스트 단위 캐시
+- 일괄 계산 (여러 할당 / 배열)
+- FermiEstimator._evaluate_formula 연동
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator import FermiEstimator
+from umis_rag.agents.estimator.common.estimation_result import create_prior_result
+from umis_rag.agents.estimator.common.formula import FormulaError, compile_formula
+
+
+class TestCompile:
+
+    def test_basic_formula(self):
+        f = compile_formula("LTV = ARPU / Churn")
+
+        assert f.variables == ('ARPU', 'Churn')
+        assert f.evaluate({'ARPU': 50000, 'Churn': 0.05}) == pytest.approx(1_000_000)
+        assert f(ARPU=100, Churn=0.5) == pytest.approx(200)
+
+    def test_substring_variable_names(self):
+        f = compile_formula("X = 평균매출 - 매출")
+
+        assert f.evaluate({'매출': 1, '평균매출': 10}) == 9
+
+    def test_operator_symbols(self):
+        f = compile_formula("시장 = 사업자수 × 도입률 ÷ 2 + 성장률^2")
+
+        assert f.evaluate({'사업자수': 100, '도입률': 0.5, '성장률': 3}) == 34
+
+    def test_whitelisted_functions_and_constants(self):
+        f = compile_formula("max(a, b, 1) + sqrt(c) + abs(-d) + pi * 0")
+
+        assert f.variables == ('a', 'b', 'c', 'd')
+        assert f.evaluate({'a': 2, 'b': 5, 'c': 16, 'd': 3}) == pytest.approx(12)
+
+    def test_non_identifier_names(self):
+        f = compile_formula("월 매출 * 12", variables=['월 매출'])
+
+        assert f.variables == ('월 매출',)
+        assert f.evaluate({'월 매출': 10}) == 120
+
+    @pytest.mark.parametrize("formula", [
+        "__import__('os').system('true')",
+        "a.__class__",
+        "open('x')",
+        "a if b else c",
+        "a < b",
+        "[a, b]",
+        "lambda: 1",
+        "'text'",
+        "max(a, key=b)",
+    ])
+    def test_rejects_unsafe_syntax(self, formula):
+        with pytest.raises(FormulaError):
+            compile_formula(formula)
+
+    def test_syntax_error(self):
+        with pytest.raises(FormulaError):
+            compile_formula("a * (b + ")
+
+    def test_cached_by_text(self):
+        assert compile_formula("y = a * b") is compile_formula("y = a * b")
+        assert compile_formula("y = a * b", ['b', 'a']) is compile_formula("y = a * b", ['a', 'b'])
+
+
+class TestEvaluate:
+
+    def test_missing_variable(self):
+        with pytest.raises(FormulaError, match="Churn"):
+            compile_formula("ARPU / Churn").evaluate({'ARPU': 1})
+
+    def test_division_by_zero(self):
+        with pytest.raises(FormulaError):
+            compile_formula("a / b").evaluate({'a': 1, 'b': 0})
+
+    def test_batch(self):
+        f = compile_formula("LTV = ARPU / Churn")
+
+        result = f.evaluate_batch([
+            {'ARPU': 100, 'Churn': 0.5},
+            {'ARPU': 100, 'Churn': 0.25},
+            {'ARPU': 100, 'Churn': 0},
+        ])
+
+        assert result[:2].tolist() == [200, 400]
+        assert np.isinf(result[2])
+
+    def test_batch_constant_formula_broadcasts(self):
+        assert compile_formula("2 * 3").evaluate_batch([{}, {}]).tolist() == [6, 6]
+
+    def test_arrays(self):
+        f = compile_formula("min(a, b) * 2")
+
+        assert f.evaluate_arrays({'a': [1, 5], 'b': 3}).tolist() == [2, 6]
+
+
+class TestFermiIntegration:
+
+    def test_evaluate_formula_substring_names(self):
+        fermi = FermiEstimator(llm_provider=Mock())
+        variables = {
+            '매출': create_prior_result(100, None, 'medium', '매출'),
+            '평균매출': create_prior_result(1000, None, 'medium', '평균매출'),
+        }
+
+        # 예전 str.replace 방식은 '평균매출' → '평균100'이 되어 실패
+        assert fermi._evaluate_formula("X = 평균매출 / 매출", variables) == 10
+
+    def test_evaluate_formula_rejects_unsafe(self):
+        fermi = FermiEstimator(llm_provider=Mock())
+
+        with pytest.raises(FormulaError):
+            fermi._evaluate_formula("X = __import__('os')", {})
@@ -0,0 +1,261 @@
+"""
+워크북 수식 재계산기 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 연산자 우선순위 / 오류 값 전파 / IFERROR
+- FormulaEngine Named Range, 시트 간 참조 ('Sheet Name'!A1)
+- COUNTIF 와일드카드, TEXT 서식
+- 위상 순서 계산 (정의 순서와 무관) / 순환 참조 #CIRC!
+- UnitEconomicsGenerator 워크북 재계산 + GoldenTestRunner 연동
+"""
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.workbook.defined_name import DefinedName
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.deliverables.excel import FormulaEngine, WorkbookEvaluator
+from umis_rag.deliverables.excel.formula_evaluator import (
+    CIRC,
+    DIV0,
+    NAME,
+    NUM,
+    FormulaSyntaxError,
+    evaluation_order,
+    parse_formula,
+)
+from umis_rag.deliverables.excel.golden_test_framework import GoldenTestRunner
+
+
+def evaluate_cells(cells, sheet_title='Sheet'):
+    """{셀: 값/수식} → WorkbookEvaluator"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = sheet_title
+    for coordinate, value in cells.items():
+        ws[coordinate] = value
+    return WorkbookEvaluator(wb)
+
+
+class TestExpressions:
+
+    @pytest.mark.parametrize("formula, expected", [
+        ("=1+2*3", 7),
+        ("=-2^2", 4),              # Excel: 단항 -가 ^보다 우선
+        ("=2^3^2", 64),            # 왼쪽 결합
+        ("=50%*10", 5.0),
+        ("=\"a\"&1.5&TRUE", "a1.5TRUE"),
+        ("=1<2", True),
+        ("=\"abc\"=\"ABC\"", True),
+        ("=\"1\"+1", 2.0),
+        ("=ROUND(2.5,0)", 3.0),
+        ("=ROUND(1E30,0)", 1e30),  # Decimal 정밀도 초과
+        ("=2^1024", NUM),          # 오버플로 → #NUM! (big-int 아님)
+        ("=10^400*1.5", NUM),
+        ("=10^400/3", NUM),
+        ("=SUM(10^400,0.5)", NUM),
+        ("=ROUND(10^400,0)", NUM),
+        ("=TEXT(10^400,\"0\")", NUM),
+        ("=1E308*10", NUM),
+        ("=SUM(1E308,1E308)", NUM),
+        ("=0^-1", DIV0),
+        ("=(-8)^(1/3)", NUM),
+        ("=ROUND(-1.5E25,-2)", -1.5e25),
+        ("=IF(1>2,\"y\",\"n\")", "n"),
+        ("=AND(TRUE,1,OR(FALSE,0))", False),
+    ])
+    def test_scalar(self, formula, expected):
+        assert evaluate_cells({'A1': formula}).get_value('Sheet', 'A1') == expected
+
+    def test_errors_propagate_and_iferror_catches(self):
+        evaluator = evaluate_cells({
+            'A1': 0,
+            'A2': '=10/A1',
+            'A3': '=A2*2',
+            'A4': '=IFERROR(A3, -1)',
+            'A5': '=UNKNOWNFN(1)',
+        })
+
+        assert evaluator.get_value('Sheet', 'A3') == DIV0
+        assert evaluator.get_value('Sheet', 'A4') == -1
+        assert evaluator.get_value('Sheet', 'A5') == NAME
+        assert set(evaluator.get_errors()) == {'Sheet!A2', 'Sheet!A3', 'Sheet!A5'}
+
+    def test_aggregates_skip_text_in_ranges(self):
+        evaluator = evaluate_cells({
+            'A1': 1, 'A2': 'text', 'A3': 3, 'A4': None,
+            'B1': '=SUM(A1:A4)',
+            'B2': '=AVERAGE(A1:A4)',
+            'B3': '=MAX(A1:A3)-MIN(A1:A3)',
+            'B4': '=STDEV(A1:A3)',
+            'B5': '=AVERAGE(C1:C3)',
+        })
+
+        assert evaluator.get_value('Sheet', 'B1') == 4
+        assert evaluator.get_value('Sheet', 'B2') == 2
+        assert evaluator.get_value('Sheet', 'B3') == 2
+        assert evaluator.get_value('Sheet', 'B4') == pytest.approx(1.41421356)
+        assert evaluator.get_value('Sheet', 'B5') == DIV0
+
+    def test_countif_and_text(self):
+        evaluator = evaluate_cells({
+            'A1': '✅ 우수', 'A2': '⚠️ 주의', 'A3': '✅ 양호', 'A4': 5,
+            'B1': '=COUNTIF(A1:A4, "*✅*")',
+            'B2': '=COUNTIF(A1:A4, ">=5")',
+            'B3': '=TEXT(0.2345, "0.0%")',
+            'B4': '=TEXT(1234567.891, "#,##0.00")',
+        })
+
+        assert evaluator.get_value('Sheet', 'B1') == 2
+        assert evaluator.get_value('Sheet', 'B2') == 1
+        assert evaluator.get_value('Sheet', 'B3') == '23.5%'
+        assert evaluator.get_value('Sheet', 'B4') == '1,234,567.89'
+
+    def test_syntax_error_recorded(self):
+        evaluator = evaluate_cells({'A1': '= Proxy × Rate'})
+
+        assert evaluator.get_errors() == {'Sheet!A1': evaluator.get_value('Sheet', 'A1')}
+        assert ('Sheet', 1, 1) in evaluator.syntax_errors
+
+        with pytest.raises(FormulaSyntaxError):
+            parse_formula("=SUM(A1")
+
+
+class TestWorkbookReferences:
+
+    def test_named_ranges_and_cross_sheet(self):
+        wb = Workbook()
+        assumptions = wb.active
+        assumptions.title = 'Assumptions'
+        calc = wb.create_sheet('Method 1')
+        summary = wb.create_sheet('Summary')
+
+        engine = FormulaEngine(wb)
+        assumptions['D2'] = 1000
+        assumptions['D3'] = 0.15
+        assumptions['D4'] = 0.25
+        engine.define_named_range('TAM', 'Assumptions', 'D2')
+        engine.define_named_range('ASM_KR', 'Assumptions', 'D3')
+        engine.define_named_range('ASM_PIANO', 'Assumptions', 'D4')
+
+        # 요약 시트를 먼저 작성해도 의존성 순서대로 계산
+        summary['B2'] = engine.create_cross_sheet_ref('Method 1', 'B3')
+        summary['B3'] = '=SUM(ASM_KR:ASM_PIANO)'
+        calc['B2'] = '=TAM*ASM_KR'
+        calc['B3'] = '=B2*ASM_PIANO'
+
+        evaluator = WorkbookEvaluator(wb)
+
+        assert evaluator.get_value('Summary', 'B2') == pytest.approx(37.5)
+        assert evaluator.get_value('Summary', 'B3') == pytest.approx(0.4)
+        assert evaluator.get("'Method 1'!B2") == pytest.approx(150)
+        assert evaluator.get('tam') == 1000
+        assert evaluator.get('Assumptions!D2:D3') == [1000, 0.15]
+
+    def test_cell_and_reference_accessors(self):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = 'S'
+        FormulaEngine(wb).define_named_range('Rate', 'S', 'A1')
+        ws['A1'] = 0.1
+        ws['A2'] = '=Rate*2'
+        evaluator = WorkbookEvaluator(wb)
+        node = parse_formula('=Rate')
+
+        assert evaluator.raw_value('S', 2, 1) == '=Rate*2'
+        assert evaluator.raw_value('S', 1, 1) == 0.1
+        assert evaluator.has_cell('S', 1, 1) and not evaluator.has_cell('S', 3, 1)
+        assert evaluator.name_target(node, 'S') is not None
+        assert evaluator.name_target(parse_formula('=Missing'), 'S') is None
+        assert evaluator.reference_bounds(node, 'S') == ('S', 1, 1, 1, 1)
+        assert evaluator.dependencies(parse_formula('=A2+Rate'), 'S') == {('S', 2, 1)}
+
+    def test_undefined_name(self):
+        assert evaluate_cells({'A1': '=TAM'}).get_value('Sheet', 'A1') == NAME
+
+    def test_cycle_marked_and_propagated(self):
+        evaluator = evaluate_cells({
+            'A1': '=A2+1',
+            'A2': '=A1+1',
+            'A3': '=A3',
+            'B1': '=A1*2',
+            'B2': 5,
+            'B3': '=B2+1',
+        })
+
+        assert evaluator.circular_cells == {('Sheet', 1, 1), ('Sheet', 2, 1), ('Sheet', 3, 1)}
+        assert evaluator.get_value('Sheet', 'A1') == CIRC
+        assert evaluator.get_value('Sheet', 'B1') == CIRC
+        assert evaluator.get_value('Sheet', 'B3') == 6
+
+    def test_formula_name_adds_dependencies(self):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = 'S'
+        wb.defined_names.add(DefinedName('Dbl', attr_text='S!$A$3*1'))
+        ws['A1'] = '=Dbl+1'      # 정의식 경유 A3 참조 → A3 먼저 계산
+        ws['A2'] = 5
+        ws['A3'] = '=A2*2'
+
+        evaluator = WorkbookEvaluator(wb)
+
+        assert evaluator.get_value('S', 'A1') == 11
+        assert evaluator.circular_cells == set()
+
+    def test_evaluation_order_dependencies_first(self):
+        order, cyclic = evaluation_order({'c': {'b'}, 'b': {'a'}, 'a': set()})
+
+        assert order == ['a', 'b', 'c']
+        assert cyclic == set()
+
+
+class TestGeneratedWorkbooks:
+
+    @pytest.fixture(scope='class')
+    @classmethod
+    def unit_economics_path(cls, tmp_path_factory):
+        from umis_rag.deliverables.excel.unit_economics.unit_economics_generator import (
+            UnitEconomicsGenerator
+        )
+
+        return UnitEconomicsGenerator().generate(
+            'music',
+            {
+                'arpu': 9000, 'cac': 25000, 'gross_margin': 0.35,
+                'monthly_churn': 0.04, 'customer_lifetime': 25,
+                'sm_spend_monthly': 5_000_000, 'new_customers_monthly': 200
+            },
+            output_dir=tmp_path_factory.mktemp('ue')
+        )
+
+    def test_unit_economics_recalculated(self, unit_economics_path):
+        # 생성 직후 파일에는 캐시된 계산 값이 없음
+        cached = load_workbook(unit_economics_path, data_only=True)
+        assert cached['LTV_Calculation']['B18'].value is None
+
+        evaluator = WorkbookEvaluator.from_file(unit_economics_path)
+
+        assert evaluator.get('LTV') == pytest.approx(78_750)
+        assert evaluator.get('LTV_CAC_Ratio') == pytest.approx(3.15)
+        assert evaluator.get('PaybackPeriod') == pytest.approx(7.94, abs=0.01)
+        assert not evaluator.syntax_errors
+        assert not evaluator.circular_cells
+
+    def test_golden_runner_uses_recalculated_values(self, unit_economics_path):
+        spec = {
+            'name': 'Unit Economics',
+            'case': 'music',
+            'expected_values': [
+                {'sheet': 'LTV_Calculation', 'cell': 'B18', 'expected': 78_750, 'description': 'LTV'},
+            ],
+        }
+
+        result = GoldenTestRunner(unit_economics_path, spec).run()
+        offline = GoldenTestRunner(unit_economics_path, spec, recalculate=False).run()
+
+        assert result['passed'], result['errors']
+        assert result['results']['LTV_Calculation!B18'] == pytest.approx(78_750)
+        assert not offline['passed']
@@ -8,6 +8,8 @@ Week 4: GuardrailAnalyzer 단위 테스트 (v7.10.0)
 - Stage 1 통합
 """
 
+import time
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -277,6 +279,75 @@ class TestAnalyzeBatch:
         assert len(guardrails) == 3
 
 
+class TestAnalyzeBatchParallel:
+    """병렬 배치 / 통합 프롬프트 / 조기 종료 (v7.11.2)"""
+
+    @staticmethod
+    def make_guardrail(guard_type, value):
+        return Guardrail(
+            type=guard_type,
+            value=value,
+            confidence=0.95,
+            is_hard=guard_type in (GuardrailType.HARD_UPPER, GuardrailType.HARD_LOWER),
+            reasoning="테스트",
+            source="Test"
+        )
+
+    def test_parallel_keeps_input_order(self):
+        analyzer = GuardrailAnalyzer()
+
+        def fake_analyze(similar_question, similar_value, **kwargs):
+            time.sleep(0.01 * (5 - similar_value))  # 뒤 항목이 먼저 끝나도록
+            return self.make_guardrail(GuardrailType.SOFT_UPPER, similar_value)
+
+        with patch.object(analyzer, 'analyze', side_effect=fake_analyze):
+            guardrails = analyzer.analyze_batch(
+                target_question="테스트",
+                similar_items=[("유사", i) for i in range(5)]
+            )
+
+        assert [g.value for g in guardrails] == [0, 1, 2, 3, 4]
+
+    def test_stop_when_bounded_skips_remaining(self):
+        analyzer = GuardrailAnalyzer()
+        called = []
+
+        def fake_analyze(similar_question, similar_value, **kwargs):
+            called.append(similar_value)
+            guard_type = GuardrailType.HARD_UPPER if similar_value == 0 else GuardrailType.HARD_LOWER
+            return self.make_guardrail(guard_type, similar_value)
+
+        with patch.object(analyzer, 'analyze', side_effect=fake_analyze):
+            guardrails = analyzer.analyze_batch(
+                target_question="테스트",
+                similar_items=[("유사", i) for i in range(5)],
+                parallel=False,
+                stop_when_bounded=True
+            )
+
+        assert called == [0, 1]
+        assert len(guardrails) == 2
+
+    def test_combined_prompt_uses_single_llm_call(self):
+        analyzer = GuardrailAnalyzer(combined_prompt=True)
+
+        mock_response = Mock()
+        mock_response.content = '{"relationship": "UPPER_BOUND", "is_hard": true, "reasoning": "부분 <= 전체"}'
+
+        with patch.object(analyzer, '_get_llm') as mock_llm:
+            mock_llm.return_value.invoke.return_value = mock_response
+
+            guardrail = analyzer.analyze(
+                target_question="개인사업자 수는?",
+                similar_question="전체 사업자 수는?",
+                similar_value=10_000_000
+            )
+
+        assert mock_llm.return_value.invoke.call_count == 1
+        assert guardrail.type == GuardrailType.HARD_UPPER
+        assert guardrail.is_hard is True
+
+
 class TestStage1Integration:
     """Stage 1 통합 테스트"""
 
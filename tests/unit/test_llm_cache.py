@@ -0,0 +1,127 @@
+"""
+LLM 응답 캐시 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- Content-addressed 키 (model, params, prompt)
+- hit/miss 통계, bypass
+- TTL 만료, 용량 기반 LRU eviction
+- LangChain Chat 모델 호출 래핑
+"""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.core.llm_cache import LLMResponseCache, SQLiteLLMCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    backend = SQLiteLLMCache(tmp_path / "llm_cache.sqlite3", max_bytes=10_000)
+    yield LLMResponseCache(backend=backend)
+    backend.close()
+
+
+class TestLLMResponseCache:
+    """캐시 기본 동작"""
+
+    def test_key_depends_on_model_params_prompt(self):
+        key = LLMResponseCache.make_key("gpt-4o-mini", {"temperature": 0.3}, "질문")
+        assert key == LLMResponseCache.make_key("gpt-4o-mini", {"temperature": 0.3}, "질문")
+        assert key != LLMResponseCache.make_key("gpt-4o", {"temperature": 0.3}, "질문")
+        assert key != LLMResponseCache.make_key("gpt-4o-mini", {"temperature": 0.7}, "질문")
+        assert key != LLMResponseCache.make_key("gpt-4o-mini", {"temperature": 0.3}, "다른 질문")
+
+    def test_hit_after_miss(self, cache):
+        call = Mock(return_value='{"value": 1}')
+
+        first = cache.get_or_call("m", {}, "p", call)
+        second = cache.get_or_call("m", {}, "p", call)
+
+        assert first == second == '{"value": 1}'
+        assert call.call_count == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_bypass(self, cache):
+        call = Mock(return_value="r")
+
+        cache.get_or_call("m", {}, "p", call)
+        cache.get_or_call("m", {}, "p", call, bypass=True)
+
+        assert call.call_count == 2
+        assert cache.stats.bypassed == 1
+
+    def test_disabled_cache_always_calls(self):
+        cache = LLMResponseCache(backend=None)
+        call = Mock(return_value="r")
+
+        cache.get_or_call("m", {}, "p", call)
+        cache.get_or_call("m", {}, "p", call)
+
+        assert call.call_count == 2
+        assert not cache.enabled
+
+    def test_invoke_wraps_chat_model(self, cache):
+        llm = Mock()
+        llm.model_name = "gpt-4o-mini"
+        llm.temperature = 0.3
+        llm.invoke.return_value = Mock(content="응답")
+
+        assert cache.invoke(llm, "프롬프트", timeout=5.0) == "응답"
+        assert cache.invoke(llm, "프롬프트", timeout=5.0) == "응답"
+        llm.invoke.assert_called_once_with("프롬프트", timeout=5.0)
+
+
+class TestSQLiteLLMCache:
+    """SQLite 저장소"""
+
+    def test_ttl_expiry(self, tmp_path):
+        backend = SQLiteLLMCache(tmp_path / "c.sqlite3")
+        backend.set("k", "v", ttl_seconds=0.05)
+        assert backend.get("k") == "v"
+
+        time.sleep(0.1)
+        assert backend.get("k") is None
+
+    def test_lru_eviction(self, tmp_path):
+        backend = SQLiteLLMCache(tmp_path / "c.sqlite3", max_bytes=250, touch_interval=0)
+        backend.set("a", "x" * 100)
+        backend.set("b", "x" * 100)
+        backend.get("a")  # a를 최근 사용으로
+
+        evicted = backend.set("c", "x" * 100)
+
+        assert evicted == 1
+        assert backend.get("b") is None
+        assert backend.get("a") is not None
+        assert backend.info()['size_bytes'] <= 250
+
+    def test_reads_do_not_write(self, tmp_path):
+        backend = SQLiteLLMCache(tmp_path / "c.sqlite3")
+        backend.set("a", "v")
+        changes = backend._conn.total_changes
+
+        for _ in range(5):
+            assert backend.get("a") == "v"
+
+        assert backend._conn.total_changes == changes
+
+    def test_running_size_matches_storage(self, tmp_path):
+        backend = SQLiteLLMCache(tmp_path / "c.sqlite3", max_bytes=1000, touch_interval=0)
+        for i in range(30):
+            backend.set(f"k{i % 12}", "x" * (10 + i))
+        backend.delete("k3")
+        backend.set("expired", "x" * 50, ttl_seconds=0.01)
+        time.sleep(0.02)
+        backend.get("expired")
+
+        assert backend._total == backend.info()['size_bytes']
+        # 재시작 시 파일에서 복원
+        assert SQLiteLLMCache(tmp_path / "c.sqlite3")._total == backend._total
@@ -0,0 +1,171 @@
+"""
+LLM Client Registry 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- (model, params)별 ChatOpenAI 재사용
+- 모든 클라이언트의 HTTP 풀 공유
+- 풀 한도 설정
+- async 풀: asyncio.run() 여러 번 호출 시 루프별 풀 사용 / 종료
+- ExternalLLM / Estimator 호출 지점의 공유 클라이언트 사용
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.core.llm_clients import (
+    LLMClientRegistry, ESTIMATOR_CLIENT_PARAMS,
+    get_llm_client_registry, reset_llm_client_registry
+)
+from umis_rag.core.llm_external import ExternalLLM
+from umis_rag.core.llm_interface import TaskType
+
+
+@pytest.fixture
+def registry():
+    registry = LLMClientRegistry(max_connections=10, max_keepalive_connections=5)
+    yield registry
+    registry.close()
+
+
+class TestLLMClientRegistry:
+    """클라이언트 재사용"""
+
+    def test_same_model_and_params_reuse_client(self, registry):
+        a = registry.get_chat_model("gpt-4o-mini", temperature=0.2)
+        b = registry.get_chat_model("gpt-4o-mini", temperature=0.2)
+
+        assert a is b
+        assert registry.get_stats()['clients'] == 1
+
+    def test_different_params_get_different_clients(self, registry):
+        a = registry.get_chat_model("gpt-4o-mini", temperature=0.2)
+        b = registry.get_chat_model("gpt-4o-mini", temperature=0.3)
+        c = registry.get_chat_model("gpt-4o", temperature=0.2)
+
+        assert len({id(a), id(b), id(c)}) == 3
+
+    def test_clients_share_http_pool(self, registry):
+        a = registry.get_chat_model("gpt-4o-mini", temperature=0.2)
+        b = registry.get_chat_model("gpt-4o", temperature=0.7)
+
+        assert a.http_client is registry.http_client
+        assert b.http_client is registry.http_client
+        assert a.http_async_client is registry.http_async_client
+
+    def test_pool_limits(self, registry):
+        stats = registry.get_stats()
+
+        assert stats['max_connections'] == 10
+        assert stats['max_keepalive_connections'] == 5
+
+    def test_concurrent_get_creates_one_client(self, registry):
+        results = []
+
+        def worker():
+            results.append(registry.get_chat_model("gpt-4o-mini", temperature=0.2))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(r) for r in results}) == 1
+
+    def test_warm_up_without_connect(self, registry):
+        count = registry.warm_up(
+            [("gpt-4o-mini", ESTIMATOR_CLIENT_PARAMS['prior']),
+             ("gpt-4o-mini", ESTIMATOR_CLIENT_PARAMS['fermi'])],
+            connect=False
+        )
+
+        assert count == 2
+        assert registry.get_stats()['clients'] == 2
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive → 연결이 풀에 남음
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+class TestAsyncPool:
+    """async HTTP 풀은 이벤트 루프별"""
+
+    def test_shared_client_across_asyncio_runs(self, registry, local_server):
+        client = registry.http_async_client
+
+        async def fetch():
+            responses = await asyncio.gather(*(client.get(local_server) for _ in range(3)))
+            return [r.text for r in responses], registry.get_stats()['async_pools']
+
+        # 두 번째 asyncio.run()이 첫 루프의 keep-alive 연결을 쓰면 실패
+        assert asyncio.run(fetch()) == (["ok"] * 3, 1)
+        assert asyncio.run(fetch()) == (["ok"] * 3, 1)
+        assert registry.http_async_client is client
+        # 루프 종료 시 그 루프의 풀도 닫힘
+        assert registry.get_stats()['async_pools'] == 0
+
+    def test_aclose_keeps_client_usable(self, registry, local_server):
+        client = registry.http_async_client
+
+        async def fetch_close_fetch():
+            first = (await client.get(local_server)).text
+            await registry.aclose()
+            pools_after_close = registry.get_stats()['async_pools']
+            second = (await client.get(local_server)).text
+            return first, pools_after_close, second
+
+        assert asyncio.run(fetch_close_fetch()) == ("ok", 0, "ok")
+
+    def test_close_releases_idle_loop_pool(self, registry, local_server):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(registry.http_async_client.get(local_server))
+            assert registry.get_stats()['async_pools'] == 1
+
+            transport = registry._async_transport
+            registry.close()
+
+            assert transport.pool_count == 0
+        finally:
+            loop.close()
+
+
+class TestSharedClientCallSites:
+    """ExternalLLM은 같은 모델/파라미터의 Task끼리 클라이언트 공유"""
+
+    def teardown_method(self):
+        reset_llm_client_registry()
+
+    def test_external_llm_reuses_client(self):
+        a = ExternalLLM(TaskType.PRIOR_ESTIMATION)
+        b = ExternalLLM(TaskType.PRIOR_ESTIMATION)
+
+        assert a.llm is b.llm
+        assert a.llm.http_client is get_llm_client_registry().http_client
@@ -0,0 +1,130 @@
+"""
+Margin Benchmark Index 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- (industry, sub_category, business_model, region) 계층 조회
+- ValidatorSource: 인덱스 hit 시 Vector 검색 없음, miss 시에만 Vector 검색
+- 기본 YAML (data/raw/profit_margin_benchmarks.yaml) 로드
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator import ValidatorSource
+from umis_rag.agents.estimator.margin_benchmark_index import (
+    MarginBenchmarkIndex,
+    get_margin_benchmark_index,
+)
+
+
+def make_benchmark(benchmark_id, industry, sub, model, region, reliability='high', sample_size=100, median=0.1):
+    return {
+        'benchmark_id': benchmark_id,
+        'industry': industry,
+        'sub_category': sub,
+        'business_model': model,
+        'region': region,
+        'reliability': reliability,
+        'sample_size': sample_size,
+        'year': 2024,
+        'margins': {'operating_margin': {'p25': median - 0.05, 'median': median, 'p75': median + 0.05}}
+    }
+
+
+BENCHMARKS = [
+    make_benchmark('saas_global', 'SaaS', 'B2B', '구독', 'Global', sample_size=450),
+    make_benchmark('saas_korea', 'SaaS', 'B2B', '구독', '한국', sample_size=50),
+    make_benchmark('saas_usage', 'SaaS', 'B2B', '사용량', 'Global', reliability='medium', sample_size=900),
+    make_benchmark('beauty', '커머스', 'Beauty D2C', '자체 브랜드', 'Global', median=0.08),
+    make_benchmark('beauty_low', '커머스', 'Beauty D2C', '자체 브랜드', 'Global', reliability='low'),
+]
+
+
+@pytest.fixture
+def index():
+    return MarginBenchmarkIndex(BENCHMARKS)
+
+
+class TestMarginBenchmarkIndex:
+
+    def test_full_key(self, index):
+        assert index.lookup('SaaS', 'B2B', '구독', '한국')['benchmark_id'] == 'saas_korea'
+
+    def test_region_fallback(self, index):
+        assert index.lookup('SaaS', 'B2B', '구독', '일본')['benchmark_id'] == 'saas_global'
+
+    def test_model_fallback_prefers_reliability(self, index):
+        # 사용량 모델은 sample_size가 크지만 medium → high 우선
+        assert index.lookup('SaaS', 'B2B', '라이선스')['benchmark_id'] == 'saas_global'
+
+    def test_normalizes_case_and_spaces(self, index):
+        assert index.lookup('saas', ' b2b ', '구독', 'global')['benchmark_id'] == 'saas_global'
+        assert index.lookup('커머스', 'beautyd2c')['benchmark_id'] == 'beauty'
+
+    def test_requires_sub_category(self, index):
+        assert index.lookup('SaaS') is None
+        assert index.lookup('SaaS', 'B2C') is None
+
+    def test_low_reliability_excluded(self):
+        index = MarginBenchmarkIndex([BENCHMARKS[-1]])
+
+        assert index.lookup('커머스', 'Beauty D2C') is None
+        assert index.get('beauty_low')['benchmark_id'] == 'beauty_low'
+
+    def test_returns_copy(self, index):
+        index.lookup('SaaS', 'B2B')['benchmark_id'] = 'changed'
+
+        assert index.lookup('SaaS', 'B2B')['benchmark_id'] == 'saas_global'
+
+    def test_default_yaml_loads(self):
+        default = get_margin_benchmark_index()
+
+        assert default is not None
+        assert default.size > 100
+        assert default.lookup('커머스', 'Beauty D2C') is not None
+
+
+class TestValidatorSourceIndex:
+
+    def test_index_hit_skips_vector_search(self, index):
+        source = ValidatorSource(benchmark_index=index)
+        source.benchmark_store = Mock()
+
+        result = source.search_with_context(
+            "뷰티 D2C 영업이익률은?",
+            {'industry': '커머스', 'sub_category': 'Beauty D2C', 'business_model': '자체 브랜드'}
+        )
+
+        assert result is not None
+        assert result.reasoning_detail['base_benchmark']['benchmark_id'] == 'beauty'
+        source.benchmark_store.similarity_search.assert_not_called()
+
+    def test_works_without_benchmark_store(self, index):
+        source = ValidatorSource(benchmark_index=index)
+
+        result = source.search_with_context("SaaS 마진", {'industry': 'SaaS', 'sub_category': 'B2B'})
+
+        assert result.reasoning_detail['base_benchmark']['benchmark_id'] == 'saas_global'
+
+    def test_miss_falls_back_to_vector_search(self, index):
+        source = ValidatorSource(benchmark_index=index)
+        hit = Mock(metadata={'benchmark_id': 'saas_usage', 'reliability': 'medium', 'industry': 'SaaS'})
+        source.benchmark_store = Mock()
+        source.benchmark_store.similarity_search.return_value = [hit]
+
+        benchmark = source._search_industry_benchmarks('SaaS', 'B2C')
+
+        assert source.benchmark_store.similarity_search.called
+        # Vector 결과도 인덱스 원본으로 (margins 포함)
+        assert benchmark['benchmark_id'] == 'saas_usage'
+        assert benchmark['margins']['operating_margin']['median'] == 0.1
+
+    def test_industry_only_context_uses_vector_search(self, index):
+        source = ValidatorSource(benchmark_index=index)
+
+        assert source._search_industry_benchmarks('SaaS') is None
@@ -0,0 +1,148 @@
+"""
+Monte Carlo 불확실성 전파 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 분포 샘플링 (삼각 / 로그정규 / certainty 폭)
+- 공식 벡터 계산 (변수명 부분 문자열 충돌 방지)
+- 백분위수, 민감도 순위
+- FermiEstimator 결과의 value_range / decomposition['uncertainty']
+"""
+
+import time
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator import FermiEstimator
+from umis_rag.agents.estimator.common import Evidence
+from umis_rag.agents.estimator.common.estimation_result import create_prior_result
+from umis_rag.agents.estimator.common.monte_carlo import (
+    evaluate_vectorized,
+    propagate_uncertainty,
+    sample_variable,
+)
+
+
+class TestSampling:
+
+    def test_triangular_within_range(self):
+        draws = sample_variable(100, (80, 150), 'medium', 5000, np.random.default_rng(0))
+
+        assert draws.min() >= 80 and draws.max() <= 150
+
+    def test_wide_positive_range_is_lognormal(self):
+        draws = sample_variable(10, (1, 100), 'medium', 20000, np.random.default_rng(0))
+
+        assert np.percentile(draws, 50) == pytest.approx(10, rel=0.05)
+        assert np.percentile(draws, 5) == pytest.approx(1, rel=0.1)
+        assert np.percentile(draws, 95) == pytest.approx(100, rel=0.1)
+
+    @pytest.mark.parametrize("value, value_range", [(50, (10, 100)), (12, (10, 100)), (90, (10, 100))])
+    def test_off_centre_value_keeps_range_as_p5_p95(self, value, value_range):
+        draws = sample_variable(value, value_range, 'medium', 40000, np.random.default_rng(0))
+
+        assert np.percentile(draws, 50) == pytest.approx(value, rel=0.03)
+        assert np.percentile(draws, 5) == pytest.approx(value_range[0], rel=0.05)
+        assert np.percentile(draws, 95) == pytest.approx(value_range[1], rel=0.05)
+        assert (draws > value_range[1]).mean() == pytest.approx(0.05, abs=0.01)
+
+    def test_certainty_spread_without_range(self):
+        rng = np.random.default_rng(0)
+        high = sample_variable(100, None, 'high', 5000, rng)
+        low = sample_variable(100, None, 'low', 5000, rng)
+
+        assert high.min() >= 90 and high.max() <= 110
+        assert low.std() > high.std()
+
+    def test_degenerate_range_is_constant(self):
+        draws = sample_variable(0, None, 'low', 10, np.random.default_rng(0))
+
+        assert (draws == 0).all()
+
+
+class TestPropagation:
+
+    def test_substring_variable_names(self):
+        arrays = {'매출': np.array([1.0, 2.0]), '평균매출': np.array([10.0, 20.0])}
+
+        result = evaluate_vectorized("X = 평균매출 - 매출", arrays)
+
+        assert result.tolist() == [9.0, 18.0]
+
+    def test_percentiles_bracket_point_value(self):
+        result = propagate_uncertainty(
+            "시장 = 사업자수 × 도입률 × 평균매출",
+            {
+                '사업자수': (1_000_000, (800_000, 1_200_000), 'high'),
+                '도입률': (0.1, (0.05, 0.2), 'medium'),
+                '평균매출': (500, None, 'low'),
+            }
+        )
+        low, high = result.interval()
+
+        assert low < 1_000_000 * 0.1 * 500 < high
+        assert result.valid == result.samples == 20000
+        assert list(result.percentiles) == [5, 10, 25, 50, 75, 90, 95]
+
+    def test_sensitivity_ranks_widest_variable_first(self):
+        result = propagate_uncertainty(
+            "LTV = ARPU / Churn",
+            {'ARPU': (100, (95, 105), 'high'), 'Churn': (0.05, (0.01, 0.2), 'low')}
+        )
+
+        assert result.sensitivity[0]['variable'] == 'Churn'
+        assert result.sensitivity[0]['correlation'] < 0
+        assert sum(s['contribution'] for s in result.sensitivity) == pytest.approx(1.0, abs=1e-3)
+
+    def test_drops_non_finite_samples(self):
+        result = propagate_uncertainty("y = 1 / x", {'x': (0.0, (-1.0, 1.0), 'low')}, samples=1000)
+
+        assert result.valid <= 1000
+        assert np.isfinite(result.mean)
+
+    def test_seeded_runs_are_reproducible(self):
+        spec = {'a': (10, (5, 20), 'medium')}
+
+        assert propagate_uncertainty("a * 2", spec).percentiles == propagate_uncertainty("a * 2", spec).percentiles
+
+    def test_fast_enough_for_every_estimate(self):
+        spec = {f'v{i}': (10 + i, (5, 30), 'medium') for i in range(4)}
+
+        start = time.perf_counter()
+        propagate_uncertainty("v0 * v1 / v2 + v3", spec, samples=50000)
+
+        assert time.perf_counter() - start < 0.5
+
+
+class TestFermiUncertainty:
+
+    def _variables(self):
+        return {
+            'ARPU': create_prior_result(50000, (30000, 80000), 'medium', 'ARPU 추정'),
+            'Churn': create_prior_result(0.05, (0.03, 0.08), 'low', 'Churn 추정'),
+        }
+
+    def test_build_result_sets_range_and_uncertainty(self):
+        fermi = FermiEstimator(llm_provider=Mock())
+
+        result = fermi._build_result("LTV = ARPU / Churn", self._variables(), Evidence(), 0, time.time())
+
+        assert result.value == pytest.approx(1_000_000)
+        low, high = result.value_range
+        assert low < result.value < high
+        uncertainty = result.decomposition['uncertainty']
+        assert uncertainty['samples'] == 20000
+        assert {s['variable'] for s in uncertainty['sensitivity']} == {'ARPU', 'Churn'}
+
+    def test_disabled(self):
+        fermi = FermiEstimator(llm_provider=Mock(), uncertainty_samples=0)
+
+        result = fermi._build_result("LTV = ARPU / Churn", self._variables(), Evidence(), 0, time.time())
+
+        assert result.value_range is None
+        assert 'uncertainty' not in result.decomposition
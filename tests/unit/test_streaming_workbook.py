@@ -0,0 +1,183 @@
+"""
+스트리밍(write-only) 워크북 백엔드 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 일반 Workbook과 동일한 결과 (값/수식/스타일/병합/열 너비/Named Range)
+- window 밖 행 재기록 / 늦은 열 너비 설정 → StreamingWriteError
+- 스타일 조합 NamedStyle 공유
+- 대용량 Assumptions 스트리밍 생성 + 수식 재계산
+- 저장 없이 close() / Builder 예외 → 스트림 / 임시 파일 정리 (경고 없음)
+"""
+
+import gc
+
+import pytest
+from openpyxl import load_workbook
+from openpyxl.worksheet._writer import ALL_TEMP_FILES
+from openpyxl.styles import Font, PatternFill
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.deliverables.excel import (
+    FormulaEngine,
+    MarketSizingWorkbookGenerator,
+    StreamingWorkbook,
+    StreamingWriteError,
+    WorkbookEvaluator,
+)
+from umis_rag.deliverables.excel.unit_economics import UnitEconomicsGenerator
+from umis_rag.deliverables.excel.unit_economics import unit_economics_generator
+
+
+UE_INPUTS = {
+    'arpu': 9000, 'cac': 25000, 'gross_margin': 0.35,
+    'monthly_churn': 0.04, 'customer_lifetime': 25,
+    'sm_spend_monthly': 5_000_000, 'new_customers_monthly': 200
+}
+
+
+def snapshot(filepath):
+    """비교용: 셀 값 + 주요 스타일, 병합, 열 너비, Named Range"""
+    wb = load_workbook(filepath)
+    cells = {}
+    for ws in wb.worksheets:
+        for row in ws.iter_rows():
+            for cell in row:
+                if cell.value is not None:
+                    cells[(ws.title, cell.coordinate)] = (
+                        cell.value, cell.number_format, cell.font.b,
+                        cell.fill.fgColor.rgb, cell.alignment.horizontal
+                    )
+        cells[(ws.title, 'merged')] = sorted(str(r) for r in ws.merged_cells.ranges)
+        cells[(ws.title, 'widths')] = {k: v.width for k, v in ws.column_dimensions.items()}
+    cells['sheets'] = wb.sheetnames
+    cells['names'] = sorted(wb.defined_names.keys())
+    return cells
+
+
+class TestEquivalence:
+
+    def test_unit_economics_same_as_in_memory(self, tmp_path, capsys):
+        memory = UnitEconomicsGenerator().generate('music', UE_INPUTS, output_dir=tmp_path / 'memory')
+        streaming = UnitEconomicsGenerator().generate(
+            'music', UE_INPUTS, output_dir=tmp_path / 'streaming', streaming=True
+        )
+
+        assert snapshot(streaming) == snapshot(memory)
+
+    def test_large_assumptions_streamed(self, tmp_path, capsys):
+        assumptions = [
+            {'id': f'ASM_{i:04d}', 'category': '시장', 'description': f'가정 {i}',
+             'value': i * 10, 'unit': '', 'data_type': '공개 데이터',
+             'source': 'test', 'confidence': 'high'}
+            for i in range(500)
+        ]
+        tam = {'definition': 'TAM', 'source': 'ASM_0001', 'narrowing_steps': [
+            {'dimension': '지역', 'description': '한국', 'ratio_source': 'ASM_0002'}
+        ]}
+        segments = [{'name': '성인', 'total_population': 'ASM_0003', 'purchase_rate': 'ASM_0004',
+                     'aov': 'ASM_0005', 'frequency': 'ASM_0006'}]
+        proxy = {'proxy_market': 'ASM_0007', 'correlation': 'ASM_0008', 'application_rate': 'ASM_0009'}
+        competitors = [{'company': 'A', 'revenue': 'ASM_0010', 'market_share': 'ASM_0011'}]
+
+        filepath = MarketSizingWorkbookGenerator().generate(
+            'big', assumptions, tam, segments, proxy, competitors, tmp_path, streaming=True
+        )
+
+        evaluator = WorkbookEvaluator.from_file(filepath)
+        assert load_workbook(filepath)['Assumptions'].freeze_panes == 'A2'
+        assert evaluator.get('ASM_0499') == 4990
+        # TAM(ASM_0001=10) × 한국(ASM_0002=20)
+        assert evaluator.get_value('Method_1_TopDown', 'B6') == 200
+
+
+class TestStreamingRules:
+
+    def test_rows_outside_window_cannot_be_revisited(self, tmp_path):
+        wb = StreamingWorkbook(window=2)
+        ws = wb.create_sheet('S')
+
+        ws['A1'] = 1
+        ws['A3'] = 3
+        ws['A2'] = 2  # window 안 → 허용
+        ws['A5'] = 5  # 1~3행 기록
+
+        with pytest.raises(StreamingWriteError):
+            ws['A2'] = 'late'
+        with pytest.raises(StreamingWriteError):
+            ws.column_dimensions['A'].width = 20
+        with pytest.raises(StreamingWriteError):
+            ws.row_dimensions[1].height = 30
+
+        wb.save(tmp_path / 'out.xlsx')
+        assert [c.value for c in load_workbook(tmp_path / 'out.xlsx')['S']['A']] == [1, 2, 3, None, 5]
+
+    def test_named_styles_shared_and_saved(self, tmp_path):
+        wb = StreamingWorkbook()
+        engine = FormulaEngine(wb)
+        ws = wb.create_sheet('Data')
+        ws.column_dimensions['B'].width = 22
+
+        for row in range(1, 201):
+            ws.cell(row=row, column=1).value = row
+            cell = ws.cell(row=row, column=2)
+            cell.value = f"=A{row}*2"
+            cell.font = Font(bold=row % 2 == 0)
+            cell.fill = PatternFill(start_color="FFC000", end_color="FFC000", fill_type="solid")
+        engine.define_named_range('First', 'Data', 'B1')
+        ws.merge_cells('C1:D1')
+        wb.save(tmp_path / 'out.xlsx')
+
+        assert wb.style_count == 2
+        loaded = load_workbook(tmp_path / 'out.xlsx')['Data']
+        assert loaded['B200'].value == '=A200*2'
+        assert loaded['B2'].font.b and not loaded['B1'].font.b
+        assert loaded.column_dimensions['B'].width == 22
+        assert 'C1:D1' in loaded.merged_cells
+        assert WorkbookEvaluator.from_file(tmp_path / 'out.xlsx').get('First') == 2
+
+
+class TestDiscard:
+
+    @pytest.fixture
+    def unraisable(self, monkeypatch):
+        """GC 시점 예외 (열린 write-only 스트림 → LxmlSyntaxError) 수집"""
+        seen = []
+        monkeypatch.setattr(sys, 'unraisablehook', seen.append)
+        return seen
+
+    def test_close_without_save(self, unraisable):
+        wb = StreamingWorkbook(window=2)
+        ws = wb.create_sheet('S')
+        for row in range(1, 20):
+            ws.cell(row=row, column=1).value = row
+        temp_files = set(ALL_TEMP_FILES)
+        assert temp_files
+
+        wb.close()
+        wb.close()  # 반복 호출 허용
+        del wb, ws
+        gc.collect()
+
+        assert unraisable == []
+        assert not temp_files & set(ALL_TEMP_FILES)
+        assert not any(Path(f).exists() for f in temp_files)
+
+    def test_builder_error_closes_workbook(self, tmp_path, monkeypatch, capsys, unraisable):
+        def fail(builder, *args, **kwargs):
+            ws = builder.wb.create_sheet('Cohort_LTV')
+            for row in range(1, 500):  # window 밖까지 기록 → write-only 스트림 열림
+                ws.cell(row=row, column=1).value = row
+            raise RuntimeError('builder failed')
+
+        monkeypatch.setattr(unit_economics_generator.CohortLTVBuilder, 'create_sheet', fail)
+        before = set(ALL_TEMP_FILES)
+
+        with pytest.raises(RuntimeError, match='builder failed'):
+            UnitEconomicsGenerator().generate('music', UE_INPUTS, output_dir=tmp_path, streaming=True)
+        gc.collect()
+
+        assert unraisable == []
+        assert set(ALL_TEMP_FILES) <= before
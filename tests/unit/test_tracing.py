@@ -0,0 +1,273 @@
+"""
+트레이싱 / 메트릭 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- span 중첩, 예외 기록, ThreadPoolExecutor 전파 (propagate)
+- LLMResponseCache.invoke: 모델 / 캐시 hit / 토큰 수 기록
+- Prometheus 텍스트 형식
+- EstimatorRAG.estimate: 요청 trace + Stage별 시간 + 토큰 비용 첨부
+- 트레이싱 비활성 시 no-op
+- OpenTelemetry 연동: 예외 span은 ERROR status + exception 이벤트
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.agents.estimator import EstimatorRAG
+from umis_rag.agents.estimator.common import EstimationResult, Evidence
+from umis_rag.core.config import settings
+from umis_rag.core.llm_cache import LLMResponseCache
+from umis_rag.core.tracing import (
+    MetricsRegistry,
+    extract_token_usage,
+    get_current_trace,
+    propagate,
+    set_metrics,
+    span,
+    start_trace,
+)
+
+
+@pytest.fixture(autouse=True)
+def metrics():
+    registry = MetricsRegistry()
+    set_metrics(registry)
+    yield registry
+    set_metrics(None)
+
+
+class DictBackend:
+    """LLMCacheBackend 대역 (메모리 dict)"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value, ttl_seconds=None):
+        self.data[key] = value
+        return 0
+
+
+def make_llm(content="답변", input_tokens=10, output_tokens=3):
+    llm = Mock()
+    llm.model_name = "gpt-4o-mini"
+    llm.temperature = 0.2
+    llm.invoke.return_value = AIMessage(
+        content=content,
+        usage_metadata={
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens
+        }
+    )
+    return llm
+
+
+class TestSpans:
+
+    def test_nested_spans(self):
+        with start_trace("estimate", question="q") as trace:
+            with span("prior"):
+                with span("llm", model="m") as inner:
+                    inner.set(input_tokens=5)
+
+        names = {s.name: s for s in trace.spans}
+        assert names['prior'].parent_id == names['estimate'].span_id
+        assert names['llm'].parent_id == names['prior'].span_id
+        assert names['llm'].attributes == {'model': 'm', 'input_tokens': 5}
+        assert get_current_trace() is None
+
+    def test_error_recorded_and_reraised(self, metrics):
+        with start_trace("estimate") as trace:
+            with pytest.raises(ValueError):
+                with span("fermi"):
+                    raise ValueError("bad formula")
+
+        fermi = trace.find("fermi")[0]
+        assert fermi.status == "error"
+        assert "bad formula" in fermi.error
+        assert metrics.get_counter('umis_span_errors_total', span='fermi') == 1
+
+    def test_propagate_to_thread_pool(self):
+        def work():
+            with span("fermi.variable"):
+                pass
+
+        with start_trace("estimate") as trace:
+            with span("fermi") as fermi:
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    for _ in range(3):
+                        executor.submit(propagate(work))
+
+        variables = trace.find("fermi.variable")
+        assert len(variables) == 3
+        assert all(v.parent_id == fermi.span_id for v in variables)
+
+    def test_nested_trace_reuses_outer(self):
+        with start_trace("batch") as outer:
+            with start_trace("estimate") as inner:
+                pass
+
+        assert inner is outer
+        assert len(outer.find("estimate")) == 1
+
+    def test_disabled_is_noop(self, metrics):
+        with patch.object(settings, 'tracing_enabled', False):
+            with start_trace("estimate") as trace:
+                with span("prior") as current:
+                    current.set(model="m")
+
+        assert trace is None
+        assert metrics.get_histogram('umis_span_duration_seconds')['count'] == 0
+
+
+class TestOTelBridge:
+
+    def test_error_span_status(self):
+        sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+        from types import SimpleNamespace
+        from opentelemetry import metrics as otel_metrics
+        from opentelemetry.trace import StatusCode
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        from umis_rag.core import tracing
+
+        exporter = InMemorySpanExporter()
+        provider = sdk_trace.TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        bridge = tracing._OTelBridge(SimpleNamespace(get_tracer=provider.get_tracer), otel_metrics)
+
+        with patch.object(tracing, '_get_otel', return_value=bridge):
+            with start_trace("estimate"):
+                with pytest.raises(ValueError):
+                    with span("fermi"):
+                        raise ValueError("bad formula")
+
+        spans = {s.name: s for s in exporter.get_finished_spans()}
+        assert spans['fermi'].status.status_code == StatusCode.ERROR
+        assert [e.name for e in spans['fermi'].events] == ['exception']
+        assert spans['fermi'].attributes['error'] == "ValueError: bad formula"
+        assert spans['estimate'].status.status_code == StatusCode.UNSET
+
+
+class TestLLMCallRecording:
+
+    def test_invoke_records_model_and_tokens(self, metrics):
+        cache = LLMResponseCache(backend=DictBackend())
+        llm = make_llm()
+
+        with start_trace("estimate") as trace:
+            cache.invoke(llm, "프롬프트")
+            cache.invoke(llm, "프롬프트")
+
+        first, second = trace.find("llm")
+        assert first.attributes['cache'] == 'miss'
+        assert first.attributes['input_tokens'] == 10
+        assert second.attributes['cache'] == 'hit'
+        assert second.attributes['input_tokens'] is None
+
+        summary = trace.summary()
+        assert summary['llm_calls'] == 1
+        assert summary['llm_cache_hits'] == 1
+        assert summary['models'] == {'gpt-4o-mini': {'calls': 1, 'input_tokens': 10, 'output_tokens': 3}}
+        assert metrics.get_counter('umis_llm_tokens_total', direction='input') == 10
+        assert metrics.get_counter('umis_llm_calls_total', cache='hit') == 1
+
+    def test_bypass_when_cache_disabled(self, metrics):
+        cache = LLMResponseCache(backend=None, enabled=False)
+
+        cache.invoke(make_llm(), "프롬프트")
+
+        assert metrics.get_counter('umis_llm_calls_total', cache='bypass') == 1
+
+    def test_token_usage_fallback_to_response_metadata(self):
+        message = AIMessage(
+            content="x",
+            response_metadata={'token_usage': {'prompt_tokens': 7, 'completion_tokens': 2}}
+        )
+
+        assert extract_token_usage(message) == (7, 2)
+        assert extract_token_usage(AIMessage(content="x")) == (None, None)
+
+
+class TestPrometheus:
+
+    def test_text_format(self):
+        metrics = MetricsRegistry(buckets=(0.1, 1.0))
+        metrics.inc('umis_llm_calls_total', model='gpt-4o-mini', cache='miss')
+        metrics.inc('umis_llm_calls_total', model='gpt-4o-mini', cache='miss')
+        metrics.observe('umis_span_duration_seconds', 0.05, span='prior')
+        metrics.observe('umis_span_duration_seconds', 0.5, span='prior')
+
+        text = metrics.to_prometheus()
+
+        assert '# TYPE umis_llm_calls_total counter' in text
+        assert 'umis_llm_calls_total{cache="miss",model="gpt-4o-mini"} 2' in text
+        assert '# TYPE umis_span_duration_seconds histogram' in text
+        assert 'umis_span_duration_seconds_bucket{span="prior",le="0.1"} 1' in text
+        assert 'umis_span_duration_seconds_bucket{span="prior",le="1"} 2' in text
+        assert 'umis_span_duration_seconds_bucket{span="prior",le="+Inf"} 2' in text
+        assert 'umis_span_duration_seconds_count{span="prior"} 2' in text
+
+    def test_label_escaping(self):
+        metrics = MetricsRegistry()
+        metrics.inc('umis_estimations_total', source='a"b\\c')
+
+        assert 'source="a\\"b\\\\c"' in metrics.to_prometheus()
+
+    def test_empty(self):
+        assert MetricsRegistry().to_prometheus() == ""
+
+
+class TestEstimatorTrace:
+
+    def _make_estimator(self):
+        estimator = EstimatorRAG(llm_provider=Mock(), pipeline_stages=True)
+        estimator.evidence_collector = Mock(collect=Mock(return_value=(None, Evidence())))
+
+        cache = LLMResponseCache(backend=None, enabled=False)
+
+        def prior_estimate(question, evidence, budget, context):
+            cache.invoke(make_llm(input_tokens=100, output_tokens=20), question)
+            budget.consume_llm_call(1)
+            return EstimationResult(value=100.0, source="Generative Prior", cost={'llm_calls': 1})
+
+        estimator.prior_estimator = Mock(estimate=Mock(side_effect=prior_estimate))
+        estimator.fermi_estimator = Mock(estimate=Mock(return_value=None))
+        return estimator
+
+    def test_result_has_trace_and_tokens(self, metrics):
+        result = self._make_estimator().estimate("서울 음식점 수는?")
+
+        summary = result.trace['summary']
+        assert set(summary['stages']) == {'evidence', 'prior', 'fermi', 'fusion'}
+        assert summary['llm_calls'] == 1
+        assert result.cost['input_tokens'] == 100
+        assert result.cost['output_tokens'] == 20
+        assert result.to_dict()['trace']['trace_id'] == result.trace['trace_id']
+
+        # Prior는 Stage 2 스레드에서 실행되지만 같은 trace에 기록
+        spans = {s['span_id']: s for s in result.trace['spans']}
+        llm = next(s for s in result.trace['spans'] if s['name'] == 'llm')
+        assert spans[llm['parent_id']]['name'] == 'prior'
+
+        assert metrics.get_counter('umis_estimations_total') == 1
+        assert metrics.get_histogram('umis_span_duration_seconds', span='estimate')['count'] == 1
+
+    def test_each_request_gets_own_trace(self):
+        estimator = self._make_estimator()
+
+        first = estimator.estimate("질문 A")
+        second = estimator.estimate("질문 B")
+
+        assert first.trace['trace_id'] != second.trace['trace_id']
+        assert len([s for s in second.trace['spans'] if s['name'] == 'estimate']) == 1
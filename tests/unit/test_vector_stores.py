@@ -0,0 +1,62 @@
+"""
+Vector Store Registry 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- persist 디렉토리당 Chroma 클라이언트 1개
+- 임베딩 모델당 OpenAIEmbeddings 1개
+- Collection 핸들 재사용 / 삭제 후 재생성
+"""
+
+import pytest
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.core.vector_stores import VectorStoreRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = VectorStoreRegistry()
+    yield registry
+    registry.clear()
+
+
+class TestVectorStoreRegistry:
+    """공유 클라이언트 / 임베딩 / 핸들"""
+
+    def test_one_client_per_directory(self, registry, tmp_path):
+        a = registry.get_client(tmp_path / "chroma")
+        b = registry.get_client(str(tmp_path / "chroma"))
+
+        assert a is b
+        assert registry.get_stats()['clients'] == 1
+
+    def test_one_embeddings_per_model(self, registry):
+        a = registry.get_embeddings("text-embedding-3-large")
+        b = registry.get_embeddings("text-embedding-3-large")
+        c = registry.get_embeddings("text-embedding-3-small")
+
+        assert a is b
+        assert a is not c
+
+    def test_collection_handles_share_client_and_embeddings(self, registry, tmp_path):
+        a = registry.get_vectorstore("alpha", persist_dir=tmp_path)
+        b = registry.get_vectorstore("beta", persist_dir=tmp_path)
+
+        assert a is registry.get_vectorstore("alpha", persist_dir=tmp_path)
+        assert a._client is b._client
+        assert a._embedding_function is b._embedding_function
+        assert registry.get_stats() == {'clients': 1, 'embeddings': 1, 'collections': 2}
+
+    def test_drop_collection_reopens_empty(self, registry, tmp_path):
+        store = registry.get_vectorstore("gamma", persist_dir=tmp_path)
+        store._collection.add(ids=["1"], documents=["doc"], embeddings=[[0.0] * 8])
+        assert store._collection.count() == 1
+
+        registry.drop_collection("gamma", persist_dir=tmp_path)
+        reopened = registry.get_vectorstore("gamma", persist_dir=tmp_path)
+
+        assert reopened is not store
+        assert reopened._collection.count() == 0
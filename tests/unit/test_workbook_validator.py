@@ -0,0 +1,158 @@
+"""
+통합(단일 패스) 워크북 검증 단위 테스트 (v7.11.2)
+
+테스트 대상:
+- 수식 규칙: 자기 참조 / 간접 순환 / 오류 수식 / 미정의 Named Range / 계산 오류
+- Summary / Convergence 참조 규칙 (재계산 값 기준)
+- Golden Spec / Named Range 기대값
+- 파일 1회 로드
+"""
+
+from openpyxl import Workbook
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from umis_rag.deliverables.excel import FormulaEngine, UnifiedWorkbookValidator, WorkbookIndex
+from umis_rag.deliverables.excel import workbook_validator
+from umis_rag.deliverables.excel.golden_test_framework import GoldenTestSpec
+from umis_rag.deliverables.excel.unit_economics import UnitEconomicsGenerator
+
+
+UE_INPUTS = {
+    'arpu': 9000, 'cac': 25000, 'gross_margin': 0.35,
+    'monthly_churn': 0.04, 'customer_lifetime': 25,
+    'sm_spend_monthly': 5_000_000, 'new_customers_monthly': 200
+}
+
+
+def save(wb, tmp_path, name='test.xlsx'):
+    filepath = tmp_path / name
+    wb.save(filepath)
+    return filepath
+
+
+def validate(filepath, **kwargs):
+    return UnifiedWorkbookValidator(filepath, **kwargs).validate()
+
+
+class TestFormulaRules:
+
+    def test_formula_defects(self, tmp_path, capsys):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = 'Assumptions'
+        engine = FormulaEngine(wb)
+        ws['B5'] = 100
+        ws['C5'] = '=C5*2'             # 자기 참조
+        ws['D5'] = '=#REF!+1'          # 오류 수식
+        ws['E1'] = '=E2+1'             # 간접 순환
+        ws['E2'] = '=E1+1'
+        ws['F1'] = '=B5/0'             # 계산 오류 (발생 지점)
+        ws['F2'] = '=F1+1'             # 전파 → 경고 생략
+        ws['G1'] = '=Missing_Name*2'   # 미정의 Named Range
+        ws['H1'] = '=Loop*2'           # Named Range 경유 자기 참조
+        engine.define_named_range('Loop', 'Assumptions', 'H1')
+        dashboard = wb.create_sheet('Dashboard')
+        dashboard['B5'] = '=Assumptions!B5'  # 다른 시트의 같은 주소 (자기 참조 아님)
+        dashboard['B6'] = 1
+        dashboard['B7'] = 2
+
+        result = validate(save(wb, tmp_path))
+
+        assert not result['passed']
+        assert "❌ 자기 참조: Assumptions!C5 = =C5*2" in result['errors']
+        assert "❌ 자기 참조: Assumptions!H1 = =Loop*2" in result['errors']
+        assert "❌ 순환 참조: Assumptions!E1 = =E2+1" in result['errors']
+        assert "❌ 오류 수식: Assumptions!D5 = =#REF!+1" in result['errors']
+        assert any('Missing_Name' in e for e in result['errors'])
+        assert not any('Dashboard!B5' in e for e in result['errors'])
+
+        calc_warnings = [w for w in result['warnings'] if '계산 오류' in w]
+        assert calc_warnings == ["⚠️ 계산 오류 #DIV/0!: Assumptions!F1 = =B5/0"]
+        assert result['stats']['total_formulas'] == 9
+
+    def test_index_references(self, tmp_path):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = 'Data'
+        engine = FormulaEngine(wb)
+        ws['A1'] = 1
+        ws['A2'] = 2
+        ws['B1'] = '=SUM(A1:A2)+Total+Other!C3'
+        engine.define_named_range('Total', 'Data', 'A2')
+        wb.create_sheet('Other')
+
+        index = WorkbookIndex.from_file(save(wb, tmp_path))
+
+        assert [ref.text for ref in index.references[('Data', 1, 2)]] == [
+            'A1:A2', '<NamedRange:Total>', 'Other!C3'
+        ]
+        assert index.references[('Data', 1, 2)][1].bounds == ('Data', 2, 1, 2, 1)
+        assert index.value('Data', 1, 2) == 5
+
+
+class TestReferenceRules:
+
+    def build(self, convergence_formula):
+        wb = Workbook()
+        engine = FormulaEngine(wb)
+        ws = wb.active
+        ws.title = 'Assumptions'
+        method = wb.create_sheet('Method_1_TopDown')
+        method['A6'] = 'SAM'
+        method['C6'] = '=100*2'
+        engine.define_named_range('SAM', 'Method_1_TopDown', 'C6')
+        engine.define_named_range('SAM_Method2', 'Method_1_TopDown', 'C6')
+        summary = wb.create_sheet('Summary')
+        summary['B5'] = '=TAM'                          # 미정의
+        summary['B10'] = '=SAM'                         # 값 → 패스
+        summary['B11'] = '=Method_1_TopDown!C6'         # 라벨 'SAM' ≠ 'SAM (Method 2)'
+        convergence = wb.create_sheet('Convergence_Analysis')
+        convergence['B4'] = convergence_formula
+        return wb
+
+    def test_summary_and_convergence(self, tmp_path, capsys):
+        result = validate(save(self.build('=SAM_Method2'), tmp_path))
+        errors = result['errors']
+
+        assert "❌ 미정의 Named Range: Summary!B5 → TAM (수식: =TAM)" in errors
+        assert not any(e.startswith('❌ Summary!B10') for e in errors)
+        assert "❌ Summary!B11: Method_1_TopDown!C6는 'SAM (값: 200)'인데, 'SAM (Method 2)'을(를) 원함" in errors
+        # SAM_Method2는 SAM을 포함하지만 다른 Named Range
+        assert "❌ Convergence_Analysis!B4: SAM 참조 없음 (수식: =SAM_Method2)" in errors
+
+        result = validate(save(self.build('=SAM'), tmp_path, 'ok.xlsx'))
+        assert not any('Convergence_Analysis!B4' in e for e in result['errors'])
+
+
+class TestGolden:
+
+    def test_generated_workbook_loaded_once(self, tmp_path, monkeypatch, capsys):
+        filepath = UnitEconomicsGenerator().generate(
+            'music', UE_INPUTS, output_dir=tmp_path, streaming=True
+        )
+
+        loads = []
+        original = workbook_validator.load_workbook
+
+        def counting_load(*args, **kwargs):
+            loads.append(kwargs)
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(workbook_validator, 'load_workbook', counting_load)
+
+        result = validate(
+            filepath,
+            golden_spec=GoldenTestSpec.get_unit_economics_spec(),
+            expected_values={'ltv': 78750, 'cac': 30000}
+        )
+
+        assert loads == [{'read_only': True, 'data_only': False}]
+        assert result['results']['LTV_Calculation!B18'] == 78750
+        assert not any('자기 참조' in e or '순환 참조' in e for e in result['errors'])
+        assert [(r['name'], r['passed']) for r in result['named_results']] == [
+            ('LTV', True), ('CAC', False)
+        ]
+        assert "✅ 입력 시트 존재" in result['info']
@@ -21,7 +21,7 @@ from .estimator import EstimatorRAG, get_estimator
 from .models import Context, EstimationResult
 
 # v7.11.0 새 인터페이스
-from .common.budget import Budget, create_standard_budget, create_fast_budget, create_thorough_budget
+from .common.budget import Budget, BudgetLease, create_standard_budget, create_fast_budget, create_thorough_budget
 from .common.estimation_result import EstimationResult as EstimationResultV11, Evidence
 
 # v7.11.0 Stage 기반 구현
@@ -61,6 +61,7 @@ __all__ = [
     
     # v7.11.0 새 인터페이스
     'Budget',
+    'BudgetLease',
     'create_standard_budget',
     'create_fast_budget',
     'create_thorough_budget',
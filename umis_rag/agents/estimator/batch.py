@@ -0,0 +1,137 @@
+"""
+Batch Estimation 공유 상태 (v7.11.2)
+
+EstimatorRAG.estimate_many()에서 질문 간 중복 작업을 제거하기 위한 도구
+
+- normalize_question: 공백/대소문자/끝 구두점 정규화
+- context_key / evidence_key: 메모 키용 맥락 / 증거 지문
+- BatchMemo: 키별 단일 실행(single-flight) 메모
+  → 같은 키를 여러 워커가 동시에 요청해도 계산은 1회, 나머지는 결과 대기
+"""
+
+from concurrent.futures import Future
+from dataclasses import asdict, is_dataclass
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import hashlib
+import json
+import re
+import threading
+
+from .common import Evidence
+from .models import Context
+
+
+_TRAILING_PUNCT = re.compile(r'[\s?？.!。]+$')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_question(question: str) -> str:
+    """
+    질문 정규화 (중복 판정용)
+
+    Example:
+        >>> normalize_question("  서울  음식점 수는?? ")
+        '서울 음식점 수는'
+    """
+    text = _WHITESPACE.sub(' ', question.strip().lower())
+    return _TRAILING_PUNCT.sub('', text)
+
+
+def _fingerprint(value: Any) -> str:
+    """dataclass / dict → 내용 해시 (필드 순서 무관)"""
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def context_key(context: Optional[Context]) -> Tuple[Optional[str], Optional[str], Optional[str], str]:
+    """
+    맥락 키 (domain, region, time_period, 전체 필드 지문)
+
+    project_data / constraints 등이 다르면 domain/region/시점이 같아도 다른 키
+    """
+    if context is None:
+        return (None, None, None, '')
+    if isinstance(context, dict):
+        return (
+            context.get('domain'), context.get('region'), context.get('time_period'),
+            _fingerprint(context)
+        )
+    return (
+        getattr(context, 'domain', None),
+        getattr(context, 'region', None),
+        getattr(context, 'time_period', None),
+        _fingerprint(context)
+    )
+
+
+def evidence_key(evidence: Optional[Evidence]) -> str:
+    """증거 키 (bounds / hints / 관계식 등 전체 필드 지문)"""
+    if evidence is None:
+        return ''
+    return _fingerprint(evidence)
+
+
+class BatchMemo:
+    """
+    키별 단일 실행 메모 (thread-safe)
+
+    Example:
+        >>> memo = BatchMemo()
+        >>> value, computed = memo.get_or_compute(key, lambda: expensive())
+        >>> # computed=False면 다른 워커가 계산한 결과를 재사용
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._futures: Dict[Hashable, Future] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        키 결과 조회, 없으면 계산
+
+        계산 중 예외가 나거나 결과가 None(일시적 실패)이면 키를 비워
+        다음 요청이 다시 계산하게 합니다. 대기 중이던 워커에게는 같은
+        예외 / 결과를 전달합니다.
+
+        Args:
+            key: 메모 키
+            compute: 계산 함수
+
+        Returns:
+            (결과, 이 호출에서 계산했는지 여부)
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._futures[key] = future
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if not owner:
+            return future.result(), False
+
+        try:
+            value = compute()
+        except BaseException as e:
+            with self._lock:
+                self._futures.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        if value is None:
+            with self._lock:
+                self._futures.pop(key, None)
+        future.set_result(value)
+        return value, True
+
+    def get_stats(self) -> Dict[str, int]:
+        """hit/miss 통계"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'keys': len(self._futures)}
@@ -7,10 +7,17 @@ Budget - 예산 기반 탐색 제약 (v7.11.0)
 - 모든 리소스(LLM 호출, 변수 개수, 시간)를 명시적으로 제한
 - 예산 초과 시 즉시 중단 (fallback으로 이동)
 - 추정 품질 vs 비용 트레이드오프를 사용자가 제어 가능
+
+v7.11.2 동시성:
+- 모든 소비/예약은 Lock 아래에서 원자적으로 처리 (check-then-increment 제거)
+- reserve() → BudgetLease: 선점(reserve) / 확정(commit) / 반환(release)
+- carve() → 부모에서 선점한 만큼만 쓰는 Stage별 하위 예산
+- 잔여 시간(deadline)을 하위 예산과 LLM 요청 timeout으로 전파
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
+import threading
 import time
 
 
@@ -28,6 +35,9 @@ class Budget:
         _consumed_llm_calls: 소비된 LLM 호출 횟수 (내부용)
         _consumed_variables: 소비된 변수 개수 (내부용)
         _start_time: 시작 시간 (내부용)
+        _reserved_llm_calls: 선점(reserve)된 LLM 호출 횟수 (내부용)
+        _reserved_variables: 선점(reserve)된 변수 개수 (내부용)
+        _parent_lease: carve()로 생성된 경우 부모 예산의 Lease (내부용)
     """
 
     # 외부 설정 가능
@@ -40,6 +50,10 @@ class Budget:
     _consumed_llm_calls: int = 0
     _consumed_variables: int = 0
     _start_time: Optional[float] = None
+    _reserved_llm_calls: int = 0
+    _reserved_variables: int = 0
+    _parent_lease: Optional['BudgetLease'] = field(default=None, repr=False, compare=False)
+    _lock: threading.RLock = field(default_factory=threading.RLock, repr=False, compare=False)
 
     def __post_init__(self):
         """초기화 후 시작 시간 설정"""
@@ -60,10 +74,7 @@ class Budget:
         Returns:
             성공 여부 (예산 초과 시 False)
         """
-        if self._consumed_llm_calls + count > self.max_llm_calls:
-            return False
-        self._consumed_llm_calls += count
-        return True
+        return self._consume(llm_calls=count)
 
     def consume_variable(self, count: int = 1) -> bool:
         """
@@ -75,22 +86,176 @@ class Budget:
         Returns:
             성공 여부 (예산 초과 시 False)
         """
-        if self._consumed_variables + count > self.max_variables:
-            return False
-        self._consumed_variables += count
-        return True
+        return self._consume(variables=count)
+
+    def _consume(
+        self,
+        llm_calls: int = 0,
+        variables: int = 0,
+        from_reserved: bool = False
+    ) -> bool:
+        """
+        원자적 소비 (내부용)
+
+        carve()로 생성된 하위 예산이면 부모 Lease에도 같은 양을 소비합니다.
+        Lock 순서는 항상 하위 → 부모이므로 교착이 없습니다.
+
+        Args:
+            llm_calls: 소비할 LLM 호출 횟수
+            variables: 소비할 변수 개수
+            from_reserved: 선점분에서 소비 (BudgetLease 전용)
+
+        Returns:
+            성공 여부 (예산 초과 시 False)
+        """
+        with self._lock:
+            if from_reserved:
+                if llm_calls > self._reserved_llm_calls or variables > self._reserved_variables:
+                    return False
+            else:
+                if self._committed_llm_calls() + llm_calls > self.max_llm_calls:
+                    return False
+                if self._committed_variables() + variables > self.max_variables:
+                    return False
+
+            if self._parent_lease is not None:
+                if not self._parent_lease.consume(llm_calls=llm_calls, variables=variables):
+                    return False
+
+            if from_reserved:
+                self._reserved_llm_calls -= llm_calls
+                self._reserved_variables -= variables
+            self._consumed_llm_calls += llm_calls
+            self._consumed_variables += variables
+            return True
+
+    def _committed_llm_calls(self) -> int:
+        """소비 + 선점된 LLM 호출 횟수"""
+        return self._consumed_llm_calls + self._reserved_llm_calls
+
+    def _committed_variables(self) -> int:
+        """소비 + 선점된 변수 개수"""
+        return self._consumed_variables + self._reserved_variables
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 선점 (Reservation / Lease)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def reserve(self, llm_calls: int = 0, variables: int = 0) -> Optional['BudgetLease']:
+        """
+        예산 선점 (원자적)
+
+        선점된 양은 다른 스레드가 소비할 수 없으며, Lease를 통해
+        확정(commit)하거나 반환(release)합니다.
+
+        Args:
+            llm_calls: 선점할 LLM 호출 횟수
+            variables: 선점할 변수 개수
+
+        Returns:
+            BudgetLease (예산 부족 시 None)
+
+        Example:
+            >>> lease = budget.reserve(llm_calls=3, variables=3)
+            >>> if lease:
+            ...     with lease:
+            ...         ...  # 병렬 작업
+            ...         lease.consume(llm_calls=1, variables=1)
+            ...     # with 종료 시 미사용분 자동 반환
+        """
+        with self._lock:
+            if self._committed_llm_calls() + llm_calls > self.max_llm_calls:
+                return None
+            if self._committed_variables() + variables > self.max_variables:
+                return None
+            self._reserved_llm_calls += llm_calls
+            self._reserved_variables += variables
+            return BudgetLease(budget=self, llm_calls=llm_calls, variables=variables)
+
+    def _release_reserved(self, llm_calls: int = 0, variables: int = 0) -> None:
+        """선점분 반환 (BudgetLease 전용)"""
+        with self._lock:
+            self._reserved_llm_calls = max(0, self._reserved_llm_calls - llm_calls)
+            self._reserved_variables = max(0, self._reserved_variables - variables)
+
+    def carve(
+        self,
+        llm_calls: Optional[int] = None,
+        variables: Optional[int] = None,
+        runtime: Optional[float] = None,
+        depth: Optional[int] = None
+    ) -> Optional['Budget']:
+        """
+        Stage별 하위 예산 분할 (부모와 연결됨)
+
+        create_sub_budget()와 달리 부모 예산에서 해당 양을 선점하고,
+        하위 예산의 소비는 즉시 부모에도 반영됩니다. 하위 예산의 시간
+        한도는 부모의 잔여 시간을 넘지 않습니다 (deadline 전파).
+        작업이 끝나면 close()로 미사용분을 부모에 반환하세요.
+
+        Args:
+            llm_calls: 하위 예산 LLM 호출 (None이면 잔여량 전부)
+            variables: 하위 예산 변수 (None이면 잔여량 전부)
+            runtime: 하위 예산 시간 (None이면 부모 잔여 시간, 부모 잔여 시간 이하로 제한)
+            depth: 하위 예산 최대 깊이 (None이면 부모와 동일)
+
+        Returns:
+            하위 Budget (예산 부족 시 None)
+
+        Example:
+            >>> prior_budget = budget.carve(llm_calls=1, variables=1)
+            >>> fermi_budget = budget.carve()  # 나머지 전부
+            >>> ...  # 두 Stage 동시 실행
+            >>> prior_budget.close(); fermi_budget.close()
+        """
+        with self._lock:
+            llm_calls = self.get_remaining_llm_calls() if llm_calls is None else llm_calls
+            variables = self.get_remaining_variables() if variables is None else variables
+
+            lease = self.reserve(llm_calls=llm_calls, variables=variables)
+            if lease is None:
+                return None
+
+            remaining_time = self.get_remaining_time()
+            runtime = remaining_time if runtime is None else min(runtime, remaining_time)
+
+            return Budget(
+                max_llm_calls=llm_calls,
+                max_variables=variables,
+                max_runtime_seconds=runtime,
+                max_depth=self.max_depth if depth is None else depth,
+                _start_time=time.time(),
+                _parent_lease=lease
+            )
+
+    def close(self) -> None:
+        """
+        carve()로 생성된 하위 예산 종료
+
+        미사용 선점분을 부모 예산에 반환합니다. 독립 예산이면 무시됩니다.
+        """
+        if self._parent_lease is not None:
+            self._parent_lease.release()
+
+    def __enter__(self) -> 'Budget':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 예산 체크 (Check)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
     def can_call_llm(self, count: int = 1) -> bool:
-        """LLM 호출 가능 여부"""
-        return self._consumed_llm_calls + count <= self.max_llm_calls
+        """LLM 호출 가능 여부 (선점분 제외)"""
+        with self._lock:
+            return self._committed_llm_calls() + count <= self.max_llm_calls
 
     def can_estimate_variable(self, count: int = 1) -> bool:
-        """변수 추정 가능 여부"""
-        return self._consumed_variables + count <= self.max_variables
+        """변수 추정 가능 여부 (선점분 제외)"""
+        with self._lock:
+            return self._committed_variables() + count <= self.max_variables
 
     def has_time(self) -> bool:
         """시간 예산 잔여 여부"""
@@ -110,10 +275,11 @@ class Budget:
         """
         if not self.has_time():
             return True
-        if self._consumed_llm_calls >= self.max_llm_calls:
-            return True
-        if self._consumed_variables >= self.max_variables:
-            return True
+        with self._lock:
+            if self._committed_llm_calls() >= self.max_llm_calls:
+                return True
+            if self._committed_variables() >= self.max_variables:
+                return True
         return False
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -121,12 +287,22 @@ class Budget:
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
     def get_remaining_llm_calls(self) -> int:
-        """잔여 LLM 호출 횟수"""
-        return max(0, self.max_llm_calls - self._consumed_llm_calls)
+        """잔여 LLM 호출 횟수 (선점분 제외)"""
+        with self._lock:
+            return max(0, self.max_llm_calls - self._committed_llm_calls())
 
     def get_remaining_variables(self) -> int:
-        """잔여 변수 추정 개수"""
-        return max(0, self.max_variables - self._consumed_variables)
+        """잔여 변수 추정 개수 (선점분 제외)"""
+        with self._lock:
+            return max(0, self.max_variables - self._committed_variables())
+
+    def get_consumed_llm_calls(self) -> int:
+        """소비된 LLM 호출 횟수"""
+        return self._consumed_llm_calls
+
+    def get_consumed_variables(self) -> int:
+        """소비된 변수 개수"""
+        return self._consumed_variables
 
     def get_elapsed_time(self) -> float:
         """경과 시간 (초)"""
@@ -138,6 +314,24 @@ class Budget:
         """잔여 시간 (초)"""
         return max(0.0, self.max_runtime_seconds - self.get_elapsed_time())
 
+    def get_deadline(self) -> float:
+        """마감 시각 (epoch 초)"""
+        start = self._start_time if self._start_time is not None else time.time()
+        return start + self.max_runtime_seconds
+
+    def get_request_timeout(self, min_timeout: float = 1.0) -> float:
+        """
+        LLM/HTTP 요청 timeout (잔여 시간 전파)
+
+        Args:
+            min_timeout: 최소 timeout (초). 잔여 시간이 거의 없어도
+                요청이 즉시 실패하지 않도록 하한을 둡니다.
+
+        Returns:
+            요청 timeout (초)
+        """
+        return max(min_timeout, self.get_remaining_time())
+
     def get_status_summary(self) -> dict:
         """
         예산 상태 요약
@@ -150,12 +344,15 @@ class Budget:
                 'exhausted': False
             }
         """
-        return {
+        summary = {
             'llm_calls': f"{self._consumed_llm_calls}/{self.max_llm_calls}",
             'variables': f"{self._consumed_variables}/{self.max_variables}",
             'time': f"{self.get_elapsed_time():.1f}/{self.max_runtime_seconds}s",
             'exhausted': self.is_exhausted()
         }
+        if self._reserved_llm_calls or self._reserved_variables:
+            summary['reserved'] = f"llm={self._reserved_llm_calls}, vars={self._reserved_variables}"
+        return summary
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 예산 복사 (Copy)
@@ -179,6 +376,10 @@ class Budget:
 
         Returns:
             새로운 Budget 인스턴스 (소비 상태 초기화)
+
+        Note:
+            부모와 연결되지 않으므로 하위 예산 소비가 부모에 반영되지 않습니다.
+            동시 실행 Stage에는 carve()를 사용하세요.
         """
         return Budget(
             max_llm_calls=llm_calls if llm_calls is not None else self.get_remaining_llm_calls(),
@@ -189,6 +390,91 @@ class Budget:
         )
 
 
+@dataclass
+class BudgetLease:
+    """
+    예산 선점 Lease (v7.11.2)
+
+    Budget.reserve()가 반환합니다. 선점된 양 안에서 consume()으로 소비하고,
+    release()로 미사용분을 반환합니다. with 문으로 사용하면 종료 시 자동 반환됩니다.
+
+    Attributes:
+        budget: 선점한 Budget
+        llm_calls: 선점된 LLM 호출 횟수
+        variables: 선점된 변수 개수
+    """
+
+    budget: Budget
+    llm_calls: int = 0
+    variables: int = 0
+
+    _used_llm_calls: int = 0
+    _used_variables: int = 0
+    _closed: bool = False
+
+    @property
+    def remaining_llm_calls(self) -> int:
+        """Lease 내 잔여 LLM 호출 횟수"""
+        return 0 if self._closed else self.llm_calls - self._used_llm_calls
+
+    @property
+    def remaining_variables(self) -> int:
+        """Lease 내 잔여 변수 개수"""
+        return 0 if self._closed else self.variables - self._used_variables
+
+    def consume(self, llm_calls: int = 0, variables: int = 0) -> bool:
+        """
+        선점분에서 소비
+
+        Returns:
+            성공 여부 (Lease 초과 또는 종료 시 False)
+        """
+        with self.budget._lock:
+            if llm_calls > self.remaining_llm_calls or variables > self.remaining_variables:
+                return False
+            if not self.budget._consume(llm_calls=llm_calls, variables=variables, from_reserved=True):
+                return False
+            self._used_llm_calls += llm_calls
+            self._used_variables += variables
+            return True
+
+    def commit(self, llm_calls: Optional[int] = None, variables: Optional[int] = None) -> bool:
+        """
+        선점분 확정 후 Lease 종료
+
+        Args:
+            llm_calls: 확정할 LLM 호출 (None이면 잔여 선점분 전부)
+            variables: 확정할 변수 (None이면 잔여 선점분 전부)
+
+        Returns:
+            성공 여부
+        """
+        with self.budget._lock:
+            ok = self.consume(
+                llm_calls=self.remaining_llm_calls if llm_calls is None else llm_calls,
+                variables=self.remaining_variables if variables is None else variables
+            )
+            self.release()
+            return ok
+
+    def release(self) -> None:
+        """미사용 선점분 반환 후 Lease 종료 (중복 호출 안전)"""
+        with self.budget._lock:
+            if self._closed:
+                return
+            self.budget._release_reserved(
+                llm_calls=self.remaining_llm_calls,
+                variables=self.remaining_variables
+            )
+            self._closed = True
+
+    def __enter__(self) -> 'BudgetLease':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 프리셋 (Presets)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
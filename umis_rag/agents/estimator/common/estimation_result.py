@@ -65,7 +65,7 @@ class EstimationResult:
         certainty: LLM의 내적 확신도 (high/medium/low)
         uncertainty: 불확실성 (0.0-1.0, 낮을수록 확실)
         
-        cost: 비용 정보 (llm_calls, variables, time)
+        cost: 비용 정보 (llm_calls, variables, time, input_tokens, output_tokens)
         
         decomposition: Fermi 분해 구조 (있으면)
         used_evidence: 사용된 증거 목록
@@ -74,6 +74,7 @@ class EstimationResult:
         source: 추정 엔진 식별 (예: "Evidence", "Prior", "Fermi")
         reasoning: 추정 근거
         metadata: 추가 정보
+        trace: 요청 trace (Stage / 하위 단계 span, EstimatorRAG.estimate 결과만)
     """
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -118,6 +119,9 @@ class EstimationResult:
     reasoning: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # 요청 trace (v7.11.2, umis_rag.core.tracing.Trace.to_dict())
+    trace: Optional[Dict[str, Any]] = None
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 타임스탬프
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -163,7 +167,10 @@ class EstimationResult:
         llm = self.cost.get('llm_calls', 0)
         vars = self.cost.get('variables', 0)
         time = self.cost.get('time', 0.0)
-        return f"{llm} LLM calls, {vars} vars, {time:.1f}s"
+        summary = f"{llm} LLM calls, {vars} vars, {time:.1f}s"
+        if self.cost.get('input_tokens') or self.cost.get('output_tokens'):
+            summary += f", {self.cost.get('input_tokens', 0)}+{self.cost.get('output_tokens', 0)} tokens"
+        return summary
     
     def is_within_bounds(self, min_val: Optional[float], max_val: Optional[float]) -> bool:
         """
@@ -218,6 +225,7 @@ class EstimationResult:
             'decomposition': self.decomposition,
             'fusion_weights': self.fusion_weights,
             'metadata': self.metadata,
+            'trace': self.trace,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
     
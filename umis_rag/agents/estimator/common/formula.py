@@ -0,0 +1,268 @@
+"""
+Fermi 공식 컴파일러 (v7.11.2)
+
+분해 공식 문자열을 한 번 파싱해 안전한 callable로 만듭니다.
+
+- eval 없음: AST를 검사해 산술 연산자 + 허용 함수만 통과시키고 closure 트리로 컴파일
+- 변수명 치환 없음: 식별자 단위로 바인딩 ('매출'과 '평균매출' 충돌 없음)
+  (공백/기호가 포함된 변수명은 variables로 넘기면 자리표시자로 안전하게 처리)
+- 공식 텍스트(+ 변수 목록) 단위 캐시
+- 스칼라 / NumPy 배열 / 여러 할당 일괄 계산
+
+지원 표기:
+- "LTV = ARPU / Churn" (좌변 무시) 또는 우변만
+- + - * / ** ^(거듭제곱) × ÷, 괄호, 숫자 (1,000 같은 쉼표 숫자 제외)
+- 함수: min, max, abs, sqrt, log, log10, exp, round
+- 상수: pi, e
+
+Example:
+    >>> f = compile_formula("LTV = ARPU / Churn")
+    >>> f.variables
+    ('ARPU', 'Churn')
+    >>> f.evaluate({'ARPU': 50000, 'Churn': 0.05})
+    1000000.0
+    >>> f.evaluate_batch([{'ARPU': 1, 'Churn': 0.5}, {'ARPU': 2, 'Churn': 0.5}])
+    array([2., 4.])
+"""
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Sequence, Tuple
+import ast
+import math
+import operator
+
+import numpy as np
+
+
+class FormulaError(ValueError):
+    """공식 파싱/검증/계산 오류"""
+    pass
+
+
+def _variadic(ufunc):
+    def call(*args):
+        if not args:
+            raise FormulaError("인자가 필요합니다")
+        result = args[0]
+        for arg in args[1:]:
+            result = ufunc(result, arg)
+        return result
+    return call
+
+
+# 스칼라와 배열 모두 동작하는 함수만 허용
+ALLOWED_FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    'min': _variadic(np.minimum),
+    'max': _variadic(np.maximum),
+    'abs': np.abs,
+    'sqrt': np.sqrt,
+    'log': np.log,
+    'log10': np.log10,
+    'exp': np.exp,
+    'round': np.round,
+}
+
+CONSTANTS: Dict[str, float] = {
+    'pi': math.pi,
+    'e': math.e,
+}
+
+_BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPS = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+Env = Mapping[str, Any]
+
+
+class CompiledFormula:
+    """
+    컴파일된 공식 (불변, thread-safe)
+
+    Attributes:
+        source: 원본 공식
+        expression: 정규화된 우변
+        variables: 필요한 변수명 (등장 순서)
+    """
+
+    def __init__(
+        self,
+        source: str,
+        expression: str,
+        variables: Tuple[str, ...],
+        fn: Callable[[Env], Any],
+        aliases: Dict[str, str]
+    ):
+        self.source = source
+        self.expression = expression
+        self.variables = variables
+        self._fn = fn
+        self._aliases = aliases  # 자리표시자 → 원래 변수명
+
+    def evaluate(self, values: Mapping[str, Any]) -> float:
+        """
+        스칼라 계산
+
+        Raises:
+            FormulaError: 변수 누락, 0 나누기, 결과가 유한하지 않음
+        """
+        try:
+            result = self._fn(self._bind(values))
+        except ZeroDivisionError as e:
+            raise FormulaError(f"0으로 나눔: {self.expression}") from e
+        except OverflowError as e:
+            raise FormulaError(f"오버플로: {self.expression}") from e
+
+        result = float(result)
+        if not math.isfinite(result):
+            raise FormulaError(f"계산 결과가 유한하지 않음 ({result}): {self.expression}")
+        return result
+
+    def evaluate_arrays(self, arrays: Mapping[str, Any]) -> np.ndarray:
+        """
+        배열 계산 (0 나누기 등은 inf/nan으로 남김)
+
+        Args:
+            arrays: {변수명: 배열 또는 스칼라}
+        """
+        env = {name: np.asarray(value, dtype=float) for name, value in self._bind(arrays).items()}
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            return np.asarray(self._fn(env), dtype=float)
+
+    def evaluate_batch(self, assignments: Iterable[Mapping[str, Any]]) -> np.ndarray:
+        """
+        여러 변수 할당을 한 번에 계산 (시나리오/민감도 sweep)
+
+        Returns:
+            (할당 수,) 배열
+        """
+        assignments = list(assignments)
+        if not assignments:
+            return np.empty(0)
+
+        columns = {}
+        for name in self.variables:
+            try:
+                columns[name] = [a[name] for a in assignments]
+            except KeyError as e:
+                raise FormulaError(f"변수 누락: {e.args[0]}") from e
+
+        result = self.evaluate_arrays(columns)
+        return np.broadcast_to(result, (len(assignments),)).copy()
+
+    def __call__(self, **values) -> float:
+        return self.evaluate(values)
+
+    def _bind(self, values: Mapping[str, Any]) -> Dict[str, Any]:
+        env = {}
+        for name in self.variables:
+            if name not in values:
+                raise FormulaError(f"변수 누락: {name} (공식: {self.source})")
+            env[name] = values[name]
+        return env
+
+    def __repr__(self) -> str:
+        return f"CompiledFormula({self.expression!r}, variables={self.variables})"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 컴파일
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def compile_formula(formula: str, variables: Optional[Sequence[str]] = None) -> CompiledFormula:
+    """
+    공식 컴파일 (텍스트 + 변수 목록 단위 캐시)
+
+    Args:
+        formula: 공식 문자열
+        variables: 변수명 목록 (식별자가 아닌 이름 - 공백/기호 포함 - 이 있으면 필요)
+
+    Raises:
+        FormulaError: 문법 오류 또는 허용되지 않은 구문
+    """
+    return _compile_cached(formula, tuple(sorted(set(variables or ()))))
+
+
+@lru_cache(maxsize=512)
+def _compile_cached(formula: str, variables: Tuple[str, ...]) -> CompiledFormula:
+    expression = normalize_expression(formula)
+
+    # 식별자가 아닌 변수명 → 자리표시자 (긴 이름부터)
+    aliases: Dict[str, str] = {}
+    text = expression
+    for i, name in enumerate(sorted(variables, key=len, reverse=True)):
+        if name.isidentifier():
+            continue
+        placeholder = f"__var{i}__"
+        if name in text:
+            text = text.replace(name, placeholder)
+            aliases[placeholder] = name
+
+    try:
+        tree = ast.parse(text, mode='eval')
+    except SyntaxError as e:
+        raise FormulaError(f"공식 문법 오류: {expression}") from e
+
+    names: Dict[str, None] = {}
+    fn = _compile_node(tree.body, names, aliases)
+    return CompiledFormula(formula, expression, tuple(names), fn, aliases)
+
+
+def normalize_expression(formula: str) -> str:
+    """좌변 제거 + 연산자 표기 통일"""
+    expression = formula.split("=", 1)[1] if "=" in formula else formula
+    return (
+        expression.strip()
+        .replace('×', '*')
+        .replace('÷', '/')
+        .replace('^', '**')
+    )
+
+
+def _compile_node(node: ast.AST, names: Dict[str, None], aliases: Dict[str, str]) -> Callable[[Env], Any]:
+    """AST 노드 → env를 받는 closure (허용 구문만)"""
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        value = float(node.value)
+        return lambda env: value
+
+    if isinstance(node, ast.Name):
+        if node.id in CONSTANTS:
+            value = CONSTANTS[node.id]
+            return lambda env: value
+        if node.id in ALLOWED_FUNCTIONS:
+            raise FormulaError(f"함수는 호출 형태로만 사용: {node.id}")
+        name = aliases.get(node.id, node.id)
+        names.setdefault(name)
+        return lambda env: env[name]
+
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        op = _BINARY_OPS[type(node.op)]
+        left = _compile_node(node.left, names, aliases)
+        right = _compile_node(node.right, names, aliases)
+        return lambda env: op(left(env), right(env))
+
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        op = _UNARY_OPS[type(node.op)]
+        operand = _compile_node(node.operand, names, aliases)
+        return lambda env: op(operand(env))
+
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.func.id not in ALLOWED_FUNCTIONS:
+            raise FormulaError(f"허용되지 않은 함수: {ast.unparse(node.func)}")
+        if node.keywords:
+            raise FormulaError(f"키워드 인자는 지원하지 않음: {ast.unparse(node)}")
+        func = ALLOWED_FUNCTIONS[node.func.id]
+        args = [_compile_node(arg, names, aliases) for arg in node.args]
+        return lambda env: func(*(arg(env) for arg in args))
+
+    raise FormulaError(f"허용되지 않은 구문: {ast.unparse(node)}")
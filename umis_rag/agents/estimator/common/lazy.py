@@ -0,0 +1,69 @@
+"""
+LazyComponent - 첫 접근 시 생성되는 구성요소 (v7.11.2)
+
+EstimatorRAG / EvidenceCollector의 Stage·Source를 실제로 쓰일 때만 생성합니다.
+(예: estimate_fast()는 Fermi를 쓰지 않으므로 FermiEstimator를 만들지 않음)
+
+- thread-safe: 동시에 첫 접근해도 1회만 생성
+- 대입 가능: 테스트/주입용으로 instance.attr = obj 로 교체
+"""
+
+from typing import Any, Callable, Optional
+import threading
+
+from umis_rag.utils.logger import logger
+
+
+# 구성요소 생성은 드물고, 생성 중 다른 구성요소에 접근할 수 있으므로 (Fermi → Prior)
+# 전역 재진입 Lock 하나로 충분
+_BUILD_LOCK = threading.RLock()
+
+
+class LazyComponent:
+    """
+    Lazy 구성요소 descriptor
+
+    Example:
+        >>> class Agent:
+        ...     searcher = LazyComponent(lambda self: Searcher(), "Searcher")
+        >>> agent = Agent()
+        >>> LazyComponent.is_built(agent, 'searcher')
+        False
+        >>> agent.searcher  # 이 시점에 생성
+    """
+
+    def __init__(self, factory: Callable[[Any], Any], label: Optional[str] = None):
+        """
+        Args:
+            factory: 소유 객체를 받아 구성요소를 만드는 함수
+            label: 생성 시 로그 이름
+        """
+        self.factory = factory
+        self.label = label
+        self.attr = None
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.attr = f'_{name}'
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        value = obj.__dict__.get(self.attr)
+        if value is None:
+            with _BUILD_LOCK:
+                value = obj.__dict__.get(self.attr)
+                if value is None:
+                    value = self.factory(obj)
+                    obj.__dict__[self.attr] = value
+                    if self.label:
+                        logger.info(f"  ✅ {self.label} (lazy)")
+        return value
+
+    def __set__(self, obj, value) -> None:
+        obj.__dict__[self.attr] = value
+
+    @staticmethod
+    def is_built(obj: Any, name: str) -> bool:
+        """구성요소가 이미 생성(또는 주입)되었는지"""
+        return obj.__dict__.get(f'_{name}') is not None
@@ -0,0 +1,246 @@
+"""
+Monte Carlo 불확실성 전파 (v7.11.2)
+
+Fermi 분해식의 각 변수를 value_range/certainty 기반 분포에서 샘플링하고,
+공식을 NumPy 배열로 한 번에 계산해 결과 분포를 구합니다.
+
+- 추가 LLM 호출 없음 (변수 추정 결과만 사용)
+- 20,000회 샘플 기준 수 ms (모든 추정마다 실행 가능)
+- 결과: 백분위수 (p5~p95), 평균/표준편차, 민감도 순위 (Spearman 순위상관)
+
+분포 선택 (distribution='auto'):
+- value_range 있고 0 < low, high/low ≥ 3   → 분할 로그정규 (p5=low, p95=high, 중앙값=value,
+                                               value가 기하평균이 아니면 좌우 σ를 따로 맞춤)
+- value_range 있음                           → 삼각분포 (low, value, high)
+- value_range 없음                           → certainty별 ±폭 삼각분포
+                                               (high ±10%, medium ±30%, low ±60%)
+
+Example:
+    >>> result = propagate_uncertainty(
+    ...     "LTV = ARPU / Churn",
+    ...     {'ARPU': (50000, (30000, 80000), 'medium'), 'Churn': (0.05, (0.03, 0.08), 'low')}
+    ... )
+    >>> result.interval()          # (p5, p95)
+    >>> result.sensitivity[0]      # {'variable': 'Churn', 'correlation': -0.8, 'contribution': 0.7}
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+import math
+
+import numpy as np
+
+from .formula import compile_formula
+
+
+# certainty별 상대 폭 (value_range 없을 때)
+CERTAINTY_SPREAD = {
+    'high': 0.10,
+    'medium': 0.30,
+    'low': 0.60,
+}
+
+PERCENTILES = (5, 10, 25, 50, 75, 90, 95)
+
+# 정규분포 95% 분위수 (p5~p95 = ±1.645σ)
+_Z95 = 1.6448536269514722
+
+VariableSpec = Union[Tuple[float, Optional[Tuple[float, float]], str], Any]
+
+
+@dataclass
+class UncertaintyResult:
+    """Monte Carlo 전파 결과"""
+    samples: int
+    valid: int
+    mean: float
+    std: float
+    percentiles: Dict[int, float]
+    sensitivity: List[Dict[str, Any]] = field(default_factory=list)
+
+    def interval(self, low: int = 5, high: int = 95) -> Tuple[float, float]:
+        """백분위 구간 (기본 p5~p95)"""
+        return (self.percentiles[low], self.percentiles[high])
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'samples': self.samples,
+            'valid': self.valid,
+            'mean': self.mean,
+            'std': self.std,
+            'percentiles': {f'p{p}': v for p, v in self.percentiles.items()},
+            'sensitivity': self.sensitivity
+        }
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 샘플링
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def sample_variable(
+    value: float,
+    value_range: Optional[Tuple[float, float]],
+    certainty: str,
+    n: int,
+    rng: np.random.Generator,
+    distribution: str = 'auto'
+) -> np.ndarray:
+    """
+    변수 1개 샘플링
+
+    Args:
+        value: 점 추정값
+        value_range: (low, high) or None
+        certainty: high/medium/low (range 없을 때 폭 결정)
+        n: 샘플 수
+        rng: NumPy Generator
+        distribution: 'auto' | 'triangular' | 'lognormal' | 'uniform'
+
+    Returns:
+        (n,) 배열
+    """
+    value = float(value)
+    low, high = _resolve_range(value, value_range, certainty)
+
+    if high <= low:
+        return np.full(n, value)
+
+    if distribution == 'auto':
+        distribution = 'lognormal' if low > 0 and high / low >= 3 else 'triangular'
+
+    if distribution == 'lognormal' and low > 0:
+        # 분할 로그정규: 중앙값 아래/위 σ를 각각 low/high에 맞춤 → p5=low, p95=high
+        median = value if low < value < high else math.sqrt(low * high)
+        sigma_low = (math.log(median) - math.log(low)) / _Z95
+        sigma_high = (math.log(high) - math.log(median)) / _Z95
+        z = rng.standard_normal(n)
+        return median * np.exp(z * np.where(z < 0, sigma_low, sigma_high))
+
+    if distribution == 'uniform':
+        return rng.uniform(low, high, size=n)
+
+    mode = min(max(value, low), high)
+    return rng.triangular(low, mode, high, size=n)
+
+
+def _resolve_range(
+    value: float,
+    value_range: Optional[Tuple[float, float]],
+    certainty: str
+) -> Tuple[float, float]:
+    """유효한 value_range면 그대로, 아니면 certainty 기반 폭"""
+    if value_range and len(value_range) == 2:
+        low, high = (float(v) for v in value_range)
+        if math.isfinite(low) and math.isfinite(high) and low < high:
+            return low, high
+
+    spread = CERTAINTY_SPREAD.get(certainty, CERTAINTY_SPREAD['medium'])
+    delta = abs(value) * spread
+    return value - delta, value + delta
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 전파
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def propagate_uncertainty(
+    formula: str,
+    variables: Dict[str, VariableSpec],
+    samples: int = 20000,
+    seed: Optional[int] = 0,
+    distribution: str = 'auto'
+) -> UncertaintyResult:
+    """
+    공식의 불확실성 전파
+
+    Args:
+        formula: "LTV = ARPU / Churn" 또는 우변만
+        variables: {이름: EstimationResult} 또는 {이름: (value, value_range, certainty)}
+        samples: 샘플 수
+        seed: 난수 시드 (None이면 매번 다름)
+        distribution: 변수 분포 (sample_variable 참조)
+
+    Returns:
+        UncertaintyResult
+
+    Raises:
+        ValueError: 유효한 샘플이 없을 때 (0 나누기 등)
+    """
+    rng = np.random.default_rng(seed)
+
+    draws: Dict[str, np.ndarray] = {}
+    for name, spec in variables.items():
+        value, value_range, certainty = _unpack(spec)
+        draws[name] = sample_variable(value, value_range, certainty, samples, rng, distribution)
+
+    output = evaluate_vectorized(formula, draws)
+    output = np.broadcast_to(np.asarray(output, dtype=float), (samples,))
+
+    mask = np.isfinite(output)
+    valid = int(mask.sum())
+    if valid == 0:
+        raise ValueError(f"유효한 샘플 없음: {formula}")
+
+    out = output[mask]
+    values = np.percentile(out, PERCENTILES)
+
+    return UncertaintyResult(
+        samples=samples,
+        valid=valid,
+        mean=float(out.mean()),
+        std=float(out.std()),
+        percentiles={p: float(v) for p, v in zip(PERCENTILES, values)},
+        sensitivity=_sensitivity({k: v[mask] for k, v in draws.items()}, out)
+    )
+
+
+def evaluate_vectorized(formula: str, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    공식을 배열에 대해 계산 (FermiEstimator._evaluate_formula와 같은 컴파일러 사용)
+
+    Raises:
+        FormulaError: 허용되지 않은 구문, 변수 누락
+    """
+    return compile_formula(formula, list(arrays)).evaluate_arrays(arrays)
+
+
+def _unpack(spec: VariableSpec) -> Tuple[float, Optional[Tuple[float, float]], str]:
+    if isinstance(spec, tuple):
+        value, value_range, certainty = (tuple(spec) + (None, 'medium'))[:3]
+        return value, value_range, certainty or 'medium'
+    return spec.value, getattr(spec, 'value_range', None), getattr(spec, 'certainty', 'medium')
+
+
+def _sensitivity(draws: Dict[str, np.ndarray], output: np.ndarray) -> List[Dict[str, Any]]:
+    """
+    Spearman 순위상관 기반 민감도
+
+    contribution = ρ² / Σρ² (출력 변동에 대한 대략적 기여 비율)
+    """
+    output_rank = _rank(output)
+    correlations = {}
+    for name, values in draws.items():
+        if np.ptp(values) == 0 or np.ptp(output_rank) == 0:
+            correlations[name] = 0.0
+            continue
+        correlations[name] = float(np.corrcoef(_rank(values), output_rank)[0, 1])
+
+    total = sum(rho ** 2 for rho in correlations.values())
+    ranking = [
+        {
+            'variable': name,
+            'correlation': round(rho, 4),
+            'contribution': round(rho ** 2 / total, 4) if total else 0.0
+        }
+        for name, rho in correlations.items()
+    ]
+    ranking.sort(key=lambda item: abs(item['correlation']), reverse=True)
+    return ranking
+
+
+def _rank(values: np.ndarray) -> np.ndarray:
+    ranks = np.empty(len(values), dtype=float)
+    ranks[np.argsort(values, kind='mergesort')] = np.arange(len(values))
+    return ranks
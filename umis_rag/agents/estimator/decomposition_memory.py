@@ -0,0 +1,381 @@
+"""
+Decomposition Memory - Fermi 분해식 재사용 (v7.11.2)
+
+목적:
+- FermiEstimator.estimate는 매번 _generate_decomposition에서 LLM을 1회 호출
+- 배치에는 같은 질문군이 반복됨 ("서울 음식점 수는?" / "서울시 음식점 개수")
+- 분해 구조(공식 + 변수 설명)는 재사용하고, 변수 값만 다시 추정하면 충분
+
+특징:
+- 키 = (정규화 질문, domain, region)
+- 조회 순서: 정확 일치 → 같은 (domain, region) 안에서 임베딩 코사인 유사도
+  (region이 지정된 경우만: region 없이는 "서울/부산 음식점 수"처럼 지역만 다른 질문이
+   유사 판정될 수 있고, 변수는 이름만으로 다시 추정되므로 엉뚱한 지역 값을 쓰게 됨)
+- 공식이 컴파일되지 않는 분해식은 저장하지 않음 (formula.compile_formula)
+- 메모리 + SQLite (path 지정 시 재시작 후에도 유지), LRU 항목 수 제한
+- 임베딩 실패 시 정확 일치만 사용
+
+설정 (.env):
+    FERMI_DECOMPOSITION_MEMORY_ENABLED=true
+    FERMI_DECOMPOSITION_MEMORY_PATH=./data/cache/fermi_decompositions.sqlite3
+    FERMI_DECOMPOSITION_SIMILARITY=0.9
+
+Example:
+    >>> memory = DecompositionMemory(embeddings=get_embeddings())
+    >>> memory.remember("서울 음식점 수는?", context, formula, variables)
+    >>> match = memory.lookup("서울시 음식점 개수", context)
+    >>> match.formula, match.match_type, match.similarity
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import sqlite3
+import threading
+import time
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from umis_rag.core.cache_stats import CacheStats
+from umis_rag.core.config import settings
+from umis_rag.utils.logger import logger
+
+from .batch import normalize_question
+from .common.formula import FormulaError, compile_formula
+from .models import Context
+
+
+MemoryKey = Tuple[str, str, str]
+
+
+@dataclass
+class DecompositionMatch:
+    """조회 결과"""
+    formula: str
+    variables: Dict[str, str]
+    match_type: str              # 'exact' | 'similar'
+    similarity: float
+    source_question: str         # 저장 당시 (정규화) 질문
+
+
+@dataclass
+class _Entry:
+    formula: str
+    variables: Dict[str, str]
+    embedding: Optional[np.ndarray]
+    last_used: float
+
+
+def memory_key(question: str, context: Optional[Context]) -> MemoryKey:
+    """(정규화 질문, domain, region)"""
+    if isinstance(context, dict):
+        domain, region = context.get('domain'), context.get('region')
+    else:
+        domain, region = getattr(context, 'domain', None), getattr(context, 'region', None)
+    return (normalize_question(question), domain or '', region or '')
+
+
+class DecompositionMemory:
+    """
+    분해식 메모리 (thread-safe)
+    """
+
+    # 조회 시 last_used 저장 간격 (초) → hit마다 쓰기/commit이 생기지 않도록
+    TOUCH_INTERVAL = 300.0
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        embeddings: Optional[Embeddings] = None,
+        similarity_threshold: float = 0.9,
+        max_entries: int = 10000
+    ):
+        """
+        Args:
+            path: SQLite 경로 (None이면 프로세스 메모리만)
+            embeddings: 유사 질문 조회용 임베딩 (None이면 정확 일치만)
+            similarity_threshold: 재사용 최소 코사인 유사도
+            max_entries: 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+        """
+        self.path = Path(path) if path else None
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max(1, max_entries)
+
+        self.stats = CacheStats()
+        self.similar_hits = 0
+
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[MemoryKey, _Entry]" = OrderedDict()
+        # (domain, region) → (키 목록, 정규화 임베딩 행렬), 쓰기 시 무효화
+        self._matrices: Dict[Tuple[str, str], Tuple[List[MemoryKey], np.ndarray]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+
+        if self.path:
+            self._open()
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 조회 / 저장
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def lookup(self, question: str, context: Optional[Context] = None) -> Optional[DecompositionMatch]:
+        """
+        분해식 조회 (정확 일치 → 유사 질문)
+
+        Returns:
+            DecompositionMatch or None
+        """
+        key = memory_key(question, context)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._touch(key, entry)
+                self.stats.hits += 1
+                return DecompositionMatch(entry.formula, dict(entry.variables), 'exact', 1.0, key[0])
+
+            # 유사 조회는 region이 명시된 scope에서만
+            has_candidates = (
+                self.embeddings is not None
+                and bool(key[2])
+                and bool(self._scope_matrix(key[1:])[0])
+            )
+
+        if not has_candidates:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+
+        query = self._embed(key[0])
+        if query is None:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+
+        with self._lock:
+            keys, matrix = self._scope_matrix(key[1:])
+            if not keys:
+                self.stats.misses += 1
+                return None
+
+            scores = matrix @ query
+            best = int(np.argmax(scores))
+            similarity = float(scores[best])
+            if similarity < self.similarity_threshold:
+                self.stats.misses += 1
+                return None
+
+            match_key = keys[best]
+            entry = self._entries[match_key]
+            self._touch(match_key, entry)
+            self.stats.hits += 1
+            self.similar_hits += 1
+            return DecompositionMatch(entry.formula, dict(entry.variables), 'similar', similarity, match_key[0])
+
+    def remember(
+        self,
+        question: str,
+        context: Optional[Context],
+        formula: str,
+        variables: Dict[str, str]
+    ) -> bool:
+        """
+        분해식 저장
+
+        Returns:
+            저장 여부 (공식이 컴파일되지 않거나 변수와 맞지 않으면 False)
+        """
+        try:
+            compiled = compile_formula(formula, list(variables))
+        except FormulaError as e:
+            logger.debug(f"[DecompositionMemory] 저장 생략 (공식 오류): {e}")
+            return False
+
+        if not set(compiled.variables) <= set(variables):
+            logger.debug(f"[DecompositionMemory] 저장 생략 (정의되지 않은 변수): {formula}")
+            return False
+
+        key = memory_key(question, context)
+        embedding = self._embed(key[0]) if self.embeddings is not None else None
+        entry = _Entry(formula, dict(variables), embedding, time.time())
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._matrices.pop(key[1:], None)
+            self.stats.writes += 1
+            self._persist(key, entry)
+
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._matrices.pop(old_key[1:], None)
+                self._delete(old_key)
+                self.stats.evictions += 1
+
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """hit/miss 통계"""
+        with self._lock:
+            stats = self.stats.to_dict()
+            stats['similar_hits'] = self.similar_hits
+            stats['entries'] = len(self._entries)
+            return stats
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._matrices.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM decompositions")
+                self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 내부
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """정규화된 임베딩 (실패 시 None)"""
+        try:
+            vector = np.asarray(self.embeddings.embed_query(text), dtype=np.float32)
+        except Exception as e:
+            logger.debug(f"[DecompositionMemory] 임베딩 실패 → 정확 일치만 사용: {e}")
+            return None
+
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else None
+
+    def _scope_matrix(self, scope: Tuple[str, str]) -> Tuple[List[MemoryKey], np.ndarray]:
+        """같은 (domain, region) 항목의 임베딩 행렬 (lock 안에서 호출)"""
+        cached = self._matrices.get(scope)
+        if cached is None:
+            keys = [k for k, e in self._entries.items() if k[1:] == scope and e.embedding is not None]
+            matrix = np.vstack([self._entries[k].embedding for k in keys]) if keys else np.empty((0, 0))
+            cached = (keys, matrix)
+            self._matrices[scope] = cached
+        return cached
+
+    def _touch(self, key: MemoryKey, entry: _Entry) -> None:
+        """메모리 LRU 순서는 매번, SQLite last_used는 TOUCH_INTERVAL 단위로 갱신"""
+        self._entries.move_to_end(key)
+        now = time.time()
+        if now - entry.last_used < self.TOUCH_INTERVAL:
+            return
+        entry.last_used = now
+        if self._conn is not None:
+            self._conn.execute(
+                "UPDATE decompositions SET last_used = ? WHERE question = ? AND domain = ? AND region = ?",
+                (entry.last_used, *key)
+            )
+            self._conn.commit()
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS decompositions (
+                question TEXT NOT NULL,
+                domain TEXT NOT NULL,
+                region TEXT NOT NULL,
+                formula TEXT NOT NULL,
+                variables TEXT NOT NULL,
+                embedding BLOB,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (question, domain, region)
+            )
+            """
+        )
+        self._conn.commit()
+
+        rows = self._conn.execute(
+            "SELECT question, domain, region, formula, variables, embedding, last_used FROM decompositions "
+            "ORDER BY last_used DESC LIMIT ?",
+            (self.max_entries,)
+        ).fetchall()
+        for question, domain, region, formula, variables, blob, last_used in reversed(rows):
+            embedding = np.frombuffer(blob, dtype=np.float32).copy() if blob else None
+            self._entries[(question, domain, region)] = _Entry(formula, json.loads(variables), embedding, last_used)
+
+        if rows:
+            logger.info(f"[DecompositionMemory] {len(rows)}개 분해식 로드: {self.path}")
+
+    def _persist(self, key: MemoryKey, entry: _Entry) -> None:
+        if self._conn is None:
+            return
+        blob = entry.embedding.astype(np.float32).tobytes() if entry.embedding is not None else None
+        self._conn.execute(
+            "INSERT OR REPLACE INTO decompositions "
+            "(question, domain, region, formula, variables, embedding, last_used) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (*key, entry.formula, json.dumps(entry.variables, ensure_ascii=False), blob, entry.last_used)
+        )
+        self._conn.commit()
+
+    def _delete(self, key: MemoryKey) -> None:
+        if self._conn is None:
+            return
+        self._conn.execute(
+            "DELETE FROM decompositions WHERE question = ? AND domain = ? AND region = ?", key
+        )
+        self._conn.commit()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 싱글톤
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_memory: Optional[DecompositionMemory] = None
+_memory_loaded = False
+_memory_lock = threading.Lock()
+
+
+def get_decomposition_memory() -> Optional[DecompositionMemory]:
+    """
+    기본 분해식 메모리 (settings.fermi_decomposition_memory_enabled가 False면 None)
+    """
+    global _memory, _memory_loaded
+
+    if not _memory_loaded:
+        with _memory_lock:
+            if not _memory_loaded:
+                if settings.fermi_decomposition_memory_enabled:
+                    try:
+                        from umis_rag.core.vector_stores import get_embeddings
+                        embeddings = get_embeddings()
+                    except Exception as e:
+                        logger.warning(f"[DecompositionMemory] 임베딩 사용 불가 → 정확 일치만: {e}")
+                        embeddings = None
+
+                    _memory = DecompositionMemory(
+                        path=settings.fermi_decomposition_memory_path,
+                        embeddings=embeddings,
+                        similarity_threshold=settings.fermi_decomposition_similarity
+                    )
+                    logger.info(f"[DecompositionMemory] 활성화: {settings.fermi_decomposition_memory_path}")
+                _memory_loaded = True
+
+    return _memory
+
+
+def set_decomposition_memory(memory: Optional[DecompositionMemory]) -> None:
+    """
+    기본 메모리 교체 (테스트/배치별 메모리용)
+
+    Args:
+        memory: 새 메모리 (None이면 다음 호출 시 settings로 재생성)
+    """
+    global _memory, _memory_loaded
+    with _memory_lock:
+        _memory = memory
+        _memory_loaded = memory is not None
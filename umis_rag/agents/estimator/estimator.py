@@ -17,8 +17,12 @@ Architecture:
 - Stage 4: Fusion & Validation (Sensor Fusion)
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Iterable, Iterator, Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from pathlib import Path
+import asyncio
+import threading
 import time
 
 import sys
@@ -29,14 +33,17 @@ from umis_rag.core.config import settings
 from umis_rag.utils.logger import logger
 from umis_rag.core.llm_interface import LLMProvider
 from umis_rag.core.llm_provider_factory import get_default_llm_provider
+from umis_rag.core.tracing import Trace, get_metrics, propagate, start_trace, traced
 
 from .common.budget import Budget, create_standard_budget, create_fast_budget, create_thorough_budget
 from .common.estimation_result import EstimationResult, Evidence
+from .common.lazy import LazyComponent
 from .evidence_collector import EvidenceCollector
 from .prior_estimator import PriorEstimator
 from .fermi_estimator import FermiEstimator
 from .fusion_layer import FusionLayer
 from .models import Context
+from .batch import BatchMemo, normalize_question, context_key
 
 
 class EstimatorRAG:
@@ -87,10 +94,32 @@ class EstimatorRAG:
         >>> result = estimator.estimate("서울 음식점 수는?", budget=budget)
     """
     
+    # Stage 구성요소 (Lazy, v7.11.2)
+    evidence_collector = LazyComponent(
+        lambda self: EvidenceCollector(
+            llm_provider=self.llm_provider,
+            project_id=self._project_id
+        ),
+        "Stage 1: Evidence Collector"
+    )
+    prior_estimator = LazyComponent(
+        lambda self: PriorEstimator(llm_provider=self.llm_provider),
+        "Stage 2: Prior Estimator"
+    )
+    fermi_estimator = LazyComponent(
+        lambda self: FermiEstimator(
+            llm_provider=self.llm_provider,
+            prior_estimator=self.prior_estimator
+        ),
+        "Stage 3: Fermi Estimator (재귀 금지)"
+    )
+    fusion_layer = LazyComponent(lambda self: FusionLayer(), "Stage 4: Fusion Layer")
+    
     def __init__(
         self,
         llm_provider: Optional[LLMProvider] = None,
-        project_id: Optional[str] = None
+        project_id: Optional[str] = None,
+        pipeline_stages: bool = True
     ):
         """
         Estimator RAG Agent 초기화 (v7.11.0)
@@ -98,6 +127,7 @@ class EstimatorRAG:
         Args:
             llm_provider: LLMProvider (None이면 기본 Provider)
             project_id: 프로젝트 ID (Stage 1 Literal용, 선택)
+            pipeline_stages: Stage 2 (Prior)와 Stage 3 (Fermi) 동시 실행 여부 (v7.11.2)
         
         Note:
             v7.11.0: llm_mode 파라미터 제거됨
@@ -106,33 +136,16 @@ class EstimatorRAG:
         
         # LLMProvider 설정
         self.llm_provider = llm_provider or get_default_llm_provider()
+        self.pipeline_stages = pipeline_stages
         
         if project_id:
             logger.info(f"  📌 Project ID: {project_id}")
         
         logger.info(f"  📌 Provider: {self.llm_provider.__class__.__name__}")
         
-        # Stage 1: Evidence Collector
-        self.evidence_collector = EvidenceCollector(
-            llm_provider=self.llm_provider,
-            project_id=project_id
-        )
-        logger.info("  ✅ Stage 1: Evidence Collector")
-        
-        # Stage 2: Prior Estimator
-        self.prior_estimator = PriorEstimator(llm_provider=self.llm_provider)
-        logger.info("  ✅ Stage 2: Prior Estimator")
-        
-        # Stage 3: Fermi Estimator
-        self.fermi_estimator = FermiEstimator(
-            llm_provider=self.llm_provider,
-            prior_estimator=self.prior_estimator
-        )
-        logger.info("  ✅ Stage 3: Fermi Estimator (재귀 금지)")
-        
-        # Stage 4: Fusion Layer
-        self.fusion_layer = FusionLayer()
-        logger.info("  ✅ Stage 4: Fusion Layer")
+        # Stage 1-4는 첫 사용 시 생성 (v7.11.2, LazyComponent)
+        # → estimate_fast()처럼 Fermi를 쓰지 않는 요청은 FermiEstimator를 만들지 않음
+        self._project_id = project_id
         
         logger.info("  ⚠️  v7.11.0: 재귀 완전 제거 (Recursion FORBIDDEN)")
         logger.info("  ✅ Estimator Agent 준비 완료")
@@ -149,7 +162,8 @@ class EstimatorRAG:
         region: Optional[str] = None,
         time_period: Optional[str] = None,
         budget: Optional[Budget] = None,
-        use_fermi: bool = True
+        use_fermi: bool = True,
+        batch_memo: Optional[BatchMemo] = None
     ) -> Optional[EstimationResult]:
         """
         통합 추정 (v7.11.0 Fusion Architecture)
@@ -162,6 +176,7 @@ class EstimatorRAG:
             time_period: 시점 (예: "2024")
             budget: 예산 (None이면 표준 예산 사용)
             use_fermi: Fermi 분해 사용 여부
+            batch_memo: 배치 공유 메모 (estimate_many 내부용)
         
         Returns:
             EstimationResult or None
@@ -176,7 +191,28 @@ class EstimatorRAG:
             >>> # 빠른 추정 (예산 제한)
             >>> budget = create_fast_budget()
             >>> result = estimator.estimate("서울 음식점 수는?", budget=budget)
+            
+            >>> # Stage별 시간 / LLM 토큰 (v7.11.2)
+            >>> result.trace['summary']['stages']
         """
+        with start_trace("estimate", question=question) as trace:
+            result = self._estimate(
+                question, context, domain, region, time_period, budget, use_fermi, batch_memo
+            )
+        return self._attach_trace(result, trace)
+    
+    def _estimate(
+        self,
+        question: str,
+        context: Optional[Context],
+        domain: Optional[str],
+        region: Optional[str],
+        time_period: Optional[str],
+        budget: Optional[Budget],
+        use_fermi: bool,
+        batch_memo: Optional[BatchMemo]
+    ) -> Optional[EstimationResult]:
+        """estimate() 본문 (요청 trace 안에서 실행)"""
         logger.info("=" * 80)
         logger.info(f"[Estimator v7.11.0] 추정 시작: {question}")
         logger.info("=" * 80)
@@ -203,11 +239,7 @@ class EstimatorRAG:
         logger.info("\n[Stage 1] Evidence Collection")
         logger.info("-" * 80)
         
-        definite_result, evidence = self.evidence_collector.collect(
-            question=question,
-            context=context,
-            collect_guardrails=True
-        )
+        definite_result, evidence = self._collect_evidence(question, context, batch_memo)
         
         # 확정 값이 있으면 즉시 반환
         if definite_result:
@@ -222,8 +254,310 @@ class EstimatorRAG:
             return definite_result
         
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Stage 2: Generative Prior
+        # Stage 2 + 3: Generative Prior / Structural Explanation (Fermi)
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # Fermi는 Prior 결과를 사용하지 않으므로 동시 실행 가능
+        if self.pipeline_stages and use_fermi:
+            prior_result, fermi_result = self._run_prior_and_fermi_pipelined(
+                question, evidence, budget, context, batch_memo
+            )
+        else:
+            prior_result = self._run_prior(question, evidence, budget, context)
+            fermi_result = self._run_fermi(
+                question, evidence, budget, context, use_fermi, batch_memo
+            )
+        
+        return self._fuse(evidence, prior_result, fermi_result, budget, start_time)
+    
+    async def aestimate(
+        self,
+        question: str,
+        context: Optional[Context] = None,
+        domain: Optional[str] = None,
+        region: Optional[str] = None,
+        time_period: Optional[str] = None,
+        budget: Optional[Budget] = None,
+        use_fermi: bool = True
+    ) -> Optional[EstimationResult]:
+        """
+        통합 추정 (async, v7.11.2)
+        
+        estimate()와 같은 4-Stage 흐름입니다.
+        - Stage 1: 동기 I/O(RAG 검색)이므로 asyncio.to_thread로 실행
+        - Stage 2 + 3: 예산 분할 후 asyncio.gather로 동시 실행 (LLM은 ainvoke)
+        
+        Example:
+            >>> result = asyncio.run(estimator.aestimate("서울 음식점 수는?"))
+        """
+        with start_trace("estimate", question=question) as trace:
+            result = await self._aestimate(
+                question, context, domain, region, time_period, budget, use_fermi
+            )
+        return self._attach_trace(result, trace)
+    
+    async def _aestimate(
+        self,
+        question: str,
+        context: Optional[Context],
+        domain: Optional[str],
+        region: Optional[str],
+        time_period: Optional[str],
+        budget: Optional[Budget],
+        use_fermi: bool
+    ) -> Optional[EstimationResult]:
+        """aestimate() 본문 (요청 trace 안에서 실행)"""
+        logger.info("=" * 80)
+        logger.info(f"[Estimator v7.11.2] 추정 시작 (async): {question}")
+        logger.info("=" * 80)
+        start_time = time.time()
+        
+        if context is None:
+            context = Context(
+                domain=domain or "General",
+                region=region,
+                time_period=time_period or "2024"
+            )
+        
+        if budget is None:
+            budget = create_standard_budget()
+        
+        # Stage 1: Evidence Collection
+        logger.info("\n[Stage 1] Evidence Collection")
+        logger.info("-" * 80)
+        
+        definite_result, evidence = await asyncio.to_thread(
+            self._collect_evidence, question, context
+        )
+        
+        if definite_result:
+            definite_result.cost['time'] = time.time() - start_time
+            logger.info(f"⚡ 확정 값 발견 → 추정 불필요 ({definite_result.value:,.0f})")
+            return definite_result
+        
+        # Stage 2 + 3
+        prior_result, fermi_result = await self._arun_prior_and_fermi(
+            question, evidence, budget, context, use_fermi
+        )
+        
+        # Stage 4: Fusion
+        return self._fuse(evidence, prior_result, fermi_result, budget, start_time)
+    
+    @traced("fusion")
+    def _fuse(
+        self,
+        evidence: Evidence,
+        prior_result: Optional[EstimationResult],
+        fermi_result: Optional[EstimationResult],
+        budget: Budget,
+        start_time: float
+    ) -> EstimationResult:
+        """Stage 4: Fusion + 결과 출력"""
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # Stage 4: Fusion
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        logger.info("\n[Stage 4] Fusion")
+        logger.info("-" * 80)
+        
+        final_result = self.fusion_layer.synthesize(
+            evidence=evidence,
+            prior_result=prior_result,
+            fermi_result=fermi_result
+        )
+        
+        # 총 시간 업데이트
+        elapsed = time.time() - start_time
+        final_result.cost['time'] = elapsed
+
+        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        # 결과 출력
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        logger.info("\n" + "=" * 80)
+        logger.info("✅ 추정 완료")
+        logger.info(f"결과: {final_result.value:,.0f}")
+        logger.info(f"Source: {final_result.source}")
+        logger.info(f"Certainty: {final_result.certainty}")
+        logger.info(f"비용: {final_result.get_cost_summary()}")
+        logger.info(f"예산 상태: {budget.get_status_summary()}")
+        
+        if final_result.fusion_weights:
+            logger.info(f"Fusion Weights: {final_result.fusion_weights}")
+        
+        logger.info("=" * 80)
+        
+        return final_result
+    
+    @staticmethod
+    def _attach_trace(
+        result: Optional[EstimationResult],
+        trace: Optional[Trace]
+    ) -> Optional[EstimationResult]:
+        """요청 trace를 결과에 첨부 (cost에 토큰 수 추가, 완료 메트릭 기록)"""
+        if result is None or trace is None:
+            return result
+        
+        result.trace = trace.to_dict()
+        summary = result.trace['summary']
+        result.cost['input_tokens'] = summary['input_tokens']
+        result.cost['output_tokens'] = summary['output_tokens']
+        
+        get_metrics().inc('umis_estimations_total', source=result.source or 'unknown')
+        return result
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 배치 추정 (v7.11.2)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    
+    def estimate_many(
+        self,
+        questions: Iterable[str],
+        context: Optional[Context] = None,
+        domain: Optional[str] = None,
+        region: Optional[str] = None,
+        time_period: Optional[str] = None,
+        budget_factory: Optional[Callable[[], Budget]] = None,
+        use_fermi: bool = True,
+        max_workers: int = 4
+    ) -> Iterator[Tuple[int, str, Optional[EstimationResult]]]:
+        """
+        배치 추정 (완료 순서대로 스트리밍)
+        
+        - 최대 max_workers개 질문을 동시에 추정
+        - 정규화된 질문이 같으면 Stage 1 (Evidence) 조회는 1회만 수행
+        - 여러 질문의 Fermi 분해에 같은 변수가 나오면 변수 추정은 1회만 수행
+        - 질문마다 독립 예산 (워커가 작업을 시작할 때 생성)
+        
+        Args:
+            questions: 질문 목록
+            context: 모든 질문에 공통 적용할 Context (선택)
+            domain: 도메인
+            region: 지역
+            time_period: 시점
+            budget_factory: 질문별 예산 생성 함수 (None이면 표준 예산)
+            use_fermi: Fermi 분해 사용 여부
+            max_workers: 동시 추정 질문 수
+        
+        Yields:
+            (입력 순서 index, 질문, EstimationResult or None)
+        
+        Example:
+            >>> for i, question, result in estimator.estimate_many(questions, domain="B2B_SaaS"):
+            ...     print(i, question, result.value if result else None)
+        """
+        questions = list(questions)
+        if not questions:
+            return
+        
+        if context is None:
+            context = Context(
+                domain=domain or "General",
+                region=region,
+                time_period=time_period or "2024"
+            )
+        
+        budget_factory = budget_factory or create_standard_budget
+        memo = BatchMemo()
+        
+        unique = len({normalize_question(q) for q in questions})
+        logger.info(f"[Estimator] 배치 추정: {len(questions)}개 질문 (고유 {unique}개, workers={max_workers})")
+        start_time = time.time()
+        
+        def run(question: str) -> Optional[EstimationResult]:
+            return self.estimate(
+                question,
+                context=context,
+                budget=budget_factory(),
+                use_fermi=use_fermi,
+                batch_memo=memo
+            )
+        
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        future_to_index = {
+            executor.submit(run, question): i
+            for i, question in enumerate(questions)
+        }
+        
+        try:
+            for future in as_completed(future_to_index):
+                i = future_to_index[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"  ❌ [{i}] {questions[i]} 추정 오류: {e}")
+                    result = None
+                yield i, questions[i], result
+        finally:
+            # 소비자가 중단하면 시작 전 작업은 취소
+            for future in future_to_index:
+                future.cancel()
+            executor.shutdown(wait=True)
+        
+        elapsed = time.time() - start_time
+        logger.info(f"[Estimator] 배치 완료: {len(questions)}개, {elapsed:.2f}초 (memo={memo.get_stats()})")
+    
+    @traced("evidence")
+    def _collect_evidence(
+        self,
+        question: str,
+        context: Context,
+        batch_memo: Optional[BatchMemo] = None
+    ) -> Tuple[Optional[EstimationResult], Evidence]:
+        """
+        Stage 1 실행 (배치 중에는 정규화된 질문당 1회)
+        
+        Args:
+            question: 질문
+            context: 맥락
+            batch_memo: 배치 공유 메모
+        
+        Returns:
+            (definite_result, evidence)
+        """
+        def collect() -> Tuple[Optional[EstimationResult], Evidence]:
+            return self.evidence_collector.collect(
+                question=question,
+                context=context,
+                collect_guardrails=True
+            )
+        
+        if batch_memo is None:
+            return collect()
+        
+        key = ('evidence', normalize_question(question)) + context_key(context)
+        (definite_result, evidence), computed = batch_memo.get_or_compute(key, collect)
+        
+        if not computed:
+            logger.info("  ♻️  Stage 1 결과 재사용 (배치 내 동일 질문)")
+        
+        # 확정 결과는 질문별로 cost['time']을 갱신하므로 복사본 반환
+        if definite_result is not None:
+            definite_result = replace(definite_result, cost=dict(definite_result.cost))
+        
+        return definite_result, evidence
+    
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Stage 2 / Stage 3 실행
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    
+    @traced("prior")
+    def _run_prior(
+        self,
+        question: str,
+        evidence: Evidence,
+        budget: Budget,
+        context: Context
+    ) -> Optional[EstimationResult]:
+        """
+        Stage 2: Generative Prior 실행
+        
+        Args:
+            question: 질문
+            evidence: Stage 1 증거
+            budget: 예산
+            context: 맥락
+        
+        Returns:
+            Prior 결과 or None
+        """
         logger.info("\n[Stage 2] Generative Prior")
         logger.info("-" * 80)
         
@@ -244,9 +578,32 @@ class EstimatorRAG:
         else:
             logger.warning("  예산 부족 (Prior 스킵)")
         
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Stage 3: Structural Explanation (Fermi)
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+        return prior_result
+    
+    @traced("fermi")
+    def _run_fermi(
+        self,
+        question: str,
+        evidence: Evidence,
+        budget: Budget,
+        context: Context,
+        use_fermi: bool = True,
+        batch_memo: Optional[BatchMemo] = None
+    ) -> Optional[EstimationResult]:
+        """
+        Stage 3: Structural Explanation (Fermi) 실행
+        
+        Args:
+            question: 질문
+            evidence: Stage 1 증거
+            budget: 예산
+            context: 맥락
+            use_fermi: Fermi 분해 사용 여부
+            batch_memo: 배치 공유 메모 (변수 추정 중복 제거)
+        
+        Returns:
+            Fermi 결과 or None
+        """
         fermi_result = None
         
         if use_fermi and budget.can_call_llm(1) and not budget.is_exhausted():
@@ -258,7 +615,8 @@ class EstimatorRAG:
                 evidence=evidence,
                 budget=budget,
                 context=context,
-                depth=0
+                depth=0,
+                batch_memo=batch_memo
             )
 
             if fermi_result:
@@ -272,40 +630,130 @@ class EstimatorRAG:
                 logger.info("\n[Stage 3] Fermi 사용 안 함 (use_fermi=False)")
             else:
                 logger.warning("\n[Stage 3] Fermi 스킵 (예산 부족 또는 소진)")
-
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Stage 4: Fusion
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        logger.info("\n[Stage 4] Fusion")
-        logger.info("-" * 80)
         
-        final_result = self.fusion_layer.synthesize(
-            evidence=evidence,
-            prior_result=prior_result,
-            fermi_result=fermi_result
+        return fermi_result
+    
+    def _run_prior_and_fermi_pipelined(
+        self,
+        question: str,
+        evidence: Evidence,
+        budget: Budget,
+        context: Context,
+        batch_memo: Optional[BatchMemo] = None
+    ) -> Tuple[Optional[EstimationResult], Optional[EstimationResult]]:
+        """
+        Stage 2 + Stage 3 동시 실행 (v7.11.2)
+        
+        Budget.carve()로 부모 예산에서 Prior 몫(LLM 1회, 변수 1개)을
+        선점하고 나머지를 Fermi 하위 예산으로 분할합니다. 하위 예산 소비는
+        즉시 부모에 반영되며, 합류 후 미사용분은 부모에 반환됩니다.
+        
+        Args:
+            question: 질문
+            evidence: Stage 1 증거
+            budget: 부모 예산
+            context: 맥락
+            batch_memo: 배치 공유 메모
+        
+        Returns:
+            (prior_result, fermi_result)
+        """
+        run_prior = budget.can_call_llm(1)
+        
+        prior_budget = budget.carve(
+            llm_calls=1 if run_prior else 0,
+            variables=1 if run_prior and budget.can_estimate_variable(1) else 0
         )
+        fermi_budget = budget.carve()  # 나머지 전부
         
-        # 총 시간 업데이트
-        elapsed = time.time() - start_time
-        final_result.cost['time'] = elapsed
-
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # 결과 출력
-        # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        logger.info("\n" + "=" * 80)
-        logger.info("✅ 추정 완료")
-        logger.info(f"결과: {final_result.value:,.0f}")
-        logger.info(f"Source: {final_result.source}")
-        logger.info(f"Certainty: {final_result.certainty}")
-        logger.info(f"비용: {final_result.get_cost_summary()}")
-        logger.info(f"예산 상태: {budget.get_status_summary()}")
+        logger.info("\n[Stage 2 + 3] Prior / Fermi 동시 실행")
+        logger.info(f"  예산 분할: Prior={prior_budget.get_status_summary()}, Fermi={fermi_budget.get_status_summary()}")
         
-        if final_result.fusion_weights:
-            logger.info(f"Fusion Weights: {final_result.fusion_weights}")
+        with prior_budget, fermi_budget, ThreadPoolExecutor(max_workers=2) as executor:
+            prior_future = executor.submit(
+                propagate(self._run_prior), question, evidence, prior_budget, context
+            )
+            fermi_future = executor.submit(
+                propagate(self._run_fermi), question, evidence, fermi_budget, context, True, batch_memo
+            )
+            
+            prior_result = self._join_stage(prior_future, "Prior")
+            fermi_result = self._join_stage(fermi_future, "Fermi")
         
-        logger.info("=" * 80)
+        return prior_result, fermi_result
+    
+    async def _arun_prior_and_fermi(
+        self,
+        question: str,
+        evidence: Evidence,
+        budget: Budget,
+        context: Context,
+        use_fermi: bool = True
+    ) -> Tuple[Optional[EstimationResult], Optional[EstimationResult]]:
+        """
+        Stage 2 + Stage 3 (async)
         
-        return final_result
+        _run_prior_and_fermi_pipelined()와 같은 방식으로 예산을 분할하고
+        asyncio.gather로 동시 실행합니다.
+        """
+        run_prior = budget.can_call_llm(1)
+        run_fermi = use_fermi
+        
+        prior_budget = budget.carve(
+            llm_calls=1 if run_prior else 0,
+            variables=1 if run_prior and budget.can_estimate_variable(1) else 0
+        )
+        fermi_budget = budget.carve()  # 나머지 전부
+        
+        @traced("prior")
+        async def prior() -> Optional[EstimationResult]:
+            if not prior_budget.can_call_llm(1):
+                logger.warning("  예산 부족 (Prior 스킵)")
+                return None
+            return await self.prior_estimator.aestimate(
+                question=question,
+                evidence=evidence,
+                budget=prior_budget,
+                context=context
+            )
+        
+        @traced("fermi")
+        async def fermi() -> Optional[EstimationResult]:
+            if not run_fermi:
+                logger.info("\n[Stage 3] Fermi 사용 안 함 (use_fermi=False)")
+                return None
+            if not fermi_budget.can_call_llm(1) or fermi_budget.is_exhausted():
+                logger.warning("\n[Stage 3] Fermi 스킵 (예산 부족 또는 소진)")
+                return None
+            return await self.fermi_estimator.aestimate(
+                question=question,
+                evidence=evidence,
+                budget=fermi_budget,
+                context=context,
+                depth=0
+            )
+        
+        logger.info("\n[Stage 2 + 3] Prior / Fermi 동시 실행 (async)")
+        
+        with prior_budget, fermi_budget:
+            outcomes = await asyncio.gather(prior(), fermi(), return_exceptions=True)
+        
+        results = []
+        for stage_name, outcome in zip(("Prior", "Fermi"), outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"  ❌ {stage_name} 실행 오류: {outcome}")
+                outcome = None
+            results.append(outcome)
+        
+        return results[0], results[1]
+    
+    def _join_stage(self, future, stage_name: str) -> Optional[EstimationResult]:
+        """Stage future 합류 (예외는 실패로 처리)"""
+        try:
+            return future.result()
+        except Exception as e:
+            logger.error(f"  ❌ {stage_name} 실행 오류: {e}")
+            return None
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 편의 메서드
@@ -352,11 +800,34 @@ class EstimatorRAG:
 # Factory Function
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-def get_estimator() -> EstimatorRAG:
+_estimator_instances: Dict[Optional[str], EstimatorRAG] = {}
+_estimator_lock = threading.Lock()
+
+
+def get_estimator(project_id: Optional[str] = None) -> EstimatorRAG:
     """
-    Estimator Agent 싱글톤 인스턴스
+    Estimator Agent 싱글톤 인스턴스 (project_id별, v7.11.2)
+
+    생성 비용(Chroma/임베딩/LLM 클라이언트)을 요청마다 치르지 않도록
+    프로세스 안에서 재사용합니다. Stage 구성요소는 첫 사용 시 생성됩니다.
+
+    Args:
+        project_id: 프로젝트 ID (Stage 1 Literal용, 선택)
 
     Returns:
         EstimatorRAG 인스턴스
     """
-    return EstimatorRAG()
+    estimator = _estimator_instances.get(project_id)
+    if estimator is None:
+        with _estimator_lock:
+            estimator = _estimator_instances.get(project_id)
+            if estimator is None:
+                estimator = EstimatorRAG(project_id=project_id)
+                _estimator_instances[project_id] = estimator
+    return estimator
+
+
+def reset_estimator() -> None:
+    """싱글톤 초기화 (설정 변경/테스트용)"""
+    with _estimator_lock:
+        _estimator_instances.clear()
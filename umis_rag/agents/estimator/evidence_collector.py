@@ -20,8 +20,10 @@ from umis_rag.utils.logger import logger
 from umis_rag.core.config import settings
 from umis_rag.core.llm_interface import LLMProvider
 from umis_rag.core.llm_provider_factory import get_default_llm_provider
+from umis_rag.core.tracing import traced
 
 from .common.estimation_result import Evidence, EstimationResult, create_definite_result
+from .common.lazy import LazyComponent
 from .literal_source import LiteralSource
 from .rag_source import RAGSource
 from .validator_source import ValidatorSource
@@ -46,6 +48,16 @@ class EvidenceCollector:
     - 확정 값이 있으면 EstimationResult 반환 (추정 불필요)
     """
     
+    # Source 구성요소 (Lazy, v7.11.2)
+    literal_source = LazyComponent(
+        lambda self: LiteralSource(project_id=self._project_id), "Literal Source"
+    )
+    rag_source = LazyComponent(lambda self: RAGSource(), "RAG Source")
+    validator_source = LazyComponent(lambda self: ValidatorSource(), "Validator Source")
+    guardrail_analyzer = LazyComponent(
+        lambda self: GuardrailAnalyzer(llm_provider=self.llm_provider), "Guardrail Analyzer"
+    )
+    
     def __init__(
         self,
         llm_provider: Optional[LLMProvider] = None,
@@ -64,24 +76,8 @@ class EvidenceCollector:
         self.llm_provider = llm_provider or get_default_llm_provider()
         self._project_id = project_id
         
-        logger.info("[EvidenceCollector] 초기화 시작")
-        
-        # Literal Source (프로젝트 데이터)
-        self.literal_source = LiteralSource(project_id=project_id)
-        logger.info("  ✅ Literal Source")
-        
-        # RAG Source (학습된 규칙)
-        self.rag_source = RAGSource()
-        logger.info("  ✅ RAG Source")
-        
-        # Validator Source (외부 데이터)
-        self.validator_source = ValidatorSource()
-        logger.info("  ✅ Validator Source")
-        
-        # Guardrail Analyzer (같은 Provider 사용)
-        self.guardrail_analyzer = GuardrailAnalyzer(llm_provider=self.llm_provider)
-        logger.info("  ✅ Guardrail Analyzer")
-        
+        # Source / Guardrail Analyzer는 첫 사용 시 생성 (v7.11.2, LazyComponent)
+        # → 확정 값이 Literal/RAG에서 나오면 Validator(Chroma)·Guardrail은 만들지 않음
         logger.info("[EvidenceCollector] 초기화 완료")
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -266,6 +262,7 @@ class EvidenceCollector:
     # Private Methods
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     
+    @traced("evidence.guardrails")
     def _collect_guardrails(
         self,
         question: str,
@@ -321,39 +318,24 @@ class EvidenceCollector:
             logger.info(f"  유사 데이터 {len(similar_items)}개 발견")
             
             # 각 유사 데이터를 Guardrail로 변환 (최대 5개)
+            # v7.11.2: 항목별 병렬 분석, Hard 상/하한이 모두 나오면 나머지 취소
+            items = []
             for i, item in enumerate(similar_items[:5]):
-                try:
-                    # 유사 데이터 형식 파싱
-                    if isinstance(item, dict):
-                        similar_question = item.get('question', '')
-                        similar_value = item.get('value', 0)
-                        similar_context = item.get('context', '')
-                    elif isinstance(item, (tuple, list)) and len(item) >= 2:
-                        similar_question = item[0]
-                        similar_value = item[1]
-                        similar_context = item[2] if len(item) > 2 else None
-                    else:
-                        logger.warning(f"    항목 {i+1}: 지원하지 않는 형식 ({type(item)})")
-                        continue
-                    
-                    # Guardrail 분석
-                    guardrail = self.guardrail_analyzer.analyze(
-                        target_question=question,
-                        similar_question=similar_question,
-                        similar_value=similar_value,
-                        target_context=f"{context.domain} | {context.region}" if context else None,
-                        similar_context=similar_context
-                    )
-                    
-                    if guardrail:
-                        guardrails.append(guardrail)
-                        logger.info(f"    ✅ Guardrail {i+1}: {guardrail.type.value} = {guardrail.value:,.0f}")
-                    else:
-                        logger.info(f"    ℹ️  Guardrail {i+1}: 무관")
-                
-                except Exception as e:
-                    logger.warning(f"    항목 {i+1} 변환 실패: {e}")
-                    continue
+                if isinstance(item, dict) or (isinstance(item, (tuple, list)) and len(item) >= 2):
+                    items.append(item)
+                else:
+                    logger.warning(f"    항목 {i+1}: 지원하지 않는 형식 ({type(item)})")
+            
+            guardrails = self.guardrail_analyzer.analyze_batch(
+                target_question=question,
+                similar_items=items,
+                max_guardrails=5,
+                target_context=f"{context.domain} | {context.region}" if context else None,
+                stop_when_bounded=True
+            )
+            
+            for guardrail in guardrails:
+                logger.info(f"    ✅ Guardrail: {guardrail.type.value} = {guardrail.value:,.0f}")
             
             logger.info(f"[Guardrail Engine] 수집 완료: {len(guardrails)}개")
             
@@ -18,24 +18,40 @@ FermiEstimator - 구조적 설명 엔진 (v7.11.0 Stage 3)
 - max_depth = 2 (강제)
 - 예산 소진 시 즉시 반환
 - llm_mode 제거, LLMProvider 기반
+
+v7.11.2:
+- 변수 추정 병렬화 (ThreadPoolExecutor)
+- 예산은 fan-out 전에 일괄 선점 (Budget.carve)
+- aestimate(): async 경로 (asyncio.gather)
+- Monte Carlo 불확실성 전파 (NumPy, value_range = p5~p95)
+- 분해식 메모리: 같은/유사 질문은 분해 LLM 호출 없이 구조 재사용 (변수는 재추정)
 """
 
 from typing import Optional, Dict, Any, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+import asyncio
 import json
 import time
 
 from langchain_openai import ChatOpenAI
 
 from umis_rag.utils.logger import logger
-from umis_rag.core.config import settings
 from umis_rag.core.model_router import select_model_with_config
+from umis_rag.core.llm_cache import get_llm_cache
+from umis_rag.core.llm_clients import get_chat_model, ESTIMATOR_CLIENT_PARAMS
 from umis_rag.core.llm_interface import LLMProvider
 from umis_rag.core.llm_provider_factory import get_default_llm_provider
+from umis_rag.core.tracing import propagate, traced
 
 from .common.budget import Budget
-from .common.estimation_result import EstimationResult, create_fermi_result, Evidence
+from .common.estimation_result import EstimationResult, create_fermi_result, create_prior_result, Evidence
+from .common.formula import FormulaError, compile_formula
+from .common.monte_carlo import UncertaintyResult, propagate_uncertainty
+from .decomposition_memory import DecompositionMatch, DecompositionMemory, get_decomposition_memory
 from .prior_estimator import PriorEstimator
 from .models import Context
+from .batch import BatchMemo, normalize_question, context_key, evidence_key
 
 
 class FermiEstimator:
@@ -73,7 +89,11 @@ class FermiEstimator:
         self,
         llm_provider: Optional[LLMProvider] = None,
         model_name: Optional[str] = None,
-        prior_estimator: Optional[PriorEstimator] = None
+        prior_estimator: Optional[PriorEstimator] = None,
+        parallel_variables: bool = True,
+        max_workers: int = 4,
+        uncertainty_samples: int = 20000,
+        decomposition_memory: Optional[DecompositionMemory] = None
     ):
         """
         초기화
@@ -82,6 +102,10 @@ class FermiEstimator:
             llm_provider: LLMProvider (None이면 기본 Provider)
             model_name: LLM 모델 이름 (None이면 Stage 3 기본값)
             prior_estimator: Prior Estimator (None이면 생성)
+            parallel_variables: 변수 추정 병렬 실행 여부 (v7.11.2)
+            max_workers: 병렬 변수 추정 최대 스레드 수 (분해식 변수 최대 4개)
+            uncertainty_samples: Monte Carlo 불확실성 전파 샘플 수 (0이면 생략, v7.11.2)
+            decomposition_memory: 분해식 메모리 (None이면 settings 기본값, 비활성 시 사용 안 함)
         
         Note:
             v7.11.0: llm_mode 파라미터 제거됨
@@ -89,6 +113,10 @@ class FermiEstimator:
         self.llm_provider = llm_provider or get_default_llm_provider()
         self._model_name = model_name
         self._llm = None
+        self.parallel_variables = parallel_variables
+        self.max_workers = max(1, max_workers)
+        self.uncertainty_samples = max(0, uncertainty_samples)
+        self.decomposition_memory = decomposition_memory or get_decomposition_memory()
         
         # Prior Estimator (변수 추정용, 같은 Provider 사용)
         self.prior_estimator = prior_estimator or PriorEstimator(
@@ -108,7 +136,7 @@ class FermiEstimator:
         Stage 3 전용 모델 사용 (gpt-4o-mini 권장)
         """
         if self._model_name is None:
-            model, config = select_model_with_config(phase=3)  # Stage 3
+            model, config = select_model_with_config(3)  # Stage 3
             return model
         return self._model_name
     
@@ -117,14 +145,11 @@ class FermiEstimator:
         LLM 인스턴스 (Lazy 초기화)
         
         Note:
-            현재는 직접 ChatOpenAI 생성
+            v7.11.2: 프로세스 공유 클라이언트 레지스트리에서 받아옴
+            (같은 모델/파라미터는 하나의 ChatOpenAI + HTTP 풀 재사용)
         """
         if self._llm is None:
-            self._llm = ChatOpenAI(
-                model=self.model_name,
-                temperature=0.2,
-                openai_api_key=settings.openai_api_key
-            )
+            self._llm = get_chat_model(self.model_name, **ESTIMATOR_CLIENT_PARAMS['fermi'])
         return self._llm
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -137,7 +162,8 @@ class FermiEstimator:
         evidence: Evidence,
         budget: Budget,
         context: Optional[Context] = None,
-        depth: int = 0
+        depth: int = 0,
+        batch_memo: Optional[BatchMemo] = None
     ) -> Optional[EstimationResult]:
         """
         Fermi 분해 추정 (v7.11.0)
@@ -148,6 +174,7 @@ class FermiEstimator:
             budget: 예산
             context: 맥락
             depth: 현재 깊이 (0부터 시작)
+            batch_memo: 배치 공유 메모 (같은 변수는 배치 내 1회만 추정)
         
         Returns:
             EstimationResult or None
@@ -177,11 +204,10 @@ class FermiEstimator:
             return None
         
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        # Step 1: LLM이 분해식 제안
+        # Step 1: LLM이 분해식 제안 (메모리 hit 시 재사용)
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         try:
-            formula, variables = self._generate_decomposition(question, evidence, context)
-            budget.consume_llm_call(1)
+            formula, variables, from_memory = self._decompose(question, evidence, budget, context)
             
             logger.info(f"  분해식: {formula}")
             logger.info(f"  변수: {list(variables.keys())}")
@@ -193,50 +219,80 @@ class FermiEstimator:
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # Step 2: 각 변수 추정 (PriorEstimator만 사용, 재귀 금지)
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        variable_results = {}
+        if self.parallel_variables and len(variables) > 1:
+            variable_results = self._estimate_variables_parallel(
+                variables, evidence, budget, context, batch_memo
+            )
+        else:
+            variable_results = self._estimate_variables_sequential(
+                variables, evidence, budget, context, batch_memo
+            )
         
-        for var_name, var_description in variables.items():
-            # 예산 체크
-            if budget.is_exhausted():
-                logger.warning(f"  예산 소진 (변수 {var_name} 추정 중단)")
-                break
-            
-            if not budget.can_call_llm(1) or not budget.can_estimate_variable(1):
-                logger.warning(f"  변수 {var_name} 추정 불가 (예산 부족)")
-                break
-            
-            logger.info(f"  변수 추정: {var_name} = {var_description}")
-            
-            # PriorEstimator로 직접 추정 (재귀 금지!)
-            var_question = f"{var_name}은/는?"
-            
-            try:
-                var_result = self.prior_estimator.estimate(
-                    question=var_question,
-                    evidence=evidence,  # 동일한 증거 사용
-                    budget=budget,
-                    context=context
-                )
-                
-                if var_result:
-                    variable_results[var_name] = var_result
-                    logger.info(f"    ✅ {var_name} = {var_result.value:,.0f} (certainty={var_result.certainty})")
-                else:
-                    logger.warning(f"    ❌ {var_name} 추정 실패")
-                    # Fallback: 기본값 사용 (0이 아닌 1로)
-                    from .common.estimation_result import create_prior_result
-                    variable_results[var_name] = create_prior_result(
-                        value=1.0,
-                        value_range=(0.1, 10.0),
-                        certainty='low',
-                        reasoning=f"{var_name} 추정 실패 → Fallback 기본값",
-                        llm_calls=0
-                    )
+        return self._build_result(
+            formula, variable_results, evidence, depth, start_time, from_memory=from_memory
+        )
+    
+    async def aestimate(
+        self,
+        question: str,
+        evidence: Evidence,
+        budget: Budget,
+        context: Optional[Context] = None,
+        depth: int = 0
+    ) -> Optional[EstimationResult]:
+        """
+        Fermi 분해 추정 (async, v7.11.2)
+        
+        estimate()와 동일한 절차이며, 분해식 생성은 ainvoke로,
+        변수 추정은 선점된 하위 예산으로 asyncio.gather 동시 실행합니다.
+        """
+        logger.info(f"[FermiEstimator] 추정 시작 (async, depth={depth}): {question}")
+        start_time = time.time()
+        
+        if depth >= budget.max_depth:
+            logger.warning(f"  깊이 제한 초과 (depth={depth} >= max={budget.max_depth})")
+            return None
+        
+        if budget.is_exhausted():
+            logger.warning("  예산 소진")
+            return None
+        
+        if not budget.can_call_llm(1):
+            logger.warning("  LLM 호출 예산 부족")
+            return None
+        
+        try:
+            formula, variables, from_memory = await self._adecompose(question, evidence, budget, context)
             
-            except Exception as e:
-                logger.error(f"    ❌ {var_name} 추정 오류: {e}")
-                continue
+            logger.info(f"  분해식: {formula}")
+            logger.info(f"  변수: {list(variables.keys())}")
+        
+        except Exception as e:
+            logger.error(f"  분해식 생성 실패: {e}")
+            return None
+        
+        variable_results = await self._aestimate_variables(
+            variables, evidence, budget, context
+        )
+        
+        return self._build_result(
+            formula, variable_results, evidence, depth, start_time, from_memory=from_memory
+        )
+    
+    def _build_result(
+        self,
+        formula: str,
+        variable_results: Dict[str, EstimationResult],
+        evidence: Evidence,
+        depth: int,
+        start_time: float,
+        from_memory: bool = False
+    ) -> Optional[EstimationResult]:
+        """
+        공식 계산 + 결과 생성 (Step 3-4)
         
+        from_memory: 분해식을 메모리에서 재사용했는지 (LLM 호출 비용에 미포함)
+        """
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         # Step 3: 공식 계산
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -268,9 +324,15 @@ class FermiEstimator:
                 }
                 for var_name, var_result in variable_results.items()
             },
-            'depth': depth
+            'depth': depth,
+            'from_memory': from_memory
         }
         
+        # 불확실성 전파 (변수 범위 → 결과 분포, LLM 호출 없음)
+        uncertainty = self._propagate_uncertainty(formula, variable_results)
+        if uncertainty is not None:
+            decomposition['uncertainty'] = uncertainty.to_dict()
+        
         # Certainty 종합 (변수들의 평균)
         certainties = [r.get_certainty_score() for r in variable_results.values()]
         avg_certainty_score = sum(certainties) / len(certainties) if certainties else 0.5
@@ -282,8 +344,9 @@ class FermiEstimator:
         else:
             certainty = 'low'
         
-        # 비용 집계
-        total_llm_calls = 1 + sum(r.cost.get('llm_calls', 0) for r in variable_results.values())
+        # 비용 집계 (분해식 메모리 hit이면 분해식 LLM 호출 없음)
+        decomposition_calls = 0 if from_memory else 1
+        total_llm_calls = decomposition_calls + sum(r.cost.get('llm_calls', 0) for r in variable_results.values())
         total_variables = len(variable_results)
         
         cost = {
@@ -302,20 +365,397 @@ class FermiEstimator:
             cost=cost
         )
         result.used_evidence = [evidence]
+        if uncertainty is not None:
+            result.value_range = uncertainty.interval(5, 95)
         
         logger.info(f"  ✅ Fermi 완료: {final_value:,.0f} (certainty={certainty}, {elapsed:.2f}초)")
         
         return result
     
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 변수 추정 (Step 2)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    
+    def _estimate_variables_sequential(
+        self,
+        variables: Dict[str, str],
+        evidence: Evidence,
+        budget: Budget,
+        context: Optional[Context],
+        batch_memo: Optional[BatchMemo] = None
+    ) -> Dict[str, EstimationResult]:
+        """
+        변수 순차 추정 (PriorEstimator가 호출마다 예산 소비)
+        
+        Args:
+            variables: {변수명: 설명}
+            evidence: 증거
+            budget: 예산
+            context: 맥락
+            batch_memo: 배치 공유 메모
+        
+        Returns:
+            {변수명: EstimationResult}
+        """
+        variable_results = {}
+        
+        for var_name, var_description in variables.items():
+            # 예산 체크
+            if budget.is_exhausted():
+                logger.warning(f"  예산 소진 (변수 {var_name} 추정 중단)")
+                break
+            
+            if not budget.can_call_llm(1) or not budget.can_estimate_variable(1):
+                logger.warning(f"  변수 {var_name} 추정 불가 (예산 부족)")
+                break
+            
+            var_result = self._estimate_variable_shared(
+                var_name, var_description, evidence, budget, context, batch_memo
+            )
+            if var_result:
+                variable_results[var_name] = var_result
+        
+        return variable_results
+    
+    def _estimate_variables_parallel(
+        self,
+        variables: Dict[str, str],
+        evidence: Evidence,
+        budget: Budget,
+        context: Optional[Context],
+        batch_memo: Optional[BatchMemo] = None
+    ) -> Dict[str, EstimationResult]:
+        """
+        변수 병렬 추정 (v7.11.2)
+        
+        예산은 fan-out 전에 호출 스레드에서 Budget.carve()로 일괄 선점하고,
+        각 변수는 선점분(LLM 1회, 변수 1개)만 가진 하위 예산으로 추정합니다.
+        하위 예산 소비는 부모에 원자적으로 반영되고, 실패한 변수의
+        선점분은 close()로 반환됩니다.
+        
+        Args:
+            variables: {변수명: 설명}
+            evidence: 증거
+            budget: 예산
+            context: 맥락
+            batch_memo: 배치 공유 메모
+        
+        Returns:
+            {변수명: EstimationResult} (분해식의 변수 순서 유지)
+        """
+        if budget.is_exhausted():
+            logger.warning("  예산 소진 (변수 추정 중단)")
+            return {}
+        
+        targets = self._carve_variable_budgets(variables, budget)
+        if not targets:
+            return {}
+        
+        logger.info(f"  변수 병렬 추정: {len(targets)}개 (예산 선점 완료)")
+        
+        results: Dict[str, EstimationResult] = {}
+        max_workers = min(len(targets), self.max_workers)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_name = {
+                executor.submit(
+                    propagate(self._estimate_variable_shared),
+                    var_name,
+                    var_description,
+                    evidence,
+                    var_budget,
+                    context,
+                    batch_memo
+                ): var_name
+                for var_name, var_description, var_budget in targets
+            }
+            
+            for future in as_completed(future_to_name):
+                var_name = future_to_name[future]
+                try:
+                    var_result = future.result()
+                except Exception as e:
+                    logger.error(f"    ❌ {var_name} 추정 오류: {e}")
+                    continue
+                
+                if var_result:
+                    results[var_name] = var_result
+        
+        # 미사용 선점분 반환 (추정 실패 변수)
+        for _, _, var_budget in targets:
+            var_budget.close()
+        
+        # 분해식 변수 순서로 정렬
+        return {name: results[name] for name, _, _ in targets if name in results}
+    
+    async def _aestimate_variables(
+        self,
+        variables: Dict[str, str],
+        evidence: Evidence,
+        budget: Budget,
+        context: Optional[Context]
+    ) -> Dict[str, EstimationResult]:
+        """
+        변수 동시 추정 (async, v7.11.2)
+        
+        _estimate_variables_parallel()과 같은 방식으로 예산을 선점한 뒤
+        asyncio.gather로 동시에 추정합니다.
+        """
+        if budget.is_exhausted():
+            logger.warning("  예산 소진 (변수 추정 중단)")
+            return {}
+        
+        targets = self._carve_variable_budgets(variables, budget)
+        
+        try:
+            outcomes = await asyncio.gather(
+                *(
+                    self._aestimate_variable(var_name, var_description, evidence, var_budget, context)
+                    for var_name, var_description, var_budget in targets
+                ),
+                return_exceptions=True
+            )
+        finally:
+            for _, _, var_budget in targets:
+                var_budget.close()
+        
+        results = {}
+        for (var_name, _, _), outcome in zip(targets, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"    ❌ {var_name} 추정 오류: {outcome}")
+            elif outcome:
+                results[var_name] = outcome
+        return results
+    
+    @traced("fermi.variable")
+    async def _aestimate_variable(
+        self,
+        var_name: str,
+        var_description: str,
+        evidence: Evidence,
+        budget: Budget,
+        context: Optional[Context]
+    ) -> Optional[EstimationResult]:
+        """단일 변수 추정 (async, _estimate_variable과 동일한 Fallback)"""
+        logger.info(f"  변수 추정: {var_name} = {var_description}")
+        
+        try:
+            var_result = await self.prior_estimator.aestimate(
+                question=f"{var_name}은/는?",
+                evidence=evidence,
+                budget=budget,
+                context=context
+            )
+        except Exception as e:
+            logger.error(f"    ❌ {var_name} 추정 오류: {e}")
+            return None
+        
+        return self._variable_result(var_name, var_result)
+    
+    def _estimate_variable_shared(
+        self,
+        var_name: str,
+        var_description: str,
+        evidence: Evidence,
+        budget: Budget,
+        context: Optional[Context],
+        batch_memo: Optional[BatchMemo] = None
+    ) -> Optional[EstimationResult]:
+        """
+        변수 추정 (배치 중에는 같은 변수/맥락당 1회)
+        
+        같은 증거 / 맥락으로 다른 질문이 이미 추정한 변수는 LLM 호출 없이
+        재사용하며, 재사용 결과의 cost['llm_calls']는 0으로 기록합니다.
+        """
+        def compute() -> Optional[EstimationResult]:
+            return self._estimate_variable(
+                var_name, var_description, evidence, budget, context
+            )
+        
+        if batch_memo is None:
+            return compute()
+        
+        key = ('variable', normalize_question(var_name), evidence_key(evidence)) + context_key(context)
+        var_result, computed = batch_memo.get_or_compute(key, compute)
+        
+        if computed or var_result is None:
+            return var_result
+        
+        logger.info(f"    ♻️  {var_name} 재사용 (배치 내 동일 변수)")
+        return replace(
+            var_result,
+            cost={**var_result.cost, 'llm_calls': 0, 'variables': 0},
+            metadata={**var_result.metadata, 'batch_shared': True}
+        )
+    
+    @traced("fermi.variable")
+    def _estimate_variable(
+        self,
+        var_name: str,
+        var_description: str,
+        evidence: Evidence,
+        budget: Budget,
+        context: Optional[Context]
+    ) -> Optional[EstimationResult]:
+        """
+        단일 변수 추정 (PriorEstimator만 사용, 재귀 금지)
+        
+        Args:
+            var_name: 변수명
+            var_description: 변수 설명
+            evidence: 증거 (원 질문과 동일)
+            budget: 예산 (병렬 모드에서는 선점된 하위 예산)
+            context: 맥락
+        
+        Returns:
+            EstimationResult (실패 시 Fallback 기본값), 오류 시 None
+        """
+        logger.info(f"  변수 추정: {var_name} = {var_description}")
+        
+        # PriorEstimator로 직접 추정 (재귀 금지!)
+        try:
+            var_result = self.prior_estimator.estimate(
+                question=f"{var_name}은/는?",
+                evidence=evidence,  # 동일한 증거 사용
+                budget=budget,
+                context=context
+            )
+        except Exception as e:
+            logger.error(f"    ❌ {var_name} 추정 오류: {e}")
+            return None
+        
+        return self._variable_result(var_name, var_result)
+    
+    def _carve_variable_budgets(
+        self,
+        variables: Dict[str, str],
+        budget: Budget
+    ) -> List[Tuple[str, str, Budget]]:
+        """
+        변수별 하위 예산 선점 (변수 1개 = LLM 1회 + 변수 1개)
+        
+        Returns:
+            [(변수명, 설명, 하위 예산)] - 예산이 모자라면 앞쪽 변수만
+        """
+        targets = []
+        for var_name, var_description in variables.items():
+            var_budget = budget.carve(llm_calls=1, variables=1)
+            if var_budget is None:
+                break
+            targets.append((var_name, var_description, var_budget))
+        
+        if len(targets) < len(variables):
+            skipped = list(variables)[len(targets):]
+            logger.warning(f"  변수 {skipped} 추정 불가 (예산 부족)")
+        
+        return targets
+    
+    def _variable_result(
+        self,
+        var_name: str,
+        var_result: Optional[EstimationResult]
+    ) -> EstimationResult:
+        """변수 추정 결과 로깅 + 실패 시 Fallback (sync / async 공통)"""
+        if var_result:
+            logger.info(f"    ✅ {var_name} = {var_result.value:,.0f} (certainty={var_result.certainty})")
+            return var_result
+        
+        logger.warning(f"    ❌ {var_name} 추정 실패")
+        # Fallback: 기본값 사용 (0이 아닌 1로)
+        return create_prior_result(
+            value=1.0,
+            value_range=(0.1, 10.0),
+            certainty='low',
+            reasoning=f"{var_name} 추정 실패 → Fallback 기본값",
+            llm_calls=0
+        )
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Private Methods
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     
-    def _generate_decomposition(
+    @traced("fermi.decompose")
+    def _decompose(
+        self,
+        question: str,
+        evidence: Evidence,
+        budget: Budget,
+        context: Optional[Context]
+    ) -> Tuple[str, Dict[str, str], bool]:
+        """
+        분해식 결정 (메모리 조회 → miss면 LLM 생성 후 저장)
+        
+        메모리 hit이면 LLM 호출도, 예산 소모도 없습니다.
+        
+        Returns:
+            (formula, variables, 메모리 hit 여부)
+        """
+        match = self._recall_decomposition(question, context)
+        if match is not None:
+            return match.formula, match.variables, True
+        
+        formula, variables = self._generate_decomposition(
+            question, evidence, context,
+            timeout=budget.get_request_timeout()
+        )
+        budget.consume_llm_call(1)
+        
+        if self.decomposition_memory is not None:
+            self.decomposition_memory.remember(question, context, formula, variables)
+        return formula, variables, False
+    
+    @traced("fermi.decompose")
+    async def _adecompose(
         self,
         question: str,
         evidence: Evidence,
+        budget: Budget,
+        context: Optional[Context]
+    ) -> Tuple[str, Dict[str, str], bool]:
+        """분해식 결정 (async, 메모리 조회/저장은 임베딩 호출이 있어 스레드에서)"""
+        if self.decomposition_memory is not None:
+            match = await asyncio.to_thread(self._recall_decomposition, question, context)
+            if match is not None:
+                return match.formula, match.variables, True
+        
+        formula, variables = await self._agenerate_decomposition(
+            question, evidence, context,
+            timeout=budget.get_request_timeout()
+        )
+        budget.consume_llm_call(1)
+        
+        if self.decomposition_memory is not None:
+            await asyncio.to_thread(self.decomposition_memory.remember, question, context, formula, variables)
+        return formula, variables, False
+    
+    def _recall_decomposition(
+        self,
+        question: str,
         context: Optional[Context]
+    ) -> Optional[DecompositionMatch]:
+        """분해식 메모리 조회 (실패해도 LLM 생성으로 진행)"""
+        if self.decomposition_memory is None:
+            return None
+        
+        try:
+            match = self.decomposition_memory.lookup(question, context)
+        except Exception as e:
+            logger.warning(f"  분해식 메모리 조회 실패: {e}")
+            return None
+        
+        if match is not None:
+            logger.info(
+                f"  분해식 재사용 ({match.match_type}, 유사도 {match.similarity:.2f}): "
+                f"{match.source_question}"
+            )
+        return match
+    
+    def _generate_decomposition(
+        self,
+        question: str,
+        evidence: Evidence,
+        context: Optional[Context],
+        timeout: Optional[float] = None
     ) -> Tuple[str, Dict[str, str]]:
         """
         LLM이 분해식 생성
@@ -324,12 +764,39 @@ class FermiEstimator:
             question: 질문
             evidence: 증거
             context: 맥락
+            timeout: 요청 timeout (초, 예산 잔여 시간)
         
         Returns:
             (formula, variables)
             - formula: "LTV = ARPU / Churn"
             - variables: {'ARPU': 'B2B SaaS 월평균 매출', 'Churn': '월 해지율'}
         """
+        prompt = self._build_decomposition_prompt(question, context)
+        
+        llm = self._get_llm()
+        invoke_kwargs = {'timeout': timeout} if timeout else {}
+        content = get_llm_cache().invoke(llm, prompt, **invoke_kwargs).strip()
+        
+        return self._parse_decomposition(content)
+    
+    async def _agenerate_decomposition(
+        self,
+        question: str,
+        evidence: Evidence,
+        context: Optional[Context],
+        timeout: Optional[float] = None
+    ) -> Tuple[str, Dict[str, str]]:
+        """LLM이 분해식 생성 (async)"""
+        prompt = self._build_decomposition_prompt(question, context)
+        
+        llm = self._get_llm()
+        invoke_kwargs = {'timeout': timeout} if timeout else {}
+        content = (await get_llm_cache().ainvoke(llm, prompt, **invoke_kwargs)).strip()
+        
+        return self._parse_decomposition(content)
+    
+    def _build_decomposition_prompt(self, question: str, context: Optional[Context]) -> str:
+        """분해식 생성 프롬프트"""
         prompt = f"""당신은 Fermi 추정 전문가입니다. 주어진 질문을 **2-4개의 변수**로 분해하세요.
 
 질문: {question}
@@ -376,11 +843,10 @@ class FermiEstimator:
 }
 ```
 """
-        
-        llm = self._get_llm()
-        response = llm.invoke(prompt)
-        content = response.content.strip()
-        
+        return prompt
+    
+    def _parse_decomposition(self, content: str) -> Tuple[str, Dict[str, str]]:
+        """LLM 응답 → (formula, variables)"""
         # JSON 파싱
         if "```json" in content:
             content = content.split("```json")[1].split("```")[0].strip()
@@ -399,6 +865,36 @@ class FermiEstimator:
         
         return formula, variables
     
+    @traced("fermi.uncertainty")
+    def _propagate_uncertainty(
+        self,
+        formula: str,
+        variable_results: Dict[str, EstimationResult]
+    ) -> Optional[UncertaintyResult]:
+        """
+        Monte Carlo 불확실성 전파 (v7.11.2)
+        
+        각 변수를 value_range/certainty 분포에서 샘플링해 공식을 벡터 계산
+        → 백분위수 + 민감도 순위. 실패해도 추정은 계속 (None 반환)
+        """
+        if not self.uncertainty_samples:
+            return None
+        
+        try:
+            uncertainty = propagate_uncertainty(
+                formula,
+                variable_results,
+                samples=self.uncertainty_samples
+            )
+        except Exception as e:
+            logger.warning(f"  불확실성 전파 실패 (무시): {e}")
+            return None
+        
+        p5, p95 = uncertainty.interval(5, 95)
+        top = uncertainty.sensitivity[0]['variable'] if uncertainty.sensitivity else '-'
+        logger.info(f"  불확실성: p5={p5:,.0f} ~ p95={p95:,.0f} (주요 변수: {top})")
+        return uncertainty
+    
     def _evaluate_formula(
         self,
         formula: str,
@@ -414,24 +910,10 @@ class FermiEstimator:
         Returns:
             계산된 값
         """
-        # "=" 기준으로 우변만 추출
-        if "=" in formula:
-            expression = formula.split("=")[1].strip()
-        else:
-            expression = formula.strip()
-        
-        # 변수 값 치환
-        for var_name, var_result in variable_results.items():
-            expression = expression.replace(var_name, str(var_result.value))
-        
-        # × → *, ÷ → / 변환
-        expression = expression.replace('×', '*').replace('÷', '/')
-        
-        # 계산 (eval 사용, 보안 주의)
+        # 공식은 텍스트 단위로 1회 컴파일 (eval / 문자열 치환 없음)
+        values = {name: result.value for name, result in variable_results.items()}
         try:
-            result = eval(expression, {"__builtins__": {}}, {})
-            return float(result)
-        except Exception as e:
+            return compile_formula(formula, list(values)).evaluate(values)
+        except FormulaError as e:
             logger.error(f"  공식 계산 오류: {e}")
-            logger.error(f"  Expression: {expression}")
             raise
@@ -6,19 +6,28 @@ GuardrailAnalyzer - LLM 2단계 체인 (v7.10.0 Week 4)
 2단계 체인:
 1. 관계 판단: X > Y? X < Y? 무관?
 2. Hard/Soft 판정: 논리적(Hard) vs 경험적(Soft)
+
+v7.11.2:
+- combined_prompt: 1+2를 한 번의 LLM 호출로 판정
+- analyze_batch: 항목별 병렬 분석 + Hard 상/하한 확보 시 조기 종료
 """
 
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from enum import Enum
 import json
+import threading
 
 from langchain_openai import ChatOpenAI
 
 from umis_rag.core.config import settings
 from umis_rag.utils.logger import logger
+from umis_rag.core.llm_cache import get_llm_cache
+from umis_rag.core.llm_clients import get_chat_model, ESTIMATOR_CLIENT_PARAMS
 from umis_rag.core.llm_interface import LLMProvider
 from umis_rag.core.llm_provider_factory import get_default_llm_provider
+from umis_rag.core.tracing import propagate, traced
 from .models import Guardrail, GuardrailType
 
 
@@ -59,30 +68,36 @@ class GuardrailAnalyzer:
         # Guardrail(type=HARD_UPPER, value=28000000, confidence=0.95, ...)
     """
 
-    def __init__(self, llm_provider: Optional[LLMProvider] = None):
+    def __init__(
+        self,
+        llm_provider: Optional[LLMProvider] = None,
+        combined_prompt: bool = False,
+        max_workers: int = 4
+    ):
         """
         초기화
         
         Args:
             llm_provider: LLMProvider (None이면 기본 Provider)
+            combined_prompt: 관계/Hard 판정을 한 번의 LLM 호출로 수행 (v7.11.2)
+            max_workers: analyze_batch 병렬 스레드 수 (v7.11.2)
         
         Note:
             v7.11.0: llm_mode 파라미터 제거됨
         """
         self.llm_provider = llm_provider or get_default_llm_provider()
         self._llm = None
+        self.combined_prompt = combined_prompt
+        self.max_workers = max(1, max_workers)
 
     def _get_llm(self) -> ChatOpenAI:
         """LLM 인스턴스 (Lazy 초기화)"""
         if self._llm is None:
-            model = settings.llm_model
-            self._llm = ChatOpenAI(
-                model=model,
-                temperature=0.1,  # 일관된 판단을 위해 낮은 temperature
-                openai_api_key=settings.openai_api_key
-            )
+            # 프로세스 공유 클라이언트 (HTTP keep-alive 풀 재사용)
+            self._llm = get_chat_model(settings.llm_model, **ESTIMATOR_CLIENT_PARAMS['guardrail'])
         return self._llm
 
+    @traced("guardrail.analyze")
     def analyze(
         self,
         target_question: str,
@@ -109,47 +124,71 @@ class GuardrailAnalyzer:
         logger.info(f"  Similar: {similar_question} = {similar_value:,.0f}")
 
         try:
-            # Step 1: 관계 판단
-            relationship = self._step1_relationship(
-                target_question, similar_question,
-                target_context, similar_context
-            )
-
-            if relationship == RelationshipType.UNRELATED:
-                logger.info(f"  Step 1: 무관 → Guardrail 없음")
-                return None
-
-            # Step 2: Hard/Soft 판정
-            is_hard, hardness_reasoning = self._step2_hardness(
-                target_question, similar_question,
-                relationship
-            )
-
-            # Guardrail 생성
-            if relationship == RelationshipType.UPPER_BOUND:
-                guard_type = GuardrailType.HARD_UPPER if is_hard else GuardrailType.SOFT_UPPER
+            if self.combined_prompt:
+                # 단일 호출: 관계 + Hard/Soft 동시 판정 (v7.11.2)
+                relationship, is_hard, hardness_reasoning = self._classify_combined(
+                    target_question, similar_question,
+                    target_context, similar_context
+                )
+                if relationship == RelationshipType.UNRELATED:
+                    logger.info(f"  무관 → Guardrail 없음")
+                    return None
             else:
-                guard_type = GuardrailType.HARD_LOWER if is_hard else GuardrailType.SOFT_LOWER
-
-            confidence = 0.95 if is_hard else 0.75
-
-            guardrail = Guardrail(
-                type=guard_type,
-                value=similar_value,
-                confidence=confidence,
-                is_hard=is_hard,
-                reasoning=hardness_reasoning,
-                source="GuardrailAnalyzer",
-                relationship=f"{target_question} {'<=' if relationship == RelationshipType.UPPER_BOUND else '>='} {similar_question}"
+                # Step 1: 관계 판단
+                relationship = self._step1_relationship(
+                    target_question, similar_question,
+                    target_context, similar_context
+                )
+
+                if relationship == RelationshipType.UNRELATED:
+                    logger.info(f"  Step 1: 무관 → Guardrail 없음")
+                    return None
+
+                # Step 2: Hard/Soft 판정
+                is_hard, hardness_reasoning = self._step2_hardness(
+                    target_question, similar_question,
+                    relationship
+                )
+
+            return self._build_guardrail(
+                target_question, similar_question, similar_value,
+                relationship, is_hard, hardness_reasoning
             )
 
-            logger.info(f"  결과: {guard_type.value}, Hard={is_hard}, Conf={confidence}")
-            return guardrail
-
         except Exception as e:
             logger.error(f"[GuardrailAnalyzer] 분석 실패: {e}")
             return None
 
+    def _build_guardrail(
+        self,
+        target_question: str,
+        similar_question: str,
+        similar_value: float,
+        relationship: RelationshipType,
+        is_hard: bool,
+        reasoning: str
+    ) -> Guardrail:
+        """관계 + Hard/Soft 판정 → Guardrail"""
+        if relationship == RelationshipType.UPPER_BOUND:
+            guard_type = GuardrailType.HARD_UPPER if is_hard else GuardrailType.SOFT_UPPER
+        else:
+            guard_type = GuardrailType.HARD_LOWER if is_hard else GuardrailType.SOFT_LOWER
+
+        confidence = 0.95 if is_hard else 0.75
+
+        guardrail = Guardrail(
+            type=guard_type,
+            value=similar_value,
+            confidence=confidence,
+            is_hard=is_hard,
+            reasoning=reasoning,
+            source="GuardrailAnalyzer",
+            relationship=f"{target_question} {'<=' if relationship == RelationshipType.UPPER_BOUND else '>='} {similar_question}"
+        )
+
+        logger.info(f"  결과: {guard_type.value}, Hard={is_hard}, Conf={confidence}")
+        return guardrail
+
     def _step1_relationship(
         self,
         target_question: str,
@@ -184,8 +223,7 @@ JSON 형식으로 응답하세요:
 
         try:
             llm = self._get_llm()
-            response = llm.invoke(prompt)
-            content = response.content.strip()
+            content = get_llm_cache().invoke(llm, prompt).strip()
 
             # JSON 파싱
             if "```json" in content:
@@ -240,8 +278,7 @@ JSON 형식으로 응답하세요:
 
         try:
             llm = self._get_llm()
-            response = llm.invoke(prompt)
-            content = response.content.strip()
+            content = get_llm_cache().invoke(llm, prompt).strip()
 
             # JSON 파싱
             if "```json" in content:
@@ -260,31 +297,149 @@ JSON 형식으로 응답하세요:
             logger.warning(f"  Step 2 파싱 실패: {e} → Soft")
             return False, f"파싱 실패로 Soft 판정: {e}"
 
+    def _classify_combined(
+        self,
+        target_question: str,
+        similar_question: str,
+        target_context: Optional[str] = None,
+        similar_context: Optional[str] = None
+    ) -> Tuple[RelationshipType, bool, str]:
+        """관계 + Hard/Soft 단일 판정 (LLM 1회, v7.11.2)"""
+
+        prompt = f"""두 질문 사이의 수학적 관계와, 그 관계가 Hard인지 Soft인지 함께 판단하세요.
+
+질문 A (추정 대상): {target_question}
+{f'맥락: {target_context}' if target_context else ''}
+
+질문 B (참조 데이터): {similar_question}
+{f'맥락: {similar_context}' if similar_context else ''}
+
+relationship (하나 선택):
+1. UPPER_BOUND: A의 값은 반드시 B의 값보다 작거나 같다 (A <= B)
+   예: "개인사업자 수" <= "전체 사업자 수"
+2. LOWER_BOUND: A의 값은 반드시 B의 값보다 크거나 같다 (A >= B)
+   예: "전체 사업자 수" >= "개인사업자 수"
+3. UNRELATED: 두 질문 사이에 명확한 수학적 관계가 없다
+
+is_hard (relationship이 UNRELATED가 아닐 때):
+- true (논리적 제약): 위반 시 정의 자체가 모순 (예: "부분 <= 전체")
+- false (경험적 제약): 대부분 성립하지만 예외 가능 (예: "평균 매출 < 업계 최대치")
+
+JSON 형식으로 응답하세요:
+{{"relationship": "UPPER_BOUND" | "LOWER_BOUND" | "UNRELATED", "is_hard": true | false, "reasoning": "이유"}}
+"""
+
+        try:
+            llm = self._get_llm()
+            result = json.loads(_strip_code_fence(get_llm_cache().invoke(llm, prompt).strip()))
+
+            relationship_str = str(result.get("relationship", "UNRELATED")).upper()
+            relationship = {
+                "UPPER_BOUND": RelationshipType.UPPER_BOUND,
+                "LOWER_BOUND": RelationshipType.LOWER_BOUND
+            }.get(relationship_str, RelationshipType.UNRELATED)
+            is_hard = bool(result.get("is_hard", False))
+            reasoning = result.get("reasoning", "판정 완료")
+
+            logger.info(f"  통합 판정: {relationship_str}, {'Hard' if is_hard else 'Soft'} ({reasoning})")
+            return relationship, is_hard, reasoning
+
+        except Exception as e:
+            logger.warning(f"  통합 판정 파싱 실패: {e} → UNRELATED")
+            return RelationshipType.UNRELATED, False, f"파싱 실패: {e}"
+
     def analyze_batch(
         self,
         target_question: str,
         similar_items: list,  # List of (question, value, context)
-        max_guardrails: int = 5
+        max_guardrails: int = 5,
+        target_context: Optional[str] = None,
+        parallel: bool = True,
+        stop_when_bounded: bool = False
     ) -> list:
-        """여러 유사 데이터를 배치로 분석"""
-        guardrails = []
+        """
+        여러 유사 데이터를 배치로 분석 (v7.11.2: 병렬 + 조기 종료)
 
-        for item in similar_items[:max_guardrails]:
-            if len(item) == 3:
-                question, value, context = item
-            else:
-                question, value = item[:2]
-                context = None
+        Args:
+            target_question: 추정 대상 질문
+            similar_items: [(question, value, context), ...]
+            max_guardrails: 분석할 최대 항목 수
+            target_context: 타겟 맥락 (선택)
+            parallel: 항목별 분석 동시 실행 여부
+            stop_when_bounded: Hard 상한과 Hard 하한이 모두 나오면
+                아직 시작하지 않은 분석을 취소
 
-            guardrail = self.analyze(
+        Returns:
+            Guardrail 리스트 (입력 순서 유지)
+        """
+        items = [self._unpack_item(item) for item in similar_items[:max_guardrails]]
+        stop = threading.Event()
+
+        def run(item) -> Optional[Guardrail]:
+            if stop.is_set():
+                return None
+            question, value, context = item
+            return self.analyze(
                 target_question=target_question,
                 similar_question=question,
                 similar_value=value,
+                target_context=target_context,
                 similar_context=context
             )
 
-            if guardrail:
-                guardrails.append(guardrail)
+        results: Dict[int, Guardrail] = {}
 
+        def record(index: int, guardrail: Optional[Guardrail]) -> None:
+            if guardrail:
+                results[index] = guardrail
+                if stop_when_bounded and _is_bounded(results.values()):
+                    stop.set()
+
+        if parallel and len(items) > 1:
+            executor = ThreadPoolExecutor(max_workers=min(len(items), self.max_workers))
+            try:
+                future_to_index = {executor.submit(propagate(run), item): i for i, item in enumerate(items)}
+                for future in as_completed(future_to_index):
+                    try:
+                        record(future_to_index[future], future.result())
+                    except Exception as e:
+                        logger.warning(f"  항목 {future_to_index[future] + 1} 분석 실패: {e}")
+                    if stop.is_set():
+                        logger.info("  Hard 상/하한 확보 → 남은 분석 취소")
+                        break
+            finally:
+                executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            for i, item in enumerate(items):
+                record(i, run(item))
+                if stop.is_set():
+                    logger.info("  Hard 상/하한 확보 → 남은 분석 생략")
+                    break
+
+        guardrails = [results[i] for i in sorted(results)]
         logger.info(f"[GuardrailAnalyzer] 배치 완료: {len(guardrails)}/{len(similar_items)} Guardrails")
         return guardrails
+
+    @staticmethod
+    def _unpack_item(item) -> Tuple[str, float, Optional[str]]:
+        """(question, value[, context]) 또는 dict → 튜플"""
+        if isinstance(item, dict):
+            return item.get('question', ''), item.get('value', 0), item.get('context')
+        if len(item) >= 3:
+            return item[0], item[1], item[2]
+        return item[0], item[1], None
+
+
+def _strip_code_fence(content: str) -> str:
+    """```json ... ``` 블록 제거"""
+    if "```json" in content:
+        return content.split("```json")[1].split("```")[0].strip()
+    if "```" in content:
+        return content.split("```")[1].split("```")[0].strip()
+    return content
+
+
+def _is_bounded(guardrails) -> bool:
+    """Hard 상한과 Hard 하한이 모두 있는지"""
+    kinds = {g.type for g in guardrails if g.is_hard}
+    return GuardrailType.HARD_UPPER in kinds and GuardrailType.HARD_LOWER in kinds
@@ -27,6 +27,7 @@ from pathlib import Path
 
 from umis_rag.utils.logger import logger
 from umis_rag.core.config import settings
+from umis_rag.core.tracing import traced
 
 from .models import Context, EstimationResult
 
@@ -102,6 +103,7 @@ class LiteralSource:
     # 메인 인터페이스
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     
+    @traced("evidence.literal")
     def get(
         self,
         question: str,
@@ -0,0 +1,160 @@
+"""
+Margin Benchmark Index - 이익률 벤치마크 구조화 인덱스 (v7.11.2)
+
+목적:
+- ValidatorSource._search_industry_benchmarks가 similarity_search를 최대 3번
+  순차 호출(각각 임베딩 왕복)하고, 결과마다 page_content의 YAML을 정규식으로 재파싱
+- 흔한 질문(산업 + 세부 카테고리)은 YAML 원본에서 바로 찾을 수 있음
+
+특징:
+- data/raw/profit_margin_benchmarks.yaml을 프로세스당 1회 로드
+- (industry, sub_category, business_model, region) 키 + 계층 fallback
+  1. 4개 모두 일치
+  2. region 무시
+  3. business_model 무시 (industry + sub_category)
+  (industry만 일치는 인덱스에서 고르지 않음 → Vector 검색이 질문 의미로 선택)
+- Vector 검색 결과도 benchmark_id로 원본을 찾아 page_content 재파싱 생략
+- 같은 단계 후보가 여럿이면 reliability → sample_size → year 순
+- 키 비교는 대소문자/공백 무시
+
+Example:
+    >>> index = get_margin_benchmark_index()
+    >>> index.lookup("커머스", "Beauty D2C")['benchmark_id']
+    'margin_commerce_003'
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import threading
+
+import yaml
+
+from umis_rag.utils.logger import logger
+
+
+DEFAULT_BENCHMARK_PATH = (
+    Path(__file__).parent.parent.parent.parent / "data" / "raw" / "profit_margin_benchmarks.yaml"
+)
+
+# 사용 가능한 신뢰도 (ValidatorSource RAG 검색과 동일)
+USABLE_RELIABILITY = ('high', 'medium')
+
+_RELIABILITY_RANK = {'high': 0, 'medium': 1}
+
+
+def _norm(value: Optional[str]) -> str:
+    """키 정규화 (대소문자/공백 무시)"""
+    return "".join(str(value or "").split()).lower()
+
+
+class MarginBenchmarkIndex:
+    """
+    이익률 벤치마크 구조화 인덱스 (읽기 전용, thread-safe)
+    """
+
+    def __init__(self, benchmarks: List[Dict[str, Any]]):
+        """
+        Args:
+            benchmarks: 벤치마크 목록 (YAML benchmarks 항목)
+        """
+        self._by_full: Dict[Tuple[str, str, str, str], List[Dict]] = {}
+        self._by_model: Dict[Tuple[str, str, str], List[Dict]] = {}
+        self._by_sub: Dict[Tuple[str, str], List[Dict]] = {}
+        self._by_id: Dict[str, Dict] = {
+            b['benchmark_id']: b for b in benchmarks if b.get('benchmark_id')
+        }
+
+        usable = [b for b in benchmarks if b.get('industry') and b.get('reliability') in USABLE_RELIABILITY]
+        usable.sort(key=self._rank)
+
+        for b in usable:
+            industry = _norm(b.get('industry'))
+            sub = _norm(b.get('sub_category'))
+            model = _norm(b.get('business_model'))
+            region = _norm(b.get('region'))
+
+            self._by_full.setdefault((industry, sub, model, region), []).append(b)
+            self._by_model.setdefault((industry, sub, model), []).append(b)
+            self._by_sub.setdefault((industry, sub), []).append(b)
+
+        self.size = len(usable)
+
+    @classmethod
+    def from_yaml(cls, path: Path = DEFAULT_BENCHMARK_PATH) -> "MarginBenchmarkIndex":
+        """YAML 파일 로드 (benchmarks + benchmarks_continued)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f) or {}
+
+        benchmarks = list(data.get('benchmarks') or []) + list(data.get('benchmarks_continued') or [])
+        return cls(benchmarks)
+
+    @staticmethod
+    def _rank(benchmark: Dict[str, Any]):
+        return (
+            _RELIABILITY_RANK.get(benchmark.get('reliability'), 9),
+            -(benchmark.get('sample_size') or 0),
+            -(benchmark.get('year') or 0)
+        )
+
+    def lookup(
+        self,
+        industry: str,
+        sub_category: Optional[str] = None,
+        business_model: Optional[str] = None,
+        region: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        계층 조회 (industry + sub_category까지)
+
+        Returns:
+            벤치마크 dict (복사본) or None
+        """
+        industry, sub = _norm(industry), _norm(sub_category)
+        model, region = _norm(business_model), _norm(region)
+
+        if not industry or not sub:
+            return None
+
+        candidates = None
+        if model and region:
+            candidates = self._by_full.get((industry, sub, model, region))
+        if not candidates and model:
+            candidates = self._by_model.get((industry, sub, model))
+        if not candidates:
+            candidates = self._by_sub.get((industry, sub))
+
+        return dict(candidates[0]) if candidates else None
+
+    def get(self, benchmark_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """benchmark_id로 원본 조회 (Vector 검색 결과의 YAML 재파싱 대신 사용)"""
+        benchmark = self._by_id.get(benchmark_id) if benchmark_id else None
+        return dict(benchmark) if benchmark else None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 싱글톤
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_index: Optional[MarginBenchmarkIndex] = None
+_index_loaded = False
+_index_lock = threading.Lock()
+
+
+def get_margin_benchmark_index() -> Optional[MarginBenchmarkIndex]:
+    """
+    기본 벤치마크 인덱스 (처음 호출 시 로드, 실패 시 None)
+    """
+    global _index, _index_loaded
+
+    if not _index_loaded:
+        with _index_lock:
+            if not _index_loaded:
+                try:
+                    _index = MarginBenchmarkIndex.from_yaml(DEFAULT_BENCHMARK_PATH)
+                    logger.info(f"[MarginBenchmarkIndex] {_index.size}개 벤치마크 로드")
+                except Exception as e:
+                    logger.warning(f"[MarginBenchmarkIndex] 로드 실패 → Vector 검색만 사용: {e}")
+                    _index = None
+                _index_loaded = True
+
+    return _index
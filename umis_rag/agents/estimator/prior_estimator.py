@@ -25,7 +25,8 @@ import time
 from langchain_openai import ChatOpenAI
 
 from umis_rag.utils.logger import logger
-from umis_rag.core.config import settings
+from umis_rag.core.llm_cache import get_llm_cache
+from umis_rag.core.llm_clients import get_chat_model, ESTIMATOR_CLIENT_PARAMS
 from umis_rag.core.llm_interface import LLMProvider, TaskType
 from umis_rag.core.llm_provider_factory import get_default_llm_provider
 
@@ -97,7 +98,7 @@ class PriorEstimator:
             # Stage 2 모델 선택
             from umis_rag.core.model_router import select_model_with_config
             
-            model, config = select_model_with_config(phase=2)  # Stage 2
+            model, config = select_model_with_config(2)  # Stage 2
             return model
         return self._model_name
     
@@ -106,15 +107,11 @@ class PriorEstimator:
         LLM 인스턴스 (Lazy 초기화)
         
         Note:
-            현재는 직접 ChatOpenAI 생성하지만,
-            향후 LLMProvider.get_llm()을 통해 받아올 수 있음
+            v7.11.2: 프로세스 공유 클라이언트 레지스트리에서 받아옴
+            (같은 모델/파라미터는 하나의 ChatOpenAI + HTTP 풀 재사용)
         """
         if self._llm is None:
-            self._llm = ChatOpenAI(
-                model=self.model_name,
-                temperature=0.3,  # 약간의 다양성 허용
-                openai_api_key=settings.openai_api_key
-            )
+            self._llm = get_chat_model(self.model_name, **ESTIMATOR_CLIENT_PARAMS['prior'])
         return self._llm
     
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -154,35 +151,84 @@ class PriorEstimator:
         # LLM 호출
         try:
             value, value_range, certainty, reasoning = self._call_llm(
-                question, evidence, context
+                question, evidence, context,
+                timeout=budget.get_request_timeout()
             )
-            
-            # 예산 소비
-            budget.consume_llm_call(1)
-            budget.consume_variable(1)
-            
-            elapsed = time.time() - start_time
-            
-            # 결과 생성
-            result = create_prior_result(
-                value=value,
-                value_range=value_range,
-                certainty=certainty,
-                reasoning=reasoning,
-                llm_calls=1
+            return self._finish(
+                value, value_range, certainty, reasoning,
+                evidence, budget, start_time
             )
-            result.cost['time'] = elapsed
-            result.cost['variables'] = 1
-            result.used_evidence = [evidence]
-            
-            logger.info(f"  ✅ 완료: {value:,.0f} (certainty={certainty}, {elapsed:.2f}초)")
-            
-            return result
         
         except Exception as e:
             logger.error(f"  ❌ Prior 추정 실패: {e}")
             return None
     
+    async def aestimate(
+        self,
+        question: str,
+        evidence: Evidence,
+        budget: Budget,
+        context: Optional[Context] = None
+    ) -> Optional[EstimationResult]:
+        """
+        Prior 추정 (async, v7.11.2)
+        
+        estimate()와 동일하며 LLM 호출만 ainvoke로 수행합니다.
+        """
+        logger.info(f"[PriorEstimator] 추정 시작 (async): {question}")
+        start_time = time.time()
+        
+        if not budget.can_call_llm(1):
+            logger.warning("  예산 부족 (LLM 호출)")
+            return None
+        
+        try:
+            value, value_range, certainty, reasoning = await self._acall_llm(
+                question, evidence, context,
+                timeout=budget.get_request_timeout()
+            )
+            return self._finish(
+                value, value_range, certainty, reasoning,
+                evidence, budget, start_time
+            )
+        
+        except Exception as e:
+            logger.error(f"  ❌ Prior 추정 실패: {e}")
+            return None
+    
+    def _finish(
+        self,
+        value: float,
+        value_range: Tuple[float, float],
+        certainty: str,
+        reasoning: str,
+        evidence: Evidence,
+        budget: Budget,
+        start_time: float
+    ) -> EstimationResult:
+        """예산 소비 + 결과 생성"""
+        # 예산 소비
+        budget.consume_llm_call(1)
+        budget.consume_variable(1)
+        
+        elapsed = time.time() - start_time
+        
+        # 결과 생성
+        result = create_prior_result(
+            value=value,
+            value_range=value_range,
+            certainty=certainty,
+            reasoning=reasoning,
+            llm_calls=1
+        )
+        result.cost['time'] = elapsed
+        result.cost['variables'] = 1
+        result.used_evidence = [evidence]
+        
+        logger.info(f"  ✅ 완료: {value:,.0f} (certainty={certainty}, {elapsed:.2f}초)")
+        
+        return result
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Private Methods
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -191,7 +237,8 @@ class PriorEstimator:
         self,
         question: str,
         evidence: Evidence,
-        context: Optional[Context]
+        context: Optional[Context],
+        timeout: Optional[float] = None
     ) -> Tuple[float, Tuple[float, float], str, str]:
         """
         LLM 호출 (단일)
@@ -200,6 +247,7 @@ class PriorEstimator:
             question: 질문
             evidence: 증거
             context: 맥락
+            timeout: 요청 timeout (초, 예산 잔여 시간)
         
         Returns:
             (value, range, certainty, reasoning)
@@ -212,9 +260,29 @@ class PriorEstimator:
         
         # LLM 호출 (직접)
         llm = self._get_llm()
-        response = llm.invoke(prompt)
-        content = response.content.strip()
+        invoke_kwargs = {'timeout': timeout} if timeout else {}
+        content = get_llm_cache().invoke(llm, prompt, **invoke_kwargs).strip()
         
+        return self._extract_fields(content)
+    
+    async def _acall_llm(
+        self,
+        question: str,
+        evidence: Evidence,
+        context: Optional[Context],
+        timeout: Optional[float] = None
+    ) -> Tuple[float, Tuple[float, float], str, str]:
+        """LLM 호출 (async, 단일)"""
+        prompt = self._build_prompt(question, evidence, context)
+        
+        llm = self._get_llm()
+        invoke_kwargs = {'timeout': timeout} if timeout else {}
+        content = (await get_llm_cache().ainvoke(llm, prompt, **invoke_kwargs)).strip()
+        
+        return self._extract_fields(content)
+    
+    def _extract_fields(self, content: str) -> Tuple[float, Tuple[float, float], str, str]:
+        """LLM 응답 → (value, range, certainty, reasoning)"""
         # JSON 파싱
         parsed = self._parse_response(content)
         
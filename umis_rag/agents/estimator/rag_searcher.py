@@ -7,10 +7,10 @@ projected_index Collection에서 학습된 규칙 검색 (agent_view="estimator"
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import Chroma
 
 from umis_rag.core.config import settings
+from umis_rag.core.tracing import span
+from umis_rag.core.vector_stores import get_embeddings, get_vectorstore
 from umis_rag.utils.logger import logger
 from .models import Context, LearnedRule
 
@@ -36,18 +36,11 @@ class EstimatorRAGSearcher:
         logger.info("[Estimator RAG] 초기화")
         
         # Embeddings
-        self.embeddings = OpenAIEmbeddings(
-            model=settings.embedding_model,
-            openai_api_key=settings.openai_api_key
-        )
+        self.embeddings = get_embeddings()
         
         # Projected Index
         try:
-            self.projected_store = Chroma(
-                collection_name="projected_index",
-                embedding_function=self.embeddings,
-                persist_directory=str(settings.chroma_persist_dir)
-            )
+            self.projected_store = get_vectorstore("projected_index")
             
             # 전체 청크 수
             total_count = self.projected_store._collection.count()
@@ -114,11 +107,13 @@ class EstimatorRAGSearcher:
         # Step 3: 벡터 검색
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
         try:
-            results = self.projected_store.similarity_search_with_score(
-                query=question,
-                k=top_k * 2,  # 필터링 여유
-                filter=base_filter
-            )
+            with span('vector_search', collection='projected_index') as current:
+                results = self.projected_store.similarity_search_with_score(
+                    query=question,
+                    k=top_k * 2,  # 필터링 여유
+                    filter=base_filter
+                )
+                current.set(results=len(results))
             
             logger.info(f"  ✅ {len(results)}개 후보 발견")
             
@@ -21,6 +21,7 @@ import yaml
 from pathlib import Path
 
 from umis_rag.utils.logger import logger
+from umis_rag.core.tracing import traced
 from .models import Context, EstimationResult, Phase1Config, LearnedRule
 from .rag_searcher import EstimatorRAGSearcher
 
@@ -72,6 +73,7 @@ class RAGSource:
     # 대체: Validator 검색 (Phase 2)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     
+    @traced("evidence.rag")
     def estimate(
         self,
         question: str,
@@ -28,6 +28,10 @@ v7.11.1 변경:
 - Phase2ValidatorSearchEnhanced → ValidatorSource (명확성)
 - 기능 변경 없음
 
+v7.11.2 변경:
+- 구조화 인덱스 우선 (MarginBenchmarkIndex, 임베딩 호출 없음)
+- Vector 검색은 인덱스 miss 시에만
+
 v7.9.0 (Gap #2 Week 3)
 """
 
@@ -36,6 +40,8 @@ import logging
 import re
 from datetime import datetime
 
+from umis_rag.core.tracing import span, traced
+
 logger = logging.getLogger(__name__)
 
 
@@ -76,13 +82,15 @@ class ValidatorSource:
     100개 벤치마크를 활용하여 비공개 기업 이익률을 정확하게 추정
     """
 
-    def __init__(self, validator_rag=None):
+    def __init__(self, validator_rag=None, benchmark_index=None):
         """
         Args:
             validator_rag: ValidatorRAG 인스턴스 (기존 연동)
+            benchmark_index: MarginBenchmarkIndex (None이면 기본 YAML 인덱스, v7.11.2)
         """
         self.validator = validator_rag
         self.benchmark_store = None  # ChromaDB collection (초기화 필요)
+        self._benchmark_index = benchmark_index
 
         logger.info("[ValidatorSource] 초기화 완료")
 
@@ -94,22 +102,18 @@ class ValidatorSource:
             collection_name: Collection 이름
         """
         try:
-            from langchain_openai import OpenAIEmbeddings
-            from langchain_community.vectorstores import Chroma
             from pathlib import Path
+            from umis_rag.core.vector_stores import get_vectorstore
             
             # Persist directory
             project_root = Path(__file__).parent.parent.parent.parent
             persist_directory = str(project_root / "data" / "chroma")
             
-            # Embeddings
-            embeddings = OpenAIEmbeddings(model="text-embedding-3-large")
-            
-            # Collection 로드
-            self.benchmark_store = Chroma(
-                collection_name=collection_name,
-                embedding_function=embeddings,
-                persist_directory=persist_directory
+            # Collection 로드 (공유 클라이언트/임베딩, v7.11.2)
+            self.benchmark_store = get_vectorstore(
+                collection_name,
+                embedding_model="text-embedding-3-large",
+                persist_dir=persist_directory
             )
             
             logger.info(f"[ValidatorSource] Benchmark store 로드 완료: {collection_name}")
@@ -120,6 +124,7 @@ class ValidatorSource:
             logger.warning("  → python scripts/build_margin_benchmarks_rag.py")
             self.benchmark_store = None
 
+    @traced("evidence.validator")
     def search_with_context(
         self,
         query: str,
@@ -147,8 +152,8 @@ class ValidatorSource:
         logger.info(f"[ValidatorSource] 컨텍스트 기반 검색 시작: {query}")
         logger.info(f"  Context: {context}")
 
-        # Benchmark store 확인
-        if not self.benchmark_store:
+        # 구조화 인덱스도 Benchmark store도 없으면 검색 불가
+        if not self.benchmark_store and self.benchmark_index is None:
             logger.warning("[ValidatorSource] Benchmark store 없음 → Phase 3로")
             return None
 
@@ -283,6 +288,8 @@ class ValidatorSource:
         산업별 마진율 벤치마크 검색
 
         검색 우선순위:
+        0. 구조화 인덱스 (v7.11.2, 임베딩 호출 없음)
+           industry + sub_category + model + region → region 무시 → model 무시
         1. Exact match (industry + sub_category + model)
         2. Industry + sub_category
         3. Industry only
@@ -295,6 +302,39 @@ class ValidatorSource:
             logger.warning("[ValidatorSource] Industry 정보 없음")
             return None
 
+        index = self.benchmark_index
+        if index is not None:
+            benchmark = index.lookup(industry, sub_category, business_model, region)
+            if benchmark:
+                logger.info(f"  ✓ 구조화 인덱스 매칭: {benchmark.get('benchmark_id')}")
+                return benchmark
+
+        benchmark = self._search_benchmark_store(industry, sub_category, business_model)
+        if benchmark:
+            return benchmark
+
+        logger.warning("[ValidatorSource] 매칭되는 벤치마크 없음")
+        return None
+
+    @property
+    def benchmark_index(self):
+        """구조화 벤치마크 인덱스 (처음 접근 시 로드, 실패 시 None)"""
+        if self._benchmark_index is None:
+            from .margin_benchmark_index import get_margin_benchmark_index
+            self._benchmark_index = get_margin_benchmark_index()
+        return self._benchmark_index
+
+    def _search_benchmark_store(
+        self,
+        industry: str,
+        sub_category: str = None,
+        business_model: str = None
+    ) -> Optional[Dict]:
+        """Vector 검색 (구조화 인덱스 miss 시)"""
+
+        if not self.benchmark_store:
+            return None
+
         # RAG 검색 쿼리 생성
         search_queries = []
 
@@ -325,10 +365,12 @@ class ValidatorSource:
             logger.info(f"  RAG 검색: {query_text}")
 
             try:
-                results = self.benchmark_store.similarity_search(
-                    query_text,
-                    k=3
-                )
+                with span('vector_search', collection='benchmark_store') as current:
+                    results = self.benchmark_store.similarity_search(
+                        query_text,
+                        k=3
+                    )
+                    current.set(results=len(results))
 
                 for result in results:
                     # 신뢰도 확인
@@ -351,7 +393,6 @@ class ValidatorSource:
                 logger.error(f"  RAG 검색 오류: {e}")
                 continue
 
-        logger.warning("[ValidatorSource] 매칭되는 벤치마크 없음")
         return None
 
     def _parse_benchmark_data(self, search_result) -> Optional[Dict]:
@@ -369,6 +410,13 @@ class ValidatorSource:
             # Metadata에서 기본 정보
             metadata = search_result.metadata
 
+            # 구조화 인덱스에 원본이 있으면 그대로 사용 (v7.11.2, YAML 재파싱 생략)
+            index = self.benchmark_index
+            if index is not None:
+                benchmark = index.get(metadata.get('benchmark_id'))
+                if benchmark:
+                    return benchmark
+
             # Document에서 상세 정보 파싱
             # 메타데이터 우선, 없으면 YAML 파싱 시도
             benchmark = {
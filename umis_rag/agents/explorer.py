@@ -24,8 +24,7 @@ Phase 7: Guardian 검증
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_community.vectorstores import Chroma
+from langchain_openai import ChatOpenAI
 from langchain_core.documents import Document
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -35,6 +34,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from umis_rag.core.config import settings
+from umis_rag.core.vector_stores import get_embeddings, get_vectorstore
 from umis_rag.core.llm_provider import LLMProvider
 from umis_rag.utils.logger import logger
 from umis_rag.graph.hybrid_search import HybridSearch, HybridResult
@@ -75,19 +75,12 @@ class ExplorerRAG:
         logger.info("Explorer RAG 에이전트 초기화")
         
         # Embeddings 초기화
-        self.embeddings = OpenAIEmbeddings(
-            model=settings.embedding_model,
-            openai_api_key=settings.openai_api_key
-        )
+        self.embeddings = get_embeddings()
         
         # 벡터 스토어 로드 (v3.0 Dual-Index 지원!)
         collection_name = "projected_index" if use_projected else "explorer_knowledge_base"
         
-        self.vectorstore = Chroma(
-            collection_name=collection_name,
-            embedding_function=self.embeddings,
-            persist_directory=str(settings.chroma_persist_dir)
-        )
+        self.vectorstore = get_vectorstore(collection_name)
         
         self.use_projected = use_projected
         
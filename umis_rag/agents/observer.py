@@ -26,8 +26,6 @@ RAG Collections:
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
 
 import sys
@@ -35,6 +33,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from umis_rag.core.config import settings
+from umis_rag.core.vector_stores import get_embeddings, get_vectorstore
 from umis_rag.utils.logger import logger
 
 
@@ -66,19 +65,12 @@ class ObserverRAG:
         logger.info("Observer RAG 에이전트 초기화")
         
         # Embeddings
-        self.embeddings = OpenAIEmbeddings(
-            model=settings.embedding_model,
-            openai_api_key=settings.openai_api_key
-        )
+        self.embeddings = get_embeddings()
         
         # Vector Stores
         try:
             # 1. 시장 구조 패턴
-            self.structure_store = Chroma(
-                collection_name="market_structure_patterns",
-                embedding_function=self.embeddings,
-                persist_directory=str(settings.chroma_persist_dir)
-            )
+            self.structure_store = get_vectorstore("market_structure_patterns")
             logger.info(f"  ✅ 구조 패턴: {self.structure_store._collection.count()}개")
         except Exception as e:
             logger.warning(f"  ⚠️  구조 패턴 Collection 없음 (구축 필요): {e}")
@@ -86,11 +78,7 @@ class ObserverRAG:
         
         try:
             # 2. 가치사슬 벤치마크
-            self.chain_store = Chroma(
-                collection_name="value_chain_benchmarks",
-                embedding_function=self.embeddings,
-                persist_directory=str(settings.chroma_persist_dir)
-            )
+            self.chain_store = get_vectorstore("value_chain_benchmarks")
             logger.info(f"  ✅ 가치사슬: {self.chain_store._collection.count()}개")
         except Exception as e:
             logger.warning(f"  ⚠️  가치사슬 Collection 없음 (구축 필요): {e}")
@@ -98,11 +86,7 @@ class ObserverRAG:
         
         try:
             # 3. 진화 패턴 (v7.8.0 신규)
-            self.evolution_store = Chroma(
-                collection_name="historical_evolution_patterns",
-                embedding_function=self.embeddings,
-                persist_directory=str(settings.chroma_persist_dir)
-            )
+            self.evolution_store = get_vectorstore("historical_evolution_patterns")
             logger.info(f"  ✅ 진화 패턴: {self.evolution_store._collection.count()}개")
         except Exception as e:
             logger.warning(f"  ⚠️  진화 패턴 Collection 없음 (구축 필요): {e}")
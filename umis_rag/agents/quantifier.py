@@ -26,8 +26,6 @@ RAG Collections:
 from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
 
 import sys
@@ -35,6 +33,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from umis_rag.core.config import settings
+from umis_rag.core.vector_stores import get_embeddings, get_vectorstore
 from umis_rag.utils.logger import logger
 
 # v7.3.1: Estimator (Fermi) Agent 통합
@@ -73,19 +72,12 @@ class QuantifierRAG:
         self.estimator = None  # Lazy 초기화
         
         # Embeddings
-        self.embeddings = OpenAIEmbeddings(
-            model=settings.embedding_model,
-            openai_api_key=settings.openai_api_key
-        )
+        self.embeddings = get_embeddings()
         
         # Vector Stores (2개 Collection)
         try:
             # 1. 계산 방법론
-            self.methodology_store = Chroma(
-                collection_name="calculation_methodologies",
-                embedding_function=self.embeddings,
-                persist_directory=str(settings.chroma_persist_dir)
-            )
+            self.methodology_store = get_vectorstore("calculation_methodologies")
             logger.info(f"  ✅ 방법론 Collection: {self.methodology_store._collection.count()}개")
         except Exception as e:
             logger.warning(f"  ⚠️  방법론 Collection 없음 (구축 필요): {e}")
@@ -93,11 +85,7 @@ class QuantifierRAG:
         
         try:
             # 2. 시장 벤치마크
-            self.benchmark_store = Chroma(
-                collection_name="market_benchmarks",
-                embedding_function=self.embeddings,
-                persist_directory=str(settings.chroma_persist_dir)
-            )
+            self.benchmark_store = get_vectorstore("market_benchmarks")
             logger.info(f"  ✅ 벤치마크 Collection: {self.benchmark_store._collection.count()}개")
         except Exception as e:
             logger.warning(f"  ⚠️  벤치마크 Collection 없음 (구축 필요): {e}")
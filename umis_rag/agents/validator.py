@@ -35,8 +35,6 @@ v7.6.0+ 주요 변경:
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
 
 import sys
@@ -44,6 +42,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from umis_rag.core.config import settings
+from umis_rag.core.vector_stores import get_embeddings, get_vectorstore
 from umis_rag.utils.logger import logger
 
 # v7.3.2: Estimator 통합 (추정치 검증용)
@@ -85,19 +84,12 @@ class ValidatorRAG:
         self.kosis_api_key = settings.kosis_api_key
         
         # Embeddings
-        self.embeddings = OpenAIEmbeddings(
-            model=settings.embedding_model,
-            openai_api_key=settings.openai_api_key
-        )
+        self.embeddings = get_embeddings()
         
         # Vector Stores
         try:
             # 1. 데이터 소스
-            self.source_store = Chroma(
-                collection_name="data_sources_registry",
-                embedding_function=self.embeddings,
-                persist_directory=str(settings.chroma_persist_dir)
-            )
+            self.source_store = get_vectorstore("data_sources_registry")
             logger.info(f"  ✅ 데이터 소스: {self.source_store._collection.count()}개")
         except Exception as e:
             logger.warning(f"  ⚠️  데이터 소스 Collection 없음 (구축 필요): {e}")
@@ -105,11 +97,7 @@ class ValidatorRAG:
         
         try:
             # 2. 정의 검증 사례
-            self.definition_store = Chroma(
-                collection_name="definition_validation_cases",
-                embedding_function=self.embeddings,
-                persist_directory=str(settings.chroma_persist_dir)
-            )
+            self.definition_store = get_vectorstore("definition_validation_cases")
             logger.info(f"  ✅ 정의 사례: {self.definition_store._collection.count()}개")
         except Exception as e:
             logger.warning(f"  ⚠️  정의 검증 Collection 없음 (구축 필요): {e}")
@@ -0,0 +1,39 @@
+"""
+Cache Statistics for UMIS RAG System
+
+캐시 공통 hit/miss 통계 (v7.11.2)
+
+LLM 응답 캐시, DART 캐시, 분해 메모리가 공유합니다.
+의존성 없는 모듈 → 캐시 모듈이 llm_cache(tracing, LLM 설정)를 끌어오지 않도록 분리
+
+작성: 2026-10-18
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass
+class CacheStats:
+    """캐시 hit/miss 통계 (프로세스 단위)"""
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    bypassed: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """hit / (hit + miss)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'bypassed': self.bypassed,
+            'hit_rate': round(self.hit_rate, 4)
+        }
@@ -176,6 +176,69 @@ class Settings(BaseSettings):
     dev_mode: bool = True
     cache_enabled: bool = True
     
+    # ========================================
+    # LLM 응답 캐시 (v7.11.2)
+    # ========================================
+    # 동일 (model, params, prompt) 응답을 디스크에 캐싱 → 배치 재실행 시 API 호출 0회
+    # .env: LLM_CACHE_ENABLED=true
+    llm_cache_enabled: bool = Field(default=False)
+    # .env: LLM_CACHE_PATH=./data/cache/llm_responses.sqlite3
+    llm_cache_path: Path = Field(
+        default_factory=lambda: Path(__file__).parent.parent.parent / "data" / "cache" / "llm_responses.sqlite3"
+    )
+    # .env: LLM_CACHE_TTL_SECONDS=604800 (7일)
+    llm_cache_ttl_seconds: int = Field(default=7 * 24 * 3600)
+    # .env: LLM_CACHE_MAX_MB=512 (초과 시 LRU eviction)
+    llm_cache_max_mb: int = Field(default=512)
+    
+    # ========================================
+    # Fermi 분해식 메모리 (v7.11.2)
+    # ========================================
+    # (정규화 질문, domain, region) → 분해식 재사용 (정확 일치 → 임베딩 유사도)
+    # .env: FERMI_DECOMPOSITION_MEMORY_ENABLED=true
+    fermi_decomposition_memory_enabled: bool = Field(default=False)
+    # .env: FERMI_DECOMPOSITION_MEMORY_PATH=./data/cache/fermi_decompositions.sqlite3
+    fermi_decomposition_memory_path: Optional[Path] = Field(
+        default_factory=lambda: Path(__file__).parent.parent.parent / "data" / "cache" / "fermi_decompositions.sqlite3"
+    )
+    # .env: FERMI_DECOMPOSITION_SIMILARITY=0.9 (유사 질문 재사용 최소 코사인 유사도)
+    fermi_decomposition_similarity: float = Field(default=0.9)
+    
+    # ========================================
+    # 임베딩 캐시 (v7.11.2)
+    # ========================================
+    # 같은 텍스트 재임베딩 방지 (메모리 LRU + 선택적 SQLite), 키 = sha256(model, text)
+    # .env: EMBEDDING_CACHE_ENABLED=true
+    embedding_cache_enabled: bool = Field(default=True)
+    # .env: EMBEDDING_CACHE_MEMORY_SIZE=4096 (메모리 LRU 항목 수)
+    embedding_cache_memory_size: int = Field(default=4096)
+    # .env: EMBEDDING_CACHE_PATH=~/.cache/umis/embeddings.sqlite3 (미설정 시 디스크 캐시 사용 안 함)
+    embedding_cache_path: Optional[Path] = Field(default=None)
+    # .env: EMBEDDING_CACHE_MAX_BYTES=268435456 (디스크 최대 용량, 초과 시 LRU 정리)
+    embedding_cache_max_bytes: int = Field(default=256 * 1024 * 1024)
+    
+    # ========================================
+    # LLM HTTP 연결 풀 (v7.11.2)
+    # ========================================
+    # 모든 ChatOpenAI 클라이언트가 하나의 keep-alive 풀 공유 (umis_rag.core.llm_clients)
+    # .env: LLM_HTTP_MAX_CONNECTIONS=100
+    llm_http_max_connections: int = Field(default=100)
+    # .env: LLM_HTTP_MAX_KEEPALIVE=20
+    llm_http_max_keepalive: int = Field(default=20)
+    # .env: LLM_HTTP_KEEPALIVE_EXPIRY=60 (초)
+    llm_http_keepalive_expiry: float = Field(default=60.0)
+    # .env: LLM_HTTP_WARM_UP=true (ExternalLLMProvider 생성 시 클라이언트/연결 미리 준비)
+    llm_http_warm_up: bool = Field(default=False)
+    
+    # ========================================
+    # 트레이싱 / 메트릭 (v7.11.2)
+    # ========================================
+    # Stage / 하위 단계 span + Prometheus 메트릭 (umis_rag.core.tracing)
+    # .env: TRACING_ENABLED=true
+    tracing_enabled: bool = Field(default=True)
+    # .env: TRACING_OTEL_ENABLED=false (opentelemetry-api 필요, SDK/Exporter는 애플리케이션에서 구성)
+    tracing_otel_enabled: bool = Field(default=False)
+
     # LangSmith (optional)
     # .env: LANGCHAIN_TRACING_V2=false
     langchain_tracing_v2: bool = Field(default=False)
@@ -201,6 +264,14 @@ class Settings(BaseSettings):
     # 발급: https://opendart.fss.or.kr → 인증키 신청/관리
     # .env: DART_API_KEY=your-key
     dart_api_key: Optional[str] = Field(default=None)
+    # 기업 코드 로컬 인덱스 (v7.11.2, corpCode.xml을 주기마다 1회만 다운로드)
+    # DARTClient 기본값 (생성자 인자로 덮어쓰기 가능)
+    # .env: DART_CORP_INDEX_PATH=./data/cache/dart_corp_codes.sqlite3
+    dart_corp_index_path: Path = Field(
+        default_factory=lambda: Path(__file__).parent.parent.parent / "data" / "cache" / "dart_corp_codes.sqlite3"
+    )
+    # .env: DART_CORP_INDEX_MAX_AGE_DAYS=7
+    dart_corp_index_max_age_days: float = Field(default=7.0)
     
     # KOSIS 통계청 API
     # 발급: https://kosis.kr/openapi/index/index.jsp
@@ -0,0 +1,384 @@
+"""
+Embedding Cache for UMIS RAG System
+
+쿼리/문서 임베딩 캐시 (v7.11.2)
+
+목적:
+- 한 번의 EstimatorRAG.estimate 안에서 같은 질문이 RAGSource,
+  ValidatorSource, ValidatorRAG, QueryMemory에서 각각 임베딩됨
+- 임베딩 호출은 Chat 호출 다음으로 큰 지연/비용 항목
+
+특징:
+- CachedEmbeddings: langchain Embeddings 래퍼 (Chroma에 그대로 전달 가능)
+- 메모리 LRU + 디스크(SQLite, 선택) 2단 캐시, 키 = sha256(model, text)
+- 디스크 용량 초과 시 last_access 기준 LRU eviction (max_bytes의 90%까지 정리)
+- embed_documents: 캐시 miss만 모아서 한 번에 배치 임베딩
+- 벡터는 float32 바이트로 저장
+- 실제 임베딩 호출(캐시 miss)은 'embedding' span으로 기록
+
+설정 (.env):
+    EMBEDDING_CACHE_ENABLED=true
+    EMBEDDING_CACHE_MEMORY_SIZE=4096
+    EMBEDDING_CACHE_PATH=~/.cache/umis/embeddings.sqlite3   # 미설정 시 메모리만
+    EMBEDDING_CACHE_MAX_BYTES=268435456
+
+작성: 2026-10-18
+"""
+
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Sequence
+import hashlib
+import sqlite3
+import threading
+import time
+
+from langchain_core.embeddings import Embeddings
+
+from umis_rag.core.tracing import span
+from umis_rag.utils.logger import logger
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 저장소
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class SQLiteEmbeddingStore:
+    """
+    임베딩 디스크 저장소 (SQLite, WAL)
+
+    임베딩은 (model, text)에 대해 결정적이므로 TTL 없이 보관하고,
+    용량(max_bytes)을 넘으면 오래 안 쓴 항목부터 정리합니다.
+    """
+
+    # 조회 시 last_access 갱신 간격 (초) → 읽기마다 쓰기가 생기지 않도록
+    TOUCH_INTERVAL = 300.0
+
+    def __init__(self, path: Path, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_bytes: 최대 벡터 용량 (바이트)
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                vector BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                size INTEGER NOT NULL DEFAULT 0,
+                last_access REAL NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._migrate()
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings(last_access)"
+        )
+        self._conn.commit()
+        self._total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM embeddings"
+        ).fetchone()[0]
+
+    def _migrate(self) -> None:
+        """size / last_access 컬럼이 없던 파일 보정"""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(embeddings)")}
+        if 'size' not in columns:
+            self._conn.execute("ALTER TABLE embeddings ADD COLUMN size INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute("UPDATE embeddings SET size = length(vector)")
+        if 'last_access' not in columns:
+            self._conn.execute("ALTER TABLE embeddings ADD COLUMN last_access REAL NOT NULL DEFAULT 0")
+            self._conn.execute("UPDATE embeddings SET last_access = created_at")
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, List[float]]:
+        """키 목록 조회 (있는 것만 반환)"""
+        found = {}
+        now = time.time()
+        stale = []
+        with self._lock:
+            # SQLite 변수 한도 고려해 나눠서 조회
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector, last_access FROM embeddings WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                for key, blob, last_access in rows:
+                    found[key] = _decode(blob)
+                    if now - last_access >= self.TOUCH_INTERVAL:
+                        stale.append((now, key))
+            if stale:
+                self._conn.executemany("UPDATE embeddings SET last_access = ? WHERE key = ?", stale)
+                self._conn.commit()
+        return found
+
+    def set_many(self, items: Dict[str, List[float]]) -> int:
+        """
+        일괄 저장 (용량 초과 시 LRU eviction)
+
+        Returns:
+            정리된 항목 수
+        """
+        now = time.time()
+        rows = [(key, _encode(vector), now) for key, vector in items.items()]
+        with self._lock:
+            replaced = 0
+            for i in range(0, len(rows), 500):
+                chunk = [row[0] for row in rows[i:i + 500]]
+                placeholders = ",".join("?" * len(chunk))
+                replaced += self._conn.execute(
+                    f"SELECT COALESCE(SUM(size), 0) FROM embeddings WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchone()[0]
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO embeddings (key, vector, created_at, size, last_access)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                [(key, blob, created, len(blob), created) for key, blob, created in rows]
+            )
+            self._total += sum(len(blob) for _, blob, _ in rows) - replaced
+            evicted = self._evict_locked()
+            self._conn.commit()
+        return evicted
+
+    def _evict_locked(self) -> int:
+        """용량 초과 시 last_access 오래된 순으로 max_bytes의 90%까지 정리 (Lock 보유 상태)"""
+        if self._total <= self.max_bytes:
+            return 0
+
+        target = int(self.max_bytes * 0.9)
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM embeddings ORDER BY last_access ASC"
+        ):
+            if self._total <= target:
+                break
+            victims.append((key,))
+            self._total -= size
+
+        self._conn.executemany("DELETE FROM embeddings WHERE key = ?", victims)
+        return len(victims)
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            return self._total
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._total = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _encode(vector: Sequence[float]) -> bytes:
+    return array('f', vector).tobytes()
+
+
+def _decode(blob: bytes) -> List[float]:
+    values = array('f')
+    values.frombytes(blob)
+    return values.tolist()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 캐시 래퍼
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    임베딩 캐시 래퍼
+
+    Example:
+        >>> base = OpenAIEmbeddings(model="text-embedding-3-large")
+        >>> embeddings = CachedEmbeddings(base, model="text-embedding-3-large")
+        >>> v1 = embeddings.embed_query("서울 음식점 수")   # API 호출
+        >>> v2 = embeddings.embed_query("서울 음식점 수")   # 메모리 hit
+    """
+
+    def __init__(
+        self,
+        base: Embeddings,
+        model: str,
+        store: Optional[SQLiteEmbeddingStore] = None,
+        memory_size: int = 4096
+    ):
+        """
+        Args:
+            base: 실제 임베딩 객체 (OpenAIEmbeddings 등)
+            model: 모델 이름 (캐시 키에 포함)
+            store: 디스크 저장소 (None이면 메모리만)
+            memory_size: 메모리 LRU 최대 항목 수
+        """
+        self.base = base
+        self.model = model
+        self.store = store
+        self.memory_size = memory_size
+        self._memory: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'batches': 0}
+
+    def make_key(self, text: str) -> str:
+        """sha256(model, text)"""
+        return hashlib.sha256(f"{self.model}\0{text}".encode('utf-8')).hexdigest()
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Embeddings 인터페이스
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([text], lambda missing: [self.base.embed_query(missing[0])])[0]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(texts, self.base.embed_documents)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        cached, missing = self._lookup([text])
+        if missing:
+            with span('embedding', model=self.model, texts=1):
+                vector = await self.base.aembed_query(text)
+            self._remember({self.make_key(text): vector})
+            return vector
+        return cached[self.make_key(text)]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [self.make_key(t) for t in texts]
+        cached, missing = self._lookup(texts)
+        if missing:
+            with span('embedding', model=self.model, texts=len(missing)):
+                vectors = await self.base.aembed_documents(missing)
+            computed = {self.make_key(t): v for t, v in zip(missing, vectors)}
+            self._remember(computed)
+            cached.update(computed)
+        return [cached[k] for k in keys]
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 내부
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _embed(self, texts: List[str], embed_missing) -> List[List[float]]:
+        """캐시 조회 → miss만 한 번에 임베딩 → 저장"""
+        keys = [self.make_key(t) for t in texts]
+        cached, missing = self._lookup(texts)
+
+        if missing:
+            with span('embedding', model=self.model, texts=len(missing)):
+                vectors = embed_missing(missing)
+            computed = {self.make_key(t): v for t, v in zip(missing, vectors)}
+            self._remember(computed)
+            cached.update(computed)
+
+        return [cached[k] for k in keys]
+
+    def _lookup(self, texts: Sequence[str]):
+        """
+        메모리 → 디스크 순 조회
+
+        Returns:
+            ({key: vector}, [miss 텍스트 (중복 제거, 순서 유지)])
+        """
+        found: Dict[str, List[float]] = {}
+        pending: Dict[str, str] = {}
+
+        with self._lock:
+            for text in texts:
+                key = self.make_key(text)
+                if key in found or key in pending:
+                    continue
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    found[key] = vector
+                    self.stats['memory_hits'] += 1
+                else:
+                    pending[key] = text
+
+        if pending and self.store is not None:
+            try:
+                on_disk = self.store.get_many(list(pending))
+            except Exception as e:
+                logger.warning(f"[EmbeddingCache] 디스크 조회 실패 → 무시: {e}")
+                on_disk = {}
+            if on_disk:
+                self._remember(on_disk, persist=False)
+                found.update(on_disk)
+                for key in on_disk:
+                    pending.pop(key)
+                with self._lock:
+                    self.stats['disk_hits'] += len(on_disk)
+
+        if pending:
+            with self._lock:
+                self.stats['misses'] += len(pending)
+                self.stats['batches'] += 1
+
+        return found, list(pending.values())
+
+    def _remember(self, items: Dict[str, List[float]], persist: bool = True) -> None:
+        """메모리 LRU에 추가 (+ 디스크 저장)"""
+        with self._lock:
+            for key, vector in items.items():
+                self._memory[key] = vector
+                self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+        if persist and self.store is not None and items:
+            try:
+                self.store.set_many(items)
+            except Exception as e:
+                logger.warning(f"[EmbeddingCache] 디스크 저장 실패: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """hit/miss 통계"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats['memory_entries'] = len(self._memory)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+        stats['hit_rate'] = round((lookups - stats['misses']) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def __getattr__(self, name: str) -> Any:
+        # model, dimensions 등 원본 속성 접근 위임
+        if name == 'base':
+            raise AttributeError(name)
+        return getattr(self.base, name)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 공유 디스크 저장소
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_stores: Dict[str, SQLiteEmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(path: Path, max_bytes: int = 256 * 1024 * 1024) -> SQLiteEmbeddingStore:
+    """경로별 디스크 저장소 (모델은 키로 구분하므로 파일 하나를 공유)"""
+    key = str(Path(path).expanduser().resolve())
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = SQLiteEmbeddingStore(Path(key), max_bytes=max_bytes)
+            _stores[key] = store
+        return store
@@ -0,0 +1,561 @@
+"""
+LLM Response Cache for UMIS RAG System
+
+동일한 (model, params, prompt) 조합의 LLM 응답을 디스크에 캐싱 (v7.11.2)
+
+목적:
+- 같은 배치 재실행 시 API 비용/지연 제거
+- Estimator Stage 1-3의 모든 LLM 호출 경로에서 공유
+
+특징:
+- Content-addressed: sha256(model, params, prompt) 키
+- TTL (기본 7일), 용량 기반 LRU eviction
+- hit/miss 통계
+- bypass 플래그 (호출 단위 또는 전역)
+- Backend 교체 가능 (LLMCacheBackend)
+- invoke() / ainvoke(): 'llm' span (모델, 캐시 hit, 토큰 수) 기록
+
+설정 (.env):
+    LLM_CACHE_ENABLED=true
+    LLM_CACHE_PATH=./data/cache/llm_responses.sqlite3
+    LLM_CACHE_TTL_SECONDS=604800
+    LLM_CACHE_MAX_MB=512
+
+작성: 2026-10-18
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional, Dict, Any, Callable, Awaitable
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from umis_rag.core.cache_stats import CacheStats
+from umis_rag.core.config import settings
+from umis_rag.core.tracing import record_llm_call, span
+from umis_rag.utils.logger import logger
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Backends
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class LLMCacheBackend(ABC):
+    """
+    캐시 저장소 인터페이스
+
+    SQLite 외 다른 저장소(LMDB, Redis 등)는 이 인터페이스를 구현합니다.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """키 조회 (만료/없음 시 None)"""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> int:
+        """
+        저장
+
+        Returns:
+            eviction된 항목 수
+        """
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """키 삭제"""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """전체 삭제"""
+        ...
+
+    @abstractmethod
+    def info(self) -> Dict[str, Any]:
+        """저장소 상태 (항목 수, 크기 등)"""
+        ...
+
+
+class SQLiteLLMCache(LLMCacheBackend):
+    """
+    SQLite 기반 캐시 저장소
+
+    - 단일 파일, WAL 모드
+    - 만료 항목은 조회 시 / PURGE_INTERVAL마다 쓰기 시 제거
+    - 총 크기(메모리 누적값)가 max_bytes를 넘으면 last_access 기준 LRU eviction
+      (max_bytes의 90%까지 정리)
+    - last_access는 touch_interval 단위로만 갱신 (hit마다 쓰기/commit 방지)
+    """
+
+    # 만료 항목 정리 간격 (초)
+    PURGE_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = 512 * 1024 * 1024,
+        default_ttl_seconds: Optional[float] = 7 * 24 * 3600,
+        touch_interval: float = 60.0
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_bytes: 최대 저장 용량 (bytes)
+            default_ttl_seconds: 기본 TTL (None이면 만료 없음)
+            touch_interval: hit 시 last_access 갱신 최소 간격 (초)
+        """
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.default_ttl_seconds = default_ttl_seconds
+        self.touch_interval = touch_interval
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_expires_at ON llm_cache(expires_at)"
+        )
+        self._conn.commit()
+
+        # 누적 용량 (쓰기/삭제 시 갱신)
+        self._total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM llm_cache"
+        ).fetchone()[0]
+        self._last_purge = 0.0
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, expires_at, last_access FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, size, expires_at, last_access = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._total -= size
+                return None
+
+            # LRU 순서는 touch_interval 단위로만 갱신
+            if now - last_access >= self.touch_interval:
+                self._conn.execute(
+                    "UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key)
+                )
+                self._conn.commit()
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[float] = None) -> int:
+        now = time.time()
+        ttl = ttl_seconds if ttl_seconds is not None else self.default_ttl_seconds
+        expires_at = now + ttl if ttl else None
+        size = len(value.encode('utf-8'))
+
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, value, size, now, expires_at, now)
+            )
+            self._total += size - (row[0] if row else 0)
+            evicted = self._evict_locked(now)
+            self._conn.commit()
+            return evicted
+
+    def _evict_locked(self, now: float) -> int:
+        """만료 항목(PURGE_INTERVAL마다) + LRU eviction (Lock 보유 상태에서 호출)"""
+        evicted = 0
+        if now - self._last_purge >= self.PURGE_INTERVAL or self._total > self.max_bytes:
+            self._last_purge = now
+            expired_size = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM llm_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (now,)
+            ).fetchone()[0]
+            if expired_size:
+                evicted = self._conn.execute(
+                    "DELETE FROM llm_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+                ).rowcount
+                self._total -= expired_size
+
+        if self._total <= self.max_bytes:
+            return evicted
+
+        target = int(self.max_bytes * 0.9)
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM llm_cache ORDER BY last_access ASC"
+        ):
+            if self._total <= target:
+                break
+            victims.append((key,))
+            self._total -= size
+
+        self._conn.executemany("DELETE FROM llm_cache WHERE key = ?", victims)
+        return evicted + len(victims)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return
+            self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            self._conn.commit()
+            self._total -= row[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+            self._total = 0
+
+    def info(self) -> Dict[str, Any]:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()
+        return {
+            'backend': 'sqlite',
+            'path': str(self.path),
+            'entries': count,
+            'size_bytes': total,
+            'max_bytes': self.max_bytes
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Cache Facade
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class LLMResponseCache:
+    """
+    LLM 응답 캐시
+
+    Example:
+        >>> cache = get_llm_cache()
+        >>> content = cache.get_or_call(
+        ...     model="gpt-4o-mini",
+        ...     params={"temperature": 0.3},
+        ...     prompt=prompt,
+        ...     call=lambda: llm.invoke(prompt).content
+        ... )
+        >>> cache.stats.hit_rate
+    """
+
+    def __init__(
+        self,
+        backend: Optional[LLMCacheBackend] = None,
+        enabled: bool = True
+    ):
+        """
+        Args:
+            backend: 저장소 (None이면 캐시 비활성)
+            enabled: 전역 활성화 여부 (False면 모든 호출 bypass)
+        """
+        self.backend = backend
+        self.enabled = enabled and backend is not None
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, params: Optional[Dict[str, Any]], prompt: str) -> str:
+        """
+        Content-addressed 키 생성
+
+        Args:
+            model: 모델 이름
+            params: 응답에 영향을 주는 파라미터 (temperature, max_tokens, system 등)
+            prompt: 프롬프트
+
+        Returns:
+            sha256 hex digest
+        """
+        payload = json.dumps(
+            {'model': model, 'params': params or {}, 'prompt': prompt},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get_or_call(
+        self,
+        model: str,
+        params: Optional[Dict[str, Any]],
+        prompt: str,
+        call: Callable[[], str],
+        bypass: bool = False,
+        ttl_seconds: Optional[float] = None
+    ) -> str:
+        """
+        캐시 조회 → miss면 call() 실행 후 저장
+
+        Args:
+            model: 모델 이름
+            params: 응답에 영향을 주는 파라미터
+            prompt: 프롬프트
+            call: 실제 LLM 호출 (응답 문자열 반환)
+            bypass: True면 캐시를 읽지도 쓰지도 않음
+            ttl_seconds: 항목별 TTL (None이면 Backend 기본값)
+
+        Returns:
+            LLM 응답 문자열
+        """
+        if bypass or not self.enabled:
+            self._count('bypassed')
+            return call()
+
+        key = self.make_key(model, params, prompt)
+        cached = self._lookup(key, model)
+        if cached is not None:
+            return cached
+
+        response = call()
+        self._store(key, response, ttl_seconds)
+        return response
+
+    async def aget_or_call(
+        self,
+        model: str,
+        params: Optional[Dict[str, Any]],
+        prompt: str,
+        acall: Callable[[], Awaitable[str]],
+        bypass: bool = False,
+        ttl_seconds: Optional[float] = None
+    ) -> str:
+        """
+        get_or_call()의 async 버전 (acall: 실제 LLM 비동기 호출)
+
+        Note:
+            로컬 SQLite 조회/저장은 짧으므로 이벤트 루프에서 직접 수행합니다.
+        """
+        if bypass or not self.enabled:
+            self._count('bypassed')
+            return await acall()
+
+        key = self.make_key(model, params, prompt)
+        cached = self._lookup(key, model)
+        if cached is not None:
+            return cached
+
+        response = await acall()
+        self._store(key, response, ttl_seconds)
+        return response
+
+    def _lookup(self, key: str, model: str) -> Optional[str]:
+        """저장소 조회 + 통계 (조회 실패는 miss로 처리)"""
+        try:
+            cached = self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"[LLMCache] 조회 실패 → 캐시 무시: {e}")
+            cached = None
+
+        if cached is not None:
+            self._count('hits')
+            logger.debug(f"[LLMCache] HIT {key[:12]} ({model})")
+        else:
+            self._count('misses')
+        return cached
+
+    def _store(self, key: str, response: Any, ttl_seconds: Optional[float]) -> None:
+        """응답 저장 (빈 응답/비문자열은 저장 안 함)"""
+        if not isinstance(response, str) or not response:
+            return
+        try:
+            evicted = self.backend.set(key, response, ttl_seconds)
+            self._count('writes')
+            if evicted:
+                self._count('evictions', evicted)
+        except Exception as e:
+            logger.warning(f"[LLMCache] 저장 실패: {e}")
+
+    def invoke(
+        self,
+        llm: Any,
+        prompt: str,
+        bypass: bool = False,
+        **invoke_kwargs
+    ) -> str:
+        """
+        ChatOpenAI 등 LangChain Chat 모델 호출 (캐시 경유)
+
+        Args:
+            llm: LangChain Chat 모델 (invoke(prompt) → message.content)
+            prompt: 프롬프트
+            bypass: 캐시 bypass
+            **invoke_kwargs: llm.invoke에 전달 (timeout 등, 키에 포함 안 됨)
+
+        Returns:
+            응답 content 문자열
+        """
+        model = get_llm_model_name(llm)
+        response = {}
+
+        def call() -> str:
+            response['message'] = llm.invoke(prompt, **invoke_kwargs)
+            return response['message'].content
+
+        with span('llm', model=model) as current:
+            content = self.get_or_call(
+                model=model,
+                params=get_llm_cache_params(llm),
+                prompt=prompt,
+                call=call,
+                bypass=bypass
+            )
+            record_llm_call(current, model, self._cache_outcome(response, bypass), response.get('message'))
+        return content
+
+    async def ainvoke(
+        self,
+        llm: Any,
+        prompt: str,
+        bypass: bool = False,
+        **invoke_kwargs
+    ) -> str:
+        """invoke()의 async 버전 (llm.ainvoke 사용)"""
+        model = get_llm_model_name(llm)
+        response = {}
+
+        async def acall() -> str:
+            response['message'] = await llm.ainvoke(prompt, **invoke_kwargs)
+            return response['message'].content
+
+        with span('llm', model=model) as current:
+            content = await self.aget_or_call(
+                model=model,
+                params=get_llm_cache_params(llm),
+                prompt=prompt,
+                acall=acall,
+                bypass=bypass
+            )
+            record_llm_call(current, model, self._cache_outcome(response, bypass), response.get('message'))
+        return content
+
+    def _cache_outcome(self, response: Dict[str, Any], bypass: bool) -> str:
+        """트레이싱용 캐시 결과 (hit: LLM 미호출)"""
+        if bypass or not self.enabled:
+            return 'bypass'
+        return 'miss' if 'message' in response else 'hit'
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self.stats, name, getattr(self.stats, name) + amount)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 + 저장소 상태"""
+        stats = self.stats.to_dict()
+        stats['enabled'] = self.enabled
+        if self.backend is not None:
+            try:
+                stats.update(self.backend.info())
+            except Exception as e:
+                logger.debug(f"[LLMCache] 저장소 상태 조회 실패: {e}")
+        return stats
+
+    def clear(self) -> None:
+        """저장소 비우기"""
+        if self.backend is not None:
+            self.backend.clear()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 헬퍼
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def get_llm_model_name(llm: Any) -> str:
+    """LangChain Chat 모델의 모델 이름"""
+    for attr in ('model_name', 'model'):
+        value = getattr(llm, attr, None)
+        if isinstance(value, str) and value:
+            return value
+    return llm.__class__.__name__
+
+
+def get_llm_cache_params(llm: Any) -> Dict[str, Any]:
+    """응답에 영향을 주는 LLM 파라미터 (캐시 키용)"""
+    params = {}
+    for attr in ('temperature', 'max_tokens', 'top_p', 'reasoning_effort'):
+        value = getattr(llm, attr, None)
+        if isinstance(value, (int, float, str)) and not isinstance(value, bool):
+            params[attr] = value
+    return params
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 싱글톤
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_cache_instance: Optional[LLMResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LLMResponseCache:
+    """
+    기본 LLM 응답 캐시 (싱글톤)
+
+    settings.llm_cache_enabled가 False면 항상 bypass하는 캐시를 반환합니다.
+
+    Returns:
+        LLMResponseCache 인스턴스
+    """
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                if settings.llm_cache_enabled:
+                    backend = SQLiteLLMCache(
+                        path=settings.llm_cache_path,
+                        max_bytes=settings.llm_cache_max_mb * 1024 * 1024,
+                        default_ttl_seconds=settings.llm_cache_ttl_seconds
+                    )
+                    _cache_instance = LLMResponseCache(backend=backend)
+                    logger.info(f"[LLMCache] 활성화: {settings.llm_cache_path}")
+                else:
+                    _cache_instance = LLMResponseCache(backend=None, enabled=False)
+    return _cache_instance
+
+
+def set_llm_cache(cache: Optional[LLMResponseCache]) -> None:
+    """
+    기본 캐시 교체 (Backend 교체/테스트용)
+
+    Args:
+        cache: 새 캐시 (None이면 다음 get_llm_cache() 호출 시 settings로 재생성)
+    """
+    global _cache_instance
+    with _cache_lock:
+        _cache_instance = cache
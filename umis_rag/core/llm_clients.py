@@ -0,0 +1,370 @@
+"""
+LLM Client Registry for UMIS RAG System
+
+프로세스 단위 ChatOpenAI 클라이언트 공유 (v7.11.2)
+
+목적:
+- ExternalLLM, Prior/Fermi/Guardrail이 각자 ChatOpenAI를 만들면
+  클라이언트마다 HTTP 풀이 생기고 TLS 핸드셰이크가 반복됨
+- 짧은 Stage 1/2 호출에서 연결 수립 시간이 무시할 수 없는 비중
+
+특징:
+- (model, params) 키로 ChatOpenAI 재사용
+- 모든 클라이언트가 하나의 keep-alive HTTP 풀 공유
+  (sync 1개 / async는 이벤트 루프별 1개, 루프 종료 시 닫힘)
+- 풀 한도 설정 가능 (.env)
+- warm_up_llm_clients(): 시작 시 클라이언트 생성 + 연결 수립
+
+설정 (.env):
+    LLM_HTTP_MAX_CONNECTIONS=100
+    LLM_HTTP_MAX_KEEPALIVE=20
+    LLM_HTTP_KEEPALIVE_EXPIRY=60
+    LLM_HTTP_WARM_UP=true
+
+작성: 2026-10-18
+"""
+
+from typing import AsyncIterator, Optional, Dict, Any, Iterable, Tuple
+from weakref import WeakKeyDictionary
+import asyncio
+import threading
+
+import httpx
+from langchain_openai import ChatOpenAI
+
+from umis_rag.core.config import settings
+from umis_rag.utils.logger import logger
+
+
+OPENAI_API_BASE = "https://api.openai.com/v1"
+
+# Estimator 호출 지점별 ChatOpenAI 파라미터 (warm-up과 호출 지점이 같은 키를 쓰도록)
+ESTIMATOR_CLIENT_PARAMS: Dict[str, Dict[str, Any]] = {
+    'prior': {'temperature': 0.3},      # Stage 2: 약간의 다양성 허용
+    'fermi': {'temperature': 0.2},      # Stage 3
+    'guardrail': {'temperature': 0.1},  # 일관된 판단을 위해 낮은 temperature
+}
+
+
+class _LoopLocalAsyncTransport(httpx.AsyncBaseTransport):
+    """
+    이벤트 루프별 httpx.AsyncHTTPTransport
+
+    httpcore 연결 풀(소켓, 락)은 처음 사용한 이벤트 루프에 묶이므로
+    asyncio.run()이 끝난 뒤 같은 풀을 다른 루프에서 쓰면
+    "Event loop is closed" 오류가 납니다. 루프마다 풀을 따로 만들고,
+    asyncio.run() 종료 시(shutdown_asyncgens) 그 루프 안에서 닫습니다.
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        self.limits = limits
+        self._lock = threading.Lock()
+        # 루프 → (transport, 종료용 async generator)
+        self._pools: "WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple]" = WeakKeyDictionary()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        transport = await self._transport()
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """현재 루프의 풀 종료"""
+        with self._lock:
+            pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool[1].aclose()
+
+    def close(self) -> None:
+        """실행 중이 아닌 루프의 풀 종료 (닫힌 루프는 종료 시 이미 정리됨)"""
+        with self._lock:
+            pools = list(self._pools.items())
+            self._pools.clear()
+        for loop, (_, closer) in pools:
+            if not loop.is_closed() and not loop.is_running():
+                loop.run_until_complete(closer.aclose())
+
+    @property
+    def pool_count(self) -> int:
+        with self._lock:
+            return len(self._pools)
+
+    async def _transport(self) -> httpx.AsyncHTTPTransport:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            pool = self._pools.get(loop)
+            if pool is None:
+                transport = httpx.AsyncHTTPTransport(limits=self.limits)
+                # closer는 loop를 참조하지 않음 (WeakKeyDictionary 키 유지 방지)
+                pool = (transport, self._close_on_shutdown(transport))
+                self._pools[loop] = pool
+                created = True
+            else:
+                created = False
+        if created:
+            # 첫 iteration에서 루프의 async generator로 등록 → 루프 종료 시 aclose
+            await pool[1].__anext__()
+        return pool[0]
+
+    async def _close_on_shutdown(self, transport: httpx.AsyncHTTPTransport) -> AsyncIterator[None]:
+        try:
+            yield
+        finally:
+            with self._lock:
+                for loop, pool in list(self._pools.items()):
+                    if pool[0] is transport:
+                        del self._pools[loop]
+            await transport.aclose()
+
+
+class LLMClientRegistry:
+    """
+    ChatOpenAI 클라이언트 레지스트리 (thread-safe)
+
+    Example:
+        >>> registry = get_llm_client_registry()
+        >>> llm = registry.get_chat_model("gpt-4o-mini", temperature=0.2)
+        >>> llm is registry.get_chat_model("gpt-4o-mini", temperature=0.2)
+        True
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0
+    ):
+        """
+        Args:
+            max_connections: 풀 최대 연결 수
+            max_keepalive_connections: 유지할 keep-alive 연결 수
+            keepalive_expiry: 유휴 연결 유지 시간 (초)
+        """
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry
+        )
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple, ChatOpenAI] = {}
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+        self._async_transport: Optional[_LoopLocalAsyncTransport] = None
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # HTTP 풀
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """공유 sync HTTP 클라이언트 (Lazy)"""
+        if self._http_client is None:
+            with self._lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(limits=self.limits)
+        return self._http_client
+
+    @property
+    def http_async_client(self) -> httpx.AsyncClient:
+        """
+        공유 async HTTP 클라이언트 (Lazy)
+
+        Note:
+            클라이언트는 하나지만 연결 풀은 이벤트 루프별로 따로 두고,
+            asyncio.run()이 끝날 때 그 루프의 풀을 닫습니다.
+            → asyncio.run()을 여러 번 호출해도 이전 루프의 연결을 쓰지 않음
+        """
+        if self._http_async_client is None:
+            with self._lock:
+                if self._http_async_client is None:
+                    self._async_transport = _LoopLocalAsyncTransport(self.limits)
+                    self._http_async_client = httpx.AsyncClient(
+                        limits=self.limits, transport=self._async_transport
+                    )
+        return self._http_async_client
+
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 async 연결 풀 종료 (클라이언트는 계속 사용 가능)"""
+        if self._async_transport is not None:
+            await self._async_transport.aclose()
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # ChatOpenAI
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def get_chat_model(self, model: str, **params) -> ChatOpenAI:
+        """
+        (model, params)별 ChatOpenAI 반환 (없으면 생성)
+
+        Args:
+            model: 모델 이름
+            **params: ChatOpenAI 파라미터 (temperature, max_tokens 등)
+
+        Returns:
+            공유 HTTP 풀을 쓰는 ChatOpenAI
+        """
+        params.setdefault('openai_api_key', settings.openai_api_key)
+        key = self._make_key(model, params)
+
+        llm = self._clients.get(key)
+        if llm is not None:
+            return llm
+
+        http_client = self.http_client
+        http_async_client = self.http_async_client
+
+        with self._lock:
+            llm = self._clients.get(key)
+            if llm is None:
+                llm = ChatOpenAI(
+                    model=model,
+                    http_client=http_client,
+                    http_async_client=http_async_client,
+                    **params
+                )
+                self._clients[key] = llm
+                logger.debug(f"[LLMClients] 생성: {model} {self._describe(params)}")
+        return llm
+
+    def warm_up(
+        self,
+        models: Iterable[Tuple[str, Dict[str, Any]]],
+        connect: bool = True
+    ) -> int:
+        """
+        클라이언트 미리 생성 + (선택) API 호스트 연결 수립
+
+        연결 수립은 인증이 필요 없는 HEAD 요청으로 TLS 핸드셰이크만 하고,
+        연결은 keep-alive 풀에 남아 첫 LLM 호출이 재사용합니다.
+
+        Args:
+            models: [(model, params), ...]
+            connect: 연결 수립 여부
+
+        Returns:
+            생성/확인한 클라이언트 수
+        """
+        count = 0
+        for model, params in models:
+            self.get_chat_model(model, **dict(params))
+            count += 1
+
+        if connect:
+            try:
+                self.http_client.head(OPENAI_API_BASE, timeout=5.0)
+            except Exception as e:
+                logger.debug(f"[LLMClients] warm-up 연결 실패 (무시): {e}")
+
+        logger.info(f"[LLMClients] warm-up 완료: {count}개 클라이언트")
+        return count
+
+    def close(self) -> None:
+        """HTTP 풀 종료 + 클라이언트 정리"""
+        with self._lock:
+            self._clients.clear()
+            if self._http_client is not None:
+                self._http_client.close()
+                self._http_client = None
+            async_transport = self._async_transport
+            self._http_async_client = None
+            self._async_transport = None
+        # 실행 중인 루프의 풀은 루프 종료 시(asyncio.run) 닫힘
+        if async_transport is not None:
+            async_transport.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """레지스트리 상태"""
+        with self._lock:
+            return {
+                'clients': len(self._clients),
+                'async_pools': self._async_transport.pool_count if self._async_transport else 0,
+                'max_connections': self.limits.max_connections,
+                'max_keepalive_connections': self.limits.max_keepalive_connections,
+                'keepalive_expiry': self.limits.keepalive_expiry
+            }
+
+    @staticmethod
+    def _make_key(model: str, params: Dict[str, Any]) -> Tuple:
+        """레지스트리 키 (API 키는 키에 포함하되 로그에는 남기지 않음)"""
+        return (model,) + tuple(sorted((k, repr(v)) for k, v in params.items()))
+
+    @staticmethod
+    def _describe(params: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in params.items() if 'key' not in k}
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 싱글톤
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_registry_instance: Optional[LLMClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_llm_client_registry() -> LLMClientRegistry:
+    """
+    기본 클라이언트 레지스트리 (싱글톤, settings의 풀 한도 사용)
+    """
+    global _registry_instance
+    if _registry_instance is None:
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = LLMClientRegistry(
+                    max_connections=settings.llm_http_max_connections,
+                    max_keepalive_connections=settings.llm_http_max_keepalive,
+                    keepalive_expiry=settings.llm_http_keepalive_expiry
+                )
+    return _registry_instance
+
+
+def get_chat_model(model: str, **params) -> ChatOpenAI:
+    """
+    공유 ChatOpenAI 반환 (get_llm_client_registry().get_chat_model 단축)
+
+    Example:
+        >>> llm = get_chat_model("gpt-4o-mini", temperature=0.2)
+    """
+    return get_llm_client_registry().get_chat_model(model, **params)
+
+
+def warm_up_llm_clients(connect: bool = True) -> int:
+    """
+    Estimator(Prior / Fermi / Guardrail) 클라이언트를 미리 생성 (시작 시 호출)
+
+    Args:
+        connect: API 호스트 연결 수립 여부
+
+    Returns:
+        생성/확인한 클라이언트 수
+    """
+    if settings.llm_mode.lower() == "cursor":
+        logger.info("[LLMClients] Cursor 모드 → warm-up 생략")
+        return 0
+
+    from umis_rag.core.model_router import select_model_with_config
+
+    models = [
+        (select_model_with_config(2)[0], ESTIMATOR_CLIENT_PARAMS['prior']),
+        (select_model_with_config(3)[0], ESTIMATOR_CLIENT_PARAMS['fermi']),
+        (settings.llm_model, ESTIMATOR_CLIENT_PARAMS['guardrail']),
+    ]
+    return get_llm_client_registry().warm_up(models, connect=connect)
+
+
+def set_llm_client_registry(registry: Optional[LLMClientRegistry]) -> None:
+    """
+    기본 레지스트리 교체 (Fake LLM 벤치마크/테스트용)
+
+    Args:
+        registry: 새 레지스트리 (None이면 다음 호출 시 settings로 재생성)
+    """
+    global _registry_instance
+    with _registry_lock:
+        _registry_instance = registry
+
+
+def reset_llm_client_registry() -> None:
+    """레지스트리 초기화 (테스트/설정 변경용)"""
+    global _registry_instance
+    with _registry_lock:
+        if _registry_instance is not None:
+            _registry_instance.close()
+        _registry_instance = None
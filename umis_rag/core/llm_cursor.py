@@ -157,6 +157,32 @@ class CursorLLM(BaseLLM):
             "suggested_range": None
         }
     
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Async (v7.11.2): I/O 없음 → 동기 메서드 직접 실행
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    
+    async def aestimate(self, question: str, context: Any, **kwargs) -> Optional[Any]:
+        """estimate()의 async 버전"""
+        return self.estimate(question, context, **kwargs)
+    
+    async def adecompose(
+        self,
+        question: str,
+        context: Any,
+        budget: Any,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """decompose()의 async 버전"""
+        return self.decompose(question, context, budget, **kwargs)
+    
+    async def aevaluate_certainty(self, question: str, value: Any, context: Any, **kwargs) -> str:
+        """evaluate_certainty()의 async 버전"""
+        return self.evaluate_certainty(question, value, context, **kwargs)
+    
+    async def avalidate_boundary(self, value: Any, context: Any, **kwargs) -> Dict[str, Any]:
+        """validate_boundary()의 async 버전"""
+        return self.validate_boundary(value, context, **kwargs)
+    
     def is_native(self) -> bool:
         """Native(Cursor) 모드"""
         return True
@@ -229,6 +255,10 @@ class CursorLLMProvider(LLMProvider):
         logger.debug(f"[CursorLLMProvider] {task.value} → CursorLLM")
         return CursorLLM(task)
     
+    def supports_async(self) -> bool:
+        """CursorLLM은 I/O가 없어 이벤트 루프에서 바로 실행"""
+        return True
+    
     def is_native(self) -> bool:
         """Native(Cursor) Provider"""
         return True
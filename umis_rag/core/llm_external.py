@@ -16,6 +16,9 @@ from typing import Optional, Dict, Any
 from umis_rag.core.llm_interface import BaseLLM, LLMProvider, TaskType, TASK_TO_STAGE
 from umis_rag.core.model_router import ModelRouter, get_model_router
 from umis_rag.core.model_configs import model_config_manager
+from umis_rag.core.llm_cache import get_llm_cache, get_llm_cache_params
+from umis_rag.core.llm_clients import get_chat_model, warm_up_llm_clients
+from umis_rag.core.config import settings
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
@@ -25,6 +28,8 @@ import re
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = "You are an expert market analyst and estimator."
+
 
 class ExternalLLM(BaseLLM):
     """
@@ -80,8 +85,9 @@ class ExternalLLM(BaseLLM):
             reasoning_effort="medium" if self.stage == 3 else None
         )
         
-        return ChatOpenAI(
-            model=self.model_name,
+        # 프로세스 공유 클라이언트 (같은 모델/파라미터의 Task끼리 재사용)
+        return get_chat_model(
+            self.model_name,
             temperature=params.get("temperature", 0.7),
             max_tokens=params.get("max_tokens", 4000),
         )
@@ -217,6 +223,62 @@ class ExternalLLM(BaseLLM):
         logger.info(f"[External Boundary] 완료: valid={result['is_valid']}")
         return result
     
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Async (v7.11.2): chain.ainvoke 사용
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    
+    async def aestimate(
+        self,
+        question: str,
+        context: Any,
+        **kwargs
+    ) -> Optional[Any]:
+        """estimate()의 async 버전"""
+        prompt = self._build_prior_prompt(question, context)
+        response = await self._acall_llm(prompt)
+        result = self._parse_prior_response(response, question, context)
+        
+        if not result:
+            logger.warning(f"[External Prior] 파싱 실패")
+        return result
+    
+    async def adecompose(
+        self,
+        question: str,
+        context: Any,
+        budget: Any,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """decompose()의 async 버전"""
+        prompt = self._build_fermi_prompt(question, context, budget)
+        response = await self._acall_llm(prompt)
+        result = self._parse_fermi_response(response)
+        
+        if not result:
+            logger.warning(f"[External Fermi] 파싱 실패")
+        return result
+    
+    async def aevaluate_certainty(
+        self,
+        question: str,
+        value: Any,
+        context: Any,
+        **kwargs
+    ) -> str:
+        """evaluate_certainty()의 async 버전"""
+        prompt = self._build_certainty_prompt(question, value, context)
+        return self._parse_certainty(await self._acall_llm(prompt))
+    
+    async def avalidate_boundary(
+        self,
+        value: Any,
+        context: Any,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """validate_boundary()의 async 버전"""
+        prompt = self._build_boundary_prompt(value, context)
+        return self._parse_boundary_response(await self._acall_llm(prompt))
+    
     def is_native(self) -> bool:
         """External 모드"""
         return False
@@ -226,20 +288,48 @@ class ExternalLLM(BaseLLM):
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     
     def _call_llm(self, prompt: str) -> str:
-        """LLM API 호출"""
+        """LLM API 호출 (LLM 응답 캐시 경유)"""
         try:
-            chain = ChatPromptTemplate.from_messages([
-                ("system", "You are an expert market analyst and estimator."),
-                ("user", "{prompt}")
-            ]) | self.llm | StrOutputParser()
-            
-            response = chain.invoke({"prompt": prompt})
-            return response
+            chain = self._build_chain()
+            return get_llm_cache().get_or_call(
+                model=self.model_name,
+                params=self._cache_params(),
+                prompt=prompt,
+                call=lambda: chain.invoke({"prompt": prompt})
+            )
         
         except Exception as e:
             logger.error(f"[ExternalLLM] API 호출 실패: {e}")
             raise
     
+    async def _acall_llm(self, prompt: str) -> str:
+        """LLM API 호출 (async, LLM 응답 캐시 경유)"""
+        try:
+            chain = self._build_chain()
+            return await get_llm_cache().aget_or_call(
+                model=self.model_name,
+                params=self._cache_params(),
+                prompt=prompt,
+                acall=lambda: chain.ainvoke({"prompt": prompt})
+            )
+        
+        except Exception as e:
+            logger.error(f"[ExternalLLM] API 호출 실패: {e}")
+            raise
+    
+    def _build_chain(self):
+        """system + user 프롬프트 체인"""
+        return ChatPromptTemplate.from_messages([
+            ("system", SYSTEM_PROMPT),
+            ("user", "{prompt}")
+        ]) | self.llm | StrOutputParser()
+    
+    def _cache_params(self) -> Dict[str, Any]:
+        """캐시 키용 파라미터 (system 프롬프트 포함)"""
+        params = get_llm_cache_params(self.llm)
+        params['system'] = SYSTEM_PROMPT
+        return params
+    
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 프롬프트 생성
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -532,6 +622,9 @@ class ExternalLLMProvider(LLMProvider):
         """
         self.router = router or get_model_router()
         logger.info("[ExternalLLMProvider] 초기화 (External 모드)")
+        
+        if settings.llm_http_warm_up:
+            warm_up_llm_clients()
     
     def get_llm(self, task: TaskType) -> BaseLLM:
         """
@@ -550,6 +643,10 @@ class ExternalLLMProvider(LLMProvider):
         """External 모드"""
         return False
     
+    def supports_async(self) -> bool:
+        """ExternalLLM은 ainvoke 기반 네이티브 async 지원"""
+        return True
+    
     def get_mode_info(self) -> Dict[str, Any]:
         """
         External 모드 정보
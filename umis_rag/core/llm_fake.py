@@ -0,0 +1,382 @@
+"""
+Fake LLM Implementation for UMIS RAG System
+
+네트워크 / 토큰 비용 없이 Estimator 파이프라인을 돌리기 위한 결정적 구현 (v7.11.2)
+
+목적:
+- 벤치마크 / CI에서 오케스트레이션 오버헤드 회귀를 잡기
+- MockLLMProvider(llm_interface 사용 가이드)는 예시일 뿐 실제로 응답하지 않음
+
+특징:
+- 같은 프롬프트 → 항상 같은 응답 (sha256 기반 값)
+- 프롬프트 종류 판별: Prior / Fermi 분해 / Guardrail
+- 호출 지연 주입 (고정 + 지터, 종류별 지정 가능), sync / async 모두
+- 종류별 호출 수 집계 (thread-safe)
+- FakeLLMClientRegistry: get_chat_model()이 FakeChatModel을 반환
+  (Prior / Fermi / Guardrail은 ChatOpenAI를 레지스트리에서 받아 직접 호출)
+- FakeEmbeddings: 텍스트 해시 기반 결정적 단위 벡터
+
+Example:
+    >>> from umis_rag.core.llm_clients import set_llm_client_registry
+    >>> provider = FakeLLMProvider(latency=0.02)
+    >>> set_llm_client_registry(provider.client_registry)
+    >>> estimator = EstimatorRAG(llm_provider=provider)
+    >>> estimator.estimate("서울 음식점 수는?")
+    >>> provider.responder.get_stats()   # {'prior': 4, 'fermi_decomposition': 1, ...}
+
+작성: 2026-10-18
+"""
+
+from typing import Optional, Dict, Any, List, Tuple
+from contextlib import contextmanager
+import asyncio
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage
+
+from umis_rag.core.llm_interface import BaseLLM, LLMProvider, TaskType
+from umis_rag.core.llm_clients import LLMClientRegistry
+
+
+# 프롬프트 종류 판별 표지 (각 Estimator 프롬프트의 고정 문구)
+PROMPT_MARKERS: Tuple[Tuple[str, str], ...] = (
+    ('fermi_decomposition', "Fermi 추정 전문가"),
+    ('guardrail', '"relationship"'),
+    ('guardrail', '"is_hard"'),
+    ('prior', "시장 분석 전문가"),
+)
+
+# 분해식 템플릿 (질문 해시로 선택)
+DECOMPOSITION_TEMPLATES: Tuple[Tuple[str, Dict[str, str]], ...] = (
+    ("결과 = 모수 * 비율", {'모수': '전체 모수', '비율': '해당 비율'}),
+    ("결과 = 대상수 * 단가 * 빈도", {'대상수': '대상 수', '단가': '평균 단가', '빈도': '연간 빈도'}),
+    ("결과 = 총량 / 단위규모", {'총량': '전체 총량', '단위규모': '단위당 규모'}),
+)
+
+_QUESTION_LINE = re.compile(r'질문(?: A \(추정 대상\))?:\s*(.+)')
+
+
+def _digest(text: str) -> int:
+    return int(hashlib.sha256(text.encode('utf-8')).hexdigest()[:12], 16)
+
+
+class FakeResponder:
+    """
+    프롬프트 → 결정적 응답 (thread-safe 집계)
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        latency_by_kind: Optional[Dict[str, float]] = None,
+        seed: int = 0
+    ):
+        """
+        Args:
+            latency: 호출당 기본 지연 (초)
+            jitter: 지연 변동 폭 (0~jitter초 추가, seed로 재현 가능)
+            latency_by_kind: 종류별 지연 (prior / fermi_decomposition / guardrail)
+            seed: 지터 난수 시드
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.latency_by_kind = dict(latency_by_kind or {})
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = {}
+        self._in_flight = 0
+        self.max_in_flight = 0
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 응답
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def respond(self, prompt: str) -> Tuple[str, str]:
+        """
+        Returns:
+            (종류, 응답 content)
+        """
+        kind = self.classify(prompt)
+        with self._lock:
+            self.calls[kind] = self.calls.get(kind, 0) + 1
+
+        question = self._extract_question(prompt)
+        if kind == 'prior':
+            content = self._prior(question)
+        elif kind == 'fermi_decomposition':
+            content = self._decomposition(question)
+        elif kind == 'guardrail':
+            content = json.dumps(
+                {"relationship": "UNRELATED", "is_hard": False, "reasoning": "fake"},
+                ensure_ascii=False
+            )
+        else:
+            content = "{}"
+        return kind, content
+
+    def delay(self, kind: str) -> float:
+        """이번 호출의 지연 (초)"""
+        base = self.latency_by_kind.get(kind, self.latency)
+        if self.jitter:
+            with self._lock:
+                base += self._rng.uniform(0, self.jitter)
+        return base
+
+    @contextmanager
+    def in_flight(self):
+        """응답 대기 구간 (동시 호출 수 / 최대치 집계)"""
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    @staticmethod
+    def classify(prompt: str) -> str:
+        for kind, marker in PROMPT_MARKERS:
+            if marker in prompt:
+                return kind
+        return 'unknown'
+
+    @staticmethod
+    def value_for(question: str) -> float:
+        """질문별 결정적 값 (1e1 ~ 9e6)"""
+        h = _digest(question)
+        return float((1 + h % 9) * 10 ** (1 + (h // 9) % 6))
+
+    def get_stats(self) -> Dict[str, int]:
+        """종류별 호출 수 (+ total)"""
+        with self._lock:
+            stats = dict(self.calls)
+        stats['total'] = sum(stats.values())
+        return stats
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.calls.clear()
+            self.max_in_flight = self._in_flight
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 내부
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    @staticmethod
+    def _extract_question(prompt: str) -> str:
+        match = _QUESTION_LINE.search(prompt)
+        return match.group(1).strip() if match else prompt[:200]
+
+    def _prior(self, question: str) -> str:
+        value = self.value_for(question)
+        certainty = ('high', 'medium', 'low')[_digest(question) % 3]
+        return "```json\n" + json.dumps({
+            "value": value,
+            "range": [value * 0.5, value * 2],
+            "certainty": certainty,
+            "reasoning": f"fake prior for {question}"
+        }, ensure_ascii=False) + "\n```"
+
+    def _decomposition(self, question: str) -> str:
+        formula, variables = DECOMPOSITION_TEMPLATES[_digest(question) % len(DECOMPOSITION_TEMPLATES)]
+        return "```json\n" + json.dumps(
+            {"formula": formula, "variables": variables},
+            ensure_ascii=False
+        ) + "\n```"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Chat 모델 / 클라이언트 레지스트리
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class FakeChatModel:
+    """
+    ChatOpenAI 대역 (invoke / ainvoke → AIMessage)
+
+    LLMResponseCache 키 계산에 쓰이는 model_name / temperature 속성을 가집니다.
+    """
+
+    def __init__(self, responder: FakeResponder, model_name: str = "fake", temperature: Optional[float] = None):
+        self.responder = responder
+        self.model_name = model_name
+        self.temperature = temperature
+
+    def invoke(self, prompt: Any, **kwargs) -> AIMessage:
+        kind, content = self.responder.respond(str(prompt))
+        delay = self.responder.delay(kind)
+        with self.responder.in_flight():
+            if delay > 0:
+                time.sleep(delay)
+        return _message(prompt, content)
+
+    async def ainvoke(self, prompt: Any, **kwargs) -> AIMessage:
+        kind, content = self.responder.respond(str(prompt))
+        delay = self.responder.delay(kind)
+        with self.responder.in_flight():
+            if delay > 0:
+                await asyncio.sleep(delay)
+        return _message(prompt, content)
+
+
+def _message(prompt: Any, content: str) -> AIMessage:
+    """응답 메시지 (토큰 수는 4자 = 1토큰 근사, 트레이싱용)"""
+    input_tokens = max(1, len(str(prompt)) // 4)
+    output_tokens = max(1, len(content) // 4)
+    return AIMessage(
+        content=content,
+        usage_metadata={
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'total_tokens': input_tokens + output_tokens
+        }
+    )
+
+
+class FakeLLMClientRegistry(LLMClientRegistry):
+    """
+    get_chat_model()이 FakeChatModel을 반환하는 레지스트리 (HTTP 풀 없음)
+    """
+
+    def __init__(self, responder: FakeResponder):
+        super().__init__()
+        self.responder = responder
+
+    def get_chat_model(self, model: str, **params) -> FakeChatModel:
+        key = self._make_key(model, params)
+        with self._lock:
+            llm = self._clients.get(key)
+            if llm is None:
+                llm = FakeChatModel(self.responder, model_name=model, temperature=params.get('temperature'))
+                self._clients[key] = llm
+            return llm
+
+    def warm_up(self, models, connect: bool = True) -> int:
+        """클라이언트만 생성 (연결 수립 없음)"""
+        count = 0
+        for model, params in models:
+            self.get_chat_model(model, **dict(params))
+            count += 1
+        return count
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# BaseLLM / LLMProvider
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class FakeLLM(BaseLLM):
+    """
+    BaseLLM 결정적 구현 (FakeResponder 값 사용)
+    """
+
+    def __init__(self, task: TaskType, responder: FakeResponder):
+        self.task = task
+        self.responder = responder
+
+    def estimate(self, question: str, context: Any, **kwargs) -> Optional[Any]:
+        from umis_rag.agents.estimator.common.estimation_result import create_prior_result
+
+        value = self.responder.value_for(question)
+        return create_prior_result(
+            value=value,
+            value_range=(value * 0.5, value * 2),
+            certainty='medium',
+            reasoning=f"fake prior for {question}"
+        )
+
+    def decompose(self, question: str, context: Any, budget: Any, **kwargs) -> Optional[Dict[str, Any]]:
+        formula, variables = DECOMPOSITION_TEMPLATES[_digest(question) % len(DECOMPOSITION_TEMPLATES)]
+        return {
+            "formula": formula,
+            "variables": [{"name": name, "description": desc} for name, desc in variables.items()],
+            "reasoning": "fake decomposition"
+        }
+
+    def evaluate_certainty(self, question: str, value: Any, context: Any, **kwargs) -> str:
+        return 'medium'
+
+    def validate_boundary(self, value: Any, context: Any, **kwargs) -> Dict[str, Any]:
+        return {"is_valid": True, "reason": "fake", "suggested_range": None}
+
+    def is_native(self) -> bool:
+        return False
+
+
+class FakeLLMProvider(LLMProvider):
+    """
+    Fake LLM Provider (네트워크 없음, 결정적, 지연 주입 가능)
+
+    Estimator Stage는 ChatOpenAI를 클라이언트 레지스트리에서 직접 받으므로
+    client_registry를 set_llm_client_registry()로 설치해야 LLM 호출까지 대체됩니다.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        latency_by_kind: Optional[Dict[str, float]] = None,
+        seed: int = 0
+    ):
+        self.responder = FakeResponder(latency, jitter, latency_by_kind, seed)
+        self.client_registry = FakeLLMClientRegistry(self.responder)
+
+    def get_llm(self, task: TaskType) -> BaseLLM:
+        return FakeLLM(task, self.responder)
+
+    def is_native(self) -> bool:
+        return False
+
+    def supports_async(self) -> bool:
+        return True
+
+    def get_mode_info(self) -> Dict[str, Any]:
+        return {
+            "mode": "fake",
+            "provider": "FakeLLMProvider",
+            "uses_api": False,
+            "cost": "$0 (결정적 응답)",
+            "automation": True,
+            "description": "벤치마크 / 오프라인 테스트용 결정적 응답 + 지연 주입"
+        }
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 임베딩
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class FakeEmbeddings(Embeddings):
+    """
+    텍스트 해시 기반 결정적 단위 벡터 (API 호출 없음)
+    """
+
+    def __init__(self, dimension: int = 64):
+        self.dimension = dimension
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def embed_query(self, text: str) -> List[float]:
+        with self._lock:
+            self.calls += 1
+        return self._vector(text)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        with self._lock:
+            self.calls += 1
+        return [self._vector(t) for t in texts]
+
+    def _vector(self, text: str) -> List[float]:
+        rng = random.Random(_digest(text))
+        values = [rng.gauss(0, 1) for _ in range(self.dimension)]
+        norm = math.sqrt(sum(v * v for v in values)) or 1.0
+        return [v / norm for v in values]
@@ -14,6 +14,7 @@ LLM Interface Module for UMIS RAG System
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, List
 from enum import Enum
+import asyncio
 from dataclasses import dataclass
 
 
@@ -235,6 +236,52 @@ class BaseLLM(ABC):
         ...
 
 
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Async 인터페이스 (v7.11.2)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    #
+    # 기본 구현은 동기 메서드를 asyncio.to_thread로 실행합니다.
+    # 네이티브 async 호출이 가능한 구현체(ExternalLLM)는 재정의합니다.
+    
+    async def aestimate(
+        self,
+        question: str,
+        context: Any,
+        **kwargs
+    ) -> Optional[Any]:
+        """estimate()의 async 버전"""
+        return await asyncio.to_thread(self.estimate, question, context, **kwargs)
+    
+    async def adecompose(
+        self,
+        question: str,
+        context: Any,
+        budget: Any,
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """decompose()의 async 버전"""
+        return await asyncio.to_thread(self.decompose, question, context, budget, **kwargs)
+    
+    async def aevaluate_certainty(
+        self,
+        question: str,
+        value: Any,
+        context: Any,
+        **kwargs
+    ) -> str:
+        """evaluate_certainty()의 async 버전"""
+        return await asyncio.to_thread(self.evaluate_certainty, question, value, context, **kwargs)
+    
+    async def avalidate_boundary(
+        self,
+        value: Any,
+        context: Any,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """validate_boundary()의 async 버전"""
+        return await asyncio.to_thread(self.validate_boundary, value, context, **kwargs)
+
+
 class LLMProvider(ABC):
     """
     LLM Provider 인터페이스
@@ -281,6 +328,15 @@ class LLMProvider(ABC):
         """
         ...
     
+    def supports_async(self) -> bool:
+        """
+        네이티브 async 지원 여부 (v7.11.2)
+        
+        False면 BaseLLM의 a* 메서드가 스레드에서 동기 메서드를 실행합니다.
+        하나의 이벤트 루프에서 대량 동시 추정을 돌릴 때 참고합니다.
+        """
+        return False
+    
     @abstractmethod
     def get_mode_info(self) -> Dict[str, Any]:
         """
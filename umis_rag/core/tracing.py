@@ -0,0 +1,685 @@
+"""
+Estimator Tracing & Metrics for UMIS RAG System
+
+Stage / 하위 단계 span + 프로세스 메트릭 (v7.11.2)
+
+목적:
+- estimate() 시간 정보가 로그 문자열(`{elapsed:.2f}초`)과
+  cost['time']뿐이라 운영 환경에서 p95가 어느 단계에서 나오는지 알 수 없음
+- 요청 단위 trace (Stage → 벡터 검색 / 임베딩 / LLM 호출 / Guardrail 분석)
+- 프로세스 단위 counter / histogram (Prometheus 텍스트, OpenTelemetry)
+
+특징:
+- contextvars 기반 (asyncio Task / to_thread는 자동 전파,
+  ThreadPoolExecutor는 propagate()로 감싸서 전파)
+- span 종료 시 umis_span_duration_seconds{span=...} histogram 기록
+- LLM 호출: 모델, 캐시 hit, 입력/출력 토큰 (usage_metadata)
+- OpenTelemetry: opentelemetry-api가 있고 TRACING_OTEL_ENABLED=true면
+  span / 메트릭을 OTel로도 기록 (SDK / Exporter 구성은 애플리케이션 몫)
+
+설정 (.env):
+    TRACING_ENABLED=true
+    TRACING_OTEL_ENABLED=false
+
+Example:
+    >>> from umis_rag.core.tracing import start_trace, span, get_metrics
+    >>> with start_trace("estimate", question="서울 음식점 수는?") as trace:
+    ...     with span("vector_search", collection="projected_index") as s:
+    ...         s.set(results=3)
+    >>> trace.summary()['stages']
+    >>> print(get_metrics().to_prometheus())
+
+작성: 2026-10-18
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple, Callable, Iterator
+import asyncio
+import bisect
+import functools
+import math
+import threading
+import time
+import uuid
+
+from umis_rag.core.config import settings
+from umis_rag.utils.logger import logger
+
+
+# Stage span 이름 (Trace.summary()['stages'] 대상)
+STAGE_SPANS = ('evidence', 'prior', 'fermi', 'fusion')
+
+# 기본 histogram 경계 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 메트릭 설명 (Prometheus HELP)
+METRIC_HELP = {
+    'umis_span_duration_seconds': "Span 실행 시간 (초)",
+    'umis_span_errors_total': "예외로 끝난 span 수",
+    'umis_llm_calls_total': "LLM 호출 수 (cache=hit|miss|bypass)",
+    'umis_llm_tokens_total': "LLM 토큰 수 (direction=input|output)",
+    'umis_estimations_total': "추정 완료 수 (source별)",
+}
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Span / Trace
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+@dataclass
+class Span:
+    """실행 구간 (perf_counter 기준)"""
+    name: str
+    span_id: str
+    parent_id: Optional[str] = None
+    start: float = field(default_factory=time.perf_counter)
+    end: Optional[float] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end if self.end is not None else time.perf_counter()
+        return (end - self.start) * 1000
+
+    def set(self, **attributes) -> None:
+        """속성 추가 (모델, 토큰 수, 결과 개수 등)"""
+        self.attributes.update(attributes)
+
+    def to_dict(self, origin: float) -> Dict[str, Any]:
+        """
+        Args:
+            origin: trace 시작 시각 (start_ms 기준점)
+        """
+        data = {
+            'name': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start_ms': round((self.start - origin) * 1000, 3),
+            'duration_ms': round(self.duration_ms, 3),
+            'status': self.status,
+            'attributes': dict(self.attributes),
+        }
+        if self.error:
+            data['error'] = self.error
+        return data
+
+
+class _NoopSpan:
+    """트레이싱 비활성 시 span 대역"""
+    name = ""
+    attributes: Dict[str, Any] = {}
+
+    def set(self, **attributes) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """
+    요청 단위 trace (span 목록, thread-safe)
+
+    Stage 2 / 3, Fermi 변수, Guardrail 분석은 다른 스레드에서 실행되므로
+    span 추가는 lock으로 보호합니다.
+    """
+
+    def __init__(self, name: str):
+        self.trace_id = uuid.uuid4().hex[:16]
+        self.name = name
+        self.origin = time.perf_counter()
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    @property
+    def spans(self) -> List[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def find(self, name: str) -> List[Span]:
+        """이름이 같은 span 목록"""
+        return [s for s in self.spans if s.name == name]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Stage별 시간, LLM 호출 / 토큰 집계
+
+        Returns:
+            {
+              'duration_ms': 전체,
+              'stages': {'evidence': ms, 'prior': ms, ...} (같은 Stage 여러 번이면 합계),
+              'llm_calls': 실제 호출 수 (캐시 hit 제외),
+              'llm_cache_hits': 캐시 hit 수,
+              'input_tokens', 'output_tokens',
+              'models': {model: {'calls', 'input_tokens', 'output_tokens'}}
+            }
+        """
+        spans = self.spans
+        stages: Dict[str, float] = {}
+        models: Dict[str, Dict[str, int]] = {}
+        llm_calls = cache_hits = input_tokens = output_tokens = 0
+
+        for s in spans:
+            if s.name in STAGE_SPANS:
+                stages[s.name] = round(stages.get(s.name, 0.0) + s.duration_ms, 3)
+            elif s.name == 'llm':
+                if s.attributes.get('cache') == 'hit':
+                    cache_hits += 1
+                    continue
+                llm_calls += 1
+                tokens_in = s.attributes.get('input_tokens') or 0
+                tokens_out = s.attributes.get('output_tokens') or 0
+                input_tokens += tokens_in
+                output_tokens += tokens_out
+
+                usage = models.setdefault(
+                    s.attributes.get('model', 'unknown'),
+                    {'calls': 0, 'input_tokens': 0, 'output_tokens': 0}
+                )
+                usage['calls'] += 1
+                usage['input_tokens'] += tokens_in
+                usage['output_tokens'] += tokens_out
+
+        root = next((s for s in spans if s.parent_id is None), None)
+        return {
+            'duration_ms': round(root.duration_ms, 3) if root else 0.0,
+            'stages': stages,
+            'llm_calls': llm_calls,
+            'llm_cache_hits': cache_hits,
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'models': models,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화용 (span은 시작 순서)"""
+        spans = sorted(self.spans, key=lambda s: s.start)
+        return {
+            'trace_id': self.trace_id,
+            'name': self.name,
+            'summary': self.summary(),
+            'spans': [s.to_dict(self.origin) for s in spans],
+        }
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("umis_trace", default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar("umis_span", default=None)
+
+
+def get_current_trace() -> Optional[Trace]:
+    """현재 컨텍스트의 trace (없으면 None)"""
+    return _current_trace.get()
+
+
+def get_current_span() -> Optional[Span]:
+    """현재 컨텍스트의 span (없으면 None)"""
+    return _current_span.get()
+
+
+@contextmanager
+def start_trace(name: str, **attributes) -> Iterator[Optional[Trace]]:
+    """
+    요청 단위 trace 시작 (root span 포함)
+
+    이미 trace가 활성 상태면 새 trace를 만들지 않고 하위 span으로 기록한 뒤
+    바깥 trace를 반환합니다. 트레이싱이 꺼져 있으면 None.
+
+    Args:
+        name: root span 이름 (예: "estimate")
+        **attributes: root span 속성
+    """
+    if not settings.tracing_enabled:
+        yield None
+        return
+
+    current = _current_trace.get()
+    if current is not None:
+        with span(name, **attributes):
+            yield current
+        return
+
+    trace = Trace(name)
+    trace_token = _current_trace.set(trace)
+    try:
+        with span(name, **attributes):
+            yield trace
+    finally:
+        _current_trace.reset(trace_token)
+
+
+@contextmanager
+def span(name: str, **attributes) -> Iterator[Any]:
+    """
+    실행 구간 기록
+
+    - 활성 trace가 있으면 trace에 추가 (부모 = 현재 span)
+    - trace가 없어도 umis_span_duration_seconds histogram은 기록
+    - 예외는 status='error'로 기록 후 그대로 전파
+
+    Args:
+        name: span 이름 (예: "prior", "llm", "vector_search")
+        **attributes: 초기 속성
+
+    Yields:
+        Span (트레이싱 비활성 시 set()만 있는 대역)
+    """
+    if not settings.tracing_enabled:
+        yield NOOP_SPAN
+        return
+
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        span_id=uuid.uuid4().hex[:8],
+        parent_id=parent.span_id if parent else None,
+        attributes=dict(attributes)
+    )
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.add(current)
+
+    otel = _get_otel()
+    otel_cm = otel.start_span(name) if otel else None
+    otel_span = otel_cm.__enter__() if otel_cm else None
+
+    token = _current_span.set(current)
+    exc_info = (None, None, None)
+    try:
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.error = f"{type(e).__name__}: {e}"
+        exc_info = (type(e), e, e.__traceback__)
+        raise
+    finally:
+        current.end = time.perf_counter()
+        _current_span.reset(token)
+
+        metrics = get_metrics()
+        metrics.observe('umis_span_duration_seconds', current.end - current.start, span=name)
+        if current.status == "error":
+            metrics.inc('umis_span_errors_total', span=name)
+
+        if otel_cm:
+            otel.finish_span(otel_cm, otel_span, current, exc_info)
+
+
+def traced(name: str) -> Callable:
+    """
+    함수 / 메서드 전체를 span으로 감싸는 데코레이터 (async 함수 지원)
+
+    Example:
+        >>> @traced("prior")
+        ... def _run_prior(self, question, ...):
+        ...     ...
+    """
+    def decorator(fn: Callable) -> Callable:
+        if asyncio.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def propagate(fn: Callable) -> Callable:
+    """
+    현재 trace / span 컨텍스트를 복사해 fn을 실행하는 callable
+    (ThreadPoolExecutor.submit 용, submit마다 새로 감싸야 함)
+
+    Example:
+        >>> executor.submit(propagate(self._run_prior), question, ...)
+    """
+    ctx = copy_context()
+
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        return ctx.run(fn, *args, **kwargs)
+
+    return run
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LLM 호출 기록
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def extract_token_usage(message: Any) -> Tuple[Optional[int], Optional[int]]:
+    """
+    LangChain 메시지의 (입력 토큰, 출력 토큰)
+
+    usage_metadata (langchain-core 0.2+) → response_metadata['token_usage'] 순으로 조회
+    """
+    usage = getattr(message, 'usage_metadata', None)
+    if isinstance(usage, dict) and usage:
+        return _as_count(usage.get('input_tokens')), _as_count(usage.get('output_tokens'))
+
+    metadata = getattr(message, 'response_metadata', None)
+    token_usage = metadata.get('token_usage') if isinstance(metadata, dict) else None
+    if isinstance(token_usage, dict) and token_usage:
+        return _as_count(token_usage.get('prompt_tokens')), _as_count(token_usage.get('completion_tokens'))
+
+    return None, None
+
+
+def _as_count(value: Any) -> Optional[int]:
+    """토큰 수 (정수가 아니면 None)"""
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+
+def record_llm_call(
+    current: Any,
+    model: str,
+    cache: str,
+    message: Any = None
+) -> None:
+    """
+    LLM 호출 span 속성 + 메트릭
+
+    Args:
+        current: span() 으로 받은 span
+        model: 모델 이름
+        cache: 'hit' | 'miss' | 'bypass'
+        message: LLM 응답 메시지 (캐시 hit이면 None)
+    """
+    input_tokens, output_tokens = extract_token_usage(message) if message is not None else (None, None)
+    current.set(model=model, cache=cache, input_tokens=input_tokens, output_tokens=output_tokens)
+
+    if not settings.tracing_enabled:
+        return
+
+    metrics = get_metrics()
+    metrics.inc('umis_llm_calls_total', model=model, cache=cache)
+    if input_tokens:
+        metrics.inc('umis_llm_tokens_total', input_tokens, model=model, direction='input')
+    if output_tokens:
+        metrics.inc('umis_llm_tokens_total', output_tokens, model=model, direction='output')
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 메트릭
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class _Histogram:
+    """누적 전 bucket 카운트 + 합계"""
+    buckets: Tuple[float, ...]
+    counts: List[int]
+    total: float = 0.0
+    count: int = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """
+    프로세스 단위 counter / histogram (thread-safe)
+
+    Example:
+        >>> metrics = get_metrics()
+        >>> metrics.inc('umis_llm_calls_total', model='gpt-4o-mini', cache='miss')
+        >>> metrics.observe('umis_span_duration_seconds', 0.42, span='prior')
+        >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[LabelKey, float]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, _Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1.0, **labels) -> None:
+        """counter 증가"""
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+        otel = _get_otel()
+        if otel:
+            otel.add(name, value, labels)
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """histogram 관측 (초 단위)"""
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = _Histogram(self.buckets, [0] * (len(self.buckets) + 1))
+                series[key] = histogram
+            histogram.observe(value)
+
+        otel = _get_otel()
+        if otel:
+            otel.record(name, value, labels)
+
+    def get_counter(self, name: str, **labels) -> float:
+        """counter 값 (labels 일부만 주면 해당 series 합계)"""
+        with self._lock:
+            series = self._counters.get(name, {})
+            return sum(v for k, v in series.items() if self._matches(k, labels))
+
+    def get_histogram(self, name: str, **labels) -> Dict[str, float]:
+        """histogram count / sum (labels 일부만 주면 합계)"""
+        with self._lock:
+            series = self._histograms.get(name, {})
+            matched = [h for k, h in series.items() if self._matches(k, labels)]
+            return {
+                'count': sum(h.count for h in matched),
+                'sum': sum(h.total for h in matched),
+            }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON 직렬화용 전체 값"""
+        with self._lock:
+            return {
+                'counters': {
+                    name: [{'labels': dict(k), 'value': v} for k, v in series.items()]
+                    for name, series in self._counters.items()
+                },
+                'histograms': {
+                    name: [
+                        {'labels': dict(k), 'count': h.count, 'sum': h.total}
+                        for k, h in series.items()
+                    ]
+                    for name, series in self._histograms.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                self._header(lines, name, 'counter')
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{self._format_labels(key)} {_format_value(value)}")
+
+            for name in sorted(self._histograms):
+                self._header(lines, name, 'histogram')
+                for key, h in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(self.buckets, h.counts):
+                        cumulative += count
+                        le = self._format_labels(key + (('le', _format_value(bound)),))
+                        lines.append(f"{name}_bucket{le} {cumulative}")
+                    le = self._format_labels(key + (('le', '+Inf'),))
+                    lines.append(f"{name}_bucket{le} {h.count}")
+                    lines.append(f"{name}_sum{self._format_labels(key)} {_format_value(h.total)}")
+                    lines.append(f"{name}_count{self._format_labels(key)} {h.count}")
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self) -> None:
+        """모든 값 초기화"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    @staticmethod
+    def _label_key(labels: Dict[str, Any]) -> LabelKey:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    @staticmethod
+    def _matches(key: LabelKey, labels: Dict[str, Any]) -> bool:
+        items = dict(key)
+        return all(items.get(k) == str(v) for k, v in labels.items())
+
+    @staticmethod
+    def _header(lines: List[str], name: str, kind: str) -> None:
+        if name in METRIC_HELP:
+            lines.append(f"# HELP {name} {METRIC_HELP[name]}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    @staticmethod
+    def _format_labels(key: LabelKey) -> str:
+        if not key:
+            return ""
+        pairs = (
+            f'{k}="' + v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+            for k, v in key
+        )
+        return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# OpenTelemetry (선택)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class _OTelBridge:
+    """
+    opentelemetry-api로 span / 메트릭 중계
+
+    TracerProvider / MeterProvider가 구성되지 않았으면 OTel 기본 no-op으로 동작합니다.
+    """
+
+    def __init__(self, otel_trace, otel_metrics):
+        self.tracer = otel_trace.get_tracer("umis_rag")
+        self.meter = otel_metrics.get_meter("umis_rag")
+        self._instruments: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def start_span(self, name: str):
+        return self.tracer.start_as_current_span(name)
+
+    def finish_span(self, cm, otel_span, current: Span, exc_info=(None, None, None)) -> None:
+        """
+        속성 복사 후 span 종료
+
+        exc_info를 그대로 __exit__에 넘겨 OTel이 예외 기록 + ERROR status를 설정합니다.
+        """
+        for key, value in current.attributes.items():
+            if isinstance(value, (str, bool, int, float)):
+                otel_span.set_attribute(key, value)
+        if current.error:
+            otel_span.set_attribute('error', current.error)
+        cm.__exit__(*exc_info)
+
+    def add(self, name: str, value: float, labels: Dict[str, Any]) -> None:
+        self._instrument(name, 'counter').add(value, {k: str(v) for k, v in labels.items()})
+
+    def record(self, name: str, value: float, labels: Dict[str, Any]) -> None:
+        self._instrument(name, 'histogram').record(value, {k: str(v) for k, v in labels.items()})
+
+    def _instrument(self, name: str, kind: str):
+        with self._lock:
+            instrument = self._instruments.get(name)
+            if instrument is None:
+                description = METRIC_HELP.get(name, "")
+                if kind == 'counter':
+                    instrument = self.meter.create_counter(name, description=description)
+                else:
+                    instrument = self.meter.create_histogram(name, unit="s", description=description)
+                self._instruments[name] = instrument
+            return instrument
+
+
+_otel_bridge: Optional[_OTelBridge] = None
+_otel_checked = False
+_otel_lock = threading.Lock()
+
+
+def _get_otel() -> Optional[_OTelBridge]:
+    """settings.tracing_otel_enabled + opentelemetry-api 설치 시 Bridge (1회 초기화)"""
+    global _otel_bridge, _otel_checked
+    if not settings.tracing_otel_enabled:
+        return None
+    if not _otel_checked:
+        with _otel_lock:
+            if not _otel_checked:
+                try:
+                    from opentelemetry import trace as otel_trace, metrics as otel_metrics
+                    _otel_bridge = _OTelBridge(otel_trace, otel_metrics)
+                    logger.info("[Tracing] OpenTelemetry 연동 활성화")
+                except ImportError:
+                    logger.warning("[Tracing] opentelemetry-api 패키지 없음 (pip install opentelemetry-api)")
+                _otel_checked = True
+    return _otel_bridge
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 싱글톤
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_metrics_instance: Optional[MetricsRegistry] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """기본 메트릭 레지스트리 (싱글톤)"""
+    global _metrics_instance
+    if _metrics_instance is None:
+        with _metrics_lock:
+            if _metrics_instance is None:
+                _metrics_instance = MetricsRegistry()
+    return _metrics_instance
+
+
+def set_metrics(metrics: Optional[MetricsRegistry]) -> None:
+    """
+    기본 레지스트리 교체 (테스트용)
+
+    Args:
+        metrics: 새 레지스트리 (None이면 다음 get_metrics() 호출 시 새로 생성)
+    """
+    global _metrics_instance
+    with _metrics_lock:
+        _metrics_instance = metrics
+
+
+def render_prometheus() -> str:
+    """기본 레지스트리의 Prometheus 텍스트 (/metrics 핸들러용)"""
+    return get_metrics().to_prometheus()
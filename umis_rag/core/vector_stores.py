@@ -0,0 +1,241 @@
+"""
+Vector Store Registry for UMIS RAG System
+
+Chroma 클라이언트 / 임베딩 / Collection 핸들 공유 (v7.11.2)
+
+목적:
+- Explorer, Validator, Observer, Quantifier, Guardian 메모리, ValidatorSource,
+  TTLManager가 각자 OpenAIEmbeddings와 Chroma(persist_directory=...)를 만들면
+  같은 SQLite 파일에 클라이언트가 여러 개 열려 시작 시간·파일 핸들·메모리가
+  늘고, 같은 프로세스 안에서 SQLite Lock 경합이 생김
+
+특징:
+- persist 디렉토리당 PersistentClient 1개
+- 임베딩 모델당 OpenAIEmbeddings 1개 (CachedEmbeddings로 감싸 재임베딩 방지)
+- Collection 핸들(langchain Chroma)은 처음 요청될 때 열고 재사용
+
+Example:
+    >>> from umis_rag.core.vector_stores import get_vectorstore
+    >>> store = get_vectorstore("explorer_knowledge_base")
+    >>> store.similarity_search("구독 모델", k=3)
+
+작성: 2026-10-18
+"""
+
+from pathlib import Path
+from typing import Optional, Dict, Tuple, Union
+import threading
+
+import chromadb
+from langchain_community.vectorstores import Chroma
+from langchain_core.embeddings import Embeddings
+from langchain_openai import OpenAIEmbeddings
+
+from umis_rag.core.config import settings
+from umis_rag.core.embedding_cache import CachedEmbeddings, get_embedding_store
+from umis_rag.utils.logger import logger
+
+
+PathLike = Union[str, Path]
+
+
+class VectorStoreRegistry:
+    """
+    프로세스 단위 Chroma / 임베딩 레지스트리 (thread-safe)
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._clients: Dict[str, chromadb.ClientAPI] = {}
+        self._embeddings: Dict[str, Embeddings] = {}
+        self._stores: Dict[Tuple[str, str, str], Chroma] = {}
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 구성요소
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def get_client(self, persist_dir: Optional[PathLike] = None) -> chromadb.ClientAPI:
+        """
+        persist 디렉토리별 PersistentClient
+
+        Args:
+            persist_dir: Chroma 디렉토리 (None이면 settings.chroma_persist_dir)
+        """
+        path = self._resolve_dir(persist_dir)
+        with self._lock:
+            client = self._clients.get(path)
+            if client is None:
+                client = chromadb.PersistentClient(path=path)
+                self._clients[path] = client
+                logger.debug(f"[VectorStores] Chroma 클라이언트 생성: {path}")
+            return client
+
+    def get_embeddings(self, model: Optional[str] = None) -> Embeddings:
+        """
+        모델별 OpenAIEmbeddings (settings.embedding_cache_enabled면 CachedEmbeddings로 감쌈)
+
+        Args:
+            model: 임베딩 모델 (None이면 settings.embedding_model)
+        """
+        model = model or settings.embedding_model
+        with self._lock:
+            embeddings = self._embeddings.get(model)
+            if embeddings is None:
+                embeddings = OpenAIEmbeddings(
+                    model=model,
+                    openai_api_key=settings.openai_api_key
+                )
+                if settings.embedding_cache_enabled:
+                    embeddings = self._wrap_cache(embeddings, model)
+                self._embeddings[model] = embeddings
+                logger.debug(f"[VectorStores] 임베딩 생성: {model}")
+            return embeddings
+
+    def set_embeddings(self, embeddings: Embeddings, model: Optional[str] = None) -> None:
+        """
+        모델별 임베딩 주입 (Fake 임베딩 벤치마크/테스트용, 이미 연 Collection 핸들은 유지)
+
+        Args:
+            embeddings: 사용할 임베딩
+            model: 임베딩 모델 (None이면 settings.embedding_model)
+        """
+        with self._lock:
+            self._embeddings[model or settings.embedding_model] = embeddings
+
+    @staticmethod
+    def _wrap_cache(embeddings: OpenAIEmbeddings, model: str) -> Embeddings:
+        """임베딩 캐시 래퍼 (디스크 저장소 실패 시 메모리만)"""
+        store = None
+        if settings.embedding_cache_path:
+            try:
+                store = get_embedding_store(
+                    settings.embedding_cache_path, max_bytes=settings.embedding_cache_max_bytes
+                )
+            except Exception as e:
+                logger.warning(f"[VectorStores] 임베딩 디스크 캐시 열기 실패 → 메모리만: {e}")
+        return CachedEmbeddings(
+            embeddings,
+            model=model,
+            store=store,
+            memory_size=settings.embedding_cache_memory_size
+        )
+
+    def get_vectorstore(
+        self,
+        collection_name: str,
+        embedding_model: Optional[str] = None,
+        persist_dir: Optional[PathLike] = None
+    ) -> Chroma:
+        """
+        Collection 핸들 (처음 요청 시 열고 재사용)
+
+        Args:
+            collection_name: Collection 이름
+            embedding_model: 임베딩 모델 (None이면 settings.embedding_model)
+            persist_dir: Chroma 디렉토리 (None이면 settings.chroma_persist_dir)
+
+        Returns:
+            공유 클라이언트/임베딩을 쓰는 langchain Chroma
+        """
+        path = self._resolve_dir(persist_dir)
+        model = embedding_model or settings.embedding_model
+        key = (path, collection_name, model)
+
+        with self._lock:
+            store = self._stores.get(key)
+            if store is None:
+                store = Chroma(
+                    collection_name=collection_name,
+                    embedding_function=self.get_embeddings(model),
+                    client=self.get_client(path)
+                )
+                self._stores[key] = store
+            return store
+
+    def drop_collection(
+        self,
+        collection_name: str,
+        persist_dir: Optional[PathLike] = None
+    ) -> None:
+        """
+        Collection 삭제 + 캐시된 핸들 제거
+
+        이후 get_vectorstore()는 빈 Collection을 새로 엽니다.
+        """
+        path = self._resolve_dir(persist_dir)
+        with self._lock:
+            self.get_client(path).delete_collection(collection_name)
+            for key in [k for k in self._stores if k[0] == path and k[1] == collection_name]:
+                del self._stores[key]
+
+    def clear(self) -> None:
+        """모든 핸들 제거 (클라이언트는 Chroma가 관리하므로 참조만 해제)"""
+        with self._lock:
+            self._stores.clear()
+            self._embeddings.clear()
+            self._clients.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """레지스트리 상태"""
+        with self._lock:
+            return {
+                'clients': len(self._clients),
+                'embeddings': len(self._embeddings),
+                'collections': len(self._stores)
+            }
+
+    @staticmethod
+    def _resolve_dir(persist_dir: Optional[PathLike]) -> str:
+        return str(Path(persist_dir or settings.chroma_persist_dir).resolve())
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 싱글톤 + 편의 함수
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_registry = VectorStoreRegistry()
+
+
+def get_vector_store_registry() -> VectorStoreRegistry:
+    """기본 레지스트리"""
+    return _registry
+
+
+def set_vector_store_registry(registry: Optional[VectorStoreRegistry] = None) -> VectorStoreRegistry:
+    """
+    기본 레지스트리 교체 (임시 Chroma 디렉토리 / Fake 임베딩 벤치마크용)
+
+    Args:
+        registry: 새 레지스트리 (None이면 빈 레지스트리)
+
+    Returns:
+        이전 레지스트리 (복원용)
+    """
+    global _registry
+    previous = _registry
+    _registry = registry or VectorStoreRegistry()
+    return previous
+
+
+def get_chroma_client(persist_dir: Optional[PathLike] = None) -> chromadb.ClientAPI:
+    """공유 PersistentClient"""
+    return _registry.get_client(persist_dir)
+
+
+def get_embeddings(model: Optional[str] = None) -> Embeddings:
+    """공유 임베딩 (캐시 적용)"""
+    return _registry.get_embeddings(model)
+
+
+def get_vectorstore(
+    collection_name: str,
+    embedding_model: Optional[str] = None,
+    persist_dir: Optional[PathLike] = None
+) -> Chroma:
+    """공유 Collection 핸들"""
+    return _registry.get_vectorstore(collection_name, embedding_model, persist_dir)
+
+
+def drop_collection(collection_name: str, persist_dir: Optional[PathLike] = None) -> None:
+    """Collection 삭제 + 핸들 제거"""
+    _registry.drop_collection(collection_name, persist_dir)
@@ -12,9 +12,19 @@ Bill (Quantifier)의 market_sizing.xlsx를 완벽한 Excel 함수로 자동 생
   - validation_log_builder: 검증 이력 시트
   - summary_builder: 요약 대시보드 시트
   - market_sizing_generator: 전체 통합 생성기
+  - formula_evaluator: 수식 재계산기 (Excel 없이 값 계산, v7.11.2)
+  - batch_generator: 여러 워크북 병렬 생성 (프로세스 풀, v7.11.2)
+  - streaming_workbook: write-only 스트리밍 백엔드 (v7.11.2)
+  - workbook_validator: 단일 패스 통합 검증 (v7.11.2)
+  - dependency_graph: 셀 단위 수식 의존성 그래프 (v7.11.2)
 """
 
 from .formula_engine import FormulaEngine
+from .dependency_graph import DependencyGraph
+from .formula_evaluator import WorkbookEvaluator, ExcelError
+from .batch_generator import BatchWorkbookGenerator, WorkbookJob, WorkbookBuildResult
+from .streaming_workbook import StreamingWorkbook, StreamingWriteError
+from .workbook_validator import UnifiedWorkbookValidator, WorkbookIndex
 from .market_sizing_generator import MarketSizingWorkbookGenerator
 from .scenarios_builder import ScenariosBuilder
 from .validation_log_builder import ValidationLogBuilder
@@ -25,6 +35,16 @@ __all__ = [
     'MarketSizingWorkbookGenerator',
     'ScenariosBuilder',
     'ValidationLogBuilder',
-    'SummaryBuilder'
+    'SummaryBuilder',
+    'WorkbookEvaluator',
+    'ExcelError',
+    'BatchWorkbookGenerator',
+    'WorkbookJob',
+    'WorkbookBuildResult',
+    'StreamingWorkbook',
+    'StreamingWriteError',
+    'UnifiedWorkbookValidator',
+    'WorkbookIndex',
+    'DependencyGraph'
 ]
 
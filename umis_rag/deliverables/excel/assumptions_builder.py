@@ -91,6 +91,9 @@ class AssumptionsSheetBuilder:
         ws.column_dimensions['H'].width = 12  # Confidence
         ws.column_dimensions['I'].width = 40  # Notes
         
+        # 상단 고정 (헤더 항상 보이게, 스트리밍 모드: 행 기록 전 설정)
+        ws.freeze_panes = 'A2'
+        
         # 3. 데이터 행 작성
         for i, asm in enumerate(assumptions, start=2):
             ws.cell(row=i, column=1).value = asm.get('id')
@@ -143,9 +146,6 @@ class AssumptionsSheetBuilder:
         # for row_idx in range(2, len(assumptions) + 2):
         #     ws.cell(row=row_idx, column=4).protection = Protection(locked=False)
         
-        # 5. 상단 고정 (헤더 항상 보이게)
-        ws.freeze_panes = 'A2'
-        
         print(f"   ✅ Assumptions: {len(assumptions)}개 가정, {len(assumptions)}개 Named Range")
 
 
@@ -220,6 +220,9 @@ class EstimationDetailsBuilder:
         ws.column_dimensions['E'].width = 12
         ws.column_dimensions['F'].width = 15
         
+        # 상단 고정 (스트리밍 모드: 행 기록 전 설정)
+        ws.freeze_panes = 'A5'
+        
         # === 헤더 ===
         row = 4
         headers = ['EST_ID', 'Item', 'Final_Value', 'Used_In', 'Confidence', 'Error_Range']
@@ -338,9 +341,6 @@ class EstimationDetailsBuilder:
             # 구분선
             current_row += 1
         
-        # 상단 고정
-        ws.freeze_panes = 'A5'
-        
         print(f"   ✅ Estimation Details: {len(estimations)}개 추정치")
         print(f"      - 7개 섹션 기반 상세 문서화")
         print(f"      - {len(estimations)}개 Named Range 생성")
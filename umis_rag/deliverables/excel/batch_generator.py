@@ -0,0 +1,415 @@
+"""
+Batch Workbook Generator
+여러 워크북을 프로세스 풀에서 병렬 생성 (v7.11.2)
+
+배경:
+  - 각 Generator는 워크북 1개를 단일 스레드에서 순차 생성
+  - openpyxl 생성/저장은 CPU 바운드 (GIL) → 스레드로는 확장 불가
+  - 시장 40개+ 일괄 Export 시 코어 수에 거의 비례해 단축
+
+구조:
+  - Worker 프로세스마다 Workbook / FormulaEngine 독립 생성
+  - 완료된 파일 경로를 완료 순서대로 스트리밍 (generate_iter)
+  - Worker 메모리 한도 (RLIMIT_AS, POSIX) → 초과 시 해당 작업만 실패
+  - Worker 비정상 종료 (OOM Killer, segfault) → 시작 전 작업은 새 풀에서 재실행,
+    실행 중이던 작업은 절반씩 나눠 재실행해 원인 작업만 실패 (나머지는 병렬 유지)
+  - Builder별 생성 시간 (ms) 리포트
+
+사용:
+    jobs = [
+        WorkbookJob('unit_economics', {'market_name': 'music', 'inputs_data': {...}}),
+        WorkbookJob('financial_projection', {'market_name': 'edu', ...}),
+    ]
+    batch = BatchWorkbookGenerator(max_workers=8, memory_limit_mb=1024)
+    for result in batch.generate_iter(jobs, output_dir):
+        print(result.filepath, result.builder_timings)
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from collections import deque
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import importlib
+import io
+import os
+import sys
+import tempfile
+import time
+import traceback
+
+
+# 생성기 레지스트리 (Worker에서 지연 import)
+GENERATORS: Dict[str, Tuple[str, str]] = {
+    'market_sizing': (
+        'umis_rag.deliverables.excel.market_sizing_generator',
+        'MarketSizingWorkbookGenerator'
+    ),
+    'unit_economics': (
+        'umis_rag.deliverables.excel.unit_economics.unit_economics_generator',
+        'UnitEconomicsGenerator'
+    ),
+    'financial_projection': (
+        'umis_rag.deliverables.excel.financial_projection.financial_projection_generator',
+        'FinancialProjectionGenerator'
+    ),
+}
+
+
+class BuilderTimer:
+    """
+    Builder별 소요 시간 기록 (Generator 공용)
+
+    사용:
+        timer = BuilderTimer()
+        with timer.measure('Inputs'):
+            builder.create_sheet(...)
+        timer.timings  # {'Inputs': 12.3}
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def measure(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.timings[name] = self.timings.get(name, 0.0) + elapsed_ms
+
+    @property
+    def total_ms(self) -> float:
+        return sum(self.timings.values())
+
+
+@dataclass
+class WorkbookJob:
+    """
+    워크북 생성 작업 1건
+
+    Attributes:
+        tool_type: 'market_sizing' | 'unit_economics' | 'financial_projection'
+        params: generate() 키워드 인수 (output_dir 제외, 피클 가능해야 함)
+        job_id: 결과 식별자 (기본: tool_type:market_name)
+    """
+    tool_type: str
+    params: Dict[str, Any]
+    job_id: Optional[str] = None
+
+    def __post_init__(self):
+        if self.tool_type not in GENERATORS:
+            raise ValueError(
+                f"Unknown tool_type: {self.tool_type} (지원: {', '.join(GENERATORS)})"
+            )
+        if 'market_name' not in self.params:
+            raise ValueError("params에 market_name 필요")
+        if self.job_id is None:
+            self.job_id = f"{self.tool_type}:{self.params['market_name']}"
+
+
+@dataclass
+class WorkbookBuildResult:
+    """
+    워크북 생성 결과
+
+    Attributes:
+        job_id: 작업 식별자
+        tool_type: 생성기 종류
+        filepath: 생성된 파일 (실패 시 None)
+        builder_timings: {Builder 이름: ms} (생성 순서)
+        total_ms: Worker 내 전체 소요 시간
+        peak_memory_mb: Worker 프로세스 최대 RSS (POSIX)
+        worker_pid: Worker 프로세스 ID
+        error: 실패 메시지
+    """
+    job_id: str
+    tool_type: str
+    filepath: Optional[Path] = None
+    builder_timings: Dict[str, float] = field(default_factory=dict)
+    total_ms: float = 0.0
+    peak_memory_mb: Optional[float] = None
+    worker_pid: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'job_id': self.job_id,
+            'tool_type': self.tool_type,
+            'filepath': str(self.filepath) if self.filepath else None,
+            'builder_timings': {k: round(v, 2) for k, v in self.builder_timings.items()},
+            'total_ms': round(self.total_ms, 2),
+            'peak_memory_mb': self.peak_memory_mb,
+            'worker_pid': self.worker_pid,
+            'error': self.error,
+        }
+
+
+# ========================================
+# Worker (모듈 수준 함수: 피클 가능)
+# ========================================
+
+def _init_worker(memory_limit_mb: Optional[int]) -> None:
+    """Worker 초기화: 주소 공간 한도 설정 (POSIX만)"""
+    if not memory_limit_mb:
+        return
+    try:
+        import resource
+    except ImportError:  # Windows
+        return
+    limit = int(memory_limit_mb) * 1024 * 1024
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _peak_memory_mb() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: bytes
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+
+def build_workbook(job: WorkbookJob, output_dir: Path, verbose: bool = False) -> WorkbookBuildResult:
+    """
+    워크북 1개 생성 (Worker에서 실행, 단독 호출도 가능)
+
+    예외는 결과의 error로 변환 (MemoryError 포함)
+    """
+    result = WorkbookBuildResult(
+        job_id=job.job_id,
+        tool_type=job.tool_type,
+        worker_pid=os.getpid()
+    )
+    start = time.perf_counter()
+    generator = None
+
+    try:
+        module_name, class_name = GENERATORS[job.tool_type]
+        generator_class = getattr(importlib.import_module(module_name), class_name)
+        generator = generator_class()
+
+        if verbose:
+            filepath = generator.generate(output_dir=Path(output_dir), **job.params)
+        else:
+            with redirect_stdout(io.StringIO()):
+                filepath = generator.generate(output_dir=Path(output_dir), **job.params)
+
+        result.filepath = Path(filepath)
+
+    except MemoryError:
+        result.error = "메모리 한도 초과 (MemoryError)"
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+        if verbose:
+            traceback.print_exc()
+
+    if generator is not None:
+        result.builder_timings = dict(generator.builder_timings)
+    result.total_ms = (time.perf_counter() - start) * 1000
+    result.peak_memory_mb = _peak_memory_mb()
+    return result
+
+
+def _build_with_marker(job: WorkbookJob, output_dir: Path, verbose: bool, marker: str) -> WorkbookBuildResult:
+    """Worker 진입점: 시작 표시 파일 생성 후 생성 (풀 비정상 종료 시 실행 중이던 작업 식별용)"""
+    Path(marker).touch()
+    return build_workbook(job, output_dir, verbose)
+
+
+# ========================================
+# Batch Generator
+# ========================================
+
+class BatchWorkbookGenerator:
+    """
+    여러 워크북 병렬 생성기 (ProcessPoolExecutor)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+        max_tasks_per_child: Optional[int] = None,
+        verbose: bool = False
+    ):
+        """
+        Args:
+            max_workers: Worker 프로세스 수 (기본: CPU 코어 수)
+            memory_limit_mb: Worker별 주소 공간 한도 (MB, None=무제한, POSIX만)
+            max_tasks_per_child: Worker 재시작 주기 (메모리 누적 방지, None=재사용)
+            verbose: Generator 진행 출력 표시 (기본: 숨김)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_child = max_tasks_per_child
+        self.verbose = verbose
+
+    def generate_iter(
+        self,
+        jobs: List[WorkbookJob],
+        output_dir: Path
+    ) -> Iterator[WorkbookBuildResult]:
+        """
+        병렬 생성, 완료되는 순서대로 결과 반환 (스트리밍)
+
+        Args:
+            jobs: 생성 작업 목록
+            output_dir: 출력 디렉토리
+
+        Yields:
+            WorkbookBuildResult (실패한 작업도 error와 함께 반환)
+        """
+        self._check_duplicates(jobs)
+        if not jobs:
+            return
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        # 풀이 깨지면: 시작 전 작업은 그대로, 실행 중이던 작업은 절반씩 나눠 새 풀에서 재실행
+        # → 원인 작업만 단독으로 남아 실패, 나머지는 계속 병렬 실행
+        with tempfile.TemporaryDirectory(prefix='umis_batch_') as marker_dir:
+            markers = {job.job_id: os.path.join(marker_dir, str(i)) for i, job in enumerate(jobs)}
+            groups = deque([list(jobs)])
+            while groups:
+                group = groups.popleft()
+                running: List[WorkbookJob] = []
+                unstarted: List[WorkbookJob] = []
+                yield from self._run_pool(group, output_dir, markers, running, unstarted)
+
+                if not running and unstarted:
+                    # Worker 초기화 중 종료 등 → 시작 여부를 모르므로 전부 의심
+                    running, unstarted = unstarted, []
+                if len(running) == 1:
+                    job = running[0]
+                    yield WorkbookBuildResult(
+                        job_id=job.job_id,
+                        tool_type=job.tool_type,
+                        error="Worker 프로세스 비정상 종료 (메모리 한도 초과 가능)"
+                    )
+                elif running:
+                    half = len(running) // 2
+                    groups.append(running[:half])
+                    groups.append(running[half:])
+                if unstarted:
+                    groups.append(unstarted)
+
+    def generate(self, jobs: List[WorkbookJob], output_dir: Path) -> List[WorkbookBuildResult]:
+        """
+        병렬 생성 후 입력 순서대로 결과 반환
+        """
+        results = {r.job_id: r for r in self.generate_iter(jobs, output_dir)}
+        return [results[job.job_id] for job in jobs]
+
+    def _run_pool(
+        self,
+        jobs: List[WorkbookJob],
+        output_dir: Path,
+        markers: Dict[str, str],
+        running: List[WorkbookJob],
+        unstarted: List[WorkbookJob]
+    ) -> Iterator[WorkbookBuildResult]:
+        """
+        새 프로세스 풀에서 jobs 실행, 완료 순서대로 결과 반환
+
+        Args:
+            markers: job_id → 시작 표시 파일 경로
+            running: 풀이 깨질 때 실행 중이던 작업 (출력)
+            unstarted: 풀이 깨져 시작하지 못한 작업 (출력)
+        """
+        for job in jobs:
+            if os.path.exists(markers[job.job_id]):
+                os.remove(markers[job.job_id])
+
+        with self._make_executor(len(jobs)) as executor:
+            futures = {}
+            for index, job in enumerate(jobs):
+                try:
+                    future = executor.submit(
+                        _build_with_marker, job, output_dir, self.verbose, markers[job.job_id]
+                    )
+                except BrokenProcessPool:
+                    unstarted.extend(jobs[index:])
+                    break
+                futures[future] = job
+
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    # OOM Killer 등으로 Worker가 비정상 종료 → 진행 중/대기 작업 모두 실패
+                    if os.path.exists(markers[job.job_id]):
+                        running.append(job)
+                    else:
+                        unstarted.append(job)
+                except Exception as e:
+                    yield WorkbookBuildResult(
+                        job_id=job.job_id,
+                        tool_type=job.tool_type,
+                        error=f"{type(e).__name__}: {e}"
+                    )
+
+    def _make_executor(self, job_count: int) -> ProcessPoolExecutor:
+        kwargs: Dict[str, Any] = {
+            'max_workers': min(self.max_workers, job_count),
+            'initializer': _init_worker,
+            'initargs': (self.memory_limit_mb,),
+        }
+        if self.max_tasks_per_child:
+            # max_tasks_per_child는 fork 컨텍스트와 호환되지 않음 (Python 3.11+)
+            import multiprocessing
+            kwargs['max_tasks_per_child'] = self.max_tasks_per_child
+            kwargs['mp_context'] = multiprocessing.get_context('spawn')
+        return ProcessPoolExecutor(**kwargs)
+
+    @staticmethod
+    def _check_duplicates(jobs: List[WorkbookJob]) -> None:
+        """같은 파일명으로 저장되는 작업 (덮어쓰기) 방지"""
+        seen = set()
+        for job in jobs:
+            key = (job.tool_type, job.params['market_name'])
+            if key in seen or job.job_id in seen:
+                raise ValueError(f"중복 작업: {job.job_id} (같은 tool_type + market_name)")
+            seen.add(key)
+            seen.add(job.job_id)
+
+    @staticmethod
+    def timing_report(results: List[WorkbookBuildResult]) -> Dict[str, Dict[str, float]]:
+        """
+        Builder별 소요 시간 집계 (성공한 작업만)
+
+        Returns:
+            {'tool_type/Builder': {'count', 'mean_ms', 'max_ms', 'total_ms'}}
+            (total_ms 내림차순)
+        """
+        samples: Dict[str, List[float]] = {}
+        for result in results:
+            if not result.ok:
+                continue
+            for name, ms in result.builder_timings.items():
+                samples.setdefault(f"{result.tool_type}/{name}", []).append(ms)
+
+        report = {
+            name: {
+                'count': len(values),
+                'mean_ms': round(sum(values) / len(values), 2),
+                'max_ms': round(max(values), 2),
+                'total_ms': round(sum(values), 2),
+            }
+            for name, values in samples.items()
+        }
+        return dict(sorted(report.items(), key=lambda item: -item[1]['total_ms']))
@@ -11,6 +11,12 @@ Builder Contract
   contract = builder.create_sheet(...)
   named_ranges = contract.named_ranges
   next_builder.create_sheet(..., prev_contract=contract)
+
+쓰기 계약 (v7.11.2, streaming=True 생성 시):
+  - Builder는 StreamingWorkbook(write-only)을 일반 Workbook처럼 사용
+  - 행은 위에서 아래로 기록 (최근 window 행 안에서만 되돌아가기 허용)
+  - 열 너비 / freeze_panes는 첫 데이터 행 전에 설정
+  - 위반 시 StreamingWriteError (streaming_workbook.py 참조)
 """
 
 from dataclasses import dataclass, field
@@ -0,0 +1,422 @@
+"""
+Dependency Graph
+셀 단위 수식 의존성 그래프 (v7.11.2)
+
+배경:
+  - FormulaEngine은 수식 문자열만 생성하고 셀 간 참조 관계를 기록하지 않음
+  - ExcelValidator._has_self_reference는 파일 저장 후 다시 열어야 하고,
+    직접 자기 참조(C5 = C5*2)만 감지
+
+구조:
+  - 수식 셀 → 참조 노드 (parse_formula AST, 수식 문자열 단위 캐시)
+  - Named Range → 영역 (FormulaEngine.define_named_range에서 등록)
+  - 첫 조회 시 인덱스 1회 구성 (기록이 바뀌면 무효화)
+      * 정방향: 수식 셀 → 참조하는 수식 셀 (순환 감지, 계산 순서)
+      * 역방향: 셀 → 그 셀을 참조하는 수식 셀 (단일 셀 dict + 시트별 범위 목록)
+
+제공:
+  - find_cycles(): 순환 참조 (Tarjan SCC, O(V+E))
+  - dangling_names(): 정의되지 않은 Named Range 참조
+  - affected_cells() / affected_outputs(): 가정 변경 시 영향받는 셀 / 최종 출력 셀
+  - recalculation_order(): 변경된 셀 기준 부분 재계산 순서 (증분 재계산 기반)
+
+사용:
+    engine = FormulaEngine(wb)
+    ... Builder 실행 ...
+    graph = engine.dependency_graph()   # 파일 저장/재로드 없이
+    graph.find_cycles()
+    graph.affected_outputs('ASM_001')
+"""
+
+import re
+from collections import deque
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+
+from openpyxl.utils.cell import get_column_letter
+
+from .formula_evaluator import (
+    CellKey,
+    FormulaSyntaxError,
+    _parse_cell,
+    _split_sheet,
+    evaluation_order,
+    parse_formula,
+    strongly_connected_components,
+)
+
+
+Bounds = Tuple[str, int, int, int, int]  # (시트, r1, c1, r2, c2)
+Reference = Union[str, CellKey]  # 'Sheet!B5', 'Sheet!A1:B3', Named Range, (sheet, row, col)
+
+RANGE_EXPAND_LIMIT = 64  # 이보다 큰 범위는 해당 시트 수식 셀을 직접 검사
+
+
+class _GraphIndex(NamedTuple):
+    edges: Dict[CellKey, Set[CellKey]]  # 수식 셀 → 참조하는 수식 셀
+    single: Dict[CellKey, Set[CellKey]]  # 셀 → 그 셀만 참조하는 수식 셀
+    ranges: Dict[str, List[Tuple[Bounds, CellKey]]]  # 시트 → (범위, 수식 셀)
+    dangling: Dict[str, List[CellKey]]  # 미정의 이름 → 사용한 수식 셀
+
+
+class DependencyGraph:
+    """
+    셀 단위 수식 의존성 그래프
+
+    셀 키는 WorkbookEvaluator와 같은 (sheet, row, col)
+    """
+
+    def __init__(self):
+        self._formulas: Dict[str, Dict[Tuple[int, int], str]] = {}
+        self._refs: Dict[CellKey, Tuple] = {}  # 수식 셀 → 참조 노드
+        self._invalid: Dict[CellKey, str] = {}  # 파싱 실패 → 메시지
+        self._names: Dict[str, Tuple[str, str]] = {}  # 이름(대문자) → (시트, 주소)
+        self._name_case: Dict[str, str] = {}
+        self._sheets: Dict[str, str] = {}  # 시트(대문자) → 시트 이름
+        self._index: Optional[_GraphIndex] = None
+
+    # ----------------------------------------
+    # 기록
+    # ----------------------------------------
+
+    def set_sheets(self, sheetnames: Iterable[str]) -> None:
+        """워크북 시트 이름 (대소문자 무시 참조 해석용, 없는 시트의 수식 기록 제거)"""
+        sheetnames = list(sheetnames)
+        for sheet in set(self._formulas) - set(sheetnames):
+            self.replace_sheet(sheet, ())
+            del self._formulas[sheet]
+        for sheet in sheetnames:
+            self._sheets[sheet.upper()] = sheet
+        self._index = None
+
+    def add_name(self, name: str, sheet: str, address: str) -> None:
+        """
+        Named Range 등록
+
+        Args:
+            name: 이름 (예: 'ASM_001')
+            sheet: 시트 이름
+            address: 셀/범위 주소 (예: '$D$5', 'B5:B7')
+        """
+        self._names[name.upper()] = (sheet, address)
+        self._name_case[name.upper()] = name
+        self._sheets.setdefault(sheet.upper(), sheet)
+        self._index = None
+
+    def add_formula(self, sheet: str, cell: str, formula: str) -> None:
+        """수식 셀 기록 (cell: 'B5')"""
+        row, col = _parse_cell(cell)
+        self.set_cell(sheet, row, col, formula)
+
+    def set_cell(self, sheet: str, row: int, col: int, value: Any) -> None:
+        """셀 값 기록 (수식이 아니면 기존 수식 기록 제거)"""
+        if isinstance(value, str) and value.startswith('=') and len(value) > 1:
+            self._add(sheet, row, col, value)
+        elif (row, col) in self._formulas.get(sheet, {}):
+            self._discard(sheet, row, col)
+
+    def replace_sheet(self, sheet: str, cells: Iterable[Tuple[int, int, Any]]) -> None:
+        """시트 수식 전체 교체 (cells: (row, col, value))"""
+        for row, col in list(self._formulas.get(sheet, {})):
+            self._discard(sheet, row, col)
+        for row, col, value in cells:
+            self.set_cell(sheet, row, col, value)
+
+    def _add(self, sheet: str, row: int, col: int, formula: str) -> None:
+        key = (sheet, row, col)
+        sheet_formulas = self._formulas.setdefault(sheet, {})
+        if sheet_formulas.get((row, col)) == formula:
+            return
+        sheet_formulas[(row, col)] = formula
+        self._sheets.setdefault(sheet.upper(), sheet)
+        self._invalid.pop(key, None)
+        try:
+            self._refs[key] = tuple(_reference_nodes(parse_formula(formula)))
+        except FormulaSyntaxError as e:
+            self._refs[key] = ()
+            self._invalid[key] = str(e)
+        self._index = None
+
+    def _discard(self, sheet: str, row: int, col: int) -> None:
+        del self._formulas[sheet][(row, col)]
+        self._refs.pop((sheet, row, col), None)
+        self._invalid.pop((sheet, row, col), None)
+        self._index = None
+
+    # ----------------------------------------
+    # 조회
+    # ----------------------------------------
+
+    @property
+    def formulas(self) -> Dict[CellKey, str]:
+        """수식 셀 → 수식"""
+        return {
+            (sheet, row, col): formula
+            for sheet, cells in self._formulas.items()
+            for (row, col), formula in cells.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def precedents(self, reference: Reference) -> Set[CellKey]:
+        """수식 셀이 직접 참조하는 셀 (범위는 셀 단위로 펼침)"""
+        key = self._cell_key(reference)
+        cells: Set[CellKey] = set()
+        for node in self._refs.get(key, ()):
+            bounds = self._bounds(node, key[0])
+            if bounds is not None:
+                cells.update(_cells_in(bounds))
+        return cells
+
+    def dependents(self, reference: Reference) -> Set[CellKey]:
+        """셀(또는 Named Range)을 직접 참조하는 수식 셀"""
+        return self._dependents_of(self._reference_bounds(reference))
+
+    def affected_cells(self, reference: Reference) -> Set[CellKey]:
+        """
+        셀(또는 Named Range) 변경 시 다시 계산해야 하는 모든 수식 셀 (전이적)
+
+        Example:
+            graph.affected_cells('ASM_001')  # 가정 1개 → 영향 셀 전체
+        """
+        affected: Set[CellKey] = set()
+        queue = deque(self._dependents_of(self._reference_bounds(reference)))
+        while queue:
+            key = queue.popleft()
+            if key in affected:
+                continue
+            affected.add(key)
+            queue.extend(self._dependents_of((key[0], key[1], key[2], key[1], key[2])))
+        return affected
+
+    def affected_outputs(self, reference: Reference) -> Set[CellKey]:
+        """영향받는 수식 셀 중 다른 수식이 참조하지 않는 최종 출력 셀"""
+        return {
+            key for key in self.affected_cells(reference)
+            if not self._dependents_of((key[0], key[1], key[2], key[1], key[2]))
+        }
+
+    def find_cycles(self) -> List[List[CellKey]]:
+        """순환 참조 (강결합 요소, 자기 참조 포함), O(V+E)"""
+        edges = self._build().edges
+        return [
+            sorted(component)
+            for component in strongly_connected_components(edges)
+            if len(component) > 1 or component[0] in edges[component[0]]
+        ]
+
+    def dangling_names(self) -> Dict[str, List[CellKey]]:
+        """정의되지 않은 Named Range (수식에 쓰인 대소문자) → 사용한 수식 셀"""
+        dangling = {}
+        for name, cells in self._build().dangling.items():
+            cells = sorted(cells)
+            sheet, row, col = cells[0]
+            dangling[_written_name(name, self._formulas[sheet][(row, col)])] = cells
+        return dangling
+
+    def recalculation_order(self, changed: Optional[Iterable[Reference]] = None) -> List[CellKey]:
+        """
+        재계산 순서 (참조 대상이 먼저)
+
+        Args:
+            changed: 변경된 셀 / Named Range 목록 (None이면 전체 수식 셀)
+
+        Returns:
+            다시 계산할 수식 셀 (순환 참조 셀 포함)
+        """
+        order, _ = evaluation_order(self._build().edges)
+        if changed is None:
+            return order
+        affected: Set[CellKey] = set()
+        for reference in changed:
+            affected |= self.affected_cells(reference)
+        return [key for key in order if key in affected]
+
+    def validate(self) -> Dict[str, Any]:
+        """
+        Build-time 검증 (파일 저장 전)
+
+        Returns:
+            {'passed', 'formula_count', 'cycles', 'dangling_names', 'invalid_formulas'}
+            (셀은 'Sheet!B5' 형식)
+        """
+        cycles = [[_address(key) for key in cycle] for cycle in self.find_cycles()]
+        dangling = {
+            name: [_address(key) for key in cells]
+            for name, cells in self.dangling_names().items()
+        }
+        return {
+            'passed': not cycles and not dangling,
+            'formula_count': len(self._refs),
+            'cycles': cycles,
+            'dangling_names': dangling,
+            'invalid_formulas': {
+                _address(key): message for key, message in sorted(self._invalid.items())
+            },
+        }
+
+    # ----------------------------------------
+    # 인덱스
+    # ----------------------------------------
+
+    def _build(self) -> _GraphIndex:
+        if self._index is not None:
+            return self._index
+
+        edges: Dict[CellKey, Set[CellKey]] = {}
+        single: Dict[CellKey, Set[CellKey]] = {}
+        ranges: Dict[str, List[Tuple[Bounds, CellKey]]] = {}
+        dangling: Dict[str, List[CellKey]] = {}
+
+        for key, nodes in self._refs.items():
+            deps = edges[key] = set()
+            for node in nodes:
+                bounds = self._bounds(node, key[0], dangling, key)
+                if bounds is None:
+                    continue
+                sheet, r1, c1, r2, c2 = bounds
+                if r1 == r2 and c1 == c2:
+                    single.setdefault((sheet, r1, c1), set()).add(key)
+                    if (r1, c1) in self._formulas.get(sheet, {}):
+                        deps.add((sheet, r1, c1))
+                else:
+                    ranges.setdefault(sheet, []).append((bounds, key))
+                    deps.update(self._formulas_in(bounds))
+
+        self._index = _GraphIndex(edges, single, ranges, dangling)
+        return self._index
+
+    def _dependents_of(self, bounds: Bounds) -> Set[CellKey]:
+        index = self._build()
+        sheet, r1, c1, r2, c2 = bounds
+        result: Set[CellKey] = set()
+
+        if (r2 - r1 + 1) * (c2 - c1 + 1) <= RANGE_EXPAND_LIMIT:
+            for cell in _cells_in(bounds):
+                result.update(index.single.get(cell, ()))
+        else:
+            for cell, keys in index.single.items():
+                if cell[0] == sheet and r1 <= cell[1] <= r2 and c1 <= cell[2] <= c2:
+                    result.update(keys)
+
+        for range_bounds, key in index.ranges.get(sheet, ()):
+            _, rr1, rc1, rr2, rc2 = range_bounds
+            if rr1 <= r2 and r1 <= rr2 and rc1 <= c2 and c1 <= rc2:
+                result.add(key)
+        return result
+
+    def _formulas_in(self, bounds: Bounds) -> Iterable[CellKey]:
+        sheet, r1, c1, r2, c2 = bounds
+        sheet_formulas = self._formulas.get(sheet, {})
+        if (r2 - r1 + 1) * (c2 - c1 + 1) <= RANGE_EXPAND_LIMIT:
+            return [cell for cell in _cells_in(bounds) if cell[1:] in sheet_formulas]
+        return [
+            (sheet, row, col) for row, col in sheet_formulas
+            if r1 <= row <= r2 and c1 <= col <= c2
+        ]
+
+    def _bounds(
+        self,
+        node,
+        sheet: str,
+        dangling: Optional[Dict[str, List[CellKey]]] = None,
+        key: Optional[CellKey] = None
+    ) -> Optional[Bounds]:
+        """참조 노드 → 영역 (미정의 이름이면 None, dangling에 기록)"""
+        kind = node[0]
+        if kind == 'ref':
+            return (self._sheet(node[1] or sheet), node[2], node[3], node[2], node[3])
+        if kind == 'rng':
+            return (self._sheet(node[1] or sheet),) + tuple(node[2:])
+        if kind == 'name':
+            target = self._names.get(node[2])
+            if target is None:
+                if dangling is not None:
+                    cells = dangling.setdefault(node[2], [])
+                    if key not in cells:
+                        cells.append(key)
+                return None
+            return _address_bounds(self._sheet(target[0]), target[1])
+        if kind == 'span':
+            start = self._bounds(node[1], sheet, dangling, key)
+            end = self._bounds(node[2], sheet, dangling, key)
+            if start is None or end is None or start[0] != end[0]:
+                return None
+            return (
+                start[0],
+                min(start[1], end[1]), min(start[2], end[2]),
+                max(start[3], end[3]), max(start[4], end[4])
+            )
+        return None
+
+    def _sheet(self, sheet: str) -> str:
+        return self._sheets.get(sheet.upper(), sheet)
+
+    def _reference_bounds(self, reference: Reference) -> Bounds:
+        if isinstance(reference, tuple):
+            sheet, row, col = reference
+            return (self._sheet(sheet), row, col, row, col)
+        try:
+            node = parse_formula(reference)
+        except FormulaSyntaxError as e:
+            raise ValueError(f"잘못된 참조: {reference} ({e})")
+        if node[0] in ('ref', 'rng') and node[1] is None:
+            raise ValueError(f"시트 이름 필요: {reference} (예: 'Assumptions!B5')")
+        if node[0] not in ('ref', 'rng', 'name', 'span'):
+            raise ValueError(f"셀 / 범위 / Named Range 참조가 아님: {reference}")
+        bounds = self._bounds(node, '')
+        if bounds is None:
+            raise KeyError(f"Named Range '{reference}' not defined")
+        return bounds
+
+    def _cell_key(self, reference: Reference) -> CellKey:
+        sheet, r1, c1, r2, c2 = self._reference_bounds(reference)
+        if (r1, c1) != (r2, c2):
+            raise ValueError(f"단일 셀 참조 필요: {reference}")
+        return (sheet, r1, c1)
+
+
+# ========================================
+# 유틸리티
+# ========================================
+
+def _reference_nodes(node) -> Iterable:
+    """AST의 참조 노드 (ref / rng / name / span)"""
+    kind = node[0]
+    if kind in ('ref', 'rng', 'name', 'span'):
+        yield node
+    elif kind == 'op':
+        yield from _reference_nodes(node[2])
+        yield from _reference_nodes(node[3])
+    elif kind in ('neg', 'pct'):
+        yield from _reference_nodes(node[1])
+    elif kind == 'fn':
+        for arg in node[2]:
+            yield from _reference_nodes(arg)
+
+
+def _written_name(name: str, formula: str) -> str:
+    """이름(AST 대문자) → 수식에 쓰인 대소문자"""
+    match = re.search(rf"(?<![\w.]){re.escape(name)}(?![\w.])", formula, re.IGNORECASE)
+    return match.group(0) if match else name
+
+
+def _address_bounds(sheet: str, address: str) -> Bounds:
+    """'$D$5' / 'B5:B7' → 영역"""
+    _, address = _split_sheet(address)
+    if ':' in address:
+        start, end = address.split(':')
+        r1, c1 = _parse_cell(start)
+        r2, c2 = _parse_cell(end)
+        return (sheet, min(r1, r2), min(c1, c2), max(r1, r2), max(c1, c2))
+    row, col = _parse_cell(address)
+    return (sheet, row, col, row, col)
+
+
+def _cells_in(bounds: Bounds) -> List[CellKey]:
+    sheet, r1, c1, r2, c2 = bounds
+    return [(sheet, row, col) for row in range(r1, r2 + 1) for col in range(c1, c2 + 1)]
+
+
+def _address(key: CellKey) -> str:
+    return f"{key[0]}!{get_column_letter(key[2])}{key[1]}"
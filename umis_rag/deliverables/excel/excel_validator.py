@@ -29,6 +29,12 @@ class ExcelValidator:
       - 계산 결과 검증
     """
     
+    # 규칙 상수 (UnifiedWorkbookValidator와 공유)
+    ERROR_TOKENS = ['#REF!', '#DIV/0!', '#VALUE!', '#NAME?']
+    CRITICAL_SHEETS = ['Revenue_Buildup', 'Cost_Structure', 'PL_5Year', 'PL_3Year']
+    DASHBOARD_CELLS = ['B5', 'B6', 'B7']  # Revenue, Net Income, CAGR 등
+    REVENUE_ROWS = range(5, 8)  # 최대 3개 세그먼트 검사
+    
     def __init__(self, filepath: Path):
         """
         Args:
@@ -161,7 +167,7 @@ class ExcelValidator:
                             )
                         
                         # 오류 수식 패턴 (#REF!, #DIV/0! 등)
-                        if any(err in str(cell.value) for err in ['#REF!', '#DIV/0!', '#VALUE!', '#NAME?']):
+                        if any(err in str(cell.value) for err in self.ERROR_TOKENS):
                             error_formulas += 1
                             self.errors.append(
                                 f"❌ 오류 수식: {sheet_name}!{cell.coordinate} = {cell.value}"
@@ -224,7 +230,7 @@ class ExcelValidator:
         print("-" * 70)
         
         # 주요 시트에서 빈 셀 비율 확인
-        critical_sheets = ['Revenue_Buildup', 'Cost_Structure', 'PL_5Year', 'PL_3Year']
+        critical_sheets = self.CRITICAL_SHEETS
         
         for sheet_name in critical_sheets:
             if sheet_name not in self.wb.sheetnames:
@@ -276,7 +282,7 @@ class ExcelValidator:
         
         # Year 0 vs Year 1 성장률 확인 (샘플)
         # 첫 번째 세그먼트 (보통 Row 5)
-        for row_idx in range(5, 8):  # 최대 3개 세그먼트 검사
+        for row_idx in self.REVENUE_ROWS:
             try:
                 y0_cell = ws[f'B{row_idx}']
                 y1_cell = ws[f'C{row_idx}']
@@ -313,9 +319,7 @@ class ExcelValidator:
         ws = self.wb['Dashboard']
         
         # Dashboard의 주요 셀에 값이 있는지 확인
-        critical_cells = ['B5', 'B6', 'B7']  # Revenue, Net Income, CAGR 등
-        
-        for cell_addr in critical_cells:
+        for cell_addr in self.DASHBOARD_CELLS:
             cell = ws[cell_addr]
             
             if cell.value is None:
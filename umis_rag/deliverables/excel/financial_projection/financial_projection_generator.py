@@ -12,6 +12,8 @@ from datetime import datetime
 from openpyxl import Workbook
 
 from ..formula_engine import FormulaEngine
+from ..batch_generator import BuilderTimer
+from ..streaming_workbook import StreamingWorkbook
 from .fp_assumptions_builder import FPAssumptionsBuilder
 from .revenue_builder import RevenueBuilder
 from .cost_builder import CostBuilder
@@ -45,6 +47,8 @@ class FinancialProjectionGenerator:
     def __init__(self):
         """초기화"""
         self.formula_engine: Optional[FormulaEngine] = None
+        self.builder_timings: Dict[str, float] = {}  # v7.11.2: Builder별 ms
+        self.dependency_report: Optional[Dict] = None  # v7.11.2: 저장 전 수식 의존성 검증 결과
     
     def generate(
         self,
@@ -52,7 +56,8 @@ class FinancialProjectionGenerator:
         assumptions_data: Dict,
         segments: List[Dict],
         years: int = 5,
-        output_dir: Path = Path('.')
+        output_dir: Path = Path('.'),
+        streaming: bool = False
     ) -> Path:
         """
         Financial Projection Workbook 생성 (Batch 4)
@@ -80,6 +85,7 @@ class FinancialProjectionGenerator:
                 ]
             years: 예측 년수 (기본 5년)
             output_dir: 출력 디렉토리
+            streaming: write-only 스트리밍 백엔드 사용 (v7.11.2, 대용량 시트 메모리 절감)
         
         Returns:
             생성된 Excel 파일 경로
@@ -91,82 +97,106 @@ class FinancialProjectionGenerator:
         print(f"   예측 기간: {years}년")
         
         # 1. 워크북 초기화
-        wb = Workbook()
-        self.formula_engine = FormulaEngine(wb)
-        
-        # 기본 시트 제거
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
-        
-        # 2. Sheet 2: Assumptions
-        print(f"   2/11 Assumptions...")
-        assumptions_builder = FPAssumptionsBuilder(wb, self.formula_engine)
-        assumptions_builder.create_sheet(assumptions_data)
-        
-        # 3. Sheet 3: Revenue Build-up
-        print(f"   3/11 Revenue Build-up...")
-        revenue_builder = RevenueBuilder(wb, self.formula_engine)
-        revenue_builder.create_sheet(segments, years)
-        
-        # 4. Sheet 4: Cost Structure
-        print(f"   4/11 Cost Structure...")
-        cost_builder = CostBuilder(wb, self.formula_engine)
-        cost_builder.create_sheet(years)
-        
-        # 5. Sheet 5: P&L 3 Year
-        print(f"   5/11 P&L 3 Year...")
-        pl_3year_builder = PLBuilder(wb, self.formula_engine)
-        pl_3year_builder.create_sheet('PL_3Year', years=3, start_year=0, define_named_ranges=False)
-        
-        # 6. Sheet 6: P&L 5 Year (Named Range 정의)
-        print(f"   6/11 P&L 5 Year...")
-        pl_5year_builder = PLBuilder(wb, self.formula_engine)
-        pl_5year_builder.create_sheet('PL_5Year', years=5, start_year=0, define_named_ranges=True)
-        
-        # 7. Sheet 7: Cash Flow
-        print(f"   7/11 Cash Flow...")
-        cashflow_builder = CashFlowBuilder(wb, self.formula_engine)
-        cashflow_builder.create_sheet(years)
-        
-        # 8. Sheet 8: Key Metrics
-        print(f"   8/11 Key Metrics...")
-        metrics_builder = MetricsBuilder(wb, self.formula_engine)
-        metrics_builder.create_sheet(years, 'PL_5Year')
-        
-        # 9. Sheet 9: Scenarios (Batch 6)
-        print(f"   9/11 FP Scenarios...")
-        scenarios_builder = FPScenariosBuilder(wb, self.formula_engine)
-        scenarios_builder.create_sheet()
-        
-        # 10. Sheet 10: Break-even (Batch 6)
-        print(f"   10/11 Break-even...")
-        breakeven_builder = BreakEvenBuilder(wb, self.formula_engine)
-        breakeven_builder.create_sheet()
-        
-        # 11. Sheet 11: DCF Valuation (Batch 6)
-        print(f"   11/11 DCF Valuation...")
-        dcf_builder = DCFBuilder(wb, self.formula_engine)
-        dcf_builder.create_sheet(years)
-        
-        # 12. Sheet 1: Dashboard (Batch 6, 맨 앞으로)
-        print(f"   1/11 Dashboard...")
-        dashboard_builder = FPDashboardBuilder(wb, self.formula_engine)
-        dashboard_builder.create_sheet(market_name)
-        
-        # 13. 강제 재계산 설정
-        wb.calculation.calcMode = 'auto'
-        wb.calculation.fullCalcOnLoad = True
-        
-        # 14. 저장
-        filename = f"financial_projection_{market_name}_{datetime.now().strftime('%Y%m%d')}.xlsx"
-        filepath = output_dir / filename
-        
-        output_dir.mkdir(parents=True, exist_ok=True)
-        wb.save(filepath)
+        timer = BuilderTimer()
+        self.builder_timings = timer.timings
+        wb = StreamingWorkbook() if streaming else Workbook()
+        try:
+            self.formula_engine = FormulaEngine(wb)
+            
+            # 기본 시트 제거
+            if 'Sheet' in wb.sheetnames:
+                wb.remove(wb['Sheet'])
+            
+            # 2. Sheet 2: Assumptions
+            print(f"   2/11 Assumptions...")
+            with timer.measure('Assumptions'):
+                assumptions_builder = FPAssumptionsBuilder(wb, self.formula_engine)
+                assumptions_builder.create_sheet(assumptions_data)
+            
+            # 3. Sheet 3: Revenue Build-up
+            print(f"   3/11 Revenue Build-up...")
+            with timer.measure('Revenue Build-up'):
+                revenue_builder = RevenueBuilder(wb, self.formula_engine)
+                revenue_builder.create_sheet(segments, years)
+            
+            # 4. Sheet 4: Cost Structure
+            print(f"   4/11 Cost Structure...")
+            with timer.measure('Cost Structure'):
+                cost_builder = CostBuilder(wb, self.formula_engine)
+                cost_builder.create_sheet(years)
+            
+            # 5. Sheet 5: P&L 3 Year
+            print(f"   5/11 P&L 3 Year...")
+            with timer.measure('P&L 3 Year'):
+                pl_3year_builder = PLBuilder(wb, self.formula_engine)
+                pl_3year_builder.create_sheet('PL_3Year', years=3, start_year=0, define_named_ranges=False)
+            
+            # 6. Sheet 6: P&L 5 Year (Named Range 정의)
+            print(f"   6/11 P&L 5 Year...")
+            with timer.measure('P&L 5 Year'):
+                pl_5year_builder = PLBuilder(wb, self.formula_engine)
+                pl_5year_builder.create_sheet('PL_5Year', years=5, start_year=0, define_named_ranges=True)
+            
+            # 7. Sheet 7: Cash Flow
+            print(f"   7/11 Cash Flow...")
+            with timer.measure('Cash Flow'):
+                cashflow_builder = CashFlowBuilder(wb, self.formula_engine)
+                cashflow_builder.create_sheet(years)
+            
+            # 8. Sheet 8: Key Metrics
+            print(f"   8/11 Key Metrics...")
+            with timer.measure('Key Metrics'):
+                metrics_builder = MetricsBuilder(wb, self.formula_engine)
+                metrics_builder.create_sheet(years, 'PL_5Year')
+            
+            # 9. Sheet 9: Scenarios (Batch 6)
+            print(f"   9/11 FP Scenarios...")
+            with timer.measure('FP Scenarios'):
+                scenarios_builder = FPScenariosBuilder(wb, self.formula_engine)
+                scenarios_builder.create_sheet()
+            
+            # 10. Sheet 10: Break-even (Batch 6)
+            print(f"   10/11 Break-even...")
+            with timer.measure('Break-even'):
+                breakeven_builder = BreakEvenBuilder(wb, self.formula_engine)
+                breakeven_builder.create_sheet()
+            
+            # 11. Sheet 11: DCF Valuation (Batch 6)
+            print(f"   11/11 DCF Valuation...")
+            with timer.measure('DCF Valuation'):
+                dcf_builder = DCFBuilder(wb, self.formula_engine)
+                dcf_builder.create_sheet(years)
+            
+            # 12. Sheet 1: Dashboard (Batch 6, 맨 앞으로)
+            print(f"   1/11 Dashboard...")
+            with timer.measure('Dashboard'):
+                dashboard_builder = FPDashboardBuilder(wb, self.formula_engine)
+                dashboard_builder.create_sheet(market_name)
+            
+            # 13. 강제 재계산 설정
+            wb.calculation.calcMode = 'auto'
+            wb.calculation.fullCalcOnLoad = True
+            
+            # 저장 전 수식 의존성 검증 (v7.11.2, 순환 참조 / 미정의 Named Range)
+            self.dependency_report = self.formula_engine.validate_dependencies()
+            
+            # 14. 저장
+            filename = f"financial_projection_{market_name}_{datetime.now().strftime('%Y%m%d')}.xlsx"
+            filepath = output_dir / filename
+            
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with timer.measure('save'):
+                wb.save(filepath)
+        except BaseException:
+            # 스트리밍: 열린 시트 스트림 / 임시 파일 정리 후 전파
+            if streaming:
+                wb.close()
+            raise
         
         print(f"\n✅ Excel 생성 완료: {filepath}")
         print(f"📊 시트: {len(wb.sheetnames)}개")
         print(f"📋 Named Range: {len(self.formula_engine.named_ranges)}개")
+        print(f"🔗 {FormulaEngine.summarize_dependency_report(self.dependency_report)}")
         print(f"🎉 Financial Projection Model 완성!")
         
         return filepath
@@ -6,12 +6,16 @@ Excel 함수 생성 및 관리 (피드백 반영)
   - Named Range 절대참조 ($D$5)
   - Workbook-scope Named Range
   - 함수 검증
+  - 셀 단위 의존성 그래프 (v7.11.2): 저장 전 순환 참조 / 미정의 Named Range 검증
 """
 
-from typing import Dict, List, Tuple, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING
 from openpyxl import Workbook
 from openpyxl.workbook.defined_name import DefinedName
 
+from .dependency_graph import DependencyGraph
+from .streaming_workbook import StreamingWorkbook, StreamingWorksheet
+
 if TYPE_CHECKING:
     from .builder_contract import BuilderContract
 
@@ -37,6 +41,11 @@ class FormulaEngine:
         self.contract = contract
         self.named_ranges: Dict[str, Tuple[str, str]] = {}  # {name: (sheet, cell)}
         self.formula_cache: Dict[str, str] = {}
+        self.dependencies = DependencyGraph()  # v7.11.2: 셀 단위 의존성
+        
+        # 스트리밍 워크북: 기록된 행은 다시 읽을 수 없으므로 기록 시점에 수집
+        if isinstance(workbook, StreamingWorkbook):
+            workbook.add_cell_listener(self.dependencies.set_cell)
     
     def set_contract(self, contract: 'BuilderContract') -> None:
         """
@@ -96,6 +105,7 @@ class FormulaEngine:
         
         self.wb.defined_names.add(defn)
         self.named_ranges[name] = (sheet, cell)
+        self.dependencies.add_name(name, sheet, abs_cell)
         
         # Contract에 자동 등록 (v7.2.0)
         if self.contract:
@@ -232,6 +242,75 @@ class FormulaEngine:
         
         return True
     
+    def dependency_graph(self) -> DependencyGraph:
+        """
+        셀 단위 의존성 그래프 (v7.11.2)
+        
+        현재 워크북의 수식 셀로 그래프를 갱신 (메모리 내, 파일 저장/재로드 없음)
+        
+        Returns:
+            DependencyGraph (find_cycles, dangling_names, affected_outputs 등)
+        """
+        
+        self.dependencies.set_sheets(self.wb.sheetnames)
+        
+        for ws in self.wb.worksheets:
+            if isinstance(ws, StreamingWorksheet):
+                # 기록된 행은 listener로 수집됨 → 버퍼 행만
+                for cell in ws.iter_buffered_cells():
+                    self.dependencies.set_cell(ws.title, cell.row, cell.column, cell.value)
+            else:
+                self.dependencies.replace_sheet(
+                    ws.title,
+                    (
+                        (cell.row, cell.column, cell.value)
+                        for row in ws.iter_rows()
+                        for cell in row
+                        if cell.value is not None
+                    )
+                )
+        
+        return self.dependencies
+    
+    def validate_dependencies(self, verbose: bool = False) -> Dict[str, Any]:
+        """
+        저장 전 수식 검증 (순환 참조, 미정의 Named Range)
+        
+        Args:
+            verbose: 발견된 문제 출력
+        
+        Returns:
+            {'passed', 'formula_count', 'cycles', 'dangling_names', 'invalid_formulas'}
+        """
+        
+        report = self.dependency_graph().validate()
+        
+        if verbose:
+            for cycle in report['cycles']:
+                print(f"   ⚠️ 순환 참조: {' → '.join(cycle)}")
+            for name, cells in report['dangling_names'].items():
+                print(f"   ⚠️ 미정의 Named Range: {name} ({', '.join(cells)})")
+            for cell, message in report['invalid_formulas'].items():
+                print(f"   ⚠️ 수식 파싱 실패: {cell} ({message})")
+        
+        return report
+    
+    @staticmethod
+    def summarize_dependency_report(report: Dict[str, Any]) -> str:
+        """
+        validate_dependencies() 결과 한 줄 요약 (생성기 완료 메시지용)
+        
+        상세 내용은 report 또는 validate_dependencies(verbose=True)로 확인
+        """
+        
+        if report['passed']:
+            return "수식 의존성 ✅ 통과"
+        return (
+            f"수식 의존성 ⚠️ 순환 참조 {len(report['cycles'])}건, "
+            f"미정의 Named Range {len(report['dangling_names'])}개, "
+            f"파싱 실패 {len(report['invalid_formulas'])}건"
+        )
+    
     def create_iferror(self, formula: str, error_value: str = '"N/A"') -> str:
         """
         IFERROR로 감싸기 (0으로 나누기 방지)
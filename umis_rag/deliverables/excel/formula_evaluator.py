@@ -0,0 +1,1108 @@
+"""
+Workbook Formula Evaluator
+생성된 워크북 수식을 Python에서 직접 재계산 (v7.11.2)
+
+목적:
+  - load_workbook(data_only=True) 값은 Excel/LibreOffice가 한 번 계산해서
+    저장한 파일에만 존재 → 헤드리스 파이프라인(Linux)에서는 항상 None
+  - Golden Test / 값 추출을 Excel 없이 밀리초 단위로 실행
+
+지원 범위 (Builder들이 생성하는 수식):
+  - 연산자: + - * / ^ & % 단항 -, 비교 = <> < > <= >=
+  - 참조: A1, $B$5, A1:B3, Sheet!A1, 'Sheet Name'!A1:B3
+  - Named Range (Workbook / Sheet scope), Name1:Name2 범위
+  - 함수: SUM, AVERAGE, MIN, MAX, STDEV, COUNT, COUNTA, COUNTIF,
+          IF, IFERROR, AND, OR, NOT, ABS, ROUND, TEXT
+  - 미지원 함수 → #NAME?
+
+계산 방식:
+  - 수식 셀 의존성 그래프를 한 번 구성 → 위상 순서(Tarjan SCC)로 1회씩 계산
+  - 중간 셀 값 캐시 (같은 셀을 다시 계산하지 않음)
+  - 순환 참조 셀은 #CIRC! (circular_cells에 기록), 하위 셀로 오류 전파
+  - 수식 파싱 결과는 수식 문자열 단위로 캐시 (워크북 간 공유)
+
+사용:
+    evaluator = WorkbookEvaluator.from_file(path)
+    evaluator.get_value('Summary', 'B5')
+    evaluator.get('LTV')           # Named Range
+    evaluator.get('Dashboard!B7')
+"""
+
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
+import math
+import re
+
+from openpyxl import load_workbook
+from openpyxl.utils.cell import column_index_from_string
+from openpyxl.workbook.workbook import Workbook
+
+
+CellKey = Tuple[str, int, int]  # (sheet, row, col)
+
+
+class ExcelError:
+    """
+    Excel 오류 값 (#DIV/0!, #VALUE! 등)
+
+    예외가 아니라 값으로 전파되며 IFERROR에서 대체됩니다.
+    """
+
+    __slots__ = ('code',)
+
+    def __init__(self, code: str):
+        self.code = code
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ExcelError) and other.code == self.code
+
+    def __hash__(self) -> int:
+        return hash(self.code)
+
+    def __repr__(self) -> str:
+        return self.code
+
+    __str__ = __repr__
+
+
+DIV0 = ExcelError('#DIV/0!')
+VALUE = ExcelError('#VALUE!')
+NAME = ExcelError('#NAME?')
+REF = ExcelError('#REF!')
+NUM = ExcelError('#NUM!')
+NA = ExcelError('#N/A')
+CIRC = ExcelError('#CIRC!')  # 순환 참조 (Excel 표준 코드 아님, 검증용)
+
+_ERRORS = {e.code: e for e in (DIV0, VALUE, NAME, REF, NUM, NA)}
+_ERRORS['#NULL!'] = ExcelError('#NULL!')
+
+
+class FormulaSyntaxError(ValueError):
+    """수식 문법 오류"""
+
+
+# ========================================
+# 토크나이저 / 파서
+# ========================================
+
+_SHEET = r"(?:'(?:[^']|'')+'|[A-Za-z_][\w\.]*)!"
+_CELL = r"\$?[A-Za-z]{1,3}\$?\d+"
+
+_TOKEN_RE = re.compile(rf"""
+    (?P<ws>\s+)
+  | (?P<string>"(?:[^"]|"")*")
+  | (?P<error>\#(?:DIV/0!|N/A|NAME\?|NULL!|NUM!|REF!|VALUE!))
+  | (?P<ref>(?:{_SHEET})?{_CELL}(?::{_CELL})?)(?![\w\(])
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<func>[A-Za-z_][\w\.]*)(?=\()
+  | (?P<name>(?:{_SHEET})?[A-Za-z_\\][\w\.]*)
+  | (?P<op><=|>=|<>|[-+*/^&=<>%(),:])
+""", re.VERBOSE)
+
+_CELL_RE = re.compile(r"\$?([A-Za-z]{1,3})\$?(\d+)")
+
+_COMPARISONS = ('=', '<>', '<', '>', '<=', '>=')
+
+
+def _split_sheet(text: str) -> Tuple[Optional[str], str]:
+    """"'Sheet'!A1" → ('Sheet', 'A1')"""
+    if '!' not in text:
+        return None, text
+    sheet, rest = text.rsplit('!', 1)
+    if sheet.startswith("'"):
+        sheet = sheet[1:-1].replace("''", "'")
+    return sheet, rest
+
+
+def _parse_cell(text: str) -> Tuple[int, int]:
+    """'$B$5' → (row, col)"""
+    match = _CELL_RE.fullmatch(text)
+    if not match:
+        raise FormulaSyntaxError(f"잘못된 셀 주소: {text}")
+    return int(match.group(2)), column_index_from_string(match.group(1).upper())
+
+
+def _tokenize(formula: str) -> List[Tuple[str, str]]:
+    tokens = []
+    pos = 0
+    while pos < len(formula):
+        match = _TOKEN_RE.match(formula, pos)
+        if not match:
+            raise FormulaSyntaxError(f"알 수 없는 토큰: {formula[pos:pos + 10]!r}")
+        kind = match.lastgroup
+        if kind != 'ws':
+            tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    """
+    재귀 하강 파서 (Excel 연산자 우선순위)
+
+    비교 < & < +- < */ < ^ < 단항 - < % < 범위(:)
+    """
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def parse(self):
+        node = self._comparison()
+        if self.pos != len(self.tokens):
+            raise FormulaSyntaxError(f"예상치 못한 토큰: {self.tokens[self.pos][1]}")
+        return node
+
+    def _peek(self) -> Tuple[Optional[str], Optional[str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def _take(self) -> Tuple[str, str]:
+        if self.pos >= len(self.tokens):
+            raise FormulaSyntaxError("수식이 끝났습니다")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expect(self, value: str) -> None:
+        kind, text = self._take()
+        if kind != 'op' or text != value:
+            raise FormulaSyntaxError(f"'{value}' 필요 (실제: {text})")
+
+    def _binary(self, operand: Callable, operators: Tuple[str, ...]):
+        node = operand()
+        while True:
+            kind, text = self._peek()
+            if kind != 'op' or text not in operators:
+                return node
+            self.pos += 1
+            node = ('op', text, node, operand())
+
+    def _comparison(self):
+        return self._binary(self._concat, _COMPARISONS)
+
+    def _concat(self):
+        return self._binary(self._additive, ('&',))
+
+    def _additive(self):
+        return self._binary(self._multiplicative, ('+', '-'))
+
+    def _multiplicative(self):
+        return self._binary(self._power, ('*', '/'))
+
+    def _power(self):
+        return self._binary(self._unary, ('^',))
+
+    def _unary(self):
+        kind, text = self._peek()
+        if kind == 'op' and text in ('-', '+'):
+            self.pos += 1
+            operand = self._unary()
+            return ('neg', operand) if text == '-' else operand
+        return self._percent()
+
+    def _percent(self):
+        node = self._primary()
+        while self._peek() == ('op', '%'):
+            self.pos += 1
+            node = ('pct', node)
+        return node
+
+    def _primary(self):
+        kind, text = self._take()
+
+        if kind == 'number':
+            return ('n', float(text) if any(c in text for c in '.eE') else int(text))
+        if kind == 'string':
+            return ('s', text[1:-1].replace('""', '"'))
+        if kind == 'error':
+            return ('e', _ERRORS[text])
+        if kind == 'ref':
+            return self._span(self._ref(text))
+        if kind == 'name':
+            upper = text.upper()
+            if upper in ('TRUE', 'FALSE'):
+                return ('b', upper == 'TRUE')
+            sheet, name = _split_sheet(text)
+            return self._span(('name', sheet, name.upper()))
+        if kind == 'func':
+            return self._call(text.upper())
+        if kind == 'op' and text == '(':
+            node = self._comparison()
+            self._expect(')')
+            return node
+
+        raise FormulaSyntaxError(f"예상치 못한 토큰: {text}")
+
+    @staticmethod
+    def _ref(text: str):
+        sheet, address = _split_sheet(text)
+        if ':' in address:
+            start, end = address.split(':')
+            r1, c1 = _parse_cell(start)
+            r2, c2 = _parse_cell(end)
+            return ('rng', sheet, min(r1, r2), min(c1, c2), max(r1, r2), max(c1, c2))
+        row, col = _parse_cell(address)
+        return ('ref', sheet, row, col)
+
+    def _span(self, node):
+        """Name1:Name2 / A1:Name 형태 범위"""
+        if self._peek() != ('op', ':'):
+            return node
+        self.pos += 1
+        kind, text = self._take()
+        if kind == 'ref':
+            other = self._ref(text)
+        elif kind == 'name':
+            sheet, name = _split_sheet(text)
+            other = ('name', sheet, name.upper())
+        else:
+            raise FormulaSyntaxError(f"범위 끝 참조 필요 (실제: {text})")
+        return ('span', node, other)
+
+    def _call(self, name: str):
+        self._expect('(')
+        args = []
+        if self._peek() == ('op', ')'):
+            self.pos += 1
+            return ('fn', name, tuple(args))
+        while True:
+            if self._peek() in (('op', ','), ('op', ')')):
+                args.append(('blank',))
+            else:
+                args.append(self._comparison())
+            kind, text = self._take()
+            if kind == 'op' and text == ')':
+                return ('fn', name, tuple(args))
+            if kind != 'op' or text != ',':
+                raise FormulaSyntaxError(f"',' 또는 ')' 필요 (실제: {text})")
+
+
+@lru_cache(maxsize=8192)
+def parse_formula(formula: str):
+    """
+    수식 문자열 → AST (튜플, 수식 문자열 단위 캐시)
+
+    Args:
+        formula: "=SUM(A1:A3)" (앞의 '='는 선택)
+
+    Raises:
+        FormulaSyntaxError: 문법 오류
+    """
+    body = formula[1:] if formula.startswith('=') else formula
+    return _Parser(_tokenize(body)).parse()
+
+
+# ========================================
+# 평가 순서
+# ========================================
+
+def evaluation_order(graph: Dict[Any, Set[Any]]) -> Tuple[List[Any], Set[Any]]:
+    """
+    의존성 그래프의 계산 순서 (Tarjan SCC, O(V+E))
+
+    Args:
+        graph: {노드: 이 노드가 참조하는 노드 집합}
+
+    Returns:
+        (의존 대상이 먼저 오는 노드 순서, 순환에 속한 노드 집합)
+    """
+    order: List[Any] = []
+    cyclic: Set[Any] = set()
+    for component in strongly_connected_components(graph):
+        if len(component) > 1 or component[0] in graph.get(component[0], ()):
+            cyclic.update(component)
+        order.extend(component)
+    return order, cyclic
+
+
+def strongly_connected_components(graph: Dict[Any, Set[Any]]) -> List[List[Any]]:
+    """
+    강결합 요소 (Tarjan, O(V+E), 반복 구현 → 깊은 체인에서도 재귀 한도 없음)
+
+    Args:
+        graph: {노드: 이 노드가 참조하는 노드 집합} (graph에 없는 노드는 무시)
+
+    Returns:
+        요소 목록 (참조 대상 요소가 먼저)
+    """
+    index: Dict[Any, int] = {}
+    lowlink: Dict[Any, int] = {}
+    on_stack: Set[Any] = set()
+    stack: List[Any] = []
+    components: List[List[Any]] = []
+    counter = 0
+
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, iter(graph.get(root, ())))]
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+
+        while work:
+            node, children = work[-1]
+            advanced = False
+            for child in children:
+                if child not in graph:
+                    continue
+                if child not in index:
+                    index[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(graph.get(child, ()))))
+                    advanced = True
+                    break
+                if child in on_stack:
+                    lowlink[node] = min(lowlink[node], index[child])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+# ========================================
+# Evaluator
+# ========================================
+
+class _Range(list):
+    """범위 참조 값 (스칼라와 구분)"""
+
+
+class WorkbookEvaluator:
+    """
+    openpyxl Workbook 수식 재계산기
+
+    - 수식 워크북(data_only=False)만 필요
+    - evaluate()는 1회만 계산하고 결과를 캐시
+    """
+
+    def __init__(self, workbook: Workbook):
+        """
+        Args:
+            workbook: openpyxl Workbook (수식 포함)
+        """
+        self.wb = workbook
+        self.values: Dict[CellKey, Any] = {}
+        self.formulas: Dict[CellKey, str] = {}
+        self._circular: Set[CellKey] = set()
+        self._syntax_errors: Dict[CellKey, str] = {}
+
+        self._sheet_cells: Dict[str, Dict[Tuple[int, int], Any]] = {}
+        self._names: Dict[str, Any] = {}
+        self._sheet_names: Dict[str, Dict[str, Any]] = {}
+        self._sheet_lookup = {name.upper(): name for name in workbook.sheetnames}
+        self._evaluated = False
+
+        self._load_cells()
+        self._load_names()
+
+    @classmethod
+    def from_file(cls, filepath: Union[str, Path]) -> 'WorkbookEvaluator':
+        """xlsx 파일에서 생성 (수식 모드로 1회 로드)"""
+        return cls(load_workbook(filepath, data_only=False))
+
+    # ----------------------------------------
+    # 공개 API
+    # ----------------------------------------
+
+    def evaluate(self) -> Dict[str, Any]:
+        """
+        모든 수식 셀 계산 (이미 계산했으면 캐시 반환)
+
+        Returns:
+            {'Sheet!A1': 값} (수식 셀만)
+        """
+        if not self._evaluated:
+            self._evaluate_all()
+        return {
+            f"{sheet}!{_coordinate(row, col)}": self.values[(sheet, row, col)]
+            for sheet, row, col in self.formulas
+        }
+
+    def get_value(self, sheet: str, cell: str) -> Any:
+        """
+        셀 값 (수식이면 계산 결과)
+
+        Args:
+            sheet: 시트 이름
+            cell: 셀 주소 (예: 'B5', '$B$5')
+
+        Returns:
+            값 (빈 셀 None, 오류는 ExcelError)
+        """
+        if not self._evaluated:
+            self._evaluate_all()
+        sheet = self._resolve_sheet(sheet)
+        if sheet is None:
+            return REF
+        row, col = _parse_cell(cell)
+        return self._cell_value(sheet, row, col)
+
+    def get(self, reference: str) -> Any:
+        """
+        참조 문자열 값 ('Sheet!B5', Named Range, 'Sheet!A1:B2' → list)
+        """
+        if not self._evaluated:
+            self._evaluate_all()
+        value = self._eval(parse_formula(reference), self.wb.sheetnames[0])
+        return list(value) if isinstance(value, _Range) else value
+
+    @property
+    def circular_cells(self) -> Set[CellKey]:
+        """순환 참조에 속한 수식 셀 (sheet, row, col)"""
+        if not self._evaluated:
+            self._evaluate_all()
+        return self._circular
+
+    @property
+    def syntax_errors(self) -> Dict[CellKey, str]:
+        """파싱 실패 수식 셀 → 오류 메시지"""
+        if not self._evaluated:
+            self._evaluate_all()
+        return self._syntax_errors
+
+    def get_errors(self) -> Dict[str, ExcelError]:
+        """오류 값으로 계산된 수식 셀"""
+        return {
+            ref: value for ref, value in self.evaluate().items()
+            if isinstance(value, ExcelError)
+        }
+
+    # ----------------------------------------
+    # 셀 / 참조 조회 (검증기용, 계산 없음)
+    # ----------------------------------------
+
+    def raw_value(self, sheet: str, row: int, col: int) -> Any:
+        """셀 원본 (수식이면 수식 문자열, 빈 셀 None)"""
+        key = (sheet, row, col)
+        if key in self.formulas:
+            return self.formulas[key]
+        return self._sheet_cells.get(sheet, {}).get((row, col))
+
+    def has_cell(self, sheet: str, row: int, col: int) -> bool:
+        """값 또는 수식이 있는 셀이면 True"""
+        return (sheet, row, col) in self.formulas or (row, col) in self._sheet_cells.get(sheet, {})
+
+    def name_target(self, node, sheet: str):
+        """
+        ('name', 시트, 이름) 노드 → 정의 AST (시트 범위 이름 우선, 미정의 None)
+
+        Args:
+            node: parse_formula()의 name 노드
+            sheet: 수식이 있는 시트
+        """
+        return self._lookup_name(node[1] or sheet, node[2], scoped_sheet=node[1] is None)
+
+    def reference_bounds(self, node, sheet: str) -> Optional[Tuple[str, int, int, int, int]]:
+        """참조 노드 (ref / rng / name / span) → (시트, r1, c1, r2, c2), 해석 불가면 None"""
+        return self._bounds(node, sheet)
+
+    def dependencies(self, node, sheet: str) -> Set[CellKey]:
+        """AST가 참조하는 수식 셀 (Named Range / 범위 포함)"""
+        return set(self._dependencies(node, sheet))
+
+    # ----------------------------------------
+    # 로드
+    # ----------------------------------------
+
+    def _load_cells(self) -> None:
+        for ws in self.wb.worksheets:
+            cells: Dict[Tuple[int, int], Any] = {}
+            for row in ws.iter_rows():
+                for cell in row:
+                    value = cell.value
+                    if value is None:
+                        continue
+                    if isinstance(value, str) and value.startswith('=') and len(value) > 1:
+                        self.formulas[(ws.title, cell.row, cell.column)] = value
+                    else:
+                        cells[(cell.row, cell.column)] = value
+            self._sheet_cells[ws.title] = cells
+
+    def _load_names(self) -> None:
+        for name, defn in _iter_defined_names(self.wb.defined_names):
+            node = self._name_node(defn.attr_text)
+            if node is not None:
+                self._names[name.upper()] = node
+
+        for ws in self.wb.worksheets:
+            scoped = getattr(ws, 'defined_names', None)
+            if not scoped:
+                continue
+            for name, defn in _iter_defined_names(scoped):
+                node = self._name_node(defn.attr_text)
+                if node is not None:
+                    self._sheet_names.setdefault(ws.title, {})[name.upper()] = node
+
+    @staticmethod
+    def _name_node(attr_text: Optional[str]):
+        """Named Range 정의 → ref / rng 노드 (상수/수식 이름은 해당 AST)"""
+        if not attr_text:
+            return None
+        try:
+            return parse_formula(attr_text)
+        except FormulaSyntaxError:
+            return ('e', REF)
+
+    # ----------------------------------------
+    # 그래프 / 계산
+    # ----------------------------------------
+
+    def _evaluate_all(self) -> None:
+        graph: Dict[CellKey, Set[CellKey]] = {}
+        asts: Dict[CellKey, Any] = {}
+
+        for key, formula in self.formulas.items():
+            try:
+                asts[key] = parse_formula(formula)
+            except FormulaSyntaxError as e:
+                self._syntax_errors[key] = str(e)
+                asts[key] = ('e', VALUE)
+            graph[key] = set(self._dependencies(asts[key], key[0]))
+
+        order, self._circular = evaluation_order(graph)
+
+        for key in order:
+            if key in self._circular:
+                self.values[key] = CIRC
+            else:
+                value = self._eval(asts[key], key[0])
+                if isinstance(value, _Range):
+                    value = VALUE  # 암시적 교차(implicit intersection) 미지원
+                self.values[key] = value
+
+        self._evaluated = True
+
+    def _dependencies(self, node, sheet: str, names: frozenset = frozenset()) -> Iterator[CellKey]:
+        """AST가 참조하는 수식 셀 (수식/상수 이름은 정의식을 따라감, names: 순환 정의 방지)"""
+        kind = node[0]
+        if kind == 'name':
+            target = self._lookup_name(node[1] or sheet, node[2], scoped_sheet=node[1] is None)
+            if target is not None and target[0] not in ('ref', 'rng'):
+                if node[2] not in names:
+                    yield from self._dependencies(target, sheet, names | {node[2]})
+                return
+        if kind in ('ref', 'rng', 'name', 'span'):
+            bounds = self._bounds(node, sheet)
+            if bounds is None:
+                return
+            ref_sheet, r1, c1, r2, c2 = bounds
+            if (r2 - r1 + 1) * (c2 - c1 + 1) <= 64:
+                for row in range(r1, r2 + 1):
+                    for col in range(c1, c2 + 1):
+                        if (ref_sheet, row, col) in self.formulas:
+                            yield (ref_sheet, row, col)
+            else:
+                for key in self.formulas:
+                    if key[0] == ref_sheet and r1 <= key[1] <= r2 and c1 <= key[2] <= c2:
+                        yield key
+        elif kind == 'op':
+            yield from self._dependencies(node[2], sheet, names)
+            yield from self._dependencies(node[3], sheet, names)
+        elif kind in ('neg', 'pct'):
+            yield from self._dependencies(node[1], sheet, names)
+        elif kind == 'fn':
+            for arg in node[2]:
+                yield from self._dependencies(arg, sheet, names)
+
+    def _bounds(self, node, sheet: str) -> Optional[Tuple[str, int, int, int, int]]:
+        """참조 노드 → (시트, r1, c1, r2, c2), 해석 불가면 None"""
+        kind = node[0]
+        if kind == 'ref':
+            ref_sheet = self._resolve_sheet(node[1] or sheet)
+            return (ref_sheet, node[2], node[3], node[2], node[3]) if ref_sheet else None
+        if kind == 'rng':
+            ref_sheet = self._resolve_sheet(node[1] or sheet)
+            return (ref_sheet,) + tuple(node[2:]) if ref_sheet else None
+        if kind == 'name':
+            target = self._lookup_name(node[1] or sheet, node[2], scoped_sheet=node[1] is None)
+            if target is None or target[0] not in ('ref', 'rng'):
+                return None
+            return self._bounds(target, sheet)
+        if kind == 'span':
+            start = self._bounds(node[1], sheet)
+            end = self._bounds(node[2], sheet)
+            if start is None or end is None or start[0] != end[0]:
+                return None
+            return (
+                start[0],
+                min(start[1], end[1]), min(start[2], end[2]),
+                max(start[3], end[3]), max(start[4], end[4])
+            )
+        return None
+
+    def _lookup_name(self, sheet: str, name: str, scoped_sheet: bool = True):
+        scoped = self._sheet_names.get(sheet, {}) if scoped_sheet or sheet else {}
+        return scoped.get(name) or self._names.get(name)
+
+    def _resolve_sheet(self, sheet: Optional[str]) -> Optional[str]:
+        if sheet is None:
+            return None
+        if sheet in self._sheet_cells:
+            return sheet
+        return self._sheet_lookup.get(sheet.upper())
+
+    def _cell_value(self, sheet: str, row: int, col: int) -> Any:
+        key = (sheet, row, col)
+        if key in self.formulas:
+            return self.values.get(key, CIRC)
+        return self._sheet_cells[sheet].get((row, col))
+
+    def _range_values(self, bounds) -> '_Range':
+        sheet, r1, c1, r2, c2 = bounds
+        return _Range(
+            self._cell_value(sheet, row, col)
+            for row in range(r1, r2 + 1)
+            for col in range(c1, c2 + 1)
+        )
+
+    def _eval(self, node, sheet: str) -> Any:
+        kind = node[0]
+
+        if kind in ('n', 's', 'b', 'e'):
+            return node[1]
+        if kind == 'blank':
+            return None
+        if kind in ('ref', 'rng', 'span'):
+            bounds = self._bounds(node, sheet)
+            if bounds is None:
+                return REF
+            if kind == 'ref':
+                return self._cell_value(*bounds[:3])
+            return self._range_values(bounds)
+        if kind == 'name':
+            target = self._lookup_name(node[1] or sheet, node[2], scoped_sheet=node[1] is None)
+            if target is None:
+                return NAME
+            if target[0] == 'ref' and target[1] is None:
+                return REF
+            return self._eval(target, sheet)
+        if kind == 'neg':
+            value = _to_number(self._eval(node[1], sheet))
+            return value if isinstance(value, ExcelError) else -value
+        if kind == 'pct':
+            value = _to_number(self._eval(node[1], sheet))
+            return value if isinstance(value, ExcelError) else value / 100
+        if kind == 'op':
+            return _binary(node[1], self._eval(node[2], sheet), self._eval(node[3], sheet))
+        if kind == 'fn':
+            return self._call(node[1], node[2], sheet)
+
+        return VALUE
+
+    def _call(self, name: str, args: tuple, sheet: str) -> Any:
+        # 지연 평가 함수
+        if name == 'IF':
+            if not 1 <= len(args) <= 3:
+                return VALUE
+            condition = _to_bool(self._scalar(args[0], sheet))
+            if isinstance(condition, ExcelError):
+                return condition
+            if condition:
+                return self._scalar(args[1], sheet) if len(args) > 1 else True
+            return self._scalar(args[2], sheet) if len(args) > 2 else False
+
+        if name == 'IFERROR':
+            if len(args) != 2:
+                return VALUE
+            value = self._scalar(args[0], sheet)
+            return self._scalar(args[1], sheet) if isinstance(value, ExcelError) else value
+
+        function = _FUNCTIONS.get(name)
+        if function is None:
+            return NAME
+        try:
+            return _finite(function(*[self._eval(arg, sheet) for arg in args]))
+        except OverflowError:
+            return NUM
+
+    def _scalar(self, node, sheet: str) -> Any:
+        value = self._eval(node, sheet)
+        return VALUE if isinstance(value, _Range) else value
+
+
+def _iter_defined_names(defined_names) -> Iterator[Tuple[str, Any]]:
+    """openpyxl 3.1 (dict) / 3.0 (DefinedNameList) 호환"""
+    if hasattr(defined_names, 'items'):
+        yield from defined_names.items()
+    else:
+        for defn in getattr(defined_names, 'definedName', []):
+            if defn.localSheetId is None:
+                yield defn.name, defn
+
+
+def _coordinate(row: int, col: int) -> str:
+    from openpyxl.utils.cell import get_column_letter
+    return f"{get_column_letter(col)}{row}"
+
+
+# ========================================
+# 값 변환 / 연산자
+# ========================================
+
+def _to_number(value: Any) -> Any:
+    """산술용 숫자 변환 (빈 셀 0, 불리언 0/1, 숫자 문자열 허용)"""
+    if isinstance(value, ExcelError):
+        return value
+    if value is None:
+        return 0
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        text = value.strip()
+        try:
+            if text.endswith('%'):
+                return float(text[:-1].replace(',', '')) / 100
+            return float(text.replace(',', ''))
+        except ValueError:
+            return VALUE
+    return VALUE
+
+
+def _to_bool(value: Any) -> Any:
+    if isinstance(value, ExcelError):
+        return value
+    if value is None:
+        return False
+    if isinstance(value, (bool, int, float)):
+        return bool(value)
+    if isinstance(value, str) and value.upper() in ('TRUE', 'FALSE'):
+        return value.upper() == 'TRUE'
+    return VALUE
+
+
+def _to_text(value: Any) -> Any:
+    if isinstance(value, ExcelError):
+        return value
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, float):
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return f"{value:.15g}"
+    return str(value)
+
+
+def _type_rank(value: Any) -> int:
+    """Excel 비교 순서: 숫자 < 텍스트 < 논리값"""
+    if isinstance(value, bool):
+        return 2
+    if isinstance(value, str):
+        return 1
+    return 0
+
+
+def _compare(op: str, left: Any, right: Any) -> bool:
+    if left is None:
+        left = "" if isinstance(right, str) else (False if isinstance(right, bool) else 0)
+    if right is None:
+        right = "" if isinstance(left, str) else (False if isinstance(left, bool) else 0)
+
+    rank_left, rank_right = _type_rank(left), _type_rank(right)
+    if rank_left != rank_right:
+        left, right = rank_left, rank_right
+    elif rank_left == 1:
+        left, right = left.lower(), right.lower()
+
+    if op == '=':
+        return left == right
+    if op == '<>':
+        return left != right
+    if op == '<':
+        return left < right
+    if op == '>':
+        return left > right
+    if op == '<=':
+        return left <= right
+    return left >= right
+
+
+def _binary(op: str, left: Any, right: Any) -> Any:
+    if isinstance(left, _Range) or isinstance(right, _Range):
+        return VALUE
+    if isinstance(left, ExcelError):
+        return left
+    if isinstance(right, ExcelError):
+        return right
+
+    if op in _COMPARISONS:
+        return _compare(op, left, right)
+    if op == '&':
+        return _to_text(left) + _to_text(right)
+
+    a, b = _to_number(left), _to_number(right)
+    if isinstance(a, ExcelError):
+        return a
+    if isinstance(b, ExcelError):
+        return b
+
+    try:
+        if op == '+':
+            result = a + b
+        elif op == '-':
+            result = a - b
+        elif op == '*':
+            result = a * b
+        elif op == '/':
+            if b == 0:
+                return DIV0
+            result = a / b
+        elif op == '^':
+            # float 거듭제곱 (정수 big-int 거듭제곱은 수백 자리 int → 이후 연산 OverflowError)
+            result = float(a) ** float(b)
+        else:
+            return VALUE
+    except ZeroDivisionError:
+        return DIV0  # 0 ^ 음수
+    except OverflowError:
+        return NUM
+    return _finite(result)
+
+
+def _finite(value: Any) -> Any:
+    """Excel 숫자 범위 밖 (inf / nan / 복소수) → #NUM!"""
+    if isinstance(value, complex) or (isinstance(value, float) and not math.isfinite(value)):
+        return NUM
+    return value
+
+
+# ========================================
+# 함수
+# ========================================
+
+def _numbers(args: tuple) -> Any:
+    """
+    집계 함수 인수 → 숫자 목록
+
+    - 범위 안: 숫자만 사용 (텍스트/논리값/빈 셀 무시)
+    - 직접 인수: 논리값·숫자 문자열도 변환, 변환 불가 텍스트는 #VALUE!
+    - 오류는 그대로 반환
+    """
+    numbers: List[float] = []
+    for arg in args:
+        if isinstance(arg, _Range):
+            for value in arg:
+                if isinstance(value, ExcelError):
+                    return value
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    numbers.append(value)
+        elif arg is not None:
+            value = _to_number(arg)
+            if isinstance(value, ExcelError):
+                return value
+            numbers.append(value)
+    return numbers
+
+
+def _aggregate(reducer: Callable[[List[float]], Any]) -> Callable:
+    def function(*args):
+        numbers = _numbers(args)
+        if isinstance(numbers, ExcelError):
+            return numbers
+        return reducer(numbers)
+    return function
+
+
+def _average(numbers: List[float]) -> Any:
+    return sum(numbers) / len(numbers) if numbers else DIV0
+
+
+def _stdev(numbers: List[float]) -> Any:
+    if len(numbers) < 2:
+        return DIV0
+    mean = sum(numbers) / len(numbers)
+    return math.sqrt(sum((x - mean) ** 2 for x in numbers) / (len(numbers) - 1))
+
+
+def _flatten(args: tuple) -> Iterator[Any]:
+    for arg in args:
+        if isinstance(arg, _Range):
+            yield from arg
+        else:
+            yield arg
+
+
+def _count(*args) -> int:
+    return sum(
+        1 for value in _flatten(args)
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    )
+
+
+def _counta(*args) -> int:
+    return sum(1 for value in _flatten(args) if value is not None)
+
+
+def _logical(combine: Callable[[List[bool]], bool]) -> Callable:
+    def function(*args):
+        flags = []
+        for value in _flatten(args):
+            if value is None or (isinstance(value, str) and value.upper() not in ('TRUE', 'FALSE')):
+                continue
+            flag = _to_bool(value)
+            if isinstance(flag, ExcelError):
+                return flag
+            flags.append(flag)
+        return combine(flags) if flags else VALUE
+    return function
+
+
+def _not(value=None) -> Any:
+    flag = _to_bool(value)
+    return flag if isinstance(flag, ExcelError) else not flag
+
+
+def _abs(value=None) -> Any:
+    number = _to_number(value)
+    return number if isinstance(number, ExcelError) else abs(number)
+
+
+def _round(value=None, digits=0) -> Any:
+    number, digits = _to_number(value), _to_number(digits)
+    for v in (number, digits):
+        if isinstance(v, ExcelError):
+            return v
+    if not math.isfinite(number):
+        return NUM
+    quantum = Decimal(1).scaleb(-int(digits))
+    try:
+        return float(Decimal(repr(number)).quantize(quantum, rounding=ROUND_HALF_UP))
+    except InvalidOperation:
+        # 유효 자릿수(28) 초과 → float 정밀도 밖이므로 반올림 불필요
+        return number
+
+
+_CRITERIA_RE = re.compile(r"^(<=|>=|<>|<|>|=)?(.*)$", re.DOTALL)
+
+
+def _countif(values=None, criteria=None) -> Any:
+    if not isinstance(values, _Range):
+        values = _Range([values])
+    if isinstance(criteria, ExcelError):
+        return criteria
+
+    if isinstance(criteria, str):
+        op, operand = _CRITERIA_RE.match(criteria).groups()
+        op = op or '='
+    else:
+        op, operand = '=', criteria
+
+    target = _to_number(operand) if isinstance(operand, str) else operand
+    numeric = not isinstance(target, ExcelError) and operand != "" and not isinstance(operand, bool)
+
+    if numeric:
+        return sum(
+            1 for value in values
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+            and _compare(op, value, target)
+        )
+
+    text = _to_text(operand)
+    if op in ('=', '<>') and any(c in text for c in '*?'):
+        pattern = _wildcard(text)
+        matches = sum(1 for value in values if isinstance(value, str) and pattern.fullmatch(value))
+        return matches if op == '=' else len(values) - matches
+
+    if op == '=' and text == "":
+        return sum(1 for value in values if value is None or value == "")
+    return sum(1 for value in values if isinstance(value, str) and _compare(op, value, text))
+
+
+def _wildcard(text: str) -> 're.Pattern':
+    """Excel 와일드카드 (* ? ~) → 정규식 (대소문자 무시)"""
+    parts = []
+    escape = False
+    for char in text:
+        if escape:
+            parts.append(re.escape(char))
+            escape = False
+        elif char == '~':
+            escape = True
+        elif char == '*':
+            parts.append('.*')
+        elif char == '?':
+            parts.append('.')
+        else:
+            parts.append(re.escape(char))
+    return re.compile(''.join(parts), re.IGNORECASE | re.DOTALL)
+
+
+def _text(value=None, fmt=None) -> Any:
+    """
+    TEXT(값, 서식) - 숫자 서식 일부 지원
+
+    0 / 0.0 / #,##0 / #,##0.00 / 0% / 0.0% (그 외 서식은 기본 표시)
+    """
+    if isinstance(value, ExcelError):
+        return value
+    if isinstance(fmt, ExcelError):
+        return fmt
+    number = _to_number(value)
+    if isinstance(number, ExcelError) or not isinstance(fmt, str):
+        return _to_text(value)
+
+    percent = fmt.endswith('%')
+    body = fmt[:-1] if percent else fmt
+    if not re.fullmatch(r"[#0,]*(?:\.0+)?", body) or not body:
+        return _to_text(value)
+
+    decimals = len(body.split('.', 1)[1]) if '.' in body else 0
+    if percent:
+        number *= 100
+    rounded = _round(number, decimals)
+    text = f"{rounded:,.{decimals}f}" if ',' in body else f"{rounded:.{decimals}f}"
+    return text + ('%' if percent else '')
+
+
+_FUNCTIONS: Dict[str, Callable] = {
+    'SUM': _aggregate(sum),
+    'AVERAGE': _aggregate(_average),
+    'MIN': _aggregate(lambda numbers: min(numbers) if numbers else 0),
+    'MAX': _aggregate(lambda numbers: max(numbers) if numbers else 0),
+    'STDEV': _aggregate(_stdev),
+    'COUNT': _count,
+    'COUNTA': _counta,
+    'COUNTIF': _countif,
+    'AND': _logical(all),
+    'OR': _logical(any),
+    'NOT': _not,
+    'ABS': _abs,
+    'ROUND': _round,
+    'TEXT': _text,
+}
+
+SUPPORTED_FUNCTIONS = frozenset(_FUNCTIONS) | {'IF', 'IFERROR'}
+
+
+def evaluate_workbook(filepath: Union[str, Path]) -> Dict[str, Any]:
+    """
+    편의 함수: 파일의 모든 수식 셀 계산
+
+    Returns:
+        {'Sheet!A1': 값}
+    """
+    return WorkbookEvaluator.from_file(filepath).evaluate()
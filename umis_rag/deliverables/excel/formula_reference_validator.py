@@ -33,6 +33,50 @@ class FormulaReferenceValidator:
       - 의도와 비교
     """
     
+    # 규칙 상수 (UnifiedWorkbookValidator와 공유)
+    SUMMARY_CRITICAL_CELLS = [
+        {
+            'cell': 'B5',
+            'expected_name': 'TAM',
+            'expected_source': 'TAM (Convergence 또는 Named Range)',
+            'description': 'Summary TAM'
+        },
+        {
+            'cell': 'B6',
+            'expected_name': 'SAM',
+            'expected_source': 'Convergence 평균 SAM',
+            'description': 'Summary SAM (평균)'
+        },
+        # Method별 SAM (B10-B13)
+        {
+            'cell': 'B10',
+            'expected_name': 'SAM (Method 1)',
+            'expected_source': 'SAM Named Range',
+            'description': 'Summary Method 1'
+        },
+        {
+            'cell': 'B11',
+            'expected_name': 'SAM (Method 2)',
+            'expected_source': 'SAM_Method2',
+            'description': 'Summary Method 2'
+        },
+        # Scenarios
+        {
+            'cell': 'B21',  # 대략 이 위치
+            'expected_name': 'Best Case Average SAM',
+            'expected_source': 'Scenarios Average SAM (Best)',
+            'description': 'Best Case SAM'
+        },
+    ]
+    
+    # Method별 SAM이 올바른 Named Range 참조하는지
+    CONVERGENCE_SAM_CELLS = [
+        ('B4', 'SAM', 'Method 1 SAM'),
+        ('B5', 'SAM_Method2', 'Method 2 SAM'),
+        ('B6', 'SAM_Method3', 'Method 3 SAM'),
+        ('B7', 'SAM_Method4', 'Method 4 SAM'),
+    ]
+    
     def __init__(self, filepath: Path):
         """
         Args:
@@ -75,42 +119,7 @@ class FormulaReferenceValidator:
         ws = self.wb['Summary']
         
         # 주요 셀 검증
-        critical_cells = [
-            {
-                'cell': 'B5',
-                'expected_name': 'TAM',
-                'expected_source': 'TAM (Convergence 또는 Named Range)',
-                'description': 'Summary TAM'
-            },
-            {
-                'cell': 'B6',
-                'expected_name': 'SAM',
-                'expected_source': 'Convergence 평균 SAM',
-                'description': 'Summary SAM (평균)'
-            },
-            # Method별 SAM (B10-B13)
-            {
-                'cell': 'B10',
-                'expected_name': 'SAM (Method 1)',
-                'expected_source': 'SAM Named Range',
-                'description': 'Summary Method 1'
-            },
-            {
-                'cell': 'B11',
-                'expected_name': 'SAM (Method 2)',
-                'expected_source': 'SAM_Method2',
-                'description': 'Summary Method 2'
-            },
-            # Scenarios
-            {
-                'cell': 'B21',  # 대략 이 위치
-                'expected_name': 'Best Case Average SAM',
-                'expected_source': 'Scenarios Average SAM (Best)',
-                'description': 'Best Case SAM'
-            },
-        ]
-        
-        for spec in critical_cells:
+        for spec in self.SUMMARY_CRITICAL_CELLS:
             cell_addr = spec['cell']
             cell = ws[cell_addr]
             
@@ -160,15 +169,7 @@ class FormulaReferenceValidator:
         
         ws = self.wb['Convergence_Analysis']
         
-        # Method별 SAM이 올바른 Named Range 참조하는지
-        sam_cells = [
-            ('B4', 'SAM', 'Method 1 SAM'),
-            ('B5', 'SAM_Method2', 'Method 2 SAM'),
-            ('B6', 'SAM_Method3', 'Method 3 SAM'),
-            ('B7', 'SAM_Method4', 'Method 4 SAM'),
-        ]
-        
-        for cell_addr, expected_range, desc in sam_cells:
+        for cell_addr, expected_range, desc in self.CONVERGENCE_SAM_CELLS:
             cell = ws[cell_addr]
             
             if cell.value and isinstance(cell.value, str) and cell.value.startswith('='):
@@ -11,13 +11,19 @@ Golden Test Spec:
   - 각 Generator마다 expected_results 정의
   - 주요 셀의 기대값 명시 (시트!셀 → 값)
   - 자동 비교 (오차 < 1%)
+
+값 계산 (v7.11.2):
+  - 기본: WorkbookEvaluator로 수식 직접 재계산 (Excel/LibreOffice 불필요)
+  - recalculate=False: Excel이 저장한 캐시 값 사용 (data_only=True)
 """
 
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional
 from openpyxl import load_workbook
 from openpyxl.workbook.workbook import Workbook
 
+from .formula_evaluator import ExcelError, WorkbookEvaluator
+
 
 class GoldenTestSpec:
     """
@@ -331,16 +337,27 @@ class GoldenTestRunner:
     Syntax + Golden Values 병행 검증
     """
     
-    def __init__(self, filepath: Path, spec: Dict):
+    def __init__(
+        self,
+        filepath: Path,
+        spec: Dict,
+        recalculate: bool = True,
+        evaluator: Optional[WorkbookEvaluator] = None
+    ):
         """
         Args:
             filepath: 검증할 Excel 파일
             spec: Golden Test Spec
+            recalculate: True면 수식 직접 재계산 (v7.11.2),
+                False면 Excel 저장 값 사용 (data_only=True)
+            evaluator: 이미 로드한 워크북의 재계산기 (재사용 시 파일을 다시 열지 않음)
         """
         self.filepath = filepath
         self.spec = spec
-        self.wb_formula = None  # 수식 확인용
-        self.wb_data = None  # 값 확인용
+        self.recalculate = recalculate or evaluator is not None
+        self.wb_formula = evaluator.wb if evaluator is not None else None  # 수식 확인용
+        self.wb_data = None  # 값 확인용 (recalculate=False)
+        self.evaluator = evaluator  # 값 계산용 (recalculate=True)
         self.results = {}
         self.errors = []
         self.warnings = []
@@ -357,10 +374,15 @@ class GoldenTestRunner:
         print(f"   케이스: {self.spec['case']}")
         print("="*70)
         
-        # 파일 열기 (2가지 모드)
+        # 파일 열기 (재계산 시 1회 로드)
         try:
-            self.wb_formula = load_workbook(self.filepath, data_only=False)
-            self.wb_data = load_workbook(self.filepath, data_only=True)
+            if self.wb_formula is None:
+                self.wb_formula = load_workbook(self.filepath, data_only=False)
+            if self.recalculate:
+                if self.evaluator is None:
+                    self.evaluator = WorkbookEvaluator(self.wb_formula)
+            else:
+                self.wb_data = load_workbook(self.filepath, data_only=True)
         except Exception as e:
             self.errors.append(f"파일 열기 실패: {e}")
             return self._compile_results()
@@ -370,6 +392,19 @@ class GoldenTestRunner:
         print("-"*70)
         self._check_syntax()
         
+        # Step 2-3: Golden Values + 논리적 일관성
+        self.check_values()
+        
+        return self._compile_results()
+    
+    def check_values(self):
+        """
+        Golden Values + 논리적 일관성 검증 (Syntax 제외)
+        
+        evaluator(또는 wb_data)가 준비된 상태에서 호출
+        (UnifiedWorkbookValidator는 자체 인덱스로 Syntax를 검사하고 이 단계만 재사용)
+        """
+        
         # Step 2: Golden Values 검증 ⭐ 핵심
         print("\n2️⃣ Golden Values 검증 (결과 중심)")
         print("-"*70)
@@ -379,8 +414,6 @@ class GoldenTestRunner:
         print("\n3️⃣ 논리적 일관성 검증")
         print("-"*70)
         self._check_consistency()
-        
-        return self._compile_results()
     
     def _check_syntax(self):
         """Syntax 검증 (자기 참조, 오류 수식)"""
@@ -433,6 +466,16 @@ class GoldenTestRunner:
                 self.errors.append(
                     f"❌ {sheet}!{cell} ({desc}): 값 없음 (기대: {self._format_value(expected)})"
                 )
+            elif isinstance(actual, ExcelError):
+                failed_count += 1
+                self.errors.append(
+                    f"❌ {sheet}!{cell} ({desc}): 수식 오류 {actual} (기대: {self._format_value(expected)})"
+                )
+            elif not isinstance(actual, (int, float)):
+                failed_count += 1
+                self.errors.append(
+                    f"❌ {sheet}!{cell} ({desc}): 숫자 아님 '{actual}' (기대: {self._format_value(expected)})"
+                )
             else:
                 # 오차 계산
                 if expected != 0:
@@ -479,37 +522,41 @@ class GoldenTestRunner:
     
     def _get_cell_value(self, sheet: str, cell: str) -> Any:
         """
-        셀 값 가져오기 (data_only=True)
+        셀 값 가져오기 (재계산 값 또는 data_only=True)
         
         Args:
             sheet: 시트 이름
             cell: 셀 주소
         
         Returns:
-            셀 값 (숫자) 또는 None
+            셀 값 (숫자), ExcelError 또는 None
         """
         
         try:
-            if sheet not in self.wb_data.sheetnames:
-                return None
-            
-            ws = self.wb_data[sheet]
-            cell_obj = ws[cell]
+            if self.evaluator is not None:
+                if sheet not in self.wb_formula.sheetnames:
+                    return None
+                value = self.evaluator.get_value(sheet, cell)
+            else:
+                if sheet not in self.wb_data.sheetnames:
+                    return None
+                value = self.wb_data[sheet][cell].value
             
-            if cell_obj.value is None:
-                return None
+            if value is None or isinstance(value, ExcelError):
+                return value
             
             # 숫자로 변환 시도
             try:
-                return float(cell_obj.value)
+                return float(value)
             except:
                 # 문자열일 수 있음 (예: "✅ 통과")
-                return cell_obj.value
+                return value
         
         except Exception as e:
             return None
     
-    def _format_value(self, value: float) -> str:
+    @staticmethod
+    def _format_value(value: float) -> str:
         """값 포맷팅"""
         
         if value >= 1_0000_0000:
@@ -551,13 +598,14 @@ class GoldenTestRunner:
 
 
 # 편의 함수
-def run_golden_test(filepath: Path, tool_type: str) -> bool:
+def run_golden_test(filepath: Path, tool_type: str, recalculate: bool = True) -> bool:
     """
     Golden Test 실행 (편의 함수)
     
     Args:
         filepath: Excel 파일
         tool_type: 'market_sizing', 'unit_economics', 'financial_projection'
+        recalculate: 수식 직접 재계산 여부 (False면 Excel 저장 값)
     
     Returns:
         통과 여부
@@ -574,7 +622,7 @@ def run_golden_test(filepath: Path, tool_type: str) -> bool:
         raise ValueError(f"Unknown tool_type: {tool_type}")
     
     # 실행
-    runner = GoldenTestRunner(filepath, spec)
+    runner = GoldenTestRunner(filepath, spec, recalculate=recalculate)
     result = runner.run()
     
     return result['passed']
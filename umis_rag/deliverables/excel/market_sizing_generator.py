@@ -25,6 +25,8 @@ from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.worksheet.worksheet import Worksheet
 
 from .formula_engine import FormulaEngine, ExcelStyles
+from .batch_generator import BuilderTimer
+from .streaming_workbook import StreamingWorkbook
 from .assumptions_builder import AssumptionsSheetBuilder, EstimationDetailsBuilder
 from .method_builders import (
     Method1TopDownBuilder,
@@ -52,6 +54,8 @@ class MarketSizingWorkbookGenerator:
     def __init__(self):
         """초기화"""
         self.formula_engine: Optional[FormulaEngine] = None
+        self.builder_timings: Dict[str, float] = {}  # v7.11.2: Builder별 ms
+        self.dependency_report: Optional[Dict] = None  # v7.11.2: 저장 전 수식 의존성 검증 결과
     
     def generate(
         self,
@@ -61,7 +65,8 @@ class MarketSizingWorkbookGenerator:
         segments: List[Dict],
         proxy_data: Dict,
         competitors: List[Dict],
-        output_dir: Path
+        output_dir: Path,
+        streaming: bool = False
     ) -> Path:
         """
         전체 워크북 생성
@@ -74,6 +79,7 @@ class MarketSizingWorkbookGenerator:
             proxy_data: Proxy 데이터
             competitors: 경쟁사 목록
             output_dir: 출력 디렉토리
+            streaming: write-only 스트리밍 백엔드 사용 (v7.11.2, 대용량 시트 메모리 절감)
         
         Returns:
             생성된 Excel 파일 경로
@@ -87,84 +93,108 @@ class MarketSizingWorkbookGenerator:
         print(f"   시장: {market_name}")
         
         # 1. 워크북 초기화
-        wb = Workbook()
-        self.formula_engine = FormulaEngine(wb)
-        
-        # 기본 시트 제거
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
-        
-        # 2. Assumptions 시트
-        print(f"   1/9 Assumptions...")
-        assumptions_builder = AssumptionsSheetBuilder(wb, self.formula_engine)
-        assumptions_builder.create_sheet(assumptions)
-        
-        # 3. Estimation Details (추정치가 있는 경우)
-        estimations = [a for a in assumptions if a.get('data_type') == '추정치']
-        if estimations:
-            print(f"   2/9 Estimation Details...")
-            estimation_builder = EstimationDetailsBuilder(wb, self.formula_engine)
-            estimation_builder.create_sheet(estimations)
-        
-        # 4-7. Method 시트들 (4가지)
-        print(f"   3/9 Method 1: Top-Down...")
-        method1 = Method1TopDownBuilder(wb, self.formula_engine)
-        method1.create_sheet(tam, tam.get('narrowing_steps', []))
-        
-        print(f"   4/9 Method 2: Bottom-Up...")
-        method2 = Method2BottomUpBuilder(wb, self.formula_engine)
-        method2.create_sheet(segments)
-        
-        print(f"   5/9 Method 3: Proxy...")
-        method3 = Method3ProxyBuilder(wb, self.formula_engine)
-        method3.create_sheet(proxy_data)
-        
-        print(f"   6/9 Method 4: Competitor Revenue...")
-        method4 = Method4CompetitorBuilder(wb, self.formula_engine)
-        method4.create_sheet(competitors)
-        
-        # 8. Convergence Analysis
-        print(f"   7/9 Convergence Analysis...")
-        convergence = ConvergenceBuilder(wb, self.formula_engine)
-        convergence.create_sheet()
-        
-        # 9. Scenarios
-        print(f"   8/9 Scenarios...")
-        scenarios = ScenariosBuilder(wb, self.formula_engine)
-        scenarios.create_sheet()
-        
-        # 10. Validation Log
-        print(f"   9/10 Validation Log...")
-        validation_log = ValidationLogBuilder(wb, self.formula_engine)  # FormulaEngine 전달
-        validation_log.create_sheet()
-        
-        # 11. Should vs Will (Note: Domain Reasoner는 deprecated)
-        print(f"   10/10 Should vs Will...")
-        should_vs_will = ShouldVsWillBuilder(wb, self.formula_engine)
-        
-        # Domain Reasoner는 deprecated되어 None 전달
-        should_vs_will_data = None
-        
-        should_vs_will.create_sheet(should_vs_will_data)
-        
-        # 12. Summary (첫 번째 시트로 이동)
-        print(f"   Summary Dashboard...")
-        summary = SummaryBuilder(wb, self.formula_engine)
-        summary.create_sheet(market_name=market_name)
-        
-        # 11. 강제 재계산 설정 (피드백 반영!)
-        wb.calculation.calcMode = 'auto'
-        wb.calculation.fullCalcOnLoad = True  # ⭐ 피드백 반영!
-        
-        # 12. 저장
-        filename = f"market_sizing_{market_name}_{datetime.now().strftime('%Y%m%d')}.xlsx"
-        filepath = output_dir / filename
-        
-        output_dir.mkdir(parents=True, exist_ok=True)
-        wb.save(filepath)
+        timer = BuilderTimer()
+        self.builder_timings = timer.timings
+        wb = StreamingWorkbook() if streaming else Workbook()
+        try:
+            self.formula_engine = FormulaEngine(wb)
+            
+            # 기본 시트 제거
+            if 'Sheet' in wb.sheetnames:
+                wb.remove(wb['Sheet'])
+            
+            # 2. Assumptions 시트
+            print(f"   1/9 Assumptions...")
+            with timer.measure('Assumptions'):
+                assumptions_builder = AssumptionsSheetBuilder(wb, self.formula_engine)
+                assumptions_builder.create_sheet(assumptions)
+            
+            # 3. Estimation Details (추정치가 있는 경우)
+            estimations = [a for a in assumptions if a.get('data_type') == '추정치']
+            if estimations:
+                print(f"   2/9 Estimation Details...")
+                with timer.measure('Estimation Details'):
+                    estimation_builder = EstimationDetailsBuilder(wb, self.formula_engine)
+                    estimation_builder.create_sheet(estimations)
+            
+            # 4-7. Method 시트들 (4가지)
+            print(f"   3/9 Method 1: Top-Down...")
+            with timer.measure('Method 1: Top-Down'):
+                method1 = Method1TopDownBuilder(wb, self.formula_engine)
+                method1.create_sheet(tam, tam.get('narrowing_steps', []))
+            
+            print(f"   4/9 Method 2: Bottom-Up...")
+            with timer.measure('Method 2: Bottom-Up'):
+                method2 = Method2BottomUpBuilder(wb, self.formula_engine)
+                method2.create_sheet(segments)
+            
+            print(f"   5/9 Method 3: Proxy...")
+            with timer.measure('Method 3: Proxy'):
+                method3 = Method3ProxyBuilder(wb, self.formula_engine)
+                method3.create_sheet(proxy_data)
+            
+            print(f"   6/9 Method 4: Competitor Revenue...")
+            with timer.measure('Method 4: Competitor Revenue'):
+                method4 = Method4CompetitorBuilder(wb, self.formula_engine)
+                method4.create_sheet(competitors)
+            
+            # 8. Convergence Analysis
+            print(f"   7/9 Convergence Analysis...")
+            with timer.measure('Convergence Analysis'):
+                convergence = ConvergenceBuilder(wb, self.formula_engine)
+                convergence.create_sheet()
+            
+            # 9. Scenarios
+            print(f"   8/9 Scenarios...")
+            with timer.measure('Scenarios'):
+                scenarios = ScenariosBuilder(wb, self.formula_engine)
+                scenarios.create_sheet()
+            
+            # 10. Validation Log
+            print(f"   9/10 Validation Log...")
+            with timer.measure('Validation Log'):
+                validation_log = ValidationLogBuilder(wb, self.formula_engine)  # FormulaEngine 전달
+                validation_log.create_sheet()
+            
+            # 11. Should vs Will (Note: Domain Reasoner는 deprecated)
+            print(f"   10/10 Should vs Will...")
+            with timer.measure('Should vs Will'):
+                should_vs_will = ShouldVsWillBuilder(wb, self.formula_engine)
+
+                # Domain Reasoner는 deprecated되어 None 전달
+                should_vs_will_data = None
+
+                should_vs_will.create_sheet(should_vs_will_data)
+            
+            # 12. Summary (첫 번째 시트로 이동)
+            print(f"   Summary Dashboard...")
+            with timer.measure('Summary Dashboard'):
+                summary = SummaryBuilder(wb, self.formula_engine)
+                summary.create_sheet(market_name=market_name)
+            
+            # 11. 강제 재계산 설정 (피드백 반영!)
+            wb.calculation.calcMode = 'auto'
+            wb.calculation.fullCalcOnLoad = True  # ⭐ 피드백 반영!
+            
+            # 저장 전 수식 의존성 검증 (v7.11.2, 순환 참조 / 미정의 Named Range)
+            self.dependency_report = self.formula_engine.validate_dependencies()
+            
+            # 12. 저장
+            filename = f"market_sizing_{market_name}_{datetime.now().strftime('%Y%m%d')}.xlsx"
+            filepath = output_dir / filename
+            
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with timer.measure('save'):
+                wb.save(filepath)
+        except BaseException:
+            # 스트리밍: 열린 시트 스트림 / 임시 파일 정리 후 전파
+            if streaming:
+                wb.close()
+            raise
         
         print(f"\n✅ Excel 생성 완료: {filepath}")
         print(f"📊 시트: {len(wb.sheetnames)}개 (Summary, Assumptions, Methods 1-4, Convergence, Scenarios, Validation)")
+        print(f"🔗 {FormulaEngine.summarize_dependency_report(self.dependency_report)}")
         print(f"📋 다음: Excel에서 열어서 함수 작동 확인")
         print(f"📋 다음: PDF로 저장 (백업)")
         
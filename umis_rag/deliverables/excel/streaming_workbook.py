@@ -0,0 +1,382 @@
+"""
+Streaming Workbook Backend
+write-only(스트리밍) 워크북 백엔드 (v7.11.2)
+
+배경:
+  - Builder들은 일반 openpyxl Workbook에 셀을 기록 → 모든 Cell 객체와
+    스타일이 wb.save까지 메모리에 유지
+  - 120개월 / 다중 코호트 예측 시 메모리와 저장 시간이 급증
+
+구조:
+  - StreamingWorkbook: Workbook(write_only=True) 래퍼
+  - StreamingWorksheet: Builder가 쓰는 Worksheet API 부분집합 제공
+    (ws['A1'], ws.cell(), merge_cells, column_dimensions, row_dimensions,
+     conditional_formatting, freeze_panes, append)
+  - 최근 window 행만 버퍼에 유지, 그 이전 행은 순서대로 디스크에 기록
+  - 스타일 조합은 NamedStyle로 1회 등록 후 공유
+
+Builder 계약 (스트리밍 모드):
+  - 행은 위에서 아래로 기록 (window 안에서는 되돌아가기 허용)
+  - 이미 기록된 행은 다시 쓰지 않음 → StreamingWriteError
+  - 열 너비 / freeze_panes는 첫 행 기록 전에 설정
+
+사용:
+    wb = StreamingWorkbook()
+    engine = FormulaEngine(wb)
+    CohortLTVBuilder(wb, engine).create_sheet(120)
+    wb.save(path)   # 저장하지 않을 때는 wb.close() (또는 with StreamingWorkbook() as wb)
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import NamedStyle
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string, get_column_letter
+
+
+DEFAULT_WINDOW = 64  # 버퍼에 유지하는 최근 행 수
+
+
+class StreamingWriteError(RuntimeError):
+    """스트리밍 모드에서 허용되지 않는 쓰기 (이미 기록된 행 등)"""
+
+
+class StreamingCell:
+    """
+    버퍼 셀 (Cell 대신 값 + 스타일 속성만 보관)
+    """
+
+    __slots__ = (
+        'row', 'column', 'value',
+        'font', 'fill', 'border', 'alignment', 'number_format', 'protection',
+        'comment', 'hyperlink'
+    )
+
+    def __init__(self, row: int, column: int):
+        self.row = row
+        self.column = column
+        self.value = None
+        self.font = None
+        self.fill = None
+        self.border = None
+        self.alignment = None
+        self.number_format = None
+        self.protection = None
+        self.comment = None
+        self.hyperlink = None
+
+    @property
+    def coordinate(self) -> str:
+        return f"{get_column_letter(self.column)}{self.row}"
+
+    @property
+    def column_letter(self) -> str:
+        return get_column_letter(self.column)
+
+    def style_key(self) -> Optional[Tuple]:
+        """스타일 조합 키 (스타일 없으면 None)"""
+        key = (self.font, self.fill, self.border, self.alignment, self.number_format, self.protection)
+        return None if key == (None,) * 6 else key
+
+
+class _RowDimensions:
+    """row_dimensions 래퍼: 이미 기록된 행 높이 변경 방지"""
+
+    def __init__(self, sheet: 'StreamingWorksheet'):
+        self._sheet = sheet
+
+    def __getitem__(self, row: int):
+        self._sheet._check_row(row, "row_dimensions")
+        return self._sheet._ws.row_dimensions[row]
+
+
+class StreamingWorksheet:
+    """
+    write-only 시트 래퍼
+
+    최근 window 행을 StreamingCell로 버퍼링하고,
+    그보다 오래된 행은 순서대로 WriteOnlyWorksheet에 기록합니다.
+    """
+
+    def __init__(self, parent: 'StreamingWorkbook', ws, window: int = DEFAULT_WINDOW):
+        self._parent = parent
+        self._ws = ws
+        self._window = window
+        self._pending: Dict[int, Dict[int, StreamingCell]] = {}
+        self._written = 0  # 기록 완료된 마지막 행
+        self._max_row = 0
+        self._max_column = 0
+
+    # ----------------------------------------
+    # Worksheet API
+    # ----------------------------------------
+
+    @property
+    def title(self) -> str:
+        return self._ws.title
+
+    @title.setter
+    def title(self, value: str) -> None:
+        self._ws.title = value
+
+    @property
+    def max_row(self) -> int:
+        return self._max_row
+
+    @property
+    def max_column(self) -> int:
+        return self._max_column
+
+    @property
+    def column_dimensions(self):
+        if self._written:
+            raise StreamingWriteError(f"{self.title}: 열 너비는 첫 행 기록 전에 설정해야 합니다")
+        return self._ws.column_dimensions
+
+    @property
+    def row_dimensions(self) -> _RowDimensions:
+        return _RowDimensions(self)
+
+    @property
+    def freeze_panes(self):
+        return self._ws.freeze_panes
+
+    @freeze_panes.setter
+    def freeze_panes(self, value) -> None:
+        if self._written:
+            raise StreamingWriteError(f"{self.title}: freeze_panes는 첫 행 기록 전에 설정해야 합니다")
+        self._ws.freeze_panes = value
+
+    def __getattr__(self, name: str) -> Any:
+        # conditional_formatting, protection, data_validations, sheet_properties 등
+        return getattr(self._ws, name)
+
+    def cell(self, row: int, column: int, value: Any = None) -> StreamingCell:
+        """셀 가져오기 (버퍼 안의 행만)"""
+        if row < 1 or column < 1:
+            raise ValueError("Row or column values must be at least 1")
+        self._check_row(row, "cell")
+
+        cells = self._pending.get(row)
+        if cells is None:
+            cells = self._pending[row] = {}
+            if row > self._max_row:
+                self._max_row = row
+            self._flush_before(row - self._window)
+
+        cell = cells.get(column)
+        if cell is None:
+            cell = cells[column] = StreamingCell(row, column)
+            if column > self._max_column:
+                self._max_column = column
+
+        if value is not None:
+            cell.value = value
+        return cell
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            # ws[4] → 행 전체 (1열 ~ 현재 최대 열)
+            return tuple(self.cell(key, column) for column in range(1, self._max_column + 1))
+        if ':' in key:
+            raise StreamingWriteError(f"{self.title}: 스트리밍 모드는 범위 접근({key})을 지원하지 않습니다")
+        column, row = coordinate_from_string(key)
+        return self.cell(row, column_index_from_string(column))
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self[key].value = value
+
+    def append(self, values: Iterable[Any]) -> None:
+        """다음 행에 값 추가"""
+        row = max(self._max_row, self._written) + 1
+        for column, value in enumerate(values, start=1):
+            if value is not None:
+                self.cell(row, column, value)
+        if row not in self._pending:
+            self._pending[row] = {}
+            self._max_row = row
+
+    def merge_cells(self, range_string: Optional[str] = None, **kwargs) -> None:
+        """병합 (시트 끝에 기록되므로 언제든 가능)"""
+        if range_string is None:
+            start = f"{get_column_letter(kwargs['start_column'])}{kwargs['start_row']}"
+            end = f"{get_column_letter(kwargs['end_column'])}{kwargs['end_row']}"
+            range_string = f"{start}:{end}"
+        self._ws.merged_cells.add(range_string)
+
+    # ----------------------------------------
+    # 기록
+    # ----------------------------------------
+
+    def _check_row(self, row: int, operation: str) -> None:
+        if row <= self._written:
+            raise StreamingWriteError(
+                f"{self.title}: {row}행은 이미 기록됨 ({operation}, "
+                f"기록 완료 {self._written}행, window={self._window})"
+            )
+
+    def _flush_before(self, row: int) -> None:
+        """row행까지 기록"""
+        while self._written < row:
+            self._written += 1
+            self._write_row(self._pending.pop(self._written, None))
+
+    def _write_row(self, cells: Optional[Dict[int, StreamingCell]]) -> None:
+        if not cells:
+            self._ws.append([])
+            return
+
+        values: List[Any] = [None] * max(cells)
+        listeners = self._parent._cell_listeners
+        for column, cell in cells.items():
+            values[column - 1] = self._to_write_only(cell)
+            for listener in listeners:
+                listener(self.title, cell.row, column, cell.value)
+        self._ws.append(values)
+
+    def _to_write_only(self, cell: StreamingCell) -> Any:
+        key = cell.style_key()
+        if key is None and cell.comment is None and cell.hyperlink is None:
+            return cell.value
+
+        out = WriteOnlyCell(self._ws, value=cell.value)
+        if key is not None:
+            out.style = self._parent._named_style(key)
+        if cell.comment is not None:
+            out.comment = cell.comment
+        if cell.hyperlink is not None:
+            out.hyperlink = cell.hyperlink
+        return out
+
+    def iter_buffered_cells(self) -> Iterable[StreamingCell]:
+        """아직 기록되지 않은 (window 안) 셀"""
+        for cells in self._pending.values():
+            yield from cells.values()
+
+    def close(self) -> None:
+        """남은 행 모두 기록"""
+        self._flush_before(self._max_row)
+
+    def discard(self) -> None:
+        """
+        저장 없이 버림: 버퍼 삭제 + write-only 행 스트림 종료 + 임시 파일 삭제
+
+        스트림을 연 채로 GC되면 lxml 요소 중간에서 generator가 닫혀 경고 발생
+        """
+        self._pending.clear()
+        ws = self._ws
+        if ws._writer is None or ws.closed:
+            return
+        ws.close()
+        ws._writer.cleanup()
+
+
+class StreamingWorkbook:
+    """
+    write-only 워크북 래퍼
+
+    일반 Workbook 대신 Generator/Builder에 전달합니다.
+    FormulaEngine(Named Range), calculation 설정 등은 그대로 위임됩니다.
+    """
+
+    STYLE_PREFIX = 'umis_'
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        """
+        Args:
+            window: 시트별 버퍼 행 수 (이 범위 안에서만 되돌아가 쓰기 가능)
+        """
+        self._wb = Workbook(write_only=True)
+        self._window = window
+        self._sheets: Dict[str, StreamingWorksheet] = {}
+        self._styles: Dict[Tuple, str] = {}
+        self._cell_listeners: List[Callable[[str, int, int, Any], None]] = []
+
+    def add_cell_listener(self, listener: Callable[[str, int, int, Any], None]) -> None:
+        """
+        행 기록 시 셀마다 호출 (sheet, row, column, value)
+
+        기록된 셀은 다시 읽을 수 없으므로 FormulaEngine 의존성 그래프가 사용
+        """
+        self._cell_listeners.append(listener)
+
+    @property
+    def sheetnames(self) -> List[str]:
+        return self._wb.sheetnames
+
+    @property
+    def worksheets(self) -> List[StreamingWorksheet]:
+        return [self._sheets[name] for name in self._wb.sheetnames]
+
+    def create_sheet(self, title: Optional[str] = None, index: Optional[int] = None) -> StreamingWorksheet:
+        ws = self._wb.create_sheet(title, index)
+        sheet = StreamingWorksheet(self, ws, window=self._window)
+        self._sheets[ws.title] = sheet
+        return sheet
+
+    def __getitem__(self, name: str) -> StreamingWorksheet:
+        for sheet in self._sheets.values():
+            if sheet.title == name:
+                return sheet
+        raise KeyError(f"Worksheet {name} does not exist.")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._wb.sheetnames
+
+    def remove(self, sheet: StreamingWorksheet) -> None:
+        self._wb.remove(sheet._ws)
+        self._sheets = {k: v for k, v in self._sheets.items() if v is not sheet}
+
+    def __getattr__(self, name: str) -> Any:
+        # defined_names, calculation, properties 등
+        return getattr(self._wb, name)
+
+    def _named_style(self, key: Tuple) -> str:
+        """스타일 조합 → NamedStyle 이름 (처음 1회 등록)"""
+        name = self._styles.get(key)
+        if name is None:
+            font, fill, border, alignment, number_format, protection = key
+            name = f"{self.STYLE_PREFIX}{len(self._styles) + 1}"
+            style = NamedStyle(name=name)
+            if font is not None:
+                style.font = font
+            if fill is not None:
+                style.fill = fill
+            if border is not None:
+                style.border = border
+            if alignment is not None:
+                style.alignment = alignment
+            if number_format is not None:
+                style.number_format = number_format
+            if protection is not None:
+                style.protection = protection
+            self._wb.add_named_style(style)
+            self._styles[key] = name
+        return name
+
+    @property
+    def style_count(self) -> int:
+        """등록된 공유 스타일 수"""
+        return len(self._styles)
+
+    def close(self) -> None:
+        """
+        저장하지 않고 닫기 (Builder 예외, 테스트 등) → 시트 스트림 / 임시 파일 정리
+
+        save() 후에는 아무 것도 하지 않습니다.
+        """
+        for sheet in self._sheets.values():
+            sheet.discard()
+
+    def __enter__(self) -> 'StreamingWorkbook':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def save(self, filename) -> None:
+        """모든 시트 버퍼를 기록하고 저장 (write-only 워크북은 1회만 저장 가능)"""
+        for sheet in self._sheets.values():
+            sheet.close()
+        self._wb.save(filename)
@@ -12,6 +12,8 @@ from datetime import datetime
 from openpyxl import Workbook
 
 from ..formula_engine import FormulaEngine
+from ..batch_generator import BuilderTimer
+from ..streaming_workbook import StreamingWorkbook
 from .inputs_builder import InputsBuilder
 from .ltv_builder import LTVBuilder
 from .cac_builder import CACBuilder
@@ -44,6 +46,8 @@ class UnitEconomicsGenerator:
     def __init__(self):
         """초기화"""
         self.formula_engine: Optional[FormulaEngine] = None
+        self.builder_timings: Dict[str, float] = {}  # v7.11.2: Builder별 ms
+        self.dependency_report: Optional[Dict] = None  # v7.11.2: 저장 전 수식 의존성 검증 결과
     
     def generate(
         self,
@@ -52,7 +56,8 @@ class UnitEconomicsGenerator:
         channels_data: List[Dict] = None,
         industry: str = 'SaaS',
         cohort_months: int = 12,
-        output_dir: Path = Path('.')
+        output_dir: Path = Path('.'),
+        streaming: bool = False
     ) -> Path:
         """
         Unit Economics Workbook 생성 (완성)
@@ -73,6 +78,7 @@ class UnitEconomicsGenerator:
             industry: 업계 (SaaS, E-commerce, Subscription 등)
             cohort_months: 코호트 추적 개월 수
             output_dir: 출력 디렉토리
+            streaming: write-only 스트리밍 백엔드 사용 (v7.11.2, 대용량 시트 메모리 절감)
         
         Returns:
             생성된 Excel 파일 경로
@@ -83,77 +89,100 @@ class UnitEconomicsGenerator:
         print(f"   버전: 완성 (10개 시트)")
         
         # 1. 워크북 초기화
-        wb = Workbook()
-        self.formula_engine = FormulaEngine(wb)
-        
-        # 기본 시트 제거
-        if 'Sheet' in wb.sheetnames:
-            wb.remove(wb['Sheet'])
-        
-        # 2. Sheet 2: Inputs
-        print(f"   2/10 Inputs...")
-        inputs_builder = InputsBuilder(wb, self.formula_engine)
-        inputs_builder.create_sheet(inputs_data)
-        
-        # 3. Sheet 3: LTV Calculation
-        print(f"   3/10 LTV Calculation...")
-        ltv_builder = LTVBuilder(wb, self.formula_engine)
-        ltv_builder.create_sheet()
-        
-        # 4. Sheet 4: CAC Analysis
-        print(f"   4/10 CAC Analysis...")
-        cac_builder = CACBuilder(wb, self.formula_engine)
-        cac_builder.create_sheet(channels_data)
-        
-        # 5. Sheet 5: LTV/CAC Ratio
-        print(f"   5/10 LTV/CAC Ratio...")
-        ratio_builder = RatioBuilder(wb, self.formula_engine)
-        ratio_builder.create_sheet()
-        
-        # 6. Sheet 6: Payback Period
-        print(f"   6/10 Payback Period...")
-        payback_builder = PaybackBuilder(wb, self.formula_engine)
-        payback_builder.create_sheet()
-        
-        # 7. Sheet 7: Sensitivity Analysis
-        print(f"   7/10 Sensitivity Analysis...")
-        sensitivity_builder = SensitivityBuilder(wb, self.formula_engine)
-        sensitivity_builder.create_sheet()
-        
-        # 8. Sheet 8: Scenarios
-        print(f"   8/10 UE Scenarios...")
-        scenarios_builder = UEScenariosBuilder(wb, self.formula_engine)
-        scenarios_builder.create_sheet()
-        
-        # 9. Sheet 9: Cohort LTV (Batch 3)
-        print(f"   9/10 Cohort LTV...")
-        cohort_builder = CohortLTVBuilder(wb, self.formula_engine)
-        cohort_builder.create_sheet(cohort_months)
-        
-        # 10. Sheet 10: Benchmark Comparison (Batch 3)
-        print(f"   10/10 Benchmark Comparison...")
-        benchmark_builder = BenchmarkBuilder(wb, self.formula_engine)
-        benchmark_builder.create_sheet(industry)
-        
-        # 11. Sheet 1: Dashboard (Batch 3, 맨 앞으로 이동)
-        print(f"   1/10 Dashboard...")
-        dashboard_builder = UEDashboardBuilder(wb, self.formula_engine)
-        dashboard_builder.create_sheet(market_name)
-        
-        # 12. 강제 재계산 설정
-        wb.calculation.calcMode = 'auto'
-        wb.calculation.fullCalcOnLoad = True
-        
-        # 13. 저장
-        filename = f"unit_economics_{market_name}_{datetime.now().strftime('%Y%m%d')}.xlsx"
-        filepath = output_dir / filename
-        
-        output_dir.mkdir(parents=True, exist_ok=True)
-        wb.save(filepath)
+        timer = BuilderTimer()
+        self.builder_timings = timer.timings
+        wb = StreamingWorkbook() if streaming else Workbook()
+        try:
+            self.formula_engine = FormulaEngine(wb)
+            
+            # 기본 시트 제거
+            if 'Sheet' in wb.sheetnames:
+                wb.remove(wb['Sheet'])
+            
+            # 2. Sheet 2: Inputs
+            print(f"   2/10 Inputs...")
+            with timer.measure('Inputs'):
+                inputs_builder = InputsBuilder(wb, self.formula_engine)
+                inputs_builder.create_sheet(inputs_data)
+            
+            # 3. Sheet 3: LTV Calculation
+            print(f"   3/10 LTV Calculation...")
+            with timer.measure('LTV Calculation'):
+                ltv_builder = LTVBuilder(wb, self.formula_engine)
+                ltv_builder.create_sheet()
+            
+            # 4. Sheet 4: CAC Analysis
+            print(f"   4/10 CAC Analysis...")
+            with timer.measure('CAC Analysis'):
+                cac_builder = CACBuilder(wb, self.formula_engine)
+                cac_builder.create_sheet(channels_data)
+            
+            # 5. Sheet 5: LTV/CAC Ratio
+            print(f"   5/10 LTV/CAC Ratio...")
+            with timer.measure('LTV/CAC Ratio'):
+                ratio_builder = RatioBuilder(wb, self.formula_engine)
+                ratio_builder.create_sheet()
+            
+            # 6. Sheet 6: Payback Period
+            print(f"   6/10 Payback Period...")
+            with timer.measure('Payback Period'):
+                payback_builder = PaybackBuilder(wb, self.formula_engine)
+                payback_builder.create_sheet()
+            
+            # 7. Sheet 7: Sensitivity Analysis
+            print(f"   7/10 Sensitivity Analysis...")
+            with timer.measure('Sensitivity Analysis'):
+                sensitivity_builder = SensitivityBuilder(wb, self.formula_engine)
+                sensitivity_builder.create_sheet()
+            
+            # 8. Sheet 8: Scenarios
+            print(f"   8/10 UE Scenarios...")
+            with timer.measure('UE Scenarios'):
+                scenarios_builder = UEScenariosBuilder(wb, self.formula_engine)
+                scenarios_builder.create_sheet()
+            
+            # 9. Sheet 9: Cohort LTV (Batch 3)
+            print(f"   9/10 Cohort LTV...")
+            with timer.measure('Cohort LTV'):
+                cohort_builder = CohortLTVBuilder(wb, self.formula_engine)
+                cohort_builder.create_sheet(cohort_months)
+            
+            # 10. Sheet 10: Benchmark Comparison (Batch 3)
+            print(f"   10/10 Benchmark Comparison...")
+            with timer.measure('Benchmark Comparison'):
+                benchmark_builder = BenchmarkBuilder(wb, self.formula_engine)
+                benchmark_builder.create_sheet(industry)
+            
+            # 11. Sheet 1: Dashboard (Batch 3, 맨 앞으로 이동)
+            print(f"   1/10 Dashboard...")
+            with timer.measure('Dashboard'):
+                dashboard_builder = UEDashboardBuilder(wb, self.formula_engine)
+                dashboard_builder.create_sheet(market_name)
+            
+            # 12. 강제 재계산 설정
+            wb.calculation.calcMode = 'auto'
+            wb.calculation.fullCalcOnLoad = True
+            
+            # 저장 전 수식 의존성 검증 (v7.11.2, 순환 참조 / 미정의 Named Range)
+            self.dependency_report = self.formula_engine.validate_dependencies()
+            
+            # 13. 저장
+            filename = f"unit_economics_{market_name}_{datetime.now().strftime('%Y%m%d')}.xlsx"
+            filepath = output_dir / filename
+            
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with timer.measure('save'):
+                wb.save(filepath)
+        except BaseException:
+            # 스트리밍: 열린 시트 스트림 / 임시 파일 정리 후 전파
+            if streaming:
+                wb.close()
+            raise
         
         print(f"\n✅ Excel 생성 완료: {filepath}")
         print(f"📊 시트: {len(wb.sheetnames)}개 (Dashboard, Inputs, LTV, CAC, Ratio, Payback, Sensitivity, Scenarios, Cohort, Benchmark)")
         print(f"📋 Named Range: {len(self.formula_engine.named_ranges)}개")
+        print(f"🔗 {FormulaEngine.summarize_dependency_report(self.dependency_report)}")
         print(f"🎉 Unit Economics Analyzer 완성!")
         
         return filepath
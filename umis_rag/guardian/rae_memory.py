@@ -16,8 +16,6 @@ from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import Chroma
 from langchain_core.documents import Document
 
 import sys
@@ -25,6 +23,7 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from umis_rag.core.config import settings
+from umis_rag.core.vector_stores import get_embeddings, get_vectorstore, drop_collection
 from umis_rag.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -72,17 +71,10 @@ class RAEMemory:
         self.similarity_threshold = similarity_threshold
         
         # Embeddings 초기화
-        self.embeddings = OpenAIEmbeddings(
-            model=settings.embedding_model,
-            openai_api_key=settings.openai_api_key
-        )
+        self.embeddings = get_embeddings()
         
         # Vector Store 초기화
-        self.vectorstore = Chroma(
-            collection_name=collection_name,
-            embedding_function=self.embeddings,
-            persist_directory=str(settings.chroma_persist_dir)
-        )
+        self.vectorstore = get_vectorstore(collection_name)
         
         current_count = self.vectorstore._collection.count()
         logger.info(f"  ✅ RAEMemory 로드: {current_count}개 평가")
@@ -317,12 +309,8 @@ class RAEMemory:
         """
         try:
             logger.warning("🗑️ RAEMemory 전체 삭제...")
-            self.vectorstore._client.delete_collection(self.collection_name)
-            self.vectorstore = Chroma(
-                collection_name=self.collection_name,
-                embedding_function=self.embeddings,
-                persist_directory=str(settings.chroma_persist_dir)
-            )
+            drop_collection(self.collection_name)
+            self.vectorstore = get_vectorstore(self.collection_name)
             logger.warning("✅ RAEMemory 삭제 완료")
             return True
         except Exception as e:
@@ -12,13 +12,13 @@ import json
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from pathlib import Path
-import chromadb
 
 import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 from umis_rag.core.config import settings
+from umis_rag.core.vector_stores import get_chroma_client, get_embeddings
 from umis_rag.utils.logger import get_logger
 from umis_rag.projection.hybrid_projector import HybridProjector
 
@@ -61,8 +61,8 @@ class TTLManager:
         self.default_ttl_hours = default_ttl_hours
         self.high_traffic_threshold = high_traffic_threshold
         
-        # Chroma
-        self.client = chromadb.PersistentClient(path=str(settings.chroma_persist_dir))
+        # Chroma (공유 클라이언트, v7.11.2)
+        self.client = get_chroma_client()
         
         # Projector
         self.projector = HybridProjector()
@@ -207,13 +207,8 @@ class TTLManager:
     
     def _save_projected(self, projected_chunk: Dict[str, Any]):
         """Projected 청크 저장/업데이트"""
-        from langchain_openai import OpenAIEmbeddings
-        
         projected_collection = self.client.get_collection("projected_index")
-        embeddings_model = OpenAIEmbeddings(
-            model=settings.embedding_model,
-            openai_api_key=settings.openai_api_key
-        )
+        embeddings_model = get_embeddings()
         
         # Embedding 생성
         content = projected_chunk['content']
@@ -5,7 +5,8 @@ DART API 유틸리티 모듈
 SG&A 파서 개발 과정에서 11개 기업, 537개 항목으로 검증 완료.
 
 주요 기능:
-- get_corp_code(): 기업 코드 조회 (상장사 우선)
+- get_corp_code(): 기업 코드 조회 (상장사 우선, 로컬 인덱스)
+- get_corp_codes(): 기업 코드 일괄 조회
 - get_financials(): 재무제표 조회 (OFS 우선)
 - get_report_list(): 공시 목록 (재시도 로직)
 - download_document(): 원문 다운로드 (ZIP 해제)
@@ -22,31 +23,54 @@ import os
 import zipfile
 import io
 import time
-import xml.etree.ElementTree as ET
-from typing import Optional, Dict, List
+from pathlib import Path
+from typing import Optional, Dict, List, Iterable, Union
+import threading
 from dotenv import load_dotenv
 
+from umis_rag.core.config import settings
+from umis_rag.utils import dart_corp_index
+from umis_rag.utils.dart_corp_index import CorpCodeIndex
+from umis_rag.utils.logger import logger
+
 load_dotenv()
 
+# corpCode.xml 동시 다운로드 방지
+_CORP_INDEX_REFRESH_LOCK = threading.Lock()
+
 
 class DARTClient:
     """
     DART API 클라이언트
     
     검증된 기능:
+    - 기업 코드 로컬 인덱스 (v7.11.2)
     - 900 오류 재시도
     - 개별재무제표 우선
     - 상장사 우선 매칭
     - ZIP 압축 해제
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        corp_index_path: Optional[Union[str, Path]] = None,
+        corp_index_max_age_days: Optional[float] = None
+    ):
         """
         Args:
             api_key: DART API Key (없으면 환경변수에서 로드)
+            corp_index_path: 기업 코드 인덱스 경로 (없으면 settings.dart_corp_index_path)
+            corp_index_max_age_days: 인덱스 갱신 주기 (없으면 settings.dart_corp_index_max_age_days)
         """
         self.api_key = api_key or os.getenv('DART_API_KEY')
         self.base_url = "https://opendart.fss.or.kr/api"
+        self.corp_index_path = Path(corp_index_path or settings.dart_corp_index_path)
+        self.corp_index_max_age_days = float(
+            corp_index_max_age_days
+            if corp_index_max_age_days is not None
+            else settings.dart_corp_index_max_age_days
+        )
         
         if not self.api_key or self.api_key == 'your-dart-api-key-here':
             raise ValueError("DART_API_KEY 필요 (.env 파일 설정)")
@@ -59,6 +83,7 @@ class DARTClient:
         - 정확한 이름 매칭 우선
         - 부분 매칭 시 상장사 우선 (stock_code 있는 회사)
         - '하이브' 검색 시 29개 중 상장사 자동 선택
+        - v7.11.2: 로컬 인덱스 조회 (corpCode.xml은 갱신 주기마다 1회만 다운로드)
         
         Args:
             company_name: 회사명 (예: "삼성전자")
@@ -66,42 +91,94 @@ class DARTClient:
         Returns:
             corp_code (8자리) or None
         """
+        return self.get_corp_index().lookup(company_name)
+    
+    def get_corp_codes(self, company_names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        기업 코드 일괄 조회 (v7.11.2)
         
-        # corpCode.xml 다운로드
-        url = f"{self.base_url}/corpCode.xml"
-        response = requests.get(url, params={'crtfc_key': self.api_key}, timeout=30)
-        
-        zip_file = zipfile.ZipFile(io.BytesIO(response.content))
-        xml_data = zip_file.read('CORPCODE.xml')
-        root = ET.fromstring(xml_data)
-        
-        # 1순위: 정확한 이름 매칭
-        for corp in root.findall('list'):
-            name = corp.findtext('corp_name', '')
-            if name == company_name:
-                code = corp.findtext('corp_code', '')
-                stock_code = corp.findtext('stock_code', '')
-                return code
-        
-        # 2순위: 부분 매칭 (상장사 우선)
-        candidates = []
-        for corp in root.findall('list'):
-            name = corp.findtext('corp_name', '')
-            if company_name in name:
-                code = corp.findtext('corp_code', '')
-                stock_code = corp.findtext('stock_code', '')
-                has_stock = stock_code and stock_code.strip()
-                candidates.append((name, code, stock_code, has_stock))
-        
-        if candidates:
-            # 상장사 우선
-            listed = [c for c in candidates if c[3]]
-            if listed:
-                return listed[0][1]  # corp_code
-            
-            return candidates[0][1]
+        Example:
+            >>> from umis_rag.utils.dart_corp_index import read_company_names
+            >>> names = read_company_names("data/corps_list_final.txt")
+            >>> client.get_corp_codes(names)
+            {'이마트': '00872984', ...}
         
-        return None
+        Args:
+            company_names: 회사명 목록
+        
+        Returns:
+            {회사명: corp_code or None} (입력 순서 유지)
+        """
+        return self.get_corp_index().lookup_many(company_names)
+    
+    def get_corp_index(self) -> CorpCodeIndex:
+        """
+        기업 코드 인덱스 (비어 있거나 갱신 주기가 지났으면 갱신 후 반환)
+        """
+        index = dart_corp_index.get_corp_index(self.corp_index_path)
+        
+        if index.is_stale(self.corp_index_max_age_days):
+            with _CORP_INDEX_REFRESH_LOCK:
+                # 다른 스레드가 먼저 갱신했으면 생략
+                if index.is_stale(self.corp_index_max_age_days):
+                    self.refresh_corp_index(index)
+        
+        return index
+    
+    def refresh_corp_index(
+        self,
+        index: Optional[CorpCodeIndex] = None,
+        force: bool = False
+    ) -> bool:
+        """
+        corpCode.xml 다운로드 → 인덱스 재구축
+        
+        이전 응답의 ETag/Last-Modified로 조건부 요청하고,
+        304(변경 없음)면 갱신 시각만 기록합니다.
+        기존 인덱스가 있으면 다운로드 실패 시 기존 인덱스를 계속 사용합니다.
+        
+        Args:
+            index: 대상 인덱스 (None이면 corp_index_path)
+            force: True면 조건부 헤더 없이 다운로드
+        
+        Returns:
+            True: 재구축함, False: 변경 없음 또는 실패(기존 유지)
+        """
+        index = index or dart_corp_index.get_corp_index(self.corp_index_path)
+        meta = index.get_meta()
+        
+        headers = {}
+        if not force and meta['count']:
+            if meta['etag']:
+                headers['If-None-Match'] = meta['etag']
+            if meta['last_modified']:
+                headers['If-Modified-Since'] = meta['last_modified']
+        
+        try:
+            url = f"{self.base_url}/corpCode.xml"
+            response = requests.get(
+                url,
+                params={'crtfc_key': self.api_key},
+                headers=headers,
+                timeout=30
+            )
+            
+            if response.status_code == 304:
+                index.touch()
+                return False
+            
+            index.build_from_zip(
+                response.content,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+            return True
+        
+        except Exception as e:
+            if not meta['count']:
+                raise
+            logger.warning(f"[DART] corpCode.xml 갱신 실패 → 기존 인덱스 사용: {e}")
+            return False
     
     def get_financials(
         self,
@@ -0,0 +1,312 @@
+"""
+DART 배치 크롤러 (v7.11.2)
+
+목적:
+- DARTCrawlerRobust.crawl_sga는 기업 1개를 HTTP 4단계로 직렬 처리하고,
+  _rate_limit이 time.sleep으로 지연하므로 기업 목록 크롤링이 완전히 직렬
+- 벤치마크 갱신 시간 대부분이 다른 기업 파싱과 겹칠 수 있는 sleep 대기
+
+특징:
+- ThreadPoolExecutor로 여러 기업 동시 처리
+- 모든 worker가 TokenBucket 하나를 공유 → 전체 요청 속도는 기존 간격 유지
+- 크롤러 1개(requests.Session 연결 풀) 공유
+- 결과를 JSONL에 1건씩 즉시 기록 = 체크포인트
+  (중단 후 재실행하면 완료된 기업은 건너뜀)
+
+Example:
+    >>> from umis_rag.utils.dart_batch_crawler import DARTBatchCrawler, read_corp_list
+    >>> batch = DARTBatchCrawler(output_path="data/dart_sga_results.jsonl", max_workers=4)
+    >>> summary = batch.crawl(read_corp_list("data/corps_list_final.txt"))
+    >>> summary['succeeded'], summary['failed'], summary['skipped']
+
+작성: 2026-10-18
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple, Iterable, Any, Union
+import json
+import os
+import random
+import threading
+import time
+
+from umis_rag.utils.dart_crawler_robust import DARTCrawlerRobust
+from umis_rag.utils.logger import logger
+
+
+PathLike = Union[str, Path]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Rate limiter
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class TokenBucket:
+    """
+    Thread-safe 토큰 버킷
+
+    acquire()는 토큰을 예약하고 자기 차례까지 대기합니다.
+    (예약 방식이라 대기 중인 worker들이 깨어나서 다시 경쟁하지 않음)
+
+    Example:
+        >>> bucket = TokenBucket(rate=0.5, capacity=2)   # 평균 2초당 1요청, 최대 2개 연속
+        >>> bucket.acquire()
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, jitter: float = 0.0):
+        """
+        Args:
+            rate: 초당 토큰 수 (> 0)
+            capacity: 버킷 크기 (연속 허용 요청 수)
+            jitter: 획득 후 추가 랜덤 지연 최대값 (초, Bot 탐지 회피용)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate는 0보다 커야 합니다: {rate}")
+
+        self.rate = rate
+        self.capacity = capacity
+        self.jitter = jitter
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """
+        토큰 획득 (필요 시 대기)
+
+        Returns:
+            대기한 시간 (초)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            wait = max(0.0, -self._tokens / self.rate)
+
+        if self.jitter:
+            wait += random.uniform(0, self.jitter)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 배치 크롤러
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class DARTBatchCrawler:
+    """
+    DARTCrawlerRobust 배치 실행기 (동시 처리 + 공유 Rate limit + 체크포인트)
+    """
+
+    def __init__(
+        self,
+        output_path: PathLike,
+        crawler: Optional[DARTCrawlerRobust] = None,
+        max_workers: int = 4,
+        rate: Optional[float] = None,
+        burst: float = 2.0,
+        cache_dir: Optional[str] = '/tmp/dart_cache'
+    ):
+        """
+        Args:
+            output_path: 결과 JSONL (체크포인트 겸용)
+            crawler: 공유 크롤러 (None이면 생성)
+            max_workers: 동시 처리 기업 수
+            rate: 전체 초당 요청 수 (None이면 1 / crawler.min_delay)
+            burst: 연속 허용 요청 수
+            cache_dir: crawler 생성 시 캐시 디렉토리
+        """
+        self.output_path = Path(output_path)
+        self.max_workers = max_workers
+
+        if crawler is None:
+            crawler = DARTCrawlerRobust(cache_dir=cache_dir, pool_size=max(10, max_workers))
+
+        if crawler.rate_limiter is None:
+            if rate is None:
+                rate = 1.0 / crawler.min_delay if crawler.min_delay > 0 else 1.0
+            jitter = max(0.0, crawler.max_delay - crawler.min_delay)
+            crawler.rate_limiter = TokenBucket(rate, capacity=burst, jitter=jitter)
+
+        self.crawler = crawler
+        self._write_lock = threading.Lock()
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 실행
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def crawl(
+        self,
+        corps: Iterable[Tuple[str, str]],
+        year: int = 2024,
+        verify_ofs: bool = True,
+        retry_failed: bool = True
+    ) -> Dict[str, Any]:
+        """
+        기업 목록 크롤링
+
+        Args:
+            corps: [(기업명, rcept_no), ...]
+            year: 사업연도
+            verify_ofs: OFS 검증 여부 (crawl_sga 전달)
+            retry_failed: 체크포인트의 실패 기업도 다시 시도
+
+        Returns:
+            {
+                'total': int, 'succeeded': int, 'failed': int, 'skipped': int,
+                'elapsed': float, 'results': [새로 처리한 결과 (입력 순서)]
+            }
+        """
+        corps = list(corps)
+        done = self.load_checkpoint()
+
+        pending = []
+        skipped = 0
+        for corp_name, rcept_no in corps:
+            previous = done.get(self._key(corp_name, rcept_no))
+            if previous is not None and (previous.get('success') or not retry_failed):
+                skipped += 1
+                continue
+            pending.append((corp_name, rcept_no))
+
+        logger.info(
+            f"[DARTBatch] {len(corps)}개 중 {len(pending)}개 처리 "
+            f"(체크포인트 {skipped}개 건너뜀, workers={self.max_workers})"
+        )
+
+        start = time.time()
+        results: Dict[Tuple[str, str], Dict] = {}
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {
+                executor.submit(self._crawl_one, corp_name, rcept_no, year, verify_ofs): (corp_name, rcept_no)
+                for corp_name, rcept_no in pending
+            }
+            for future in as_completed(futures):
+                corp_name, rcept_no = futures[future]
+                result = future.result()
+                results[(corp_name, rcept_no)] = result
+                status = '✓' if result.get('success') else '✗'
+                logger.info(f"[DARTBatch] {status} {corp_name} ({len(results)}/{len(pending)})")
+        finally:
+            # 중단(KeyboardInterrupt 등) 시 시작 안 한 기업은 취소, 완료분은 이미 기록됨
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        ordered = [results[c] for c in pending if c in results]
+        succeeded = sum(1 for r in ordered if r.get('success'))
+
+        return {
+            'total': len(corps),
+            'succeeded': succeeded,
+            'failed': len(ordered) - succeeded,
+            'skipped': skipped,
+            'elapsed': round(time.time() - start, 2),
+            'results': ordered
+        }
+
+    def _crawl_one(self, corp_name: str, rcept_no: str, year: int, verify_ofs: bool) -> Dict:
+        try:
+            result = self.crawler.crawl_sga(
+                corp_name=corp_name,
+                rcept_no=rcept_no,
+                verify_ofs=verify_ofs,
+                year=year
+            )
+        except Exception as e:
+            result = {'success': False, 'error': str(e), 'corp_name': corp_name}
+
+        result.setdefault('corp_name', corp_name)
+        result.setdefault('rcept_no', rcept_no)
+        result['crawled_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+
+        # worker에서 바로 기록 → 메인 스레드가 중단돼도 끝난 기업은 남음
+        self._append(result)
+        return result
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 체크포인트 (결과 JSONL)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def load_checkpoint(self) -> Dict[str, Dict]:
+        """
+        기존 결과 로드 (같은 기업은 마지막 기록 우선, 깨진 줄은 무시)
+
+        Returns:
+            {"기업명|rcept_no": result}
+        """
+        done: Dict[str, Dict] = {}
+        if not self.output_path.exists():
+            return done
+
+        with open(self.output_path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 기록 도중 중단된 마지막 줄
+                    continue
+                done[self._key(record.get('corp_name', ''), record.get('rcept_no', ''))] = record
+        return done
+
+    def _append(self, result: Dict) -> None:
+        """결과 1건 즉시 기록 (flush + fsync)"""
+        with self._write_lock:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.output_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(result, ensure_ascii=False, default=str) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+
+    @staticmethod
+    def _key(corp_name: str, rcept_no: str) -> str:
+        return f"{corp_name}|{rcept_no}"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 편의 함수
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+def read_corp_list(path: PathLike) -> List[Tuple[str, str]]:
+    """
+    기업 목록 파일 읽기
+
+    형식: 한 줄에 "기업명,rcept_no" (# 주석, 빈 줄, rcept_no 없는 줄 무시)
+    (예: data/corps_list_final.txt)
+    """
+    corps = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or ',' not in line:
+                continue
+            corp_name, rcept_no = (part.strip() for part in line.split(',', 1))
+            if corp_name and rcept_no:
+                corps.append((corp_name, rcept_no))
+    return corps
+
+
+def crawl_corp_list(
+    corps_list_path: PathLike,
+    output_path: PathLike,
+    max_workers: int = 4,
+    year: int = 2024,
+    verify_ofs: bool = True
+) -> Dict[str, Any]:
+    """
+    기업 목록 파일 배치 크롤링 (중단 후 같은 output_path로 재실행하면 이어서 진행)
+
+    Example:
+        >>> summary = crawl_corp_list("data/corps_list_final.txt", "data/dart_sga_results.jsonl")
+    """
+    batch = DARTBatchCrawler(output_path=output_path, max_workers=max_workers)
+    return batch.crawl(read_corp_list(corps_list_path), year=year, verify_ofs=verify_ofs)
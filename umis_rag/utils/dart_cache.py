@@ -0,0 +1,346 @@
+"""
+DART 크롤러 응답 캐시 (v7.11.2)
+
+목적:
+- DARTCrawlerRobust가 키마다 들여쓴 JSON 파일 1개를 만료/용량 제한/압축 없이 저장
+- 캐시된 HTML 본문이 디스크 대부분을 차지하고, 파일 수만 개에서 디렉토리 탐색이 느려짐
+
+특징:
+- SQLite shard N개 (키 해시로 분배, shard별 Lock → 배치 크롤러 동시 쓰기 경합 감소)
+- zlib 압축 blob (HTML은 보통 1/5~1/10)
+- 종류별 TTL (toc: 목차 JSON, section: 섹션 HTML)
+- 용량 초과 시 last_access 기준 LRU eviction (max_bytes의 90%까지 정리)
+  (shard별 누적 용량을 메모리에 유지 → 쓰기마다 전체 합계를 다시 세지 않음)
+- 조회 시 last_access는 touch_interval보다 오래됐을 때만 갱신 (읽기 = 쓰기 방지)
+- 종류별 hit/miss 통계
+- 기존 JSON 파일 캐시 가져오기 (import_json_dir)
+
+Example:
+    >>> cache = DARTResponseCache("/tmp/dart_cache")
+    >>> cache.set("a1b2...", {'content': html}, kind='section')
+    >>> cache.get("a1b2...", kind='section')
+    >>> cache.get_stats()['section']['hit_rate']
+
+작성: 2026-10-18
+"""
+
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Union
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+
+from umis_rag.core.cache_stats import CacheStats
+from umis_rag.utils.logger import logger
+
+
+PathLike = Union[str, Path]
+
+# 종류별 기본 TTL (초)
+# 공시 원문은 접수번호 단위로 고정(정정은 새 접수번호)이므로 길게 유지
+DEFAULT_TTL_BY_KIND: Dict[str, Optional[float]] = {
+    'toc': 30 * 24 * 3600,
+    'section': 180 * 24 * 3600,
+}
+
+
+class _CacheShard:
+    """SQLite shard 1개 (thread-safe)"""
+
+    # 만료 항목 정리 간격 (초)
+    PURGE_INTERVAL = 60.0
+
+    def __init__(self, path: Path, max_bytes: int, touch_interval: float = 60.0):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS dart_cache (
+                key TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                raw_size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_dart_cache_last_access ON dart_cache(last_access)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_dart_cache_expires_at ON dart_cache(expires_at)"
+        )
+        self._conn.commit()
+
+        # 누적 용량 (압축 후, 쓰기/삭제 시 갱신)
+        self._total = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM dart_cache"
+        ).fetchone()[0]
+        self._last_purge = 0.0
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            return self._total
+
+    def get(self, key: str, now: float) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, size, expires_at, last_access FROM dart_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, size, expires_at, last_access = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM dart_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._total -= size
+                return None
+
+            # LRU 순서는 touch_interval 단위로만 갱신
+            if now - last_access >= self.touch_interval:
+                self._conn.execute("UPDATE dart_cache SET last_access = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+            return value
+
+    def set(
+        self,
+        key: str,
+        kind: str,
+        blob: bytes,
+        raw_size: int,
+        now: float,
+        expires_at: Optional[float]
+    ) -> int:
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM dart_cache WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO dart_cache
+                    (key, kind, value, size, raw_size, created_at, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, kind, blob, len(blob), raw_size, now, expires_at, now)
+            )
+            self._total += len(blob) - (row[0] if row else 0)
+            evicted = self._evict_locked(now)
+            self._conn.commit()
+            return evicted
+
+    def _evict_locked(self, now: float) -> int:
+        """만료 항목(PURGE_INTERVAL마다) + LRU eviction (Lock 보유 상태에서 호출)"""
+        evicted = 0
+        if now - self._last_purge >= self.PURGE_INTERVAL or self._total > self.max_bytes:
+            self._last_purge = now
+            expired_size = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM dart_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (now,)
+            ).fetchone()[0]
+            if expired_size:
+                evicted = self._conn.execute(
+                    "DELETE FROM dart_cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+                ).rowcount
+                self._total -= expired_size
+
+        if self._total <= self.max_bytes:
+            return evicted
+
+        target = int(self.max_bytes * 0.9)
+        victims = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM dart_cache ORDER BY last_access ASC"
+        ):
+            if self._total <= target:
+                break
+            victims.append((key,))
+            self._total -= size
+
+        self._conn.executemany("DELETE FROM dart_cache WHERE key = ?", victims)
+        return evicted + len(victims)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM dart_cache")
+            self._conn.commit()
+            self._total = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            count, size, raw_size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(raw_size), 0) FROM dart_cache"
+            ).fetchone()
+        return {'entries': count, 'size_bytes': size, 'raw_bytes': raw_size}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class DARTResponseCache:
+    """
+    DART 크롤러 응답 캐시 (SQLite shard + zlib)
+    """
+
+    def __init__(
+        self,
+        cache_dir: PathLike,
+        shards: int = 4,
+        max_bytes: int = 1024 * 1024 * 1024,
+        ttl_by_kind: Optional[Dict[str, Optional[float]]] = None,
+        compress_level: int = 6,
+        touch_interval: float = 60.0
+    ):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 (dart_cache_{i}.sqlite3 생성)
+            shards: shard 수
+            max_bytes: 전체 최대 용량 (압축 후, shard별로 균등 분배)
+            ttl_by_kind: 종류별 TTL (초, None이면 만료 없음), DEFAULT_TTL_BY_KIND에 덮어씀
+            compress_level: zlib 압축 레벨 (1-9)
+            touch_interval: 조회 시 last_access 갱신 최소 간격 (초, LRU 정밀도)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self.ttl_by_kind = {**DEFAULT_TTL_BY_KIND, **(ttl_by_kind or {})}
+
+        self._shards: List[_CacheShard] = [
+            _CacheShard(self.cache_dir / f"dart_cache_{i}.sqlite3", max_bytes // shards, touch_interval)
+            for i in range(shards)
+        ]
+        self._stats: Dict[str, CacheStats] = {}
+        self._stats_lock = threading.Lock()
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 조회 / 저장
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def get(self, key: str, kind: str = 'default') -> Optional[Dict[str, Any]]:
+        """
+        캐시 조회 (만료/없음/손상 시 None)
+
+        Args:
+            key: 캐시 키
+            kind: 통계 구분 ('toc', 'section' 등)
+        """
+        blob = self._shard(key).get(key, time.time())
+        data = None
+        if blob is not None:
+            try:
+                data = json.loads(zlib.decompress(blob).decode('utf-8'))
+            except (zlib.error, ValueError) as e:
+                logger.warning(f"[DARTCache] 손상된 항목 무시: {key} ({e})")
+
+        with self._stats_lock:
+            stats = self._stats.setdefault(kind, CacheStats())
+            if data is None:
+                stats.misses += 1
+            else:
+                stats.hits += 1
+        return data
+
+    def set(
+        self,
+        key: str,
+        data: Dict[str, Any],
+        kind: str = 'default',
+        ttl_seconds: Optional[float] = None
+    ) -> None:
+        """
+        저장
+
+        Args:
+            key: 캐시 키
+            data: JSON 직렬화 가능한 dict
+            kind: 종류 (TTL 결정)
+            ttl_seconds: 항목별 TTL (None이면 종류별 기본값)
+        """
+        raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        blob = zlib.compress(raw, self.compress_level)
+
+        now = time.time()
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_by_kind.get(kind)
+        expires_at = now + ttl if ttl else None
+
+        evicted = self._shard(key).set(key, kind, blob, len(raw), now, expires_at)
+
+        with self._stats_lock:
+            stats = self._stats.setdefault(kind, CacheStats())
+            stats.writes += 1
+            stats.evictions += evicted
+
+    def _shard(self, key: str) -> _CacheShard:
+        digest = hashlib.md5(key.encode('utf-8')).digest()
+        return self._shards[digest[0] % len(self._shards)]
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 관리
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def import_json_dir(self, directory: Optional[PathLike] = None, delete: bool = False) -> int:
+        """
+        기존 JSON 파일 캐시({md5}.json) 가져오기
+
+        파일명(md5)을 그대로 키로 사용하므로 DARTCrawlerRobust 키와 호환됩니다.
+        종류는 내용으로 판별 (all_sections → toc, content → section).
+
+        Args:
+            directory: JSON 파일 디렉토리 (None이면 cache_dir)
+            delete: 가져온 파일 삭제
+
+        Returns:
+            가져온 항목 수
+        """
+        directory = Path(directory) if directory else self.cache_dir
+        imported = 0
+        for path in directory.glob("*.json"):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            kind = 'toc' if 'all_sections' in data else 'section' if 'content' in data else 'default'
+            self.set(path.stem, data, kind=kind)
+            imported += 1
+            if delete:
+                path.unlink()
+
+        logger.info(f"[DARTCache] JSON 캐시 {imported}개 가져옴 ({directory})")
+        return imported
+
+    def clear(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """종류별 hit/miss + 저장소 크기"""
+        with self._stats_lock:
+            stats = {kind: s.to_dict() for kind, s in self._stats.items()}
+
+        infos = [shard.info() for shard in self._shards]
+        stats['storage'] = {
+            'shards': len(self._shards),
+            'entries': sum(i['entries'] for i in infos),
+            'size_bytes': sum(i['size_bytes'] for i in infos),
+            'raw_bytes': sum(i['raw_bytes'] for i in infos),
+            'max_bytes': self.max_bytes
+        }
+        return stats
+
+    def close(self) -> None:
+        for shard in self._shards:
+            shard.close()
@@ -0,0 +1,291 @@
+"""
+DART 기업 코드 로컬 인덱스 (v7.11.2)
+
+목적:
+- DARTClient.get_corp_code()가 호출마다 corpCode.xml(ZIP, 수 MB)을 내려받아
+  전체 목록을 두 번 선형 탐색함
+- 수백 개 기업을 매핑하면 수백 번 다운로드
+
+특징:
+- corpCode.xml ZIP을 한 번 받아 SQLite 인덱스로 저장 (corp_name 인덱스)
+- 조회 순서 (기존 규칙 유지):
+  1. 정확한 이름 (상장사 우선)
+  2. 상장사 부분 매칭 (접두어 → 포함)
+  3. 비상장사 부분 매칭 (접두어 → 포함)
+- 정확/접두어 매칭은 인덱스 탐색 O(log n)
+- 갱신 주기(max_age_days) 경과 시 조건부 요청(ETag/Last-Modified)으로 재다운로드
+
+Example:
+    >>> from umis_rag.utils.dart_api import DARTClient
+    >>> client = DARTClient()
+    >>> client.get_corp_code("삼성전자")        # 첫 호출만 다운로드
+    '00126380'
+    >>> names = read_company_names("data/corps_list_final.txt")
+    >>> client.get_corp_codes(names)            # 로컬 조회
+
+작성: 2026-10-18
+"""
+
+from pathlib import Path
+from typing import Optional, Dict, List, Iterable, Any, Union
+import io
+import sqlite3
+import threading
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+
+from umis_rag.utils.logger import logger
+
+
+PathLike = Union[str, Path]
+
+# 접두어 범위 검색 상한 (UTF-8 BINARY 비교에서 가장 큰 문자)
+_PREFIX_END = '\U0010ffff'
+
+
+class CorpCodeIndex:
+    """
+    corpCode.xml 기반 기업 코드 인덱스 (SQLite, thread-safe)
+    """
+
+    def __init__(self, path: PathLike):
+        """
+        Args:
+            path: 인덱스 파일 경로
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS corps (
+                seq INTEGER PRIMARY KEY,
+                corp_code TEXT NOT NULL,
+                corp_name TEXT NOT NULL,
+                stock_code TEXT NOT NULL DEFAULT '',
+                listed INTEGER NOT NULL DEFAULT 0,
+                modify_date TEXT NOT NULL DEFAULT ''
+            );
+            CREATE INDEX IF NOT EXISTS idx_corps_name ON corps (corp_name, listed DESC, seq);
+            CREATE INDEX IF NOT EXISTS idx_corps_listed ON corps (listed, seq);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            """
+        )
+        self._conn.commit()
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 구축 / 갱신 정보
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def build_from_zip(
+        self,
+        content: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> int:
+        """
+        corpCode.xml ZIP으로 인덱스 재구축 (트랜잭션 1개, 실패 시 기존 유지)
+
+        Args:
+            content: OpenDART corpCode.xml 응답 (ZIP)
+            etag: 응답 ETag (조건부 요청용)
+            last_modified: 응답 Last-Modified (조건부 요청용)
+
+        Returns:
+            저장된 기업 수
+        """
+        with zipfile.ZipFile(io.BytesIO(content)) as zf:
+            xml_data = zf.read('CORPCODE.xml')
+
+        rows = []
+        for _, elem in ET.iterparse(io.BytesIO(xml_data)):
+            if elem.tag != 'list':
+                continue
+            stock_code = (elem.findtext('stock_code') or '').strip()
+            rows.append((
+                (elem.findtext('corp_code') or '').strip(),
+                (elem.findtext('corp_name') or '').strip(),
+                stock_code,
+                1 if stock_code else 0,
+                (elem.findtext('modify_date') or '').strip()
+            ))
+            elem.clear()
+
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM corps")
+                self._conn.executemany(
+                    "INSERT INTO corps (corp_code, corp_name, stock_code, listed, modify_date) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self._set_meta({
+                    'fetched_at': str(time.time()),
+                    'etag': etag or '',
+                    'last_modified': last_modified or ''
+                })
+
+        logger.info(f"[DART] 기업 코드 인덱스 구축: {len(rows):,}개 ({self.path})")
+        return len(rows)
+
+    def touch(self) -> None:
+        """변경 없음(304) 확인 시 갱신 시각만 기록"""
+        with self._lock:
+            with self._conn:
+                self._set_meta({'fetched_at': str(time.time())})
+
+    def get_meta(self) -> Dict[str, Any]:
+        """갱신 정보 (fetched_at, etag, last_modified, count)"""
+        with self._lock:
+            meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+            count = self._conn.execute("SELECT COUNT(*) FROM corps").fetchone()[0]
+        return {
+            'fetched_at': float(meta['fetched_at']) if meta.get('fetched_at') else None,
+            'etag': meta.get('etag') or None,
+            'last_modified': meta.get('last_modified') or None,
+            'count': count
+        }
+
+    def is_stale(self, max_age_days: float) -> bool:
+        """비어 있거나 max_age_days 이상 지났으면 True"""
+        meta = self.get_meta()
+        if not meta['count'] or meta['fetched_at'] is None:
+            return True
+        return time.time() - meta['fetched_at'] >= max_age_days * 86400
+
+    def _set_meta(self, items: Dict[str, str]) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            list(items.items())
+        )
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 조회
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def lookup(self, company_name: str) -> Optional[str]:
+        """
+        회사명 → corp_code
+
+        Args:
+            company_name: 회사명 (예: "삼성전자")
+
+        Returns:
+            corp_code (8자리) or None
+        """
+        record = self.find(company_name)
+        return record['corp_code'] if record else None
+
+    def find(self, company_name: str) -> Optional[Dict[str, Any]]:
+        """
+        회사명 → 기업 레코드 (corp_code, corp_name, stock_code, listed, modify_date)
+
+        조회 순서: 정확 → 상장사 접두어 → 상장사 포함 → 비상장 접두어 → 비상장 포함
+        """
+        name = (company_name or '').strip()
+        if not name:
+            return None
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM corps WHERE corp_name = ? ORDER BY listed DESC, seq LIMIT 1",
+                (name,)
+            ).fetchone()
+            if row is None:
+                row = self._find_partial(name, listed=1) or self._find_partial(name, listed=0)
+
+        return self._to_record(row) if row else None
+
+    def _find_partial(self, name: str, listed: int):
+        row = self._conn.execute(
+            "SELECT * FROM corps WHERE corp_name >= ? AND corp_name < ? AND listed = ? "
+            "ORDER BY seq LIMIT 1",
+            (name, name + _PREFIX_END, listed)
+        ).fetchone()
+        if row is None:
+            # 포함 매칭은 선형 탐색이지만 프로세스 내 SQLite라 ms 단위
+            row = self._conn.execute(
+                "SELECT * FROM corps WHERE listed = ? AND instr(corp_name, ?) > 0 "
+                "ORDER BY seq LIMIT 1",
+                (listed, name)
+            ).fetchone()
+        return row
+
+    def search(self, prefix: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """접두어 검색 (상장사 우선)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM corps WHERE corp_name >= ? AND corp_name < ? "
+                "ORDER BY listed DESC, corp_name, seq LIMIT ?",
+                (prefix, prefix + _PREFIX_END, limit)
+            ).fetchall()
+        return [self._to_record(r) for r in rows]
+
+    def lookup_many(self, company_names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        회사명 목록 일괄 조회
+
+        Returns:
+            {회사명: corp_code or None} (입력 순서 유지)
+        """
+        return {name: self.lookup(name) for name in company_names}
+
+    @staticmethod
+    def _to_record(row) -> Dict[str, Any]:
+        _, corp_code, corp_name, stock_code, listed, modify_date = row
+        return {
+            'corp_code': corp_code,
+            'corp_name': corp_name,
+            'stock_code': stock_code,
+            'listed': bool(listed),
+            'modify_date': modify_date
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 공유 인덱스 + 편의 함수
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_indexes: Dict[str, CorpCodeIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_corp_index(path: PathLike) -> CorpCodeIndex:
+    """경로별 공유 인덱스"""
+    key = str(Path(path).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = CorpCodeIndex(Path(key))
+            _indexes[key] = index
+        return index
+
+
+def read_company_names(path: PathLike) -> List[str]:
+    """
+    기업 목록 파일에서 회사명만 읽기
+
+    형식: 한 줄에 "기업명" 또는 "기업명,rcept_no" (# 주석, 빈 줄 무시)
+    (예: data/corps_list_final.txt)
+    """
+    names = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            name = line.split(',', 1)[0].strip()
+            if name:
+                names.append(name)
+    return names
@@ -16,6 +16,7 @@ DART Robust 크롤러 v2.0 (Bot 탐지 우회)
 """
 
 import requests
+import requests.adapters
 from bs4 import BeautifulSoup
 import re
 import time
@@ -25,6 +26,13 @@ from typing import Dict, List, Optional
 from pathlib import Path
 import hashlib
 
+from umis_rag.utils.dart_cache import DARTResponseCache
+
+
+class DARTCacheMiss(Exception):
+    """cache_only 모드에서 캐시에 없는 요청"""
+    pass
+
 
 class DARTCrawlerRobust:
     """
@@ -34,7 +42,7 @@ class DARTCrawlerRobust:
     1. JavaScript 목차 데이터 파싱
     2. Bot 탐지 우회 (User-Agent, Rate limiting, Session)
     3. 자동 재시도 (지수 백오프)
-    4. 캐싱 (중복 요청 방지)
+    4. 캐싱 (중복 요청 방지, v7.11.2: SQLite + zlib, 종류별 TTL, 오프라인 재현)
     5. OFS/CFS 자동 검증
     """
     
@@ -53,30 +61,49 @@ class DARTCrawlerRobust:
         min_delay: float = 2.0,
         max_delay: float = 5.0,
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        rate_limiter=None,
+        pool_size: int = 10,
+        cache: Optional[DARTResponseCache] = None,
+        cache_only: bool = False
     ):
         """
         Args:
-            cache_dir: 캐시 디렉토리 (None이면 캐싱 안 함)
+            cache_dir: 캐시 디렉토리 (None이면 캐싱 안 함, v7.11.2: SQLite + zlib)
             min_delay: 최소 요청 간격 (초)
             max_delay: 최대 요청 간격 (초)
             timeout: 요청 타임아웃 (초)
             max_retries: 최대 재시도 횟수
+            rate_limiter: 공유 Rate limiter (acquire() 제공, 예: TokenBucket)
+                          지정 시 time.sleep 기반 지연 대신 사용 (v7.11.2, 배치 크롤링용)
+            pool_size: Session 연결 풀 크기 (동시 worker 수 이상)
+            cache: 응답 캐시 직접 지정 (TTL/용량 조정 시, 지정하면 cache_dir 무시)
+            cache_only: True면 네트워크 요청 없이 캐시만 사용 (오프라인 재현/테스트용)
         """
         
         self.base_url = "https://dart.fss.or.kr"
         self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_only = cache_only
         self.min_delay = min_delay
         self.max_delay = max_delay
         self.timeout = timeout
         self.max_retries = max_retries
         
-        # Session 생성 (쿠키 유지)
-        self.session = requests.Session()
+        self.rate_limiter = rate_limiter
         
-        # 캐시 디렉토리 생성
-        if self.cache_dir:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Session 생성 (쿠키 유지, worker 간 연결 풀 공유)
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # 응답 캐시 (v7.11.2: 파일별 JSON → SQLite shard + zlib, 종류별 TTL)
+        if cache is None and self.cache_dir:
+            cache = DARTResponseCache(self.cache_dir)
+        self.cache = cache
         
         # 마지막 요청 시간
         self.last_request_time = 0
@@ -99,7 +126,11 @@ class DARTCrawlerRobust:
         }
     
     def _rate_limit(self):
-        """Rate limiting (요청 간 랜덤 지연)"""
+        """Rate limiting (요청 간 랜덤 지연, rate_limiter 지정 시 공유 토큰 버킷)"""
+        
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+            return
         
         current_time = time.time()
         elapsed = current_time - self.last_request_time
@@ -110,41 +141,37 @@ class DARTCrawlerRobust:
         
         self.last_request_time = time.time()
     
-    def _get_cache_path(self, key: str) -> Optional[Path]:
-        """캐시 파일 경로"""
-        
-        if not self.cache_dir:
-            return None
-        
-        # MD5 해시로 파일명 생성
-        hash_key = hashlib.md5(key.encode()).hexdigest()
-        return self.cache_dir / f"{hash_key}.json"
+    @staticmethod
+    def _cache_key(key: str) -> str:
+        """캐시 키 (MD5, 기존 JSON 파일명과 동일)"""
+        return hashlib.md5(key.encode()).hexdigest()
     
-    def _load_from_cache(self, key: str) -> Optional[Dict]:
+    def _load_from_cache(self, key: str, kind: str = 'default') -> Optional[Dict]:
         """캐시에서 로드"""
         
-        cache_path = self._get_cache_path(key)
-        
-        if cache_path and cache_path.exists():
-            try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                pass
+        if self.cache is None:
+            return None
         
-        return None
+        try:
+            return self.cache.get(self._cache_key(key), kind=kind)
+        except Exception:
+            return None
     
-    def _save_to_cache(self, key: str, data: Dict):
+    def _save_to_cache(self, key: str, data: Dict, kind: str = 'default'):
         """캐시에 저장"""
         
-        cache_path = self._get_cache_path(key)
+        if self.cache is None:
+            return
         
-        if cache_path:
-            try:
-                with open(cache_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-            except:
-                pass
+        try:
+            self.cache.set(self._cache_key(key), data, kind=kind)
+        except Exception:
+            pass
+    
+    def get_cache_stats(self) -> Optional[Dict]:
+        """캐시 종류별 hit/miss + 저장소 크기 (캐시 없으면 None)"""
+        
+        return self.cache.get_stats() if self.cache is not None else None
     
     def _request_with_retry(
         self,
@@ -154,6 +181,9 @@ class DARTCrawlerRobust:
     ) -> requests.Response:
         """재시도 로직을 포함한 HTTP 요청 (지수 백오프)"""
         
+        if self.cache_only:
+            raise DARTCacheMiss(f"cache_only 모드: 캐시에 없는 요청 ({url}, {params})")
+        
         if max_retries is None:
             max_retries = self.max_retries
         
@@ -236,7 +266,7 @@ class DARTCrawlerRobust:
         
         # 캐시 확인
         cache_key = f"toc_{rcept_no}"
-        cached = self._load_from_cache(cache_key)
+        cached = self._load_from_cache(cache_key, kind='toc')
         
         if cached:
             print(f"  ✓ 캐시에서 로드")
@@ -263,7 +293,7 @@ class DARTCrawlerRobust:
             result = {'all_sections': sections}
             
             # 캐시 저장
-            self._save_to_cache(cache_key, result)
+            self._save_to_cache(cache_key, result, kind='toc')
             
             print(f"  ✓ {len(sections)}개 섹션 추출 완료")
             
@@ -404,7 +434,7 @@ class DARTCrawlerRobust:
         
         # 캐시 확인
         cache_key = f"section_{section['rcpNo']}_{section['dcmNo']}_{section['eleId']}"
-        cached = self._load_from_cache(cache_key)
+        cached = self._load_from_cache(cache_key, kind='section')
         
         if cached:
             return cached.get('content')
@@ -426,7 +456,7 @@ class DARTCrawlerRobust:
             content = response.text
             
             # 캐시 저장
-            self._save_to_cache(cache_key, {'content': content})
+            self._save_to_cache(cache_key, {'content': content}, kind='section')
             
             return content
             